@@ -42,3 +42,21 @@ Feature: User Authentication
     When I call get_me with the access_token
     Then the profile email is "frank@test.com"
     And the profile is_active is True
+
+  Scenario: Role changes are visible to the principal lookup immediately
+    Given a user "grace@test.com" with password "Grace111!" exists
+    And I have logged in as "grace@test.com"
+    When I resolve the principal for the access_token
+    Then the principal is_super_user is False
+    When "grace@test.com" is promoted to super user
+    And I resolve the principal for the access_token
+    Then the principal is_super_user is True
+
+  Scenario: A deactivated admin is refused even when the role claim is trusted
+    Given I am logged in as admin "judy@test.com"
+    And the admin guard trusts the access-token role claim
+    When I pass the admin guard with the access_token
+    Then the admin guard lets me through
+    When another worker deactivates "judy@test.com"
+    And I pass the admin guard with the access_token
+    Then I should receive an UnauthenticatedError
@@ -0,0 +1,44 @@
+# ═══════════════════════════════════════════════
+# FILE: features/cache_invalidation.feature
+# ═══════════════════════════════════════════════
+Feature: Cache invalidation across workers
+  As an API operator running several workers
+  I want every worker to drop cached entries as soon as another worker changes them
+  So that a write is visible everywhere without waiting for the next refresh
+
+  Scenario: A genre renamed through another worker is seen on the next read
+    Given genres "Drama,Fantasy" exist
+    And the genre catalog was loaded
+    When another worker renames genre "Drama" to "Melodrama"
+    Then searching genres for "drama" finds "Melodrama"
+
+  Scenario: A role granted through another worker is seen by the principal lookup
+    Given a user "heidi@test.com" with password "Heidi222!" exists
+    And I have logged in as "heidi@test.com"
+    When I resolve the principal for the access_token
+    Then the principal is_super_user is False
+    When another worker promotes "heidi@test.com" to super user
+    And I resolve the principal for the access_token
+    Then the principal is_super_user is True
+
+  Scenario: Workers handle each other's changes but not their own, and measure the lag
+    Given two workers sharing an invalidation bus
+    When worker "A" publishes 3 genre changes
+    Then worker "B" handled 3 genre changes
+    And worker "A" handled 0 genre changes
+    And worker "B" measured the propagation lag of 3 events
+
+  Scenario: A failing handler is counted and later events are still handled
+    Given two workers sharing an invalidation bus
+    And worker "B" has a failing genre handler
+    When worker "A" publishes 2 genre changes
+    Then worker "B" handled 2 genre changes
+    And worker "B" counted 2 handler failure
+
+  @postgres
+  Scenario: Only committed changes reach the other worker through Postgres
+    Given two workers listening on Postgres
+    When worker "A" publishes a genre change and commits
+    And worker "A" publishes a genre change and rolls back
+    Then worker "B" receives exactly 1 genre change within 5 seconds
+    And worker "A" handled 0 genre changes
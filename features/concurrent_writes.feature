@@ -0,0 +1,38 @@
+# ═══════════════════════════════════════════════
+# FILE: features/concurrent_writes.feature
+# ═══════════════════════════════════════════════
+@postgres
+Feature: Concurrent watchlist and rating writes on PostgreSQL
+  As a maintainer
+  I want racing requests to be settled by the database
+  So that a user never ends up with duplicate watch entries or ratings
+
+  Scenario: Concurrent watch requests for the same movie insert exactly one entry
+    When 20 concurrent requests watch the same movie for the same user
+    Then exactly 1 request succeeds
+    And the other 19 requests receive an AlreadyExistsError
+    And the user has 1 "user_watch_movie" row for the movie
+
+  Scenario: Concurrent ratings of a watched movie insert exactly one rating
+    Given the racing user has watched the movie
+    When 20 concurrent requests rate the same movie for the same user
+    Then exactly 1 request succeeds
+    And the other 19 requests receive an AlreadyExistsError
+    And the user has 1 "user_rate_movie" row for the movie
+
+  Scenario: Concurrent ratings of an unwatched movie are all rejected
+    When 5 concurrent requests rate the same movie for the same user
+    Then exactly 0 request succeeds
+    And the other 5 requests receive an InvalidArgumentError
+    And the user has 0 "user_rate_movie" row for the movie
+
+  Scenario: Concurrent ratings of one movie by different users keep its stats exact
+    When 10 different users concurrently rate the same movie
+    Then exactly 10 request succeeds
+    And the movie stats count 10 ratings summing to 40
+
+  Scenario: Concurrent re-ratings of one rating keep its stats exact
+    Given the racing user has watched the movie
+    When 10 concurrent requests re-rate the racing user's rating of the movie
+    Then exactly 10 request succeeds
+    And the movie stats count 1 rating summing to its final score
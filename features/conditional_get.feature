@@ -0,0 +1,94 @@
+# ═══════════════════════════════════════════════
+# FILE: features/conditional_get.feature
+# ═══════════════════════════════════════════════
+Feature: Conditional GETs
+  As a mobile client
+  I want reads to carry strong ETags and to be answered 304 when mine still matches
+  So that revalidating an unchanged resource costs a version check instead of the full response
+
+  Scenario: A movie's tag holds until the movie is rated
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    And I hold the tag of movie "The Matrix"
+    Then the tag of movie "The Matrix" still matches
+    When I rate "The Matrix" with 4 stars
+    Then the tag of movie "The Matrix" no longer matches
+
+  Scenario: A genre renamed through another worker no longer matches its tag
+    Given genres "Drama" exist
+    And I hold the tag of genre "Drama"
+    When another worker renames genre "Drama" to "Melodrama"
+    Then the tag of genre "Drama" no longer matches
+
+  Scenario: A promoted user no longer matches the tag of its details
+    Given I am logged in as "user@test.com"
+    And I hold the tag of user "user@test.com"
+    Then the tag of user "user@test.com" still matches
+    When "user@test.com" is promoted to super user
+    Then the tag of user "user@test.com" no longer matches
+
+  Scenario: The movies list tag follows ratings but not users
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    And I hold the tag of the movies list
+    When another worker renames "user@test.com" to "Neo"
+    Then the tag of the movies list still matches
+    When I rate "The Matrix" with 4 stars
+    Then the tag of the movies list no longer matches
+
+  Scenario: The genres list tag changes when another worker renames a genre
+    Given genres "Drama,Docudrama" exist
+    And I hold the tag of the genres list
+    When another worker renames genre "Drama" to "Melodrama"
+    Then the tag of the genres list no longer matches
+
+  Scenario: Registering a user changes the users list tag
+    Given I hold the tag of the users list
+    When I register with email "carol@test.com", username "carol", first_name "Carol", last_name "White", password "Password123!"
+    Then the tag of the users list no longer matches
+
+  Scenario: Each page of a list has a tag of its own
+    Then pages 1 and 2 of the movies list have different tags
+
+  Scenario: A movie revalidated with its tag is answered 304 until it changes
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    When I read movie "The Matrix"
+    Then the response is 200 with the tag of the previous read
+    When I revalidate movie "The Matrix" with If-None-Match ETAG
+    Then the response is 304 with the tag of the previous read
+    When I rate "The Matrix" with 4 stars
+    And I revalidate movie "The Matrix" with If-None-Match ETAG
+    Then the response is 200 with a new tag
+
+  Scenario Outline: A list answers If-None-Match by its tag
+    Given genres "Drama" exist
+    When I read the genres list
+    And I revalidate the genres list with If-None-Match <header>
+    Then the response is <status> with the tag of the previous read
+
+    Examples:
+      | header         | status |
+      | ETAG           | 304    |
+      | W/ETAG         | 304    |
+      | "xyz", ETAG    | 304    |
+      | *              | 304    |
+      | "xyz"          | 200    |
+      | "xyz", W/"abc" | 200    |
+
+  Scenario Outline: If-None-Match is compared weakly
+    Then an If-None-Match of <header> is <outcome> for the tag "abc"
+
+    Examples:
+      | header          | outcome  |
+      | "abc"           | a match  |
+      | W/"abc"         | a match  |
+      | "xyz", "abc"    | a match  |
+      | *               | a match  |
+      | "xyz"           | no match |
+      | "ab"            | no match |
+      | W/"xyz",W/"abc" | a match  |
+      | "abc"x          | no match |
+
+  Scenario: A request without If-None-Match matches no tag
+    Then a request without If-None-Match is no match for the tag "abc"
@@ -0,0 +1,73 @@
+# ═══════════════════════════════════════════════
+# FILE: features/content_similarity.feature
+# ═══════════════════════════════════════════════
+Feature: Similar movies by content
+  As a user
+  I want to find movies that sound like one I know
+  So that new movies nobody has watched yet are found too
+
+  Background:
+    Given these movies are described as:
+      | title  | description                                                  |
+      | Alien  | The crew of a space freighter is hunted by a deadly creature |
+      | Ripley | Space marines return to fight the deadly creature            |
+      | Heat   | A detective chases a crew of bank robbers across the city    |
+      | Brick  | A teenage detective investigates a murder at his high school |
+    And the content index was synced
+
+  Scenario: Movies that share the rarest words are the most similar
+    When I fetch the movies described like "Alien"
+    Then the recommended titles are "Ripley,Heat"
+    When I fetch the movies described like "Brick"
+    Then the recommended titles are "Heat"
+
+  Scenario: A new movie is indexed in the background once it is created
+    When I create a movie titled "Prometheus" in genre "Sci-Fi" with description "Explorers meet a deadly creature in space"
+    And the queued movies are indexed
+    And I fetch the movies described like "Prometheus"
+    Then the top recommended title is "Alien"
+    And the recommended titles include "Ripley"
+
+  Scenario: A changed description moves the movie to its new neighbours
+    When I update movie "Heat" description to "A space crew is hunted by a deadly creature"
+    And the queued movies are indexed
+    And I fetch the movies described like "Brick"
+    Then no movies are recommended
+    When I fetch the movies described like "Alien"
+    Then the top recommended title is "Heat"
+
+  Scenario: A deleted movie is no longer suggested
+    When I delete movie "Ripley"
+    And the queued movies are indexed
+    And I fetch the movies described like "Alien"
+    Then the recommended titles are "Heat"
+
+  Scenario: A movie write does not wait for a running content sync
+    Given a content sync is holding the index
+    When I create "Prometheus" described as "Explorers meet a deadly creature in space" within 5 seconds
+    Then the content sync still holds the index
+    When the content sync finishes
+    And the queued movies are indexed
+    And I fetch the movies described like "Prometheus"
+    Then the top recommended title is "Alien"
+
+  Scenario: Movies imported from a catalog are indexed
+    When I import the NDJSON catalog
+      """
+      {"title": "Alien 3", "genre_uuid": "<Sci-Fi>", "description": "The crew of a space prison is hunted by a deadly creature"}
+      """
+    And the queued movies are indexed
+    And I fetch the movies described like "Alien"
+    Then the top recommended title is "Alien 3"
+
+  Scenario: Catching up on missed movie changes does not hold up the other change handlers
+    Given a content sync is holding the index
+    When the change listener catches up on missed movie and user changes within 5 seconds
+    Then the content sync still holds the index
+    When the content sync finishes
+    And the queued movies are indexed
+    Then the content index was synced again
+
+  Scenario: The saved index is mapped by a new worker without rebuilding
+    When a new worker maps the saved content index
+    Then the mapped index finds "Ripley,Heat" similar to "Alien"
@@ -72,6 +72,17 @@ def before_all(context) -> None:  # type: ignore[no-untyped-def]
     context.movie_logic = container.movie_logic()
     context.watch_logic = container.watch_logic()
     context.rating_logic = container.rating_logic()
+    context.movie_stats_logic = container.movie_stats_logic()
+    context.leaderboard_logic = container.leaderboard_logic()
+    context.recommendation_logic = container.recommendation_logic()
+    context.content_similarity_logic = container.content_similarity_logic()
+
+    # Step 6 – optional PostgreSQL adapter for @postgres scenarios (behave -D postgres=true)
+    context.postgres_adapter = None
+    if context.config.userdata.getbool("postgres"):
+        from tests.container import build_postgres_adapter
+
+        context.postgres_adapter = build_postgres_adapter()
 
 
 def after_all(context) -> None:  # type: ignore[no-untyped-def]
@@ -82,6 +93,7 @@ def after_all(context) -> None:  # type: ignore[no-untyped-def]
     if hasattr(context, "container") and hasattr(context, "loop"):
         from tests.container import drop_test_schema
         context.loop.run_until_complete(drop_test_schema(context.container.sqlite_adapter()))
+        context.container.password_hasher().shutdown()
 
     if hasattr(context, "loop") and context.loop is not None:
         context.loop.close()
@@ -89,12 +101,20 @@ def after_all(context) -> None:  # type: ignore[no-untyped-def]
 
 def before_scenario(context, scenario) -> None:  # type: ignore[no-untyped-def]
     """
-    1. Clear all table rows (fast truncation pattern for test isolation).
-    2. Reset per-scenario context state.
+    1. Skip @postgres scenarios unless a PostgreSQL adapter was requested.
+    2. Clear all table rows (fast truncation pattern for test isolation).
+    3. Reset per-scenario context state.
     """
+    if "postgres" in scenario.effective_tags and context.postgres_adapter is None:
+        scenario.skip("requires PostgreSQL; run behave with -D postgres=true")
+        return
+
     from tests.container import clear_all_tables
 
     context.loop.run_until_complete(clear_all_tables(context.container.sqlite_adapter()))
+    context.container.principal_cache().clear()
+    context.container.genre_logic().invalidate()
+    context.loop.run_until_complete(context.container.response_cache().clear())
 
     # Reset per-scenario state
     context.current_user_uuid = None
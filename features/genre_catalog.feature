@@ -0,0 +1,44 @@
+# ═══════════════════════════════════════════════
+# FILE: features/genre_catalog.feature
+# ═══════════════════════════════════════════════
+Feature: Genre catalog served from memory
+  As an API client
+  I want genre reads and genre checks answered by the worker itself
+  So that browsing genres and creating movies do not wait on the database for them
+
+  Scenario: Genre reads are served from the loaded catalog
+    Given genres "Drama,Melodrama,Fantasy" exist
+    And the genre catalog was loaded
+    When the genres table is emptied directly in the database
+    Then searching genres for "drama" finds "Drama,Melodrama"
+    And fetching genre "Fantasy" returns it
+
+  Scenario: Genre search matches substrings, including short terms
+    Given genres "Drama,Melodrama,Fantasy" exist
+    Then searching genres for "RAMA" finds "Drama,Melodrama"
+    And searching genres for "dr" finds "Drama,Melodrama"
+
+  Scenario: Genre writes are visible to the next read
+    Given genres "Drama,Fantasy" exist
+    And the genre catalog was loaded
+    When I rename genre "Drama" to "Melodrama"
+    And I delete genre "Fantasy"
+    Then searching genres for "drama" finds "Melodrama"
+    And fetching genre "Fantasy" raises NotFoundError
+
+  Scenario: A movie in an unknown genre is rejected before it is inserted
+    When I create a movie titled "Orphan" in an unknown genre
+    Then I should receive an InvalidArgumentError
+    And the unknown genres are at indexes "0"
+
+  Scenario: Bulk creation points at the movies in an unknown genre
+    Given a genre "Crime" exists
+    When I bulk create movies "Heat,Orphan,Brick" in genre "Crime" where "Orphan" has an unknown genre
+    Then I should receive an InvalidArgumentError
+    And the unknown genres are at indexes "1"
+
+  Scenario: A genre created through another worker is accepted for new movies
+    Given the genre catalog was loaded
+    When another worker creates the genre "Noir"
+    And I create a movie titled "Brick" in genre "Noir" with description "A detective story"
+    Then the movie is created with title "Brick"
@@ -0,0 +1,44 @@
+# ═══════════════════════════════════════════════
+# FILE: features/leaderboards.feature
+# ═══════════════════════════════════════════════
+Feature: Movie leaderboards
+  As a visitor
+  I want to see the best rated and the currently trending movies
+  So that I can pick something to watch
+
+  Scenario: Top rated weighs a few perfect scores against many good ones
+    Given "Alien" in genre "Sci-Fi" is rated "5,5,4,5,5" by different users
+    And "Heat" in genre "Crime" is rated "5" by different users
+    And "Brick" in genre "Crime" is rated "2,2" by different users
+    When the leaderboards are refreshed
+    And I fetch the top rated movies
+    Then the leaderboard titles are "Alien,Heat,Brick"
+    And the leaderboard reports its age and refresh interval
+
+  Scenario: Leaderboards can be narrowed to one genre
+    Given "Alien" in genre "Sci-Fi" is rated "5,5,4,5,5" by different users
+    And "Heat" in genre "Crime" is rated "5" by different users
+    When the leaderboards are refreshed
+    And I fetch the top rated movies in genre "Crime"
+    Then the leaderboard titles are "Heat"
+
+  Scenario: Requests are served from the snapshot until the next refresh
+    Given "Heat" in genre "Crime" is rated "5" by different users
+    And the leaderboards were refreshed
+    And "Alien" in genre "Sci-Fi" is rated "5,5,5" by different users
+    When I fetch the top rated movies
+    Then the leaderboard titles are "Heat"
+    When the leaderboards are refreshed
+    And I fetch the top rated movies
+    Then the leaderboard titles are "Alien,Heat"
+
+  Scenario: Trending favours recent activity and forgets activity outside the window
+    Given "Alien" in genre "Sci-Fi" is added to 3 watchlists
+    And all activity on "Alien" happened 4 days ago
+    And "Heat" in genre "Crime" is added to 1 watchlists
+    And "Brick" in genre "Crime" is added to 5 watchlists
+    And all activity on "Brick" happened 20 days ago
+    When the leaderboards are refreshed
+    And I fetch the trending movies
+    Then the leaderboard titles are "Heat,Alien"
+    And the leaderboard reports its age and refresh interval
@@ -19,12 +19,67 @@ Feature: Movie Management
     When I create a genre named "Drama" with no description
     Then I should receive an AlreadyExistsError
 
+  Scenario: Bulk genre creation reports the conflicting rows
+    Given a genre "Drama" already exists
+    When I bulk create genres "Noir, Drama, Documentary"
+    Then I should receive an AlreadyExistsError
+    And the bulk conflicts are at indexes "1"
+
+  Scenario: Bulk genre creation can skip conflicting rows
+    Given a genre "Drama" already exists
+    When I bulk create genres "Noir, Drama, Documentary" skipping conflicts
+    Then 2 genres are created in bulk
+    And the bulk conflicts are at indexes "1"
+
+  Scenario Outline: Genre search totals follow include_total
+    Given genres "Drama,Fantasy,History,Romance,Sport" exist
+    And the estimated total cap is 3
+    When I search genres page <page> of size 2 with include_total "<mode>"
+    Then the search total is <total> and exact is <exact>
+
+    Examples:
+      | page | mode      | total | exact |
+      | 1    | exact     | 5     | True  |
+      | 4    | exact     | 5     | True  |
+      | 1    | estimated | 4     | False |
+      | 3    | estimated | 5     | True  |
+      | 1    | none      | None  | False |
+
   Scenario: Admin creates a movie linked to a genre
     Given a genre "Action" exists
     When I create a movie titled "Die Hard" in genre "Action" with description "An action classic"
     Then the movie is created with title "Die Hard"
     And the movie has the correct genre_uuid
 
+  Scenario: NDJSON catalog import reports inserted, duplicate and invalid rows
+    Given a genre "Documentary" exists
+    And movie "Planet Earth" in genre "Documentary" exists
+    When I import the NDJSON catalog
+      """
+      {"title": "Blue Planet", "genre_uuid": "<Documentary>", "description": "Oceans"}
+      {"title": "Planet Earth", "genre_uuid": "<Documentary>"}
+      {"title": "Blue Planet", "genre_uuid": "<Documentary>"}
+
+      {"title": "", "genre_uuid": "<Documentary>"}
+      {"title": "Orphan", "genre_uuid": "00000000-0000-0000-0000-000000000000"}
+      not json
+      """
+    Then the import reports 1 inserted, 2 duplicates and 3 invalid
+    And the import errors are on lines "5, 6, 7"
+
+  Scenario: CSV catalog import handles quoted multi-line fields
+    Given a genre "Documentary" exists
+    When I import the CSV catalog
+      """
+      title,description,genre_uuid
+      "Cosmos","A ""personal"" voyage,
+      across the universe",<Documentary>
+      Life,,<Documentary>
+      Broken,<Documentary>
+      """
+    Then the import reports 2 inserted, 0 duplicates and 1 invalid
+    And the import errors are on lines "5"
+
   Scenario: Search movies returns paginated results
     Given a genre "Thriller" exists
     And a genre "Comedy" exists
@@ -42,6 +97,49 @@ Feature: Movie Management
     Then I receive exactly 1 movie
     And the movie title is "The Shining"
 
+  Scenario Outline: Title search matches substrings, including short terms
+    Given a genre "Family" exists
+    And movie "Up" in genre "Family" exists
+    And movie "Cup Final" in genre "Family" exists
+    And movie "Soup_Kitchen" in genre "Family" exists
+    When I search movies titled "<term>"
+    Then the found titles are "<titles>"
+
+    Examples:
+      | term | titles                     |
+      | up   | Up,Soup_Kitchen,Cup Final  |
+      | UP   | Up,Soup_Kitchen,Cup Final  |
+      | p    | Up,Soup_Kitchen,Cup Final  |
+      | up F | Cup Final                  |
+      | p_K  | Soup_Kitchen               |
+      | _K   | Soup_Kitchen               |
+
+  Scenario: Full-text search matches descriptions and ranks by relevance
+    Given a genre "Crime" exists
+    And movie "Rififi" in genre "Crime" with description "A jewel heist in Paris" exists
+    And movie "Heat" in genre "Crime" with description "Heist after heist, a crew of heist specialists" exists
+    And movie "Laura" in genre "Crime" with description "A detective falls for a portrait" exists
+    When I full-text search movies for "heists"
+    Then the found titles are "Heat,Rififi"
+    When I update movie "Laura" description to "A detective investigates a heist"
+    And I full-text search movies for "investigating"
+    Then the found titles are "Laura"
+
+  Scenario Outline: Cursor pagination walks every movie exactly once
+    Given a genre "Noir" exists
+    And movie "Laura" in genre "Noir" exists
+    And movie "Detour" in genre "Noir" exists
+    And movie "Gilda" in genre "Noir" exists
+    And movie "Rififi" in genre "Noir" exists
+    And movie "Pickup" in genre "Noir" exists
+    When I page through genre "Noir" movies by title <order> with page_size 2
+    Then the paged titles are "<titles>"
+
+    Examples:
+      | order | titles                            |
+      | asc   | Detour,Gilda,Laura,Pickup,Rififi  |
+      | desc  | Rififi,Pickup,Laura,Gilda,Detour  |
+
   Scenario: Admin updates a movie description
     Given a genre "Western" exists
     And movie "Unforgiven" in genre "Western" exists
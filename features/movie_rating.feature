@@ -19,6 +19,35 @@ Feature: Movie Rating
     When I try to rate "Inception" with 5 stars
     Then I should get error "Can only rate watched movies"
 
+  Scenario: Watching the same movie twice is rejected
+    When I try to watch "The Matrix" again
+    Then I should receive an AlreadyExistsError
+
+  Scenario: Rating a movie twice is rejected
+    Given I have rated "The Matrix" with 4 stars
+    When I try to rate "The Matrix" with 5 stars
+    Then I should receive an AlreadyExistsError
+    And my rating for "The Matrix" is 4
+
+  Scenario: Updating a watch status returns the updated entry
+    Given I have a movie "Inception" with status "want_to_watch"
+    When I mark "Inception" as "watched"
+    Then the watch entry status is "watched"
+
+  Scenario: Removing a want-to-watch entry
+    Given I have a movie "Inception" with status "want_to_watch"
+    When I remove "Inception" from my watchlist
+    Then the removal succeeds
+
+  Scenario: Removing a watched entry is rejected
+    When I remove "The Matrix" from my watchlist
+    Then I should receive an InvalidArgumentError
+
+  Scenario: Removing a movie that is not on the watchlist
+    Given a genre "Drama" and movie "Arrival" exist
+    When I remove "Arrival" from my watchlist
+    Then I should receive a NotFoundError
+
   Scenario: Invalid rating value
     When I try to rate "The Matrix" with 6 stars
     Then I should get error "Rating must be between 1 and 5"
@@ -26,9 +55,24 @@ Feature: Movie Rating
   Scenario: Update an existing rating
     Given I have rated "The Matrix" with 3 stars
     When I update my rating for "The Matrix" to 4 stars
-    Then my rating for "The Matrix" is 4
+    Then the movie rating should be 4
+    And my rating for "The Matrix" is 4
 
   Scenario: Get my ratings returns correct list
     Given I have rated "The Matrix" with 5 stars
     When I fetch my ratings
     Then "The Matrix" appears in my ratings with score 5
+
+  Scenario Outline: Rating pages are sorted and carry the total of every rating
+    Given I have rated "The Matrix" with 5 stars
+    And I have rated "Alien" with 3 stars
+    And I have rated "Heat" with 4 stars
+    When I fetch page <page> of my ratings by score "<order>" with page_size 2
+    Then the ratings page lists "<titles>" out of 3
+
+    Examples:
+      | page | order | titles          |
+      | 1    | desc  | The Matrix,Heat |
+      | 2    | desc  | Alien           |
+      | 1    | asc   | Alien,Heat      |
+      | 3    | asc   | -               |
@@ -0,0 +1,72 @@
+# ═══════════════════════════════════════════════
+# FILE: features/movie_stats.feature
+# ═══════════════════════════════════════════════
+Feature: Movie statistics
+  As a user
+  I want every movie to show its rating and watch counts
+  So that I can see how popular it is without listing its raters
+
+  Background:
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+
+  Scenario: Rating and re-rating keep the average current
+    Given I have rated "The Matrix" with 3 stars
+    When I update my rating for "The Matrix" to 5 stars
+    Then "The Matrix" has 1 rating averaging 5.0
+    And "The Matrix" has 1 watched and 0 want-to-watch entries
+
+  Scenario: Watch status changes and removals move the watch counters
+    Given I have a movie "Inception" with status "want_to_watch"
+    And I have a movie "Arrival" with status "want_to_watch"
+    When I mark "Inception" as "watched"
+    And I remove "Arrival" from my watchlist
+    Then "Inception" has 1 watched and 0 want-to-watch entries
+    And "Arrival" has 0 watched and 0 want-to-watch entries
+
+  Scenario: A movie nobody has rated has no average
+    Given a genre "Drama" and movie "Heat" exist
+    Then "Heat" has 0 rating averaging nothing
+    And "Heat" has 0 watched and 0 want-to-watch entries
+
+  Scenario: Search results carry the stats
+    Given I have rated "The Matrix" with 4 stars
+    When I search movies titled "Matrix"
+    Then the found "The Matrix" has 1 rating averaging 4.0
+
+  Scenario: The rating histogram follows ratings and re-ratings
+    Given I have a movie "Inception" with status "watched"
+    And I have rated "The Matrix" with 3 stars
+    And I have rated "Inception" with 4 stars
+    When I update my rating for "The Matrix" to 5 stars
+    And I fetch the rating histogram of "The Matrix"
+    Then the histogram counts from 1 to 5 stars are "0,0,0,0,1"
+    When I fetch the rating histogram of "Inception"
+    Then the histogram counts from 1 to 5 stars are "0,0,0,1,0"
+
+  Scenario: A movie nobody has rated has an empty histogram
+    Given a genre "Drama" and movie "Heat" exist
+    When I fetch the rating histogram of "Heat"
+    Then the histogram counts from 1 to 5 stars are "0,0,0,0,0"
+
+  Scenario: The histogram of an unknown movie is not found
+    When I fetch the rating histogram of an unknown movie
+    Then I should receive a NotFoundError
+
+  Scenario Outline: Reconciliation reports drifted stats and repairs them on request
+    Given I have rated "The Matrix" with 4 stars
+    And the stats of "The Matrix" are <drift>
+    When I reconcile the movie stats
+    Then 1 movie is reported as drifted
+    And "The Matrix" has <count> rating averaging <average>
+    When I reconcile and repair the movie stats
+    Then 1 movie is reported as drifted
+    And "The Matrix" has 1 rating averaging 4.0
+    When I reconcile the movie stats
+    Then 0 movie is reported as drifted
+
+    Examples:
+      | drift       | count | average |
+      | inflated    | 3     | 1.33    |
+      | missing     | 0     | nothing |
+      | misbucketed | 1     | 4.0     |
@@ -0,0 +1,32 @@
+# ═══════════════════════════════════════════════
+# FILE: features/password_hashing.feature
+# ═══════════════════════════════════════════════
+Feature: Password hashing pool
+  As an API operator
+  I want bcrypt to run on a bounded worker pool
+  So that a burst of logins neither blocks the event loop nor queues without limit
+
+  Scenario: Logins are verified through the pool
+    Given a user "henry@test.com" with password "Henry222!" exists
+    And I note the password hasher counts
+    When I login with email "henry@test.com" and password "Henry222!"
+    Then I receive an access_token and a refresh_token
+    And the password hasher completed 1 more job
+    When I login with email "henry@test.com" and password "WrongPass1!"
+    Then I should receive an UnauthenticatedError
+    And the password hasher completed 2 more jobs
+
+  Scenario: Jobs beyond the queue depth are rejected
+    Given a password hasher of its own with 1 worker and a queue depth of 2
+    When 3 passwords are hashed at once
+    Then 2 hashes succeeded and 1 was rejected with ResourceExhaustedError
+    And the hasher counts 2 submitted, 2 completed, 0 failed and 1 rejected with none in flight
+
+  Scenario: The pool counts verifications and failures
+    Given a password hasher of its own with 2 workers and a queue depth of 4
+    When a password is hashed and verified with the right and a wrong password
+    Then the verifications returned "True,False"
+    When a password is verified against a malformed hash
+    Then the verification raised ValueError
+    And the hasher counts 4 submitted, 3 completed, 1 failed and 0 rejected with none in flight
+    And the hasher spent a positive time on its jobs
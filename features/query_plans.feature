@@ -0,0 +1,58 @@
+# ═══════════════════════════════════════════════
+# FILE: features/query_plans.feature
+# ═══════════════════════════════════════════════
+@postgres
+Feature: Query plans on PostgreSQL
+  As a maintainer
+  I want the hot search queries to be served by their indexes
+  So that they stay fast as the catalog grows
+
+  Background:
+    Given a PostgreSQL database seeded with 5000 rows per table
+
+  Scenario Outline: Substring search uses the trigram index
+    When I explain the search on "<column>" for "<term>"
+    Then the plan uses index "<index>"
+
+    Examples:
+      | column           | term   | index                    |
+      | movies.title     | altese | ix_movies_title_trgm     |
+      | genres.name      | ilm No | ix_genres_name_trgm      |
+      | users.first_name | umphr  | ix_users_first_name_trgm |
+      | users.last_name  | ogar   | ix_users_last_name_trgm  |
+
+  Scenario: Full-text search uses the search vector index
+    When I explain the movie full-text search for "maltese falcon"
+    Then the plan uses index "ix_movies_search_vector"
+
+  Scenario: An estimated total binds the search terms into the planner query
+    Given the estimated total cap is 3
+    When I estimate the total of movies titled "Movie" or "O'Hara: %(x)s :y"
+    Then the estimated total exceeds 3
+
+  Scenario Outline: Watch and rating listings are read in index order
+    When I explain the first page of the <listing> listing with include_total "none"
+    Then the plan uses index "<index>"
+    And the plan does not sort
+
+    Examples:
+      | listing                | index                                            |
+      | watch history          | ix_user_watch_movie_user_uuid_created_at         |
+      | watched history        | ix_user_watch_movie_user_uuid_status_created_at  |
+      | movie watchers         | ix_user_watch_movie_movie_uuid_created_at        |
+      | watched movie watchers | ix_user_watch_movie_movie_uuid_status_created_at |
+      | movie raters by score  | ix_user_rate_movie_movie_uuid_score              |
+      | user ratings by date   | ix_user_rate_movie_user_uuid_created_at          |
+
+  Scenario Outline: Counted watch and rating listings still find their rows through an index
+    When I explain the first page of the <listing> listing with include_total "exact"
+    Then the plan scans an index starting with "<prefix>"
+
+    Examples:
+      | listing                | prefix                            |
+      | watch history          | ix_user_watch_movie_user_uuid_    |
+      | watched history        | ix_user_watch_movie_user_uuid_    |
+      | movie watchers         | ix_user_watch_movie_movie_uuid_   |
+      | watched movie watchers | ix_user_watch_movie_movie_uuid_   |
+      | movie raters by score  | ix_user_rate_movie_movie_uuid_    |
+      | user ratings by date   | ix_user_rate_movie_user_uuid_     |
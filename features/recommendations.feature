@@ -0,0 +1,75 @@
+# ═══════════════════════════════════════════════
+# FILE: features/recommendations.feature
+# ═══════════════════════════════════════════════
+Feature: Movie recommendations
+  As a user
+  I want to see movies similar to the ones I like
+  So that I can find something new to watch
+
+  Background:
+    Given these users watched these movies:
+      | user  | movies              |
+      | ann   | Alien,Aliens        |
+      | bob   | Alien,Aliens        |
+      | carol | Alien,Aliens,Heat   |
+      | dave  | Heat,Brick          |
+      | erin  | Heat,Brick          |
+      | me    | Alien               |
+
+  Scenario: Movies with the same audience are the most similar
+    When the recommendations are refreshed
+    And I fetch the movies similar to "Alien"
+    Then the recommended titles are "Aliens,Heat"
+
+  Scenario: Movies nobody watched together are not similar
+    When the recommendations are refreshed
+    And I fetch the movies similar to "Brick"
+    Then the recommended titles are "Heat"
+
+  Scenario: Recommendations skip the movies the user already has
+    Given I am logged in as "me@test.com"
+    When the recommendations are refreshed
+    And I fetch my recommendations
+    Then the recommended titles are "Aliens,Heat"
+
+  Scenario: Ratings weigh more than watch entries
+    Given "me" watched "Brick" and rated it 5
+    And I am logged in as "me@test.com"
+    When the recommendations are refreshed
+    And I fetch my recommendations
+    Then the recommended titles are "Heat,Aliens"
+
+  Scenario: Users and movies without history get empty lists
+    Given movie "Solaris" in genre "Sci-Fi" exists
+    And I am logged in as "newbie@test.com"
+    When the recommendations are refreshed
+    And I fetch the movies similar to "Solaris"
+    Then no movies are recommended
+    When I fetch my recommendations
+    Then no movies are recommended
+
+  Scenario: Requests are served from the snapshot until the next refresh
+    Given the recommendations were refreshed
+    And these users watched these movies:
+      | user  | movies        |
+      | frank | Brick,Solaris |
+    When I fetch the movies similar to "Solaris"
+    Then no movies are recommended
+    When the recommendations are refreshed
+    And I fetch the movies similar to "Solaris"
+    Then the recommended titles are "Brick"
+
+  Scenario: Factorization recommends what the user's audience watched
+    Given I am logged in as "me@test.com"
+    When the factorization model is trained
+    And I fetch my factor recommendations
+    Then the top recommended title is "Aliens"
+    And the recommended titles do not include "Alien"
+
+  Scenario: New activity is folded in without retraining
+    Given the factorization model was trained
+    And "newbie" watched "Brick" and rated it 5
+    And I am logged in as "newbie@test.com"
+    When I fetch my factor recommendations
+    Then the top recommended title is "Heat"
+    And the recommended titles do not include "Brick"
@@ -0,0 +1,18 @@
+# ═══════════════════════════════════════════════
+# FILE: features/recommendations_single_movie.feature
+# ═══════════════════════════════════════════════
+Feature: Movie recommendations for a one-movie catalog
+  As a user of a brand-new catalog
+  I want recommendations to come back empty rather than fail
+  So that the recommendation pages work before the catalog grows
+
+  Scenario: A catalog of one movie has nothing to recommend
+    Given these users watched these movies:
+      | user | movies  |
+      | me   | Solaris |
+    And I am logged in as "me@test.com"
+    When the recommendations are refreshed
+    And I fetch my recommendations
+    Then no movies are recommended
+    When I fetch the movies similar to "Solaris"
+    Then no movies are recommended
@@ -0,0 +1,56 @@
+# ═══════════════════════════════════════════════
+# FILE: features/response_cache.feature
+# ═══════════════════════════════════════════════
+Feature: Response cache
+  As an API operator
+  I want the busiest read endpoints answered from a cache that writes evict precisely
+  So that repeated reads skip the database without ever serving a stale response
+
+  Scenario: A repeated read is served from the cache
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    When I fetch movie "The Matrix" 3 times
+    Then the route "GET /api/v1/movies/{movie_uuid}" has 2 hits and 1 miss
+
+  Scenario: Rating a movie evicts only that movie's cached responses
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    And I have a movie "Inception" with status "watched"
+    And the movie and raters of "The Matrix" and "Inception" were fetched
+    When I rate "The Matrix" with 4 stars
+    Then "The Matrix" has 1 rating averaging 4.0
+    And the raters of "The Matrix" are named "Test"
+    And the movie and raters of "Inception" are served from the cache
+
+  Scenario: A user renamed through another worker is no longer shown under the old name
+    Given I am logged in as "user@test.com"
+    And I have rated "The Matrix" with 4 stars
+    And the raters of "The Matrix" are named "Test"
+    When another worker renames "user@test.com" to "Neo"
+    Then the raters of "The Matrix" are named "Neo"
+
+  Scenario: A new genre evicts the cached genre searches
+    Given genres "Drama,Docudrama" exist
+    Then searching genres for "drama" finds "Docudrama,Drama"
+    When I create a genre named "Melodrama" with no description
+    Then searching genres for "drama" finds "Docudrama,Drama,Melodrama"
+
+  Scenario: A response loaded while a write commits is not stored
+    Given a response cache of its own holding at most 10 entries
+    When a response is loaded while a write commits
+    And the same response is requested again
+    Then that cache counts 0 hits and 2 misses on route "GET /probe"
+
+  Scenario: The memory backend stays within its bounds and reports its use per route
+    Given a response cache of its own holding at most 2 entries
+    When 3 different responses are loaded on route "GET /probe"
+    Then that cache holds 2 entries on route "GET /probe" in a positive number of bytes
+
+  Scenario: Workers sharing a Redis server serve and evict each other's entries
+    Given two workers caching responses on a shared Redis stand-in
+    When worker "A" requests the probe response
+    And worker "B" requests the probe response
+    Then worker "B" served it from the cache
+    When worker "B" evicts the probe entity
+    And worker "A" requests the probe response
+    Then worker "A" loaded it 2 times
@@ -0,0 +1,51 @@
+# ═══════════════════════════════════════════════
+# FILE: features/single_flight.feature
+# ═══════════════════════════════════════════════
+Feature: Single-flight reads
+  As an API operator
+  I want concurrent identical reads to share one query
+  So that a burst of requests for a hot movie costs the database one read
+
+  Scenario: Concurrent reads of a movie's watchers share one query
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    When 5 concurrent requests read the watchers of "The Matrix"
+    Then they all get the same watchers
+    And 4 of the 5 reads on "GET /api/v1/watchlist/movie/{movie_uuid}/watchers" were coalesced
+
+  Scenario: Concurrent cache misses on a movie share one query
+    Given I am logged in as "user@test.com"
+    And I have a movie "The Matrix" with status "watched"
+    When 5 concurrent requests read the movie "The Matrix"
+    Then they all get the same movie
+    And 4 of the 5 reads on "GET /api/v1/movies/{movie_uuid}" were coalesced
+
+  Scenario: A failed load fails every read waiting for it, and the next read retries
+    Given a single flight of its own
+    When 3 identical probe reads start
+    And the probe load fails
+    Then 3 probe reads failed
+    And the probe counts 1 failed load
+    When the probe is read again
+    Then the probe was loaded 2 times
+
+  Scenario: A cancelled read leaves the others waiting for the load
+    Given a single flight of its own
+    When 3 identical probe reads start
+    And 1 of the probe reads is cancelled
+    And the probe load completes
+    Then 2 probe reads got the result of load 1
+
+  Scenario: Cancelling every read cancels the load
+    Given a single flight of its own
+    When 3 identical probe reads start
+    And 3 of the probe reads are cancelled
+    Then the probe load was cancelled
+    And no probe read is in flight
+
+  Scenario: A read after a write does not join a load that started before it
+    Given a single flight of its own
+    When 3 identical probe reads start
+    And a probe read starts after a write
+    And the probe load completes
+    Then the probe was loaded 2 times
@@ -70,6 +70,15 @@ def step_have_logged_in_as(context, email: str):
     arun(context, login_user_async(context, email, password))
 
 
+@given("the admin guard trusts the access-token role claim")
+def step_trust_role_claim(context):
+    from src.configs.runtime_config import RuntimeConfig
+
+    principal_config = RuntimeConfig.global_config().PRINCIPAL
+    context.add_cleanup(setattr, principal_config, "TRUST_ROLE_CLAIM", principal_config.TRUST_ROLE_CLAIM)
+    principal_config.TRUST_ROLE_CLAIM = True
+
+
 # ── WHEN steps ────────────────────────────────────────────────────────────────
 
 @when(
@@ -162,6 +171,49 @@ def step_get_me(context):
         context.last_error = exc
 
 
+@when("I resolve the principal for the access_token")
+def step_resolve_principal(context):
+    """Resolve the role/active flags the admin guard would use for the stored access token."""
+    context.last_error = None
+    context.last_result = None
+
+    async def _do():
+        user_uuid = JWTUtils.get_user_uuid_from_token(
+            context.current_access_token, expected_type="access"
+        )
+        return await context.auth_logic.get_principal(user_uuid=user_uuid)
+
+    try:
+        result = arun(context, _do())
+        context.last_result = result
+    except Exception as exc:
+        context.last_error = exc
+
+
+@when("I pass the admin guard with the access_token")
+def step_pass_admin_guard(context):
+    """Run the admin route dependency on the stored access token, as FastAPI would."""
+    from src.utils.auth_dependencies import get_current_admin_user_uuid
+
+    context.last_error = None
+    context.last_result = None
+    payload = JWTUtils.get_payload_from_token(context.current_access_token, expected_type="access")
+    try:
+        context.last_result = arun(
+            context, get_current_admin_user_uuid(payload=payload, auth_logic=context.auth_logic)
+        )
+    except Exception as exc:
+        context.last_error = exc
+
+
+@when('"{email}" is promoted to super user')
+def step_promote_to_super_user(context, email: str):
+    from src.models.dtos.user.domain.v1.user_domain_interface_dtos import UpdateUserInputDTOV1
+
+    update_dto = UpdateUserInputDTOV1(user_uuid=context.users[email], is_super_user=True)
+    arun(context, context.user_logic.update_user(input_dto=update_dto))
+
+
 # ── THEN / AND steps ─────────────────────────────────────────────────────────
 
 @then("registration succeeds")
@@ -216,3 +268,19 @@ def step_profile_is_active(context):
     assert context.last_result.is_active is True, (
         f"Expected profile is_active=True, got {context.last_result.is_active}"
     )
+
+
+@then("the admin guard lets me through")
+def step_admin_guard_passed(context):
+    assert context.last_error is None, f"Expected the admin guard to pass, got: {context.last_error}"
+    assert context.last_result == context.current_user_uuid, (
+        f"Expected the guard to return {context.current_user_uuid}, got {context.last_result}"
+    )
+
+
+@then("the principal is_super_user is {expected}")
+def step_principal_is_super_user(context, expected: str):
+    assert context.last_error is None, f"Expected principal lookup to succeed, got: {context.last_error}"
+    assert context.last_result.is_super_user is (expected == "True"), (
+        f"Expected principal is_super_user={expected}, got {context.last_result.is_super_user}"
+    )
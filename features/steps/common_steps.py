@@ -176,6 +176,15 @@ def step_expect_not_found(context):
     )
 
 
+@then("I should receive an InvalidArgumentError")
+def step_expect_invalid_argument(context):
+    from archipy.models.errors import InvalidArgumentError
+
+    assert isinstance(context.last_error, InvalidArgumentError), (
+        f"Expected InvalidArgumentError, got {type(context.last_error)}: {context.last_error}"
+    )
+
+
 @then('I should get error "{message}"')
 def step_expect_error_message(context, message: str):
     """
@@ -0,0 +1,346 @@
+# ═══════════════════════════════════════════════
+# FILE: features/steps/concurrency_steps.py
+# ═══════════════════════════════════════════════
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+
+from archipy.models.entities.sqlalchemy.base_entities import BaseEntity
+from archipy.models.errors import AlreadyExistsError, InvalidArgumentError
+from behave import given, then, when
+from sqlalchemy import func, insert, select, text
+
+from features.steps.common_steps import arun
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import (
+    ApplyMovieStatsDeltaCommandDTO,
+)
+from src.models.dtos.rating.repository.rating_repository_interface_dtos import (
+    CreateRatingCommandDTO,
+    UpdateRatingCommandDTO,
+)
+from src.models.dtos.watch.repository.watch_repository_interface_dtos import CreateWatchCommandDTO
+from src.models.entities import (
+    GenreEntity,
+    MovieEntity,
+    MovieStatsEntity,
+    UserEntity,
+    UserRateMovieEntity,
+    UserWatchMovieEntity,
+)
+from src.models.types.watch_status_type import WatchStatusType
+from src.utils.transaction_utils import retry_on_serialization_failure
+
+# Racing requests need their own committed transactions, so they run in a scratch schema that is
+# dropped afterwards instead of inside one rolled-back transaction.
+_SCHEMA = "concurrent_writes_check"
+_TABLES = {"user_watch_movie": UserWatchMovieEntity, "user_rate_movie": UserRateMovieEntity}
+_ERRORS = {"AlreadyExistsError": AlreadyExistsError, "InvalidArgumentError": InvalidArgumentError}
+
+
+async def _in_schema(session) -> None:
+    await session.execute(text(f"SET LOCAL search_path TO {_SCHEMA}, public"))
+
+
+async def _create_schema(adapter, watched: bool) -> tuple[uuid.UUID, uuid.UUID]:
+    session = adapter.get_session()
+    try:
+        await session.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await session.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await _in_schema(session)
+        await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn = await session.connection()
+        await conn.run_sync(BaseEntity.metadata.create_all)
+        user_uuid, genre_uuid, movie_uuid = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        await session.execute(
+            insert(UserEntity).values(
+                user_uuid=user_uuid,
+                first_name="Race",
+                last_name="Condition",
+                email="race@concurrency.test",
+                username="race",
+                hashed_password="x",
+            )
+        )
+        await session.execute(insert(GenreEntity).values(genre_uuid=genre_uuid, name="Thriller"))
+        await session.execute(insert(MovieEntity).values(movie_uuid=movie_uuid, title="Heat", genre_uuid=genre_uuid))
+        if watched:
+            await session.execute(
+                insert(UserWatchMovieEntity).values(
+                    user_uuid=user_uuid,
+                    movie_uuid=movie_uuid,
+                    status=WatchStatusType.WATCHED.value,
+                )
+            )
+        await session.commit()
+        return user_uuid, movie_uuid
+    finally:
+        await session.close()
+
+
+async def _drop_schema(adapter) -> None:
+    session = adapter.get_session()
+    try:
+        await session.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await session.commit()
+    finally:
+        await session.close()
+
+
+async def _request(adapter, write: Callable[[], Awaitable[object]]):
+    """One request: its own task, hence its own scoped session and transaction."""
+    session = adapter.get_session()
+    try:
+        await _in_schema(session)
+        result = await write()
+        await session.commit()
+        return result
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def _count_rows(adapter, table: str, user_uuid: uuid.UUID, movie_uuid: uuid.UUID) -> int:
+    entity = _TABLES[table]
+    session = adapter.get_session()
+    try:
+        await _in_schema(session)
+        result = await session.execute(
+            select(func.count()).where(entity.user_uuid == user_uuid, entity.movie_uuid == movie_uuid)
+        )
+        return result.scalar_one()
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+async def _seed_watchers(adapter, movie_uuid: uuid.UUID, n: int) -> list[uuid.UUID]:
+    """Add ``n`` more users who have all watched the movie."""
+    user_uuids = [uuid.uuid4() for _ in range(n)]
+    session = adapter.get_session()
+    try:
+        await _in_schema(session)
+        for index, user_uuid in enumerate(user_uuids):
+            await session.execute(
+                insert(UserEntity).values(
+                    user_uuid=user_uuid,
+                    first_name="Fan",
+                    last_name=str(index),
+                    email=f"fan{index}@concurrency.test",
+                    username=f"fan{index}",
+                    hashed_password="x",
+                )
+            )
+            await session.execute(
+                insert(UserWatchMovieEntity).values(
+                    user_uuid=user_uuid,
+                    movie_uuid=movie_uuid,
+                    status=WatchStatusType.WATCHED.value,
+                )
+            )
+        await session.commit()
+        return user_uuids
+    finally:
+        await session.close()
+
+
+async def _read_stats(adapter, movie_uuid: uuid.UUID):
+    session = adapter.get_session()
+    try:
+        await _in_schema(session)
+        result = await session.execute(
+            select(MovieStatsEntity.rating_count, MovieStatsEntity.rating_sum).where(
+                MovieStatsEntity.movie_uuid == movie_uuid,
+            )
+        )
+        return result.first()
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+async def _read_score(adapter, rate_uuid: uuid.UUID) -> int:
+    session = adapter.get_session()
+    try:
+        await _in_schema(session)
+        result = await session.execute(
+            select(UserRateMovieEntity.score).where(UserRateMovieEntity.rate_uuid == rate_uuid),
+        )
+        return result.scalar_one()
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+def _race(context, n: int, make_write: Callable[[uuid.UUID, uuid.UUID], Callable[[], Awaitable[object]]]) -> None:
+    adapter = context.postgres_adapter
+
+    async def _run():
+        user_uuid, movie_uuid = await _create_schema(adapter, watched=getattr(context, "race_watched", False))
+        try:
+            write = make_write(user_uuid, movie_uuid)
+            # Retried as the watch and rating logics retry: a row committed after a racer's snapshot fails it
+            # with a serialization error, and its next attempt sees the row and reports the duplicate.
+            request = retry_on_serialization_failure(lambda: _request(adapter, write))
+            tasks = [asyncio.create_task(request()) for _ in range(n)]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            counts = {table: await _count_rows(adapter, table, user_uuid, movie_uuid) for table in _TABLES}
+            return outcomes, counts
+        finally:
+            await _drop_schema(adapter)
+
+    context.race_outcomes, context.race_row_counts = arun(context, _run())
+
+
+@given("the racing user has watched the movie")
+def step_racing_user_watched(context):
+    context.race_watched = True
+
+
+@when("{n:d} concurrent requests watch the same movie for the same user")
+def step_concurrent_watches(context, n: int):
+    # Imported lazily: the adapter modules must load after the SQLite engine patch in tests.container.
+    from src.repositories.watch.adapters.watch_postgres_adapter import WatchPostgresAdapter
+
+    watch_adapter = WatchPostgresAdapter(adapter=context.postgres_adapter)
+
+    def make_write(user_uuid, movie_uuid):
+        command = CreateWatchCommandDTO(user_uuid=user_uuid, movie_uuid=movie_uuid, status=WatchStatusType.WATCHED)
+        return lambda: watch_adapter.create_watch(input_dto=command)
+
+    _race(context, n, make_write)
+
+
+@when("{n:d} concurrent requests rate the same movie for the same user")
+def step_concurrent_ratings(context, n: int):
+    from src.repositories.rating.adapters.rating_postgres_adapter import RatingPostgresAdapter
+
+    rating_adapter = RatingPostgresAdapter(adapter=context.postgres_adapter)
+
+    def make_write(user_uuid, movie_uuid):
+        command = CreateRatingCommandDTO(user_uuid=user_uuid, movie_uuid=movie_uuid, score=4)
+        return lambda: rating_adapter.create_rating(input_dto=command)
+
+    _race(context, n, make_write)
+
+
+@when("{n:d} different users concurrently rate the same movie")
+def step_concurrent_ratings_by_different_users(context, n: int):
+    from src.repositories.movie_stats.adapters.movie_stats_postgres_adapter import MovieStatsPostgresAdapter
+    from src.repositories.rating.adapters.rating_postgres_adapter import RatingPostgresAdapter
+
+    adapter = context.postgres_adapter
+    rating_adapter = RatingPostgresAdapter(adapter=adapter)
+    stats_adapter = MovieStatsPostgresAdapter(adapter=adapter)
+
+    def make_request(user_uuid, movie_uuid):
+        # What RatingLogic.rate_movie does: the rating and its stats delta in one retried transaction.
+        async def write():
+            response = await rating_adapter.create_rating(
+                input_dto=CreateRatingCommandDTO(user_uuid=user_uuid, movie_uuid=movie_uuid, score=4),
+            )
+            await stats_adapter.apply_delta(
+                input_dto=ApplyMovieStatsDeltaCommandDTO(movie_uuid=movie_uuid, rating_count=1, rating_sum=4),
+            )
+            return response
+
+        return retry_on_serialization_failure(lambda: _request(adapter, write))
+
+    async def _run():
+        _, movie_uuid = await _create_schema(adapter, watched=False)
+        try:
+            user_uuids = await _seed_watchers(adapter, movie_uuid, n)
+            tasks = [asyncio.create_task(make_request(user_uuid, movie_uuid)()) for user_uuid in user_uuids]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            return outcomes, await _read_stats(adapter, movie_uuid)
+        finally:
+            await _drop_schema(adapter)
+
+    context.race_outcomes, context.race_stats = arun(context, _run())
+
+
+@when("{n:d} concurrent requests re-rate the racing user's rating of the movie")
+def step_concurrent_re_ratings(context, n: int):
+    from src.repositories.movie_stats.adapters.movie_stats_postgres_adapter import MovieStatsPostgresAdapter
+    from src.repositories.rating.adapters.rating_postgres_adapter import RatingPostgresAdapter
+
+    adapter = context.postgres_adapter
+    rating_adapter = RatingPostgresAdapter(adapter=adapter)
+    stats_adapter = MovieStatsPostgresAdapter(adapter=adapter)
+
+    def make_request(user_uuid, movie_uuid, rate_uuid, score):
+        # What RatingLogic.update_rating does: the new score and the delta from the one it replaced, together.
+        async def write():
+            response = await rating_adapter.update_rating(
+                input_dto=UpdateRatingCommandDTO(rate_uuid=rate_uuid, user_uuid=user_uuid, score=score),
+            )
+            delta = response.score - response.previous_score
+            await stats_adapter.apply_delta(
+                input_dto=ApplyMovieStatsDeltaCommandDTO(movie_uuid=movie_uuid, rating_sum=delta),
+            )
+            return response
+
+        return retry_on_serialization_failure(lambda: _request(adapter, write))
+
+    async def _rate_once(user_uuid, movie_uuid):
+        async def write():
+            response = await rating_adapter.create_rating(
+                input_dto=CreateRatingCommandDTO(user_uuid=user_uuid, movie_uuid=movie_uuid, score=1),
+            )
+            await stats_adapter.apply_delta(
+                input_dto=ApplyMovieStatsDeltaCommandDTO(movie_uuid=movie_uuid, rating_count=1, rating_sum=1),
+            )
+            return response.rate_uuid
+
+        return await _request(adapter, write)
+
+    async def _run():
+        user_uuid, movie_uuid = await _create_schema(adapter, watched=True)
+        try:
+            rate_uuid = await _rate_once(user_uuid, movie_uuid)
+            requests = [make_request(user_uuid, movie_uuid, rate_uuid, index % 5 + 1) for index in range(n)]
+            tasks = [asyncio.create_task(request()) for request in requests]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            return outcomes, await _read_stats(adapter, movie_uuid), await _read_score(adapter, rate_uuid)
+        finally:
+            await _drop_schema(adapter)
+
+    context.race_outcomes, context.race_stats, context.race_final_score = arun(context, _run())
+
+
+@then("the movie stats count {n:d} rating summing to its final score")
+def step_race_stats_follow_final_score(context, n: int):
+    step_race_stats(context, n, context.race_final_score)
+
+
+@then("the movie stats count {n:d} ratings summing to {total:d}")
+def step_race_stats(context, n: int, total: int):
+    stats = context.race_stats
+    assert stats is not None, "No movie_stats row was written"
+    assert (stats.rating_count, stats.rating_sum) == (n, total), (
+        f"Expected {n} ratings summing to {total}, got {stats.rating_count} summing to {stats.rating_sum}"
+    )
+
+
+@then("exactly {n:d} request succeeds")
+def step_race_winners(context, n: int):
+    winners = [o for o in context.race_outcomes if not isinstance(o, BaseException)]
+    assert len(winners) == n, f"Expected {n} successful insert(s), got {len(winners)}"
+
+
+@then("the other {n:d} requests receive an {error_name}")
+def step_race_losers(context, n: int, error_name: str):
+    expected_type = _ERRORS[error_name]
+    errors = [o for o in context.race_outcomes if isinstance(o, BaseException)]
+    assert len(errors) == n, f"Expected {n} failures, got {len(errors)}"
+    unexpected = [e for e in errors if not isinstance(e, expected_type)]
+    assert not unexpected, f"Unexpected errors: {[(e, e.__cause__) for e in unexpected]!r}"
+
+
+@then('the user has {n:d} "{table}" row for the movie')
+def step_race_row_count(context, n: int, table: str):
+    count = context.race_row_counts[table]
+    assert count == n, f"Expected {n} {table} row(s), got {count}"
@@ -0,0 +1,231 @@
+import inspect
+
+from behave import given, then, when
+from fastapi import Response
+from pydantic.fields import FieldInfo
+
+from features.steps.common_steps import arun
+from src.utils.etag_utils import ETagUtils
+
+
+def _call_controller(context, controller, **kwargs) -> Response:
+    """Call a controller as FastAPI would for a request with only ``kwargs`` set; returns the response sent.
+
+    Query and header parameters left out take their declared defaults. A controller returning a DTO has it
+    sent with the headers it set on ``response``.
+    """
+    for name, parameter in inspect.signature(controller).parameters.items():
+        if name not in kwargs and isinstance(parameter.default, FieldInfo):
+            kwargs[name] = parameter.default.default
+    response = Response()
+    result = arun(context, controller(response=response, **kwargs))
+    if isinstance(result, Response):
+        return result
+    response.status_code = 200
+    response.body = result.model_dump_json().encode()
+    return response
+
+
+def _admin_uuid(context):
+    # The auth dependency has already run by the time a controller does; any user stands in for it here.
+    return next(iter(context.users.values()), None)
+
+
+def _read_movie(context, title: str, if_none_match: str | None) -> Response:
+    # Imported lazily: the adapter modules must load after the SQLite engine patch in tests.container.
+    from src.controllers.movie.v1.movie_controller import get_movie
+
+    return _call_controller(
+        context,
+        get_movie,
+        movie_uuid=context.movies[title],
+        _admin_uuid=_admin_uuid(context),
+        if_none_match=if_none_match,
+        movie_logic=context.movie_logic,
+    )
+
+
+def _read_genre(context, name: str, if_none_match: str | None) -> Response:
+    from src.controllers.genre.v1.genre_controller import get_genre
+
+    return _call_controller(
+        context,
+        get_genre,
+        genre_uuid=context.genres[name],
+        _admin_uuid=_admin_uuid(context),
+        if_none_match=if_none_match,
+        genre_logic=context.genre_logic,
+    )
+
+
+def _read_user(context, email: str, if_none_match: str | None) -> Response:
+    from src.controllers.user.v1.user_controller import get_user
+
+    return _call_controller(
+        context,
+        get_user,
+        user_uuid=context.users[email],
+        _admin_uuid=_admin_uuid(context),
+        if_none_match=if_none_match,
+        logic=context.container.user_logic(),
+    )
+
+
+def _read_movies_list(context, if_none_match: str | None, page: int = 1) -> Response:
+    from src.controllers.movie.v1.movie_controller import search_movies
+
+    return _call_controller(
+        context,
+        search_movies,
+        _admin_uuid=_admin_uuid(context),
+        title=None,
+        genre_uuid=None,
+        page=page,
+        if_none_match=if_none_match,
+        movie_logic=context.movie_logic,
+    )
+
+
+def _read_genres_list(context, if_none_match: str | None) -> Response:
+    from src.controllers.genre.v1.genre_controller import search_genres
+
+    return _call_controller(
+        context,
+        search_genres,
+        _admin_uuid=_admin_uuid(context),
+        name=None,
+        if_none_match=if_none_match,
+        genre_logic=context.genre_logic,
+    )
+
+
+def _read_users_list(context, if_none_match: str | None) -> Response:
+    from src.controllers.user.v1.user_controller import search_users
+
+    return _call_controller(
+        context,
+        search_users,
+        _admin_uuid=_admin_uuid(context),
+        first_name=None,
+        last_name=None,
+        birth_date_from=None,
+        birth_date_to=None,
+        if_none_match=if_none_match,
+        logic=context.container.user_logic(),
+    )
+
+
+_READERS = {
+    "movie": _read_movie,
+    "genre": _read_genre,
+    "user": _read_user,
+    "movies list": _read_movies_list,
+    "genres list": _read_genres_list,
+    "users list": _read_users_list,
+}
+
+
+def _read(context, resource: str, name: str | None, if_none_match: str | None = None) -> Response:
+    if name is None:
+        return _READERS[resource](context, if_none_match)
+    return _READERS[resource](context, name, if_none_match)
+
+
+def _still_matches(context, resource: str, name: str | None = None) -> bool:
+    response = _read(context, resource, name, if_none_match=context.held_tags[(resource, name)])
+    return response.status_code == 304
+
+
+def _hold_tag(context, resource: str, name: str | None) -> None:
+    context.held_tags = getattr(context, "held_tags", {})
+    context.held_tags[(resource, name)] = _read(context, resource, name).headers["ETag"]
+
+
+@given('I hold the tag of {resource} "{name}"')
+def step_hold_tag(context, resource: str, name: str):
+    _hold_tag(context, resource, name)
+
+
+@given("I hold the tag of the {resource}")
+def step_hold_list_tag(context, resource: str):
+    _hold_tag(context, resource, None)
+
+
+@then('the tag of {resource} "{name}" still matches')
+def step_tag_still_matches(context, resource: str, name: str):
+    assert _still_matches(context, resource, name), f"The tag of {resource} {name} changed with nothing written"
+
+
+@then('the tag of {resource} "{name}" no longer matches')
+def step_tag_no_longer_matches(context, resource: str, name: str):
+    assert not _still_matches(context, resource, name), f"The tag of {resource} {name} outlived a change"
+
+
+@then("the tag of the {resource} still matches")
+def step_list_tag_still_matches(context, resource: str):
+    assert _still_matches(context, resource), f"The tag of the {resource} changed with nothing it shows written"
+
+
+@then("the tag of the {resource} no longer matches")
+def step_list_tag_no_longer_matches(context, resource: str):
+    assert not _still_matches(context, resource), f"The tag of the {resource} outlived a change"
+
+
+@then("pages {first:d} and {second:d} of the movies list have different tags")
+def step_pages_have_different_tags(context, first: int, second: int):
+    first_tag = _read_movies_list(context, None, page=first).headers["ETag"]
+    second_tag = _read_movies_list(context, None, page=second).headers["ETag"]
+    assert first_tag != second_tag, "Two pages share a tag"
+
+
+@when('I read {resource} "{name}"')
+def step_read(context, resource: str, name: str):
+    context.last_response = _read(context, resource, name)
+    context.read_tag = context.last_response.headers.get("ETag")
+
+
+@when("I read the {resource}")
+def step_read_list(context, resource: str):
+    step_read(context, resource, None)
+
+
+@when('I revalidate {resource} "{name}" with If-None-Match {header}')
+def step_revalidate(context, resource: str, name: str, header: str):
+    # ETAG stands for the tag of the previous read.
+    context.last_response = _read(context, resource, name, if_none_match=header.replace("ETAG", context.read_tag))
+
+
+@when("I revalidate the {resource} with If-None-Match {header}")
+def step_revalidate_list(context, resource: str, header: str):
+    step_revalidate(context, resource, None, header)
+
+
+@then("the response is {status:d} with the tag of the previous read")
+def step_response_with_read_tag(context, status: int):
+    response = context.last_response
+    assert response.status_code == status, f"Expected {status}, got {response.status_code}"
+    assert response.headers.get("ETag") == context.read_tag, f"Expected ETag {context.read_tag}: {response.headers}"
+    assert response.headers.get("Cache-Control") == "private, no-cache", response.headers
+    if status == 304:
+        assert not response.body, f"Expected a 304 without a body, got {response.body!r}"
+    else:
+        assert response.body, "Expected the resource in the body"
+
+
+@then("the response is 200 with a new tag")
+def step_response_with_new_tag(context):
+    response = context.last_response
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    etag = response.headers.get("ETag")
+    assert etag and etag != context.read_tag, f"Expected a tag other than {context.read_tag}, got {etag}"
+
+
+@then('an If-None-Match of {header} is {outcome} for the tag "{tag}"')
+def step_if_none_match(context, header: str, outcome: str, tag: str):
+    matched = ETagUtils.matches(header, f'"{tag}"')
+    assert matched == (outcome == "a match"), f"If-None-Match {header} against {tag}: expected {outcome}"
+
+
+@then('a request without If-None-Match is no match for the tag "{tag}"')
+def step_no_if_none_match(context, tag: str):
+    assert not ETagUtils.matches(None, f'"{tag}"'), "A request without If-None-Match matched"
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import uuid
+
+from archipy.models.errors import InvalidArgumentError, NotFoundError
+from behave import given, then, when
+from sqlalchemy import delete
+
+from features.steps.common_steps import arun
+from features.steps.movie_steps import ensure_genre
+from src.models.dtos.genre.domain.v1.genre_domain_interface_dtos import (
+    DeleteGenreInputDTOV1,
+    GetGenreInputDTOV1,
+    SearchGenreInputDTOV1,
+    UpdateGenreInputDTOV1,
+)
+from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import (
+    BulkCreateMovieInputDTOV1,
+    CreateMovieInputDTOV1,
+)
+from src.models.entities.genre_entity import GenreEntity
+from src.models.types.genre_sort_type import GenreSortColumnType
+
+
+async def _execute_directly(context, statement) -> None:
+    """Change the database without going through the logic, as another worker would."""
+    session = context.container.sqlite_adapter().get_session()
+    await session.execute(statement)
+    await session.commit()
+
+
+@given("the genre catalog was loaded")
+def step_genre_catalog_loaded(context):
+    arun(context, context.genre_logic.refresh())
+
+
+@when("the genres table is emptied directly in the database")
+def step_empty_genres_table(context):
+    arun(context, _execute_directly(context, delete(GenreEntity)))
+
+
+@when('another worker creates the genre "{name}"')
+def step_genre_created_elsewhere(context, name: str):
+    genre_uuid = uuid.uuid4()
+
+    async def _do():
+        session = context.container.sqlite_adapter().get_session()
+        session.add(GenreEntity(genre_uuid=genre_uuid, name=name))
+        await session.commit()
+
+    arun(context, _do())
+    context.genres[name] = genre_uuid
+
+
+@when('I rename genre "{name}" to "{new_name}"')
+def step_rename_genre(context, name: str, new_name: str):
+    dto = UpdateGenreInputDTOV1(genre_uuid=context.genres[name], name=new_name)
+    arun(context, context.genre_logic.update_genre(input_dto=dto))
+
+
+@when('I delete genre "{name}"')
+def step_delete_genre(context, name: str):
+    dto = DeleteGenreInputDTOV1(genre_uuid=context.genres[name])
+    arun(context, context.genre_logic.delete_genre(input_dto=dto))
+
+
+@when('I create a movie titled "{title}" in an unknown genre')
+def step_create_movie_in_unknown_genre(context, title: str):
+    dto = CreateMovieInputDTOV1(title=title, genre_uuid=uuid.uuid4())
+    try:
+        context.last_result = arun(context, context.movie_logic.create_movie(input_dto=dto))
+    except Exception as exc:
+        context.last_error = exc
+
+
+@when('I bulk create movies "{titles}" in genre "{genre_name}" where "{orphan}" has an unknown genre')
+def step_bulk_create_with_unknown_genre(context, titles: str, genre_name: str, orphan: str):
+    genre_uuid = arun(context, ensure_genre(context, genre_name))
+    dto = BulkCreateMovieInputDTOV1(
+        movies=[
+            CreateMovieInputDTOV1(title=title, genre_uuid=uuid.uuid4() if title == orphan else genre_uuid)
+            for title in titles.split(",")
+        ],
+    )
+    try:
+        context.last_result = arun(context, context.movie_logic.bulk_create_movie(input_dto=dto))
+    except Exception as exc:
+        context.last_error = exc
+
+
+@then('searching genres for "{term}" finds "{names}"')
+def step_search_genres_finds(context, term: str, names: str):
+    dto = SearchGenreInputDTOV1.create(name=term, page_size=50, sort_column=GenreSortColumnType.NAME, sort_order="asc")
+    result = arun(context, context.genre_logic.search_genres(input_dto=dto))
+    found = [genre.name for genre in result.genres]
+    assert found == names.split(","), f"Expected {names.split(',')}, got {found}"
+    assert result.total == len(found), f"Expected a total of {len(found)}, got {result.total}"
+
+
+@then('fetching genre "{name}" returns it')
+def step_fetch_genre(context, name: str):
+    result = arun(context, context.genre_logic.get_genre(input_dto=GetGenreInputDTOV1(genre_uuid=context.genres[name])))
+    assert result.name == name, f"Expected genre '{name}', got '{result.name}'"
+
+
+@then('fetching genre "{name}" raises NotFoundError')
+def step_fetch_genre_not_found(context, name: str):
+    try:
+        arun(context, context.genre_logic.get_genre(input_dto=GetGenreInputDTOV1(genre_uuid=context.genres[name])))
+    except NotFoundError:
+        return
+    raise AssertionError(f"Genre '{name}' can still be fetched")
+
+
+@then('the unknown genres are at indexes "{indexes}"')
+def step_unknown_genre_indexes(context, indexes: str):
+    assert isinstance(context.last_error, InvalidArgumentError), (
+        f"Expected InvalidArgumentError, got {type(context.last_error)}: {context.last_error}"
+    )
+    expected = [int(index) for index in indexes.split(",")]
+    actual = context.last_error.additional_data.get("unknown_genre_indexes")
+    assert actual == expected, f"Expected unknown genres at {expected}, got {actual}"
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+
+from behave import given, then, when
+from sqlalchemy import update
+
+from features.steps.common_steps import arun
+from features.steps.genre_steps import _execute_directly
+from src.models.entities.genre_entity import GenreEntity
+from src.models.entities.user_entity import UserEntity
+from src.models.types.entity_type import EntityType
+
+
+async def _publish_from_another_worker(context, entity_type: EntityType, entity_uuid: uuid.UUID) -> None:
+    other_worker = context.container.invalidation_bus().join()
+    try:
+        await other_worker.publish(entity_type, [entity_uuid])
+    finally:
+        other_worker.leave()
+
+
+def _subscribe_recorder(context, name: str, bus) -> None:
+    context.bus_events[name] = []
+
+    async def _record(event) -> None:
+        context.bus_events[name].append(event)
+
+    bus.subscribe(EntityType.GENRE, _record)
+    context.workers[name] = bus
+
+
+@when('another worker renames genre "{name}" to "{new_name}"')
+def step_genre_renamed_elsewhere(context, name: str, new_name: str):
+    genre_uuid = context.genres[name]
+
+    async def _do():
+        await _execute_directly(
+            context,
+            update(GenreEntity).where(GenreEntity.genre_uuid == genre_uuid).values(name=new_name),
+        )
+        await _publish_from_another_worker(context, EntityType.GENRE, genre_uuid)
+
+    arun(context, _do())
+
+
+@when('another worker promotes "{email}" to super user')
+def step_promoted_elsewhere(context, email: str):
+    user_uuid = context.users[email]
+
+    async def _do():
+        await _execute_directly(
+            context,
+            update(UserEntity).where(UserEntity.user_uuid == user_uuid).values(is_super_user=True),
+        )
+        await _publish_from_another_worker(context, EntityType.USER, user_uuid)
+
+    arun(context, _do())
+
+
+@when('another worker deactivates "{email}"')
+def step_deactivated_elsewhere(context, email: str):
+    user_uuid = context.users[email]
+
+    async def _do():
+        await _execute_directly(
+            context,
+            update(UserEntity).where(UserEntity.user_uuid == user_uuid).values(is_active=False),
+        )
+        await _publish_from_another_worker(context, EntityType.USER, user_uuid)
+
+    arun(context, _do())
+
+
+@given("two workers sharing an invalidation bus")
+def step_two_in_memory_workers(context):
+    # Imported lazily: the adapter modules must load after the SQLite engine patch in tests.container.
+    from src.utils.invalidation_bus import InMemoryInvalidationBus
+
+    context.bus_events = {}
+    context.workers = {}
+    worker_a = InMemoryInvalidationBus()
+    _subscribe_recorder(context, "A", worker_a)
+    _subscribe_recorder(context, "B", worker_a.join())
+
+
+@given("two workers listening on Postgres")
+def step_two_postgres_workers(context):
+    from src.configs.runtime_config import InvalidationConfig
+    from src.utils.invalidation_bus import PostgresInvalidationBus
+
+    context.bus_events = {}
+    context.workers = {}
+    # A channel of its own, so a concurrent run on the same database is not heard.
+    config = InvalidationConfig(CHANNEL=f"test_{uuid.uuid4().hex}", HEALTH_CHECK_INTERVAL_SECONDS=1.0)
+    for name in ("A", "B"):
+        bus = PostgresInvalidationBus(adapter=context.postgres_adapter, config=config)
+        _subscribe_recorder(context, name, bus)
+        context.add_cleanup(lambda bus=bus: arun(context, bus.stop()))
+
+    async def _start_and_wait_until_listening():
+        for bus in context.workers.values():
+            bus.start()
+        deadline = time.monotonic() + 10
+        while not all(bus.stats().is_listening for bus in context.workers.values()):
+            assert time.monotonic() < deadline, "The Postgres listeners did not connect"
+            await asyncio.sleep(0.05)
+
+    arun(context, _start_and_wait_until_listening())
+
+
+@given('worker "{name}" has a failing genre handler')
+def step_failing_handler(context, name: str):
+    async def _fail(event) -> None:
+        raise RuntimeError("handler failed")
+
+    context.workers[name].subscribe(EntityType.GENRE, _fail)
+
+
+@when('worker "{name}" publishes {count:d} genre change')
+@when('worker "{name}" publishes {count:d} genre changes')
+def step_publish_genre_changes(context, name: str, count: int):
+    async def _do():
+        for _ in range(count):
+            await context.workers[name].publish(EntityType.GENRE, [uuid.uuid4()])
+
+    arun(context, _do())
+
+
+@when('worker "{name}" publishes a genre change and {outcome}')
+def step_publish_in_transaction(context, name: str, outcome: str):
+    adapter = context.postgres_adapter
+
+    async def _do():
+        session = adapter.get_session()
+        try:
+            await context.workers[name].publish(EntityType.GENRE, [uuid.uuid4()])
+            if outcome == "commits":
+                await session.commit()
+            else:
+                await session.rollback()
+        finally:
+            await session.close()
+
+    # A task of its own, hence a scoped session of its own.
+    arun(context, asyncio.ensure_future(_do()))
+
+
+@then('worker "{name}" handled {count:d} genre change')
+@then('worker "{name}" handled {count:d} genre changes')
+def step_handled_genre_changes(context, name: str, count: int):
+    handled = len(context.bus_events[name])
+    assert handled == count, f"Expected worker {name} to handle {count} genre changes, got {handled}"
+
+
+@then('worker "{name}" receives exactly {count:d} genre change within {seconds:d} seconds')
+def step_receives_genre_changes(context, name: str, count: int, seconds: int):
+    async def _wait():
+        deadline = time.monotonic() + seconds
+        while len(context.bus_events[name]) < count and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        # Long enough for a rolled-back notification to show up if it were ever sent.
+        await asyncio.sleep(0.5)
+
+    arun(context, _wait())
+    step_handled_genre_changes(context, name, count)
+
+
+@then('worker "{name}" counted {count:d} handler failure')
+def step_handler_failures(context, name: str, count: int):
+    failures = context.workers[name].stats().handler_failures
+    assert failures == count, f"Expected {count} handler failures on worker {name}, got {failures}"
+
+
+@then('worker "{name}" measured the propagation lag of {count:d} events')
+def step_measured_lag(context, name: str, count: int):
+    stats = context.workers[name].stats()
+    assert stats.lag_samples == count, f"Expected {count} lag samples, got {stats.lag_samples}"
+    assert 0 <= stats.lag_p50_seconds <= stats.lag_p99_seconds <= stats.lag_max_seconds, stats
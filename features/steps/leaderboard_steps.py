@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from behave import given, then, when
+from sqlalchemy import update
+
+from features.steps.common_steps import arun, create_user_async
+from features.steps.movie_steps import ensure_movie
+from src.models.dtos.leaderboard.domain.v1.leaderboard_domain_interface_dtos import GetLeaderboardInputDTOV1
+from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import RateMovieInputDTOV1
+from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import WatchMovieInputDTOV1
+from src.models.entities import UserRateMovieEntity, UserWatchMovieEntity
+from src.models.types.watch_status_type import WatchStatusType
+
+
+async def _new_audience_member(context) -> object:
+    """Register a fresh user; the leaderboards need several raters per movie."""
+    index = len(context.users)
+    email = f"audience{index}@test.com"
+    await create_user_async(context, email, f"audience{index}", "Audience", str(index), "Password123!")
+    return context.users[email]
+
+
+async def _watch_as(context, user_uuid, title: str, status: WatchStatusType) -> None:
+    dto = WatchMovieInputDTOV1(movie_uuid=context.movies[title], user_uuid=user_uuid, status=status)
+    await context.watch_logic.watch_movie(input_dto=dto)
+
+
+@given('"{title}" in genre "{genre_name}" is rated "{scores}" by different users')
+def step_rated_by_audience(context, title: str, genre_name: str, scores: str):
+    async def _do():
+        await ensure_movie(context, title, genre_name)
+        for score in scores.split(","):
+            user_uuid = await _new_audience_member(context)
+            await _watch_as(context, user_uuid, title, WatchStatusType.WATCHED)
+            dto = RateMovieInputDTOV1(movie_uuid=context.movies[title], user_uuid=user_uuid, score=int(score))
+            await context.rating_logic.rate_movie(input_dto=dto)
+
+    arun(context, _do())
+
+
+@given('"{title}" in genre "{genre_name}" is added to {n:d} watchlists')
+def step_added_to_watchlists(context, title: str, genre_name: str, n: int):
+    async def _do():
+        await ensure_movie(context, title, genre_name)
+        for _ in range(n):
+            user_uuid = await _new_audience_member(context)
+            await _watch_as(context, user_uuid, title, WatchStatusType.WANT_TO_WATCH)
+
+    arun(context, _do())
+
+
+@given('all activity on "{title}" happened {days:d} days ago')
+def step_backdate_activity(context, title: str, days: int):
+    # SQLite stores timestamps as naive UTC text.
+    created_at = (datetime.now(UTC) - timedelta(days=days)).replace(tzinfo=None)
+    movie_uuid = context.movies[title]
+
+    async def _do():
+        session = context.container.sqlite_adapter().get_session()
+        for entity in (UserRateMovieEntity, UserWatchMovieEntity):
+            await session.execute(update(entity).where(entity.movie_uuid == movie_uuid).values(created_at=created_at))
+        await session.commit()
+
+    arun(context, _do())
+
+
+@given("the leaderboards were refreshed")
+@when("the leaderboards are refreshed")
+def step_refresh_leaderboards(context):
+    context.last_result = arun(context, context.leaderboard_logic.refresh())
+
+
+@when("I fetch the top rated movies")
+def step_fetch_top_rated(context):
+    dto = GetLeaderboardInputDTOV1()
+    context.last_result = arun(context, context.leaderboard_logic.get_top_rated(input_dto=dto))
+
+
+@when('I fetch the top rated movies in genre "{genre_name}"')
+def step_fetch_top_rated_in_genre(context, genre_name: str):
+    dto = GetLeaderboardInputDTOV1(genre_uuid=context.genres[genre_name])
+    context.last_result = arun(context, context.leaderboard_logic.get_top_rated(input_dto=dto))
+
+
+@when("I fetch the trending movies")
+def step_fetch_trending(context):
+    dto = GetLeaderboardInputDTOV1()
+    context.last_result = arun(context, context.leaderboard_logic.get_trending(input_dto=dto))
+
+
+@then('the leaderboard titles are "{titles}"')
+def step_leaderboard_titles(context, titles: str):
+    expected = [title for title in titles.split(",") if title]
+    actual = [movie.title for movie in context.last_result.movies]
+    assert actual == expected, f"Expected {expected}, got {actual}"
+
+
+@then("the leaderboard reports its age and refresh interval")
+def step_leaderboard_snapshot_info(context):
+    result = context.last_result
+    assert result.age_seconds >= 0, f"Negative snapshot age {result.age_seconds}"
+    assert result.refresh_interval_seconds > 0, f"Unexpected refresh interval {result.refresh_interval_seconds}"
+    assert result.generated_at <= datetime.now(UTC), f"Snapshot generated in the future: {result.generated_at}"
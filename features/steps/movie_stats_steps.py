@@ -0,0 +1,118 @@
+# ═══════════════════════════════════════════════
+# FILE: features/steps/movie_stats_steps.py
+# ═══════════════════════════════════════════════
+from __future__ import annotations
+
+import uuid
+
+from behave import given, then, when
+from sqlalchemy import delete, update
+
+from features.steps.common_steps import arun
+from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import GetMovieInputDTOV1
+from src.models.dtos.movie_stats.domain.v1.movie_stats_domain_interface_dtos import ReconcileMovieStatsInputDTOV1
+from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import GetMovieRatingHistogramInputDTOV1
+from src.models.entities import MovieStatsEntity
+
+
+def _get_stats(context, title: str):
+    dto = GetMovieInputDTOV1(movie_uuid=context.movies[title])
+    return arun(context, context.movie_logic.get_movie(input_dto=dto)).stats
+
+
+def _assert_rating(stats, count: int, average: str) -> None:
+    # "nothing" stands for a movie without ratings.
+    expected_average = None if average == "nothing" else float(average)
+    assert stats.rating_count == count, f"Expected {count} rating(s), got {stats.rating_count}"
+    assert stats.average_rating == expected_average, f"Expected average {expected_average}, got {stats.average_rating}"
+
+
+@given('the stats of "{title}" are {drift}')
+def step_stats_drift(context, title: str, drift: str):
+    """Corrupt the stored counters behind the write paths' back."""
+    movie_uuid = context.movies[title]
+    if drift == "inflated":
+        statement = (
+            update(MovieStatsEntity)
+            .where(MovieStatsEntity.movie_uuid == movie_uuid)
+            .values(rating_count=MovieStatsEntity.rating_count + 2)
+        )
+    elif drift == "misbucketed":
+        statement = (
+            update(MovieStatsEntity)
+            .where(MovieStatsEntity.movie_uuid == movie_uuid)
+            .values(score_1_count=MovieStatsEntity.score_1_count + 1)
+        )
+    else:
+        statement = delete(MovieStatsEntity).where(MovieStatsEntity.movie_uuid == movie_uuid)
+
+    async def _do():
+        session = context.container.sqlite_adapter().get_session()
+        await session.execute(statement)
+        await session.commit()
+
+    arun(context, _do())
+
+
+@when("I reconcile the movie stats")
+def step_reconcile(context):
+    dto = ReconcileMovieStatsInputDTOV1()
+    context.last_result = arun(context, context.movie_stats_logic.reconcile(input_dto=dto))
+
+
+@when("I reconcile and repair the movie stats")
+def step_reconcile_and_repair(context):
+    dto = ReconcileMovieStatsInputDTOV1(repair=True)
+    context.last_result = arun(context, context.movie_stats_logic.reconcile(input_dto=dto))
+
+
+@when('I fetch the rating histogram of "{title}"')
+def step_fetch_histogram(context, title: str):
+    dto = GetMovieRatingHistogramInputDTOV1(movie_uuid=context.movies[title])
+    context.last_result = arun(context, context.rating_logic.get_movie_rating_histogram(input_dto=dto))
+
+
+@when("I fetch the rating histogram of an unknown movie")
+def step_fetch_unknown_histogram(context):
+    dto = GetMovieRatingHistogramInputDTOV1(movie_uuid=uuid.uuid4())
+    try:
+        arun(context, context.rating_logic.get_movie_rating_histogram(input_dto=dto))
+    except Exception as exc:
+        context.last_error = exc
+
+
+@then('the histogram counts from 1 to 5 stars are "{counts}"')
+def step_histogram_counts(context, counts: str):
+    histogram = context.last_result
+    expected = [int(count) for count in counts.split(",")]
+    actual = [bucket.count for bucket in histogram.buckets]
+    assert [bucket.score for bucket in histogram.buckets] == [1, 2, 3, 4, 5], f"Unexpected buckets {histogram.buckets!r}"
+    assert actual == expected, f"Expected histogram {expected}, got {actual}"
+    assert histogram.rating_count == sum(expected), f"Expected {sum(expected)} ratings, got {histogram.rating_count}"
+
+
+@then("{n:d} movie is reported as drifted")
+def step_drift_count(context, n: int):
+    drifts = context.last_result.drifts
+    assert len(drifts) == n, f"Expected {n} drifted movie(s), got {drifts!r}"
+
+
+@then('"{title}" has {count:d} rating averaging {average}')
+def step_rating_stats(context, title: str, count: int, average: str):
+    _assert_rating(_get_stats(context, title), count, average)
+
+
+@then('"{title}" has {watched:d} watched and {want_to_watch:d} want-to-watch entries')
+def step_watch_stats(context, title: str, watched: int, want_to_watch: int):
+    stats = _get_stats(context, title)
+    assert stats.watched_count == watched, f"Expected {watched} watched, got {stats.watched_count}"
+    assert stats.want_to_watch_count == want_to_watch, (
+        f"Expected {want_to_watch} want-to-watch, got {stats.want_to_watch_count}"
+    )
+
+
+@then('the found "{title}" has {count:d} rating averaging {average}')
+def step_found_rating_stats(context, title: str, count: int, average: str):
+    matching = [movie for movie in context.last_result.movies if movie.title == title]
+    assert matching, f"'{title}' not in the search results"
+    _assert_rating(matching[0].stats, count, average)
@@ -8,8 +8,10 @@ from behave import given, then, when
 from features.steps.common_steps import arun
 
 from src.models.dtos.genre.domain.v1.genre_domain_interface_dtos import (
+    BulkCreateGenreInputDTOV1,
     CreateGenreInputDTOV1,
     GetGenreInputDTOV1,
+    SearchGenreInputDTOV1,
 )
 from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import (
     CreateMovieInputDTOV1,
@@ -24,10 +26,16 @@ from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import (
     UpdateRatingInputDTOV1,
 )
 from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import (
+    DeleteWatchInputDTOV1,
     UpdateWatchStatusInputDTOV1,
     WatchMovieInputDTOV1,
 )
+from src.configs.runtime_config import RuntimeConfig
+from src.models.types.movie_sort_type import MovieSortColumnType
+from src.models.types.rating_sort_type import RatingSortColumnType
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.watch_status_type import WatchStatusType
+from src.utils.import_utils import ImportUtils
 from archipy.models.errors import AlreadyExistsError, InvalidArgumentError, NotFoundError
 
 
@@ -113,11 +121,30 @@ def step_genre_exists(context, name: str):
     arun(context, ensure_genre(context, name))
 
 
+@given('genres "{names}" exist')
+def step_genres_exist(context, names: str):
+    for name in names.split(","):
+        arun(context, ensure_genre(context, name))
+
+
+@given("the estimated total cap is {cap:d}")
+def step_estimated_total_cap(context, cap: int):
+    config = RuntimeConfig.global_config().PAGINATION
+    previous = config.ESTIMATED_TOTAL_CAP
+    config.ESTIMATED_TOTAL_CAP = cap
+    context.add_cleanup(setattr, config, "ESTIMATED_TOTAL_CAP", previous)
+
+
 @given('a genre "{genre_name}" and movie "{title}" exist')
 def step_genre_and_movie_exist(context, genre_name: str, title: str):
     arun(context, ensure_movie(context, title, genre_name))
 
 
+@given('movie "{title}" in genre "{genre_name}" with description "{desc}" exists')
+def step_movie_in_genre_with_description_exists(context, title: str, genre_name: str, desc: str):
+    arun(context, ensure_movie(context, title, genre_name, description=desc))
+
+
 @given('movie "{title}" in genre "{genre_name}" exists')
 def step_movie_in_genre_exists(context, title: str, genre_name: str):
     arun(context, ensure_movie(context, title, genre_name))
@@ -161,6 +188,68 @@ def step_create_genre_no_desc(context, name: str):
         context.last_error = exc
 
 
+def _bulk_create_genres(context, names: str, skip_conflicts: bool) -> None:
+    context.last_error = None
+    context.last_result = None
+
+    async def _do():
+        dto = BulkCreateGenreInputDTOV1(
+            genres=[CreateGenreInputDTOV1(name=name.strip()) for name in names.split(",")],
+            skip_conflicts=skip_conflicts,
+        )
+        return await context.genre_logic.bulk_create_genre(input_dto=dto)
+
+    try:
+        result = arun(context, _do())
+        context.last_result = result
+        for genre in result.genres:
+            context.genres[genre.name] = genre.genre_uuid
+    except Exception as exc:
+        context.last_error = exc
+
+
+@when('I bulk create genres "{names}" skipping conflicts')
+def step_bulk_create_genres_skipping_conflicts(context, names: str):
+    _bulk_create_genres(context, names, skip_conflicts=True)
+
+
+@when('I bulk create genres "{names}"')
+def step_bulk_create_genres(context, names: str):
+    _bulk_create_genres(context, names, skip_conflicts=False)
+
+
+def _import_catalog(context, parse) -> None:
+    context.last_error = None
+    context.last_result = None
+    content = context.text
+    for name, genre_uuid in context.genres.items():
+        content = content.replace(f"<{name}>", str(genre_uuid))
+    payload = content.encode()
+
+    async def _chunks():
+        # Small uneven chunks so records are split across reads like a real upload.
+        for start in range(0, len(payload), 7):
+            yield payload[start : start + 7]
+
+    async def _do():
+        return await context.movie_logic.import_movies(records=parse(_chunks(), max_line_bytes=1024))
+
+    try:
+        context.last_result = arun(context, _do())
+    except Exception as exc:
+        context.last_error = exc
+
+
+@when("I import the NDJSON catalog")
+def step_import_ndjson_catalog(context):
+    _import_catalog(context, ImportUtils.iter_ndjson_records)
+
+
+@when("I import the CSV catalog")
+def step_import_csv_catalog(context):
+    _import_catalog(context, ImportUtils.iter_csv_records)
+
+
 @when('I create a movie titled "{title}" in genre "{genre_name}" with description "{desc}"')
 def step_create_movie(context, title: str, genre_name: str, desc: str):
     context.last_error = None
@@ -217,6 +306,55 @@ def step_search_movies_by_genre(context, genre_name: str):
         context.last_error = exc
 
 
+@when('I search genres page {page:d} of size {size:d} with include_total "{mode}"')
+def step_search_genres_with_total_mode(context, page: int, size: int, mode: str):
+    async def _do():
+        dto = SearchGenreInputDTOV1.create(page=page, page_size=size, include_total=TotalModeType(mode))
+        return await context.genre_logic.search_genres(input_dto=dto)
+
+    context.last_result = arun(context, _do())
+
+
+@when('I full-text search movies for "{term}"')
+def step_full_text_search_movies(context, term: str):
+    async def _do():
+        dto = SearchMovieInputDTOV1.create(search=term, page_size=50)
+        return await context.movie_logic.search_movies(input_dto=dto)
+
+    context.last_result = arun(context, _do())
+
+
+@when('I search movies titled "{term}"')
+def step_search_movies_by_title(context, term: str):
+    async def _do():
+        dto = SearchMovieInputDTOV1.create(title=term, page_size=50, sort_column=MovieSortColumnType.TITLE)
+        return await context.movie_logic.search_movies(input_dto=dto)
+
+    context.last_result = arun(context, _do())
+
+
+@when('I page through genre "{genre_name}" movies by title {order} with page_size {size:d}')
+def step_page_movies_by_cursor(context, genre_name: str, order: str, size: int):
+    async def _do():
+        titles, cursor = [], None
+        while True:
+            dto = SearchMovieInputDTOV1.create(
+                genre_uuid=context.genres[genre_name],
+                page_size=size,
+                sort_column=MovieSortColumnType.TITLE,
+                sort_order=order,
+                cursor=cursor,
+            )
+            result = await context.movie_logic.search_movies(input_dto=dto)
+            titles.extend(movie.title for movie in result.movies)
+            if result.next_cursor is None:
+                return titles
+            assert result.total is None or cursor is None, "Cursor pages should not compute a total"
+            cursor = result.next_cursor
+
+    context.paged_titles = arun(context, _do())
+
+
 @when('I update movie "{title}" description to "{desc}"')
 def step_update_movie_description(context, title: str, desc: str):
     context.last_error = None
@@ -271,6 +409,41 @@ def step_genre_has_uuid(context):
     assert context.last_result.genre_uuid is not None, "genre_uuid is None"
 
 
+@then("{n:d} genres are created in bulk")
+def step_n_genres_created_in_bulk(context, n: int):
+    assert context.last_error is None, f"Bulk create failed: {context.last_error}"
+    assert len(context.last_result.genres) == n, (
+        f"Expected {n} genres to be created, got {len(context.last_result.genres)}"
+    )
+
+
+@then('the bulk conflicts are at indexes "{indexes}"')
+def step_bulk_conflicts_at_indexes(context, indexes: str):
+    expected = [int(index) for index in indexes.split(",")]
+    if context.last_error is not None:
+        actual = context.last_error.additional_data.get("conflicting_indexes")
+    else:
+        actual = context.last_result.conflicting_indexes
+    assert actual == expected, f"Expected conflicting indexes {expected}, got {actual}"
+
+
+@then("the import reports {inserted:d} inserted, {duplicates:d} duplicates and {invalid:d} invalid")
+def step_import_summary(context, inserted: int, duplicates: int, invalid: int):
+    assert context.last_error is None, f"Import failed: {context.last_error}"
+    summary = context.last_result
+    actual = (summary.inserted, summary.duplicates, summary.invalid)
+    assert actual == (inserted, duplicates, invalid), (
+        f"Expected inserted/duplicates/invalid {(inserted, duplicates, invalid)}, got {actual}"
+    )
+
+
+@then('the import errors are on lines "{lines}"')
+def step_import_error_lines(context, lines: str):
+    expected = sorted(int(line) for line in lines.split(","))
+    actual = sorted(error.line for error in context.last_result.errors)
+    assert actual == expected, f"Expected errors on lines {expected}, got {actual}: {context.last_result.errors}"
+
+
 @then('the movie is created with title "{title}"')
 def step_movie_created_with_title(context, title: str):
     assert context.last_error is None, (
@@ -314,6 +487,25 @@ def step_receive_exactly_n_movies(context, n: int):
     assert total == n, f"Expected exactly {n} movie(s), got {total}"
 
 
+@then("the search total is {total} and exact is {exact}")
+def step_search_total_is(context, total: str, exact: str):
+    expected_total = None if total == "None" else int(total)
+    assert context.last_result.total == expected_total, f"Expected total {total}, got {context.last_result.total}"
+    assert str(context.last_result.total_is_exact) == exact, f"Expected exact={exact}"
+
+
+@then('the found titles are "{titles}"')
+def step_found_titles_are(context, titles: str):
+    found = [movie.title for movie in context.last_result.movies]
+    assert found == titles.split(","), f"Expected {titles.split(',')}, got {found}"
+
+
+@then('the paged titles are "{titles}"')
+def step_paged_titles_are(context, titles: str):
+    expected = titles.split(",")
+    assert context.paged_titles == expected, f"Expected {expected}, got {context.paged_titles}"
+
+
 @then('the movie title is "{title}"')
 def step_movie_title_is(context, title: str):
     assert len(context.last_result.movies) > 0, "No movies in results"
@@ -419,6 +611,61 @@ def step_have_rated_with_stars(context, title: str, n: int):
     arun(context, _do())
 
 
+@when('I try to watch "{title}" again')
+def step_try_watch_again(context, title: str):
+    context.last_error = None
+
+    async def _do():
+        dto = WatchMovieInputDTOV1(
+            movie_uuid=context.movies[title],
+            user_uuid=context.current_user_uuid,
+            status=WatchStatusType.WANT_TO_WATCH,
+        )
+        return await context.watch_logic.watch_movie(input_dto=dto)
+
+    try:
+        arun(context, _do())
+    except Exception as exc:
+        context.last_error = exc
+
+
+@when('I mark "{title}" as "{status}"')
+def step_mark_watch_status(context, title: str, status: str):
+    async def _do():
+        dto = UpdateWatchStatusInputDTOV1(
+            watch_uuid=context.watches[(str(context.current_user_uuid), title)],
+            user_uuid=context.current_user_uuid,
+            status=_STATUS_MAP[status],
+        )
+        return await context.watch_logic.update_watch_status(input_dto=dto)
+
+    context.last_result = arun(context, _do())
+
+
+@when('I remove "{title}" from my watchlist')
+def step_remove_from_watchlist(context, title: str):
+    context.last_error = None
+
+    async def _do():
+        dto = DeleteWatchInputDTOV1(user_uuid=context.current_user_uuid, movie_uuid=context.movies[title])
+        await context.watch_logic.delete_watch(input_dto=dto)
+
+    try:
+        arun(context, _do())
+    except Exception as exc:
+        context.last_error = exc
+
+
+@then('the watch entry status is "{status}"')
+def step_watch_entry_status(context, status: str):
+    assert context.last_result.status == _STATUS_MAP[status], f"Expected {status}, got {context.last_result.status}"
+
+
+@then("the removal succeeds")
+def step_removal_succeeds(context):
+    assert context.last_error is None, f"Removal raised: {context.last_error!r}"
+
+
 # ── Rating WHEN steps ─────────────────────────────────────────────────────────
 
 @when('I rate "{title}" with {n:d} stars')
@@ -492,10 +739,10 @@ def step_update_rating(context, title: str, n: int):
             user_uuid=context.current_user_uuid,
             score=n,
         )
-        await context.rating_logic.update_rating(input_dto=dto)
+        return await context.rating_logic.update_rating(input_dto=dto)
 
     try:
-        arun(context, _do())
+        context.last_result = arun(context, _do())
     except Exception as exc:
         context.last_error = exc
 
@@ -517,6 +764,21 @@ def step_fetch_my_ratings(context):
         context.last_error = exc
 
 
+@when('I fetch page {page:d} of my ratings by score "{order}" with page_size {size:d}')
+def step_fetch_my_ratings_page(context, page: int, order: str, size: int):
+    async def _do():
+        dto = GetMyRatingsInputDTOV1.create(
+            user_uuid=context.current_user_uuid,
+            page=page,
+            page_size=size,
+            sort_column=RatingSortColumnType.SCORE,
+            sort_order=order,
+        )
+        return await context.rating_logic.get_my_ratings(input_dto=dto)
+
+    context.last_result = arun(context, _do())
+
+
 # ── Rating THEN steps ─────────────────────────────────────────────────────────
 
 @then("the movie rating should be {n:d}")
@@ -543,6 +805,15 @@ def step_my_rating_for_is(context, title: str, n: int):
     )
 
 
+@then('the ratings page lists "{titles}" out of {total:d}')
+def step_ratings_page_lists(context, titles: str, total: int):
+    # "-" stands for an empty page.
+    expected = [] if titles == "-" else titles.split(",")
+    actual = [r.title for r in context.last_result.ratings]
+    assert actual == expected, f"Expected {expected}, got {actual}"
+    assert context.last_result.total == total, f"Expected total {total}, got {context.last_result.total}"
+
+
 @then('"{title}" appears in my ratings with score {n:d}')
 def step_title_appears_in_ratings_with_score(context, title: str, n: int):
     assert context.last_error is None, f"Fetch ratings raised: {context.last_error}"
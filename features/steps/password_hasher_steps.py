@@ -0,0 +1,99 @@
+import asyncio
+
+from behave import given, then, when
+
+from features.steps.common_steps import arun
+
+
+def _completed(context) -> int:
+    return context.container.password_hasher().stats().completed
+
+
+@given("I note the password hasher counts")
+def step_note_hasher_counts(context):
+    # The container's hasher lives across scenarios; only this scenario's jobs are counted.
+    context.hasher_completed_before = _completed(context)
+
+
+@then("the password hasher completed {count:d} more job")
+@then("the password hasher completed {count:d} more jobs")
+def step_hasher_completed_more(context, count: int):
+    counted = _completed(context) - context.hasher_completed_before
+    assert counted == count, f"Expected {count} more completed jobs, got {counted}"
+
+
+@given("a password hasher of its own with {workers:d} worker and a queue depth of {depth:d}")
+@given("a password hasher of its own with {workers:d} workers and a queue depth of {depth:d}")
+def step_own_password_hasher(context, workers: int, depth: int):
+    from src.configs.runtime_config import PasswordHasherConfig
+    from src.utils.password_hasher import PasswordHasher
+
+    context.hasher = PasswordHasher(config=PasswordHasherConfig(MAX_WORKERS=workers, MAX_QUEUE_DEPTH=depth))
+    context.add_cleanup(context.hasher.shutdown)
+
+
+@when("{count:d} passwords are hashed at once")
+def step_hash_at_once(context, count: int):
+    async def _do():
+        # Every call is made before the first hash can finish, which takes bcrypt a good fraction of a second.
+        hashes = [context.hasher.hash_password(f"Password{i}!") for i in range(count)]
+        return await asyncio.gather(*hashes, return_exceptions=True)
+
+    context.hash_results = arun(context, _do())
+
+
+@then("{succeeded:d} hashes succeeded and {rejected:d} was rejected with ResourceExhaustedError")
+def step_hashes_rejected(context, succeeded: int, rejected: int):
+    from archipy.models.errors import ResourceExhaustedError
+
+    hashes = [result for result in context.hash_results if isinstance(result, str)]
+    errors = [result for result in context.hash_results if isinstance(result, ResourceExhaustedError)]
+    assert (len(hashes), len(errors)) == (succeeded, rejected), f"Unexpected results: {context.hash_results}"
+
+
+@when("a password is hashed and verified with the right and a wrong password")
+def step_hash_and_verify(context):
+    async def _do():
+        hashed = await context.hasher.hash_password("Password123!")
+        return [
+            await context.hasher.verify_password("Password123!", hashed),
+            await context.hasher.verify_password("WrongPass1!", hashed),
+        ]
+
+    context.verify_results = arun(context, _do())
+
+
+@then('the verifications returned "{results}"')
+def step_verifications_returned(context, results: str):
+    expected = [result == "True" for result in results.split(",")]
+    assert context.verify_results == expected, f"Expected {expected}, got {context.verify_results}"
+
+
+@when("a password is verified against a malformed hash")
+def step_verify_malformed(context):
+    context.last_error = None
+    try:
+        arun(context, context.hasher.verify_password("Password123!", "not-a-bcrypt-hash"))
+    except Exception as exc:
+        context.last_error = exc
+
+
+@then("the verification raised ValueError")
+def step_verification_raised(context):
+    assert isinstance(context.last_error, ValueError), f"Expected ValueError, got {context.last_error!r}"
+
+
+@then(
+    "the hasher counts {submitted:d} submitted, {completed:d} completed, {failed:d} failed and {rejected:d} rejected"
+    " with none in flight"
+)
+def step_hasher_counts(context, submitted: int, completed: int, failed: int, rejected: int):
+    stats = context.hasher.stats()
+    counted = (stats.submitted, stats.completed, stats.failed, stats.rejected, stats.in_flight)
+    assert counted == (submitted, completed, failed, rejected, 0), f"Unexpected counts: {stats}"
+
+
+@then("the hasher spent a positive time on its jobs")
+def step_hasher_time(context):
+    stats = context.hasher.stats()
+    assert stats.total_seconds > 0 and 0 < stats.max_seconds <= stats.total_seconds, f"Unexpected times: {stats}"
@@ -0,0 +1,292 @@
+# ═══════════════════════════════════════════════
+# FILE: features/steps/query_plan_steps.py
+# ═══════════════════════════════════════════════
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+
+from archipy.models.entities.sqlalchemy.base_entities import BaseEntity
+from archipy.models.types.sort_order_type import SortOrderType
+from behave import given, then, when
+from sqlalchemy import insert, or_, select, text
+
+from features.steps.common_steps import arun
+from src.models.entities import GenreEntity, MovieEntity, UserEntity, UserRateMovieEntity, UserWatchMovieEntity
+from src.models.types.rating_sort_type import RatingSortColumnType
+from src.models.types.total_mode_type import TotalModeType
+from src.models.types.watch_sort_type import WatchSortColumnType
+from src.models.types.watch_status_type import WatchStatusType
+from src.utils.sql_utils import SQLUtils
+
+_ENTITIES = {"movies": MovieEntity, "genres": GenreEntity, "users": UserEntity}
+_LISTING_FANOUT = 70
+_STATUSES = [WatchStatusType.WATCHED.value, WatchStatusType.WANT_TO_WATCH.value]
+_SEED_EPOCH = datetime(2026, 1, 1)
+_PAGE_SIZE = 10
+
+
+class _ExplainingAdapter:
+    """Stands in for an adapter's ``AsyncSQLAlchemyPort``: EXPLAINs each statement, then runs it as usual."""
+
+    def __init__(self, adapter) -> None:
+        self._adapter = adapter
+        self.plans: list[str] = []
+
+    def get_session(self):
+        return self._adapter.get_session()
+
+    async def execute(self, statement, params=None):
+        session = self._adapter.get_session()
+        compiled = statement.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+        result = await session.execute(text(f"EXPLAIN {compiled}"))
+        self.plans.append("\n".join(result.scalars()))
+        return await self._adapter.execute(statement=statement, params=params)
+
+
+def _page(include_total: TotalModeType, **query) -> dict:
+    from archipy.models.dtos.pagination_dto import PaginationDTO
+
+    return {"pagination": PaginationDTO(page=1, page_size=_PAGE_SIZE), "include_total": include_total, **query}
+
+
+def _watch_listing(by_movie: bool, status: WatchStatusType | None = None):
+    async def read(adapter, user_uuid, movie_uuid, include_total):
+        from archipy.models.dtos.sort_dto import SortDTO
+
+        from src.models.dtos.watch.repository.watch_repository_interface_dtos import (
+            GetMovieWatchersQueryDTO,
+            GetUserWatchHistoryQueryDTO,
+        )
+        from src.repositories.watch.adapters.watch_postgres_adapter import WatchPostgresAdapter
+
+        sort_info = SortDTO[WatchSortColumnType](column=WatchSortColumnType.CREATED_AT, order=SortOrderType.DESCENDING)
+        watch_adapter = WatchPostgresAdapter(adapter=adapter)
+        if by_movie:
+            query = GetMovieWatchersQueryDTO(
+                **_page(include_total, movie_uuid=movie_uuid, sort_info=sort_info, status_filter=status),
+            )
+            await watch_adapter.get_movie_watchers(input_dto=query)
+        else:
+            query = GetUserWatchHistoryQueryDTO(
+                **_page(include_total, user_uuid=user_uuid, sort_info=sort_info, status_filter=status),
+            )
+            await watch_adapter.get_user_watch_history(input_dto=query)
+
+    return read
+
+
+def _rating_listing(by_movie: bool, column: RatingSortColumnType, order: SortOrderType):
+    async def read(adapter, user_uuid, movie_uuid, include_total):
+        from archipy.models.dtos.sort_dto import SortDTO
+
+        from src.models.dtos.rating.repository.rating_repository_interface_dtos import (
+            GetMovieRatersQueryDTO,
+            GetUserRatingsQueryDTO,
+        )
+        from src.repositories.rating.adapters.rating_postgres_adapter import RatingPostgresAdapter
+
+        sort_info = SortDTO[RatingSortColumnType](column=column, order=order)
+        rating_adapter = RatingPostgresAdapter(adapter=adapter)
+        if by_movie:
+            query = GetMovieRatersQueryDTO(**_page(include_total, movie_uuid=movie_uuid, sort_info=sort_info))
+            await rating_adapter.get_movie_raters(input_dto=query)
+        else:
+            query = GetUserRatingsQueryDTO(**_page(include_total, user_uuid=user_uuid, sort_info=sort_info))
+            await rating_adapter.get_user_ratings(input_dto=query)
+
+    return read
+
+
+# The listings as the watch and rating adapters read them. In exact mode the page also carries COUNT(*) OVER(),
+# which reads every matching row anyway, so the planner is free to sort those; the index still has to find them.
+_LISTINGS = {
+    "watch history": _watch_listing(by_movie=False),
+    "watched history": _watch_listing(by_movie=False, status=WatchStatusType.WATCHED),
+    "movie watchers": _watch_listing(by_movie=True),
+    "watched movie watchers": _watch_listing(by_movie=True, status=WatchStatusType.WATCHED),
+    "movie raters by score": _rating_listing(True, RatingSortColumnType.SCORE, SortOrderType.DESCENDING),
+    "user ratings by date": _rating_listing(False, RatingSortColumnType.CREATED_AT, SortOrderType.ASCENDING),
+}
+
+
+async def _seed(session, rows: int) -> dict[str, uuid.UUID]:
+    await session.execute(text("CREATE SCHEMA query_plan_check"))
+    await session.execute(text("SET LOCAL search_path TO query_plan_check, public"))
+    await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn = await session.connection()
+    await conn.run_sync(BaseEntity.metadata.create_all)
+
+    genres = [{"genre_uuid": uuid.uuid4(), "name": "Film Noir"}]
+    genres += [{"genre_uuid": uuid.uuid4(), "name": f"Genre {uuid.uuid4().hex}"} for _ in range(rows - 1)]
+    movies = [{"title": "The Maltese Falcon", "genre_uuid": genres[0]["genre_uuid"]}]
+    movies += [{"title": f"Movie {uuid.uuid4().hex}", "genre_uuid": genres[i]["genre_uuid"]} for i in range(rows - 1)]
+    for movie in movies:
+        movie["movie_uuid"] = uuid.uuid4()
+    users = [
+        {
+            "user_uuid": uuid.uuid4(),
+            "first_name": "Humphrey" if i == 0 else uuid.uuid4().hex,
+            "last_name": "Bogart" if i == 0 else uuid.uuid4().hex,
+            "email": f"user{i}@plan.test",
+            "username": f"user{i}",
+            "hashed_password": "x",
+        }
+        for i in range(rows)
+    ]
+    await session.execute(insert(GenreEntity), genres)
+    await session.execute(insert(MovieEntity), movies)
+    await session.execute(insert(UserEntity), users)
+    # Each of the first _LISTING_FANOUT users watched and rated ~rows/_LISTING_FANOUT movies, and each of the
+    # first movies has _LISTING_FANOUT watchers and raters, so a listing matches a small slice of the table.
+    pairs = [(users[k % _LISTING_FANOUT], movies[k // _LISTING_FANOUT], k) for k in range(rows)]
+    await session.execute(
+        insert(UserWatchMovieEntity),
+        [
+            {
+                "user_uuid": user["user_uuid"],
+                "movie_uuid": movie["movie_uuid"],
+                "status": _STATUSES[k % len(_STATUSES)],
+                "created_at": _SEED_EPOCH - timedelta(minutes=k),
+            }
+            for user, movie, k in pairs
+        ],
+    )
+    await session.execute(
+        insert(UserRateMovieEntity),
+        [
+            {
+                "user_uuid": user["user_uuid"],
+                "movie_uuid": movie["movie_uuid"],
+                "score": k % 5 + 1,
+                "created_at": _SEED_EPOCH - timedelta(minutes=k),
+            }
+            for user, movie, k in pairs
+        ],
+    )
+    listing_owner = {"user_uuid": users[0]["user_uuid"], "movie_uuid": movies[0]["movie_uuid"]}
+    # Rows inserted after CREATE INDEX sit in the GIN pending list until VACUUM, which cannot run in a
+    # transaction; flush it so the planner sees the index as a long-lived table would have it.
+    await session.execute(
+        text(
+            "SELECT gin_clean_pending_list(i.indexrelid) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid JOIN pg_am am ON am.oid = c.relam "
+            "WHERE am.amname = 'gin' AND c.relnamespace = 'query_plan_check'::regnamespace"
+        )
+    )
+    await session.execute(text("ANALYZE movies, genres, users, user_watch_movie, user_rate_movie"))
+    return listing_owner
+
+
+async def _explain(adapter, rows: int, query) -> str:
+    """Seed a throwaway schema, EXPLAIN ``query`` against it and roll everything back.
+
+    The adapter scopes sessions per task, so seeding and EXPLAIN must share one coroutine. ``query`` may
+    also be a callable taking the seeded user and movie uuids.
+    """
+    session = adapter.get_session()
+    try:
+        seeded = await _seed(session, rows)
+        if callable(query):
+            query = query(**seeded)
+        compiled = query.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+        result = await session.execute(text(f"EXPLAIN {compiled}"))
+        return "\n".join(result.scalars())
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+async def _estimate_total(adapter, rows: int, query) -> tuple[int | None, bool]:
+    """Seed a throwaway schema and resolve an estimated total for a full first page of ``query``."""
+    from archipy.models.dtos.pagination_dto import PaginationDTO
+
+    from src.utils.pagination_utils import PaginationUtils
+
+    session = adapter.get_session()
+    try:
+        await _seed(session, rows)
+        pagination = PaginationDTO(page=1, page_size=_PAGE_SIZE)
+        return await PaginationUtils.resolve_total(
+            adapter,
+            query,
+            pagination,
+            page_length=_PAGE_SIZE,
+            include_total=TotalModeType.ESTIMATED,
+        )
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+@given("a PostgreSQL database seeded with {rows:d} rows per table")
+def step_seed_postgres(context, rows: int):
+    context.seed_rows = rows
+
+
+@when('I explain the search on "{column}" for "{term}"')
+def step_explain_search(context, column: str, term: str):
+    table_name, column_name = column.split(".")
+    entity = _ENTITIES[table_name]
+    query = select(entity).where(SQLUtils.contains(getattr(entity, column_name), term))
+    context.query_plan = arun(context, _explain(context.postgres_adapter, context.seed_rows, query))
+
+
+@when('I explain the movie full-text search for "{term}"')
+def step_explain_full_text_search(context, term: str):
+    # Imported here: loading the archipy adapters before tests.container patches the engine factory breaks SQLite.
+    from src.repositories.movie.adapters.movie_postgres_adapter import MoviePostgresAdapter
+
+    query = MoviePostgresAdapter.apply_full_text_search(select(MovieEntity), term, dialect_name="postgresql")
+    context.query_plan = arun(context, _explain(context.postgres_adapter, context.seed_rows, query))
+
+
+@when('I explain the first page of the {listing} listing with include_total "{mode}"')
+def step_explain_listing(context, listing: str, mode: str):
+    read = _LISTINGS[listing]
+
+    async def _do():
+        adapter = _ExplainingAdapter(context.postgres_adapter)
+        session = adapter.get_session()
+        try:
+            seeded = await _seed(session, context.seed_rows)
+            await read(adapter, include_total=TotalModeType(mode), **seeded)
+            return adapter.plans
+        finally:
+            await session.rollback()
+            await session.close()
+
+    plans = arun(context, _do())
+    # A full first page carries its own total, so the page query is the only statement either way.
+    assert len(plans) == 1, f"Expected the adapter to issue one statement, got {len(plans)}"
+    context.query_plan = plans[0]
+
+
+@when('I estimate the total of movies titled "{term}" or "{other_term}"')
+def step_estimate_total(context, term: str, other_term: str):
+    query = select(MovieEntity).where(
+        or_(SQLUtils.contains(MovieEntity.title, term), SQLUtils.contains(MovieEntity.title, other_term)),
+    )
+    context.estimated_total = arun(context, _estimate_total(context.postgres_adapter, context.seed_rows, query))
+
+
+@then("the estimated total exceeds {cap:d}")
+def step_estimated_total_exceeds(context, cap: int):
+    total, total_is_exact = context.estimated_total
+    assert total > cap and not total_is_exact, f"Expected an estimate above {cap}, got {context.estimated_total}"
+
+
+@then("the plan does not sort")
+def step_plan_does_not_sort(context):
+    sort_lines = [line for line in context.query_plan.splitlines() if "Sort" in line and "Sort Key" not in line]
+    assert not sort_lines, f"Expected an index-ordered plan:\n{context.query_plan}"
+
+
+@then('the plan scans an index starting with "{prefix}"')
+def step_plan_scans_index_prefix(context, prefix: str):
+    assert f"Scan on {prefix}" in context.query_plan, f"Expected a scan on an index {prefix}*:\n{context.query_plan}"
+
+
+@then('the plan uses index "{index}"')
+def step_plan_uses_index(context, index: str):
+    assert index in context.query_plan, f"Expected {index} in plan:\n{context.query_plan}"
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+
+from behave import given, then, when
+
+from features.steps.common_steps import arun, create_user_async
+from features.steps.movie_steps import ensure_genre, ensure_movie
+from src.configs.runtime_config import RuntimeConfig
+from src.logics.recommendation.content_similarity_index import ContentSimilarityIndex
+from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import CreateMovieInputDTOV1
+from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import RateMovieInputDTOV1
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import (
+    GetRecommendedMoviesInputDTOV1,
+    GetSimilarMoviesInputDTOV1,
+)
+from src.models.types.entity_type import EntityType
+from src.models.types.recommendation_strategy_type import RecommendationStrategyType
+from src.models.types.similarity_strategy_type import SimilarityStrategyType
+from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import WatchMovieInputDTOV1
+from src.models.types.watch_status_type import WatchStatusType
+
+
+async def _viewer(context, name: str):
+    """Register ``name@test.com`` on first use; the same name always maps to the same user."""
+    email = f"{name}@test.com"
+    await create_user_async(context, email, name, name.title(), "Viewer", "TestPass123!")
+    return context.users[email]
+
+
+async def _watch(context, user_uuid, title: str) -> None:
+    movie_uuid = await ensure_movie(context, title, "Sci-Fi")
+    dto = WatchMovieInputDTOV1(movie_uuid=movie_uuid, user_uuid=user_uuid, status=WatchStatusType.WATCHED)
+    await context.watch_logic.watch_movie(input_dto=dto)
+
+
+@given("these users watched these movies:")
+def step_users_watched_movies(context):
+    async def _do():
+        for row in context.table:
+            user_uuid = await _viewer(context, row["user"])
+            for title in row["movies"].split(","):
+                await _watch(context, user_uuid, title)
+
+    arun(context, _do())
+
+
+@given('"{name}" watched "{title}" and rated it {score:d}')
+def step_user_watched_and_rated(context, name: str, title: str, score: int):
+    async def _do():
+        user_uuid = await _viewer(context, name)
+        await _watch(context, user_uuid, title)
+        dto = RateMovieInputDTOV1(movie_uuid=context.movies[title], user_uuid=user_uuid, score=score)
+        await context.rating_logic.rate_movie(input_dto=dto)
+
+    arun(context, _do())
+
+
+@given("these movies are described as:")
+def step_movies_described_as(context):
+    async def _do():
+        for row in context.table:
+            await ensure_movie(context, row["title"], "Sci-Fi", description=row["description"])
+
+    arun(context, _do())
+
+
+@given("the recommendations were refreshed")
+@when("the recommendations are refreshed")
+def step_refresh_recommendations(context):
+    context.last_result = arun(context, context.recommendation_logic.refresh())
+
+
+@given("the factorization model was trained")
+@when("the factorization model is trained")
+def step_retrain_recommendations(context):
+    context.last_result = arun(context, context.recommendation_logic.retrain())
+
+
+@given("the content index was synced")
+@when("the content index is synced")
+def step_sync_content_index(context):
+    context.last_result = arun(context, context.content_similarity_logic.sync())
+
+
+@when("the queued movies are indexed")
+def step_wait_indexed(context):
+    arun(context, context.content_similarity_logic.wait_indexed())
+
+
+@given("a content sync is holding the index")
+def step_sync_holds_index(context):
+    # What a full build or a save-and-remap does for seconds on a large catalog.
+    lock = context.content_similarity_logic._lock
+    arun(context, lock.acquire())
+    context.add_cleanup(lambda: lock.locked() and lock.release())
+
+
+@when("the content sync finishes")
+def step_sync_finishes(context):
+    context.content_similarity_logic._lock.release()
+
+
+@when('I create "{title}" described as "{description}" within {seconds:d} seconds')
+def step_create_movie_within(context, title: str, description: str, seconds: int):
+    async def _do():
+        genre_uuid = await ensure_genre(context, "Sci-Fi")
+        dto = CreateMovieInputDTOV1(title=title, description=description, genre_uuid=genre_uuid)
+        return await context.movie_logic.create_movie(input_dto=dto)
+
+    # Fails with TimeoutError rather than hanging if the write waits for the index.
+    output = arun(context, asyncio.wait_for(_do(), timeout=seconds))
+    context.movies[title] = output.movie_uuid
+
+
+@when("the change listener catches up on missed {first} and {second} changes within {seconds:d} seconds")
+def step_catch_up_on_missed_changes(context, first: str, second: str, seconds: int):
+    # Imported lazily: the adapter modules must load after the SQLite engine patch in tests.container.
+    from src.utils.invalidation_bus import EntityChangedEventDTO
+
+    bus = context.container.invalidation_bus()
+    context.synced_before = context.content_similarity_logic._synced_at
+
+    async def _do():
+        # What the Postgres listener hands its handlers, one entity type after another, after reconnecting.
+        for name in (first, second):
+            event = EntityChangedEventDTO(entity_type=EntityType(name), entity_uuids=None, origin="", published_at=0.0)
+            await bus.receive(event)
+
+    # Fails with TimeoutError rather than hanging if a handler waits for the index.
+    arun(context, asyncio.wait_for(_do(), timeout=seconds))
+
+
+@then("the content index was synced again")
+def step_synced_again(context):
+    synced_at = context.content_similarity_logic._synced_at
+    assert synced_at > context.synced_before, f"Expected a sync after {context.synced_before}, last was {synced_at}"
+
+
+@then("the content sync still holds the index")
+def step_sync_still_holds_index(context):
+    assert context.content_similarity_logic._lock.locked(), "Expected the content sync to still hold the index"
+
+
+@when('I fetch the movies similar to "{title}"')
+def step_fetch_similar(context, title: str):
+    dto = GetSimilarMoviesInputDTOV1(movie_uuid=context.movies[title])
+    context.last_result = arun(context, context.recommendation_logic.get_similar_movies(input_dto=dto))
+
+
+@when('I fetch the movies described like "{title}"')
+def step_fetch_similar_by_content(context, title: str):
+    dto = GetSimilarMoviesInputDTOV1(movie_uuid=context.movies[title], strategy=SimilarityStrategyType.CONTENT)
+    context.last_result = arun(context, context.recommendation_logic.get_similar_movies(input_dto=dto))
+
+
+@when("a new worker maps the saved content index")
+def step_map_content_index(context):
+    context.content_index = ContentSimilarityIndex.load(RuntimeConfig.global_config().RECOMMENDATION.CONTENT_INDEX_PATH)
+
+
+@when("I fetch my recommendations")
+def step_fetch_recommended(context):
+    dto = GetRecommendedMoviesInputDTOV1(user_uuid=context.current_user_uuid)
+    context.last_result = arun(context, context.recommendation_logic.get_recommended_movies(input_dto=dto))
+
+
+@when("I fetch my factor recommendations")
+def step_fetch_factor_recommended(context):
+    dto = GetRecommendedMoviesInputDTOV1(
+        user_uuid=context.current_user_uuid,
+        strategy=RecommendationStrategyType.FACTORS,
+    )
+    context.last_result = arun(context, context.recommendation_logic.get_recommended_movies(input_dto=dto))
+
+
+@then('the recommended titles are "{titles}"')
+def step_recommended_titles(context, titles: str):
+    expected = [title for title in titles.split(",") if title]
+    actual = [movie.title for movie in context.last_result.movies]
+    assert actual == expected, f"Expected {expected}, got {actual}"
+
+
+@then("no movies are recommended")
+def step_no_recommendations(context):
+    assert context.last_result.movies == [], f"Expected no movies, got {context.last_result.movies}"
+
+
+@then('the top recommended title is "{title}"')
+def step_top_recommended_title(context, title: str):
+    actual = [movie.title for movie in context.last_result.movies]
+    assert actual and actual[0] == title, f"Expected {title} first, got {actual}"
+
+
+@then('the recommended titles include "{titles}"')
+def step_recommended_titles_include(context, titles: str):
+    actual = {movie.title for movie in context.last_result.movies}
+    missing = set(titles.split(",")) - actual
+    assert not missing, f"Expected {sorted(missing)} in {sorted(actual)}"
+
+
+@then('the recommended titles do not include "{titles}"')
+def step_recommended_titles_exclude(context, titles: str):
+    actual = {movie.title for movie in context.last_result.movies}
+    unexpected = actual & set(titles.split(","))
+    assert not unexpected, f"Did not expect {sorted(unexpected)} in {sorted(actual)}"
+
+
+@then('the mapped index finds "{titles}" similar to "{title}"')
+def step_mapped_index_similar(context, titles: str, title: str):
+    index = context.content_index
+    positions, _ = index.similar_items(index.position(context.movies[title]), 20)
+    actual = [index.movie(position)[1] for position in positions.tolist()]
+    assert actual == titles.split(","), f"Expected {titles.split(',')}, got {actual}"
@@ -0,0 +1,217 @@
+import uuid
+
+from behave import given, then, when
+from pydantic import BaseModel
+from sqlalchemy import update
+
+from features.steps.common_steps import arun
+from features.steps.genre_steps import _execute_directly
+from features.steps.invalidation_steps import _publish_from_another_worker
+from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import GetMovieInputDTOV1
+from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import GetMovieRatersInputDTOV1
+from src.models.entities.user_entity import UserEntity
+from src.models.types.entity_type import EntityType
+
+_PROBE_ROUTE = "GET /probe"
+
+
+class _ProbeParamsDTO(BaseModel):
+    probe_uuid: uuid.UUID
+
+
+class _ProbeOutputDTO(BaseModel):
+    probe_uuid: uuid.UUID
+    loaded: int
+
+
+def _route_stats(cache, route: str):
+    matching = [stats for stats in cache.stats().routes if stats.route == route]
+    assert matching, f"No stats for route {route}: {cache.stats()}"
+    return matching[0]
+
+
+def _counts(cache, route: str) -> tuple[int, int]:
+    stats = [stats for stats in cache.stats().routes if stats.route == route]
+    return (stats[0].hits, stats[0].misses) if stats else (0, 0)
+
+
+def _assert_hits(cache, route: str, hits: int, misses: int, since: tuple[int, int] = (0, 0)) -> None:
+    counted = tuple(count - before for count, before in zip(_counts(cache, route), since, strict=True))
+    assert counted == (hits, misses), f"Expected {hits} hits and {misses} misses on {route}, got {counted}"
+
+
+def _fetch_movie(context, title: str):
+    dto = GetMovieInputDTOV1(movie_uuid=context.movies[title])
+    return arun(context, context.movie_logic.get_movie(input_dto=dto))
+
+
+def _fetch_raters(context, title: str):
+    dto = GetMovieRatersInputDTOV1.create(movie_uuid=context.movies[title])
+    return arun(context, context.rating_logic.get_movie_raters(input_dto=dto))
+
+
+async def _load_probe(context, worker: str, probe_uuid: uuid.UUID) -> _ProbeOutputDTO:
+    async def _load() -> _ProbeOutputDTO:
+        context.probe_loads[worker] += 1
+        return _ProbeOutputDTO(probe_uuid=probe_uuid, loaded=context.probe_loads[worker])
+
+    return await context.probe_caches[worker].get_or_load(
+        route=_PROBE_ROUTE,
+        params=_ProbeParamsDTO(probe_uuid=probe_uuid),
+        output_type=_ProbeOutputDTO,
+        load=_load,
+        tags=lambda output: [output.probe_uuid],
+    )
+
+
+@when('I fetch movie "{title}" {count:d} times')
+def step_fetch_movie_times(context, title: str, count: int):
+    # The container's cache lives across scenarios; only this step's reads are counted.
+    context.counts_before = _counts(context.container.response_cache(), "GET /api/v1/movies/{movie_uuid}")
+    for _ in range(count):
+        _fetch_movie(context, title)
+
+
+@given('the movie and raters of "{first}" and "{second}" were fetched')
+def step_movies_and_raters_fetched(context, first: str, second: str):
+    for title in (first, second):
+        _fetch_movie(context, title)
+        _fetch_raters(context, title)
+
+
+@when('another worker renames "{email}" to "{first_name}"')
+def step_user_renamed_elsewhere(context, email: str, first_name: str):
+    user_uuid = context.users[email]
+
+    async def _do():
+        await _execute_directly(
+            context,
+            update(UserEntity).where(UserEntity.user_uuid == user_uuid).values(first_name=first_name),
+        )
+        await _publish_from_another_worker(context, EntityType.USER, user_uuid)
+
+    arun(context, _do())
+
+
+@given('the raters of "{title}" are named "{names}"')
+@then('the raters of "{title}" are named "{names}"')
+def step_raters_named(context, title: str, names: str):
+    found = [rater.first_name for rater in _fetch_raters(context, title).raters]
+    assert found == names.split(","), f"Expected raters {names.split(',')}, got {found}"
+
+
+@then('the movie and raters of "{title}" are served from the cache')
+def step_served_from_cache(context, title: str):
+    cache = context.container.response_cache()
+    routes = ("GET /api/v1/movies/{movie_uuid}", "GET /api/v1/ratings/movie/{movie_uuid}/raters")
+    hits_before = [_route_stats(cache, route).hits for route in routes]
+    _fetch_movie(context, title)
+    _fetch_raters(context, title)
+    hits_after = [_route_stats(cache, route).hits for route in routes]
+    assert hits_after == [hits + 1 for hits in hits_before], f"Expected one more hit each, {hits_before} -> {hits_after}"
+
+
+@then('the route "{route}" has {hits:d} hits and {misses:d} miss')
+@then('the route "{route}" has {hits:d} hits and {misses:d} misses')
+def step_route_hits(context, route: str, hits: int, misses: int):
+    _assert_hits(context.container.response_cache(), route, hits, misses, since=context.counts_before)
+
+
+@given("a response cache of its own holding at most {max_entries:d} entries")
+def step_own_response_cache(context, max_entries: int):
+    # Imported lazily: the adapter modules must load after the SQLite engine patch in tests.container.
+    from src.configs.runtime_config import ResponseCacheConfig
+    from src.utils.invalidation_bus import InMemoryInvalidationBus
+    from src.utils.response_cache import InMemoryResponseCacheBackend, ResponseCache
+
+    config = ResponseCacheConfig(MAX_ENTRIES=max_entries)
+    backend = InMemoryResponseCacheBackend(config=config)
+    context.probe_caches = {"own": ResponseCache(backend=backend, invalidation_bus=InMemoryInvalidationBus())}
+    context.probe_loads = {"own": 0}
+
+
+@when("a response is loaded while a write commits")
+def step_load_racing_write(context):
+    cache = context.probe_caches["own"]
+    context.probe_uuid = uuid.uuid4()
+
+    async def _load() -> _ProbeOutputDTO:
+        # The write commits after the read, so what was read may predate it.
+        await cache.invalidate(EntityType.MOVIE, [uuid.uuid4()])
+        return _ProbeOutputDTO(probe_uuid=context.probe_uuid, loaded=1)
+
+    arun(
+        context,
+        cache.get_or_load(
+            route=_PROBE_ROUTE,
+            params=_ProbeParamsDTO(probe_uuid=context.probe_uuid),
+            output_type=_ProbeOutputDTO,
+            load=_load,
+            tags=lambda output: [output.probe_uuid],
+        ),
+    )
+
+
+@when("the same response is requested again")
+def step_same_response_again(context):
+    arun(context, _load_probe(context, "own", context.probe_uuid))
+
+
+@when('{count:d} different responses are loaded on route "{route}"')
+def step_load_different_responses(context, count: int, route: str):
+    assert route == _PROBE_ROUTE, f"Only {_PROBE_ROUTE} is probed"
+    for _ in range(count):
+        arun(context, _load_probe(context, "own", uuid.uuid4()))
+
+
+@then('that cache counts {hits:d} hits and {misses:d} misses on route "{route}"')
+def step_own_route_hits(context, hits: int, misses: int, route: str):
+    _assert_hits(context.probe_caches["own"], route, hits, misses)
+
+
+@then('that cache holds {entries:d} entries on route "{route}" in a positive number of bytes')
+def step_own_route_usage(context, entries: int, route: str):
+    stats = _route_stats(context.probe_caches["own"], route)
+    assert stats.entries == entries, f"Expected {entries} entries on {route}, got {stats.entries}"
+    assert stats.bytes > 0, f"Expected the entries on {route} to be counted in bytes, got {stats.bytes}"
+
+
+@given("two workers caching responses on a shared Redis stand-in")
+def step_two_redis_workers(context):
+    from archipy.adapters.redis.mocks import AsyncRedisMock
+    from archipy.configs.config_template import RedisConfig
+
+    from src.utils.invalidation_bus import InMemoryInvalidationBus
+    from src.utils.response_cache import RedisResponseCacheBackend, ResponseCache
+
+    # One fakeredis server for both workers, as one Redis server would be.
+    redis = AsyncRedisMock(redis_config=RedisConfig())
+    worker_a = InMemoryInvalidationBus()
+    worker_b = worker_a.join()
+    context.probe_caches = {
+        name: ResponseCache(backend=RedisResponseCacheBackend(adapter=redis), invalidation_bus=bus)
+        for name, bus in (("A", worker_a), ("B", worker_b))
+    }
+    context.probe_loads = {"A": 0, "B": 0}
+    context.probe_uuid = uuid.uuid4()
+
+
+@when('worker "{name}" requests the probe response')
+def step_worker_requests_probe(context, name: str):
+    context.last_result = arun(context, _load_probe(context, name, context.probe_uuid))
+
+
+@when('worker "{name}" evicts the probe entity')
+def step_worker_evicts_probe(context, name: str):
+    arun(context, context.probe_caches[name].invalidate(EntityType.MOVIE, [context.probe_uuid]))
+
+
+@then('worker "{name}" served it from the cache')
+def step_worker_served_from_cache(context, name: str):
+    assert context.probe_loads[name] == 0, f"Worker {name} loaded the response {context.probe_loads[name]} times"
+    _assert_hits(context.probe_caches[name], _PROBE_ROUTE, 1, 0)
+
+
+@then('worker "{name}" loaded it {count:d} times')
+def step_worker_loaded_times(context, name: str, count: int):
+    assert context.probe_loads[name] == count, f"Expected {count} loads on worker {name}, got {context.probe_loads[name]}"
@@ -0,0 +1,201 @@
+import asyncio
+import uuid
+
+from behave import given, then, when
+from pydantic import BaseModel
+
+from features.steps.common_steps import arun
+from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import GetMovieInputDTOV1
+from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import GetMovieWatchersInputDTOV1
+
+_PROBE_NAME = "probe"
+
+
+class _ProbeParamsDTO(BaseModel):
+    probe_uuid: uuid.UUID
+
+
+class _ProbeOutputDTO(BaseModel):
+    loaded: int
+
+
+def _stats(single_flight, name: str) -> tuple[int, int, int, int]:
+    matching = [stats for stats in single_flight.stats() if stats.name == name]
+    if not matching:
+        return (0, 0, 0, 0)
+    return (matching[0].calls, matching[0].coalesced, matching[0].failures, matching[0].in_flight)
+
+
+async def _settle() -> None:
+    # Lets every started read reach its await, and the load its first one.
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _read_concurrently(context, name: str, count: int, read) -> None:
+    single_flight = context.container.single_flight()
+    # The container's single flight lives across scenarios; only this step's reads are counted.
+    context.flight_stats_before = _stats(single_flight, name)
+
+    async def _do():
+        return await asyncio.gather(*(read() for _ in range(count)))
+
+    context.concurrent_results = arun(context, _do())
+
+
+async def _probe_load(context) -> _ProbeOutputDTO:
+    context.probe_loads += 1
+    loaded = context.probe_loads
+    try:
+        await context.probe_release.wait()
+    except asyncio.CancelledError:
+        context.probe_load_cancelled = True
+        raise
+    if context.probe_fails:
+        raise RuntimeError("The probe load failed")
+    return _ProbeOutputDTO(loaded=loaded)
+
+
+def _start_probe_read(context, generation: int = 0) -> None:
+    read = context.probe_flight.do(
+        _PROBE_NAME,
+        _ProbeParamsDTO(probe_uuid=context.probe_uuid),
+        lambda: _probe_load(context),
+        generation=generation,
+    )
+    context.probe_reads.append(context.loop.create_task(read))
+
+
+def _finish_probe_reads(context) -> None:
+    context.probe_release.set()
+
+    async def _do():
+        return await asyncio.gather(*context.probe_reads, return_exceptions=True)
+
+    context.probe_results = arun(context, _do())
+
+
+@when('{count:d} concurrent requests read the watchers of "{title}"')
+def step_concurrent_watchers(context, count: int, title: str):
+    dto = GetMovieWatchersInputDTOV1.create(movie_uuid=context.movies[title])
+    _read_concurrently(
+        context,
+        "GET /api/v1/watchlist/movie/{movie_uuid}/watchers",
+        count,
+        lambda: context.watch_logic.get_movie_watchers(input_dto=dto),
+    )
+
+
+@when('{count:d} concurrent requests read the movie "{title}"')
+def step_concurrent_movie(context, count: int, title: str):
+    dto = GetMovieInputDTOV1(movie_uuid=context.movies[title])
+    _read_concurrently(
+        context,
+        "GET /api/v1/movies/{movie_uuid}",
+        count,
+        lambda: context.movie_logic.get_movie(input_dto=dto),
+    )
+
+
+@then("they all get the same watchers")
+@then("they all get the same movie")
+def step_same_results(context):
+    first = context.concurrent_results[0]
+    assert all(result == first for result in context.concurrent_results), "The concurrent reads got different results"
+
+
+@then('{coalesced:d} of the {calls:d} reads on "{name}" were coalesced')
+def step_reads_coalesced(context, coalesced: int, calls: int, name: str):
+    stats = _stats(context.container.single_flight(), name)
+    counted = tuple(count - before for count, before in zip(stats[:2], context.flight_stats_before[:2], strict=True))
+    assert counted == (calls, coalesced), f"Expected {calls} calls with {coalesced} coalesced on {name}, got {counted}"
+
+
+@given("a single flight of its own")
+def step_own_single_flight(context):
+    # Imported lazily: the adapter modules must load after the SQLite engine patch in tests.container.
+    from src.utils.single_flight import SingleFlight
+
+    context.probe_flight = SingleFlight()
+    context.probe_uuid = uuid.uuid4()
+    context.probe_reads = []
+    context.probe_loads = 0
+    context.probe_release = asyncio.Event()
+    context.probe_fails = False
+    context.probe_load_cancelled = False
+
+
+@when("{count:d} identical probe reads start")
+def step_probe_reads_start(context, count: int):
+    for _ in range(count):
+        _start_probe_read(context)
+    arun(context, _settle())
+
+
+@when("a probe read starts after a write")
+def step_probe_read_after_write(context):
+    _start_probe_read(context, generation=1)
+    arun(context, _settle())
+
+
+@when("the probe load fails")
+def step_probe_load_fails(context):
+    context.probe_fails = True
+    _finish_probe_reads(context)
+
+
+@when("the probe load completes")
+def step_probe_load_completes(context):
+    _finish_probe_reads(context)
+
+
+@when("{count:d} of the probe reads is cancelled")
+@when("{count:d} of the probe reads are cancelled")
+def step_probe_reads_cancelled(context, count: int):
+    for read in context.probe_reads[:count]:
+        read.cancel()
+    arun(context, _settle())
+
+
+@when("the probe is read again")
+def step_probe_read_again(context):
+    context.probe_fails = False
+    context.probe_reads = []
+    _start_probe_read(context)
+    _finish_probe_reads(context)
+
+
+@then("{count:d} probe reads failed")
+def step_probe_reads_failed(context, count: int):
+    failed = [result for result in context.probe_results if isinstance(result, RuntimeError)]
+    assert len(failed) == count, f"Expected {count} failed reads, got {context.probe_results}"
+
+
+@then("the probe counts {failures:d} failed load")
+def step_probe_failures(context, failures: int):
+    counted = _stats(context.probe_flight, _PROBE_NAME)[2]
+    assert counted == failures, f"Expected {failures} failed loads, got {counted}"
+
+
+@then("the probe was loaded {count:d} times")
+def step_probe_loaded_times(context, count: int):
+    assert context.probe_loads == count, f"Expected {count} probe loads, got {context.probe_loads}"
+
+
+@then("{count:d} probe reads got the result of load {loaded:d}")
+def step_probe_reads_got_result(context, count: int, loaded: int):
+    results = [result for result in context.probe_results if isinstance(result, _ProbeOutputDTO)]
+    assert results == [_ProbeOutputDTO(loaded=loaded)] * count, f"Expected {count} results, got {context.probe_results}"
+    assert context.probe_loads == loaded, f"Expected {loaded} probe loads, got {context.probe_loads}"
+
+
+@then("the probe load was cancelled")
+def step_probe_load_cancelled(context):
+    arun(context, _settle())
+    assert context.probe_load_cancelled, "The probe load kept running with no read waiting for it"
+
+
+@then("no probe read is in flight")
+def step_no_probe_in_flight(context):
+    in_flight = _stats(context.probe_flight, _PROBE_NAME)[3]
+    assert in_flight == 0, f"Expected no probe read in flight, got {in_flight}"
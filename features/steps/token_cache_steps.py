@@ -0,0 +1,112 @@
+import time
+
+from behave import given, then, when
+
+
+def _counts(cache) -> tuple[int, int]:
+    stats = cache.stats()
+    return stats.hits, stats.misses
+
+
+def _names(names: str) -> list[str]:
+    return [name for name in names.split(",") if name]
+
+
+@when("the access_token is decoded {count:d} times")
+def step_decode_access_token(context, count: int):
+    from src.utils.jwt_utils import JWTUtils
+
+    cache = JWTUtils.token_cache()
+    # Logging in cached nothing, but the cache is shared by every scenario; only these decodes are counted.
+    cache.invalidate(context.current_access_token)
+    context.token_counts_before = _counts(cache)
+    for _ in range(count):
+        JWTUtils.decode_token(context.current_access_token)
+
+
+@then("the token cache counted {hits:d} hit and {misses:d} miss")
+def step_shared_token_cache_counts(context, hits: int, misses: int):
+    from src.utils.jwt_utils import JWTUtils
+
+    counted = tuple(
+        count - before for count, before in zip(_counts(JWTUtils.token_cache()), context.token_counts_before, strict=True)
+    )
+    assert counted == (hits, misses), f"Expected {hits} hits and {misses} misses, got {counted}"
+
+
+@given("a token cache of its own holding at most {max_size:d} tokens")
+def step_own_token_cache(context, max_size: int):
+    from src.utils.token_cache import DecodedTokenCache
+
+    context.token_cache = DecodedTokenCache(max_size=max_size)
+
+
+@when("a token expiring in {seconds:f} seconds is cached")
+def step_cache_expiring_token(context, seconds: float):
+    context.token = "expiring"
+    context.token_cache.put(context.token, {"sub": "probe", "exp": time.time() + seconds})
+
+
+@when("{seconds:f} seconds pass")
+def step_seconds_pass(context, seconds: float):
+    time.sleep(seconds)
+
+
+@then("the token is served from the cache")
+def step_token_served(context):
+    assert context.token_cache.get(context.token) is not None, "The token was not served from the cache"
+
+
+@then("the token is not served from the cache")
+def step_token_not_served(context):
+    assert context.token_cache.get(context.token) is None, "The token was served after it expired"
+
+
+@when('tokens "{names}" are cached')
+@when('token "{names}" is cached')
+def step_cache_tokens(context, names: str):
+    for name in _names(names):
+        context.token_cache.put(name, {"sub": name, "exp": time.time() + 60})
+
+
+@when('token "{name}" is read')
+def step_read_token(context, name: str):
+    context.token_cache.get(name)
+
+
+@when("the token cache is disabled")
+def step_disable_token_cache(context):
+    context.token_cache.set_enabled(is_enabled=False)
+
+
+@then('tokens "{served}" are served from the cache and "{missing}" is not')
+def step_tokens_served(context, served: str, missing: str):
+    for name in _names(served):
+        claims = context.token_cache.get(name)
+        assert claims is not None and claims["sub"] == name, f"Token {name} was not served from the cache"
+    step_tokens_not_served(context, missing)
+
+
+@then('tokens "{names}" are not served from the cache')
+def step_tokens_not_served(context, names: str):
+    for name in _names(names):
+        assert context.token_cache.get(name) is None, f"Token {name} was served from the cache"
+
+
+@then("that token cache counts {hits:d} hit, {misses:d} miss and {expired:d} expired token")
+def step_own_token_cache_counts(context, hits: int, misses: int, expired: int):
+    stats = context.token_cache.stats()
+    counted = (stats.hits, stats.misses, stats.expired)
+    assert counted == (hits, misses, expired), f"Expected {hits} hits, {misses} misses, {expired} expired: {stats}"
+
+
+@then("that token cache counts {evicted:d} evicted token")
+def step_own_token_cache_evictions(context, evicted: int):
+    stats = context.token_cache.stats()
+    assert stats.evicted == evicted, f"Expected {evicted} evicted tokens: {stats}"
+
+
+@then("that token cache holds {size:d} tokens")
+def step_own_token_cache_size(context, size: int):
+    stats = context.token_cache.stats()
+    assert stats.size == size and not stats.is_enabled, f"Expected a disabled cache holding {size} tokens: {stats}"
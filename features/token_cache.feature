@@ -0,0 +1,37 @@
+# ═══════════════════════════════════════════════
+# FILE: features/token_cache.feature
+# ═══════════════════════════════════════════════
+Feature: Decoded token cache
+  As an API operator
+  I want verified JWT claims cached until the token expires
+  So that authenticated requests skip re-verifying the same signature
+
+  Scenario: A token decoded twice is verified once
+    Given a user "ivy@test.com" with password "Ivy333!!" exists
+    And I have logged in as "ivy@test.com"
+    When the access_token is decoded 2 times
+    Then the token cache counted 1 hit and 1 miss
+
+  Scenario: A token is a hit until it expires
+    Given a token cache of its own holding at most 10 tokens
+    When a token expiring in 0.3 seconds is cached
+    Then the token is served from the cache
+    When 0.4 seconds pass
+    Then the token is not served from the cache
+    And that token cache counts 1 hit, 1 miss and 1 expired token
+
+  Scenario: The least recently used token is evicted
+    Given a token cache of its own holding at most 2 tokens
+    When tokens "a,b" are cached
+    And token "a" is read
+    And token "c" is cached
+    Then tokens "a,c" are served from the cache and "b" is not
+    And that token cache counts 1 evicted token
+
+  Scenario: A disabled token cache neither stores nor serves tokens
+    Given a token cache of its own holding at most 10 tokens
+    When tokens "a" are cached
+    And the token cache is disabled
+    And tokens "b" are cached
+    Then tokens "a,b" are not served from the cache
+    And that token cache holds 0 tokens
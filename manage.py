@@ -17,8 +17,24 @@ async def lifespan(app: FastAPI):
     # Startup code
     # logging.info("Creating database schema with async adapter")
     # await async_schema_setup()
+    refreshers = [
+        container.genre_catalog_refresher(),
+        container.leaderboard_refresher(),
+        container.recommendation_refresher(),
+        container.recommendation_trainer(),
+        container.content_index_syncer(),
+        container.response_cache_stats_logger(),
+        container.single_flight_stats_logger(),
+    ]
+    invalidation_bus = container.invalidation_bus()
+    invalidation_bus.start()
+    for refresher in refreshers:
+        refresher.start()
     yield
-    # Shutdown code would go here if needed
+    for refresher in refreshers:
+        await refresher.stop()
+    await invalidation_bus.stop()
+    container.password_hasher().shutdown()
 
 
 container: ServiceContainer = ServiceContainer()
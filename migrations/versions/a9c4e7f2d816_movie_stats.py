@@ -0,0 +1,64 @@
+"""Denormalized per-movie rating and watch counters
+
+Revision ID: a9c4e7f2d816
+Revises: f3b8d1c5a742
+Create Date: 2026-10-18 15:12:08.316524
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e7f2d816'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d1c5a742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'movie_stats',
+        sa.Column('movie_uuid', sa.UUID(), nullable=False),
+        sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_sum', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('watched_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('want_to_watch_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['movie_uuid'], ['movies.movie_uuid'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_uuid'),
+    )
+    # Backfill from the existing ratings and watch entries; from here on the write paths keep it current.
+    op.execute(
+        """
+        INSERT INTO movie_stats (movie_uuid, rating_count, rating_sum, watched_count, want_to_watch_count)
+        SELECT m.movie_uuid,
+               coalesce(r.rating_count, 0),
+               coalesce(r.rating_sum, 0),
+               coalesce(w.watched_count, 0),
+               coalesce(w.want_to_watch_count, 0)
+        FROM movies m
+        LEFT JOIN (
+            SELECT movie_uuid, count(*) AS rating_count, sum(score) AS rating_sum
+            FROM user_rate_movie
+            GROUP BY movie_uuid
+        ) r ON r.movie_uuid = m.movie_uuid
+        LEFT JOIN (
+            SELECT movie_uuid,
+                   count(*) FILTER (WHERE status = 'watched') AS watched_count,
+                   count(*) FILTER (WHERE status = 'want_to_watch') AS want_to_watch_count
+            FROM user_watch_movie
+            GROUP BY movie_uuid
+        ) w ON w.movie_uuid = m.movie_uuid
+        WHERE r.movie_uuid IS NOT NULL OR w.movie_uuid IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('movie_stats')
@@ -0,0 +1,30 @@
+"""Rating and watch created_at indexes for the trending window
+
+Revision ID: b5d2e8a4c163
+Revises: e6b3f9c2d417
+Create Date: 2026-10-18 18:22:47.130592
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2e8a4c163'
+down_revision: Union[str, Sequence[str], None] = 'e6b3f9c2d417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_user_rate_movie_created_at', 'user_rate_movie', ['created_at'], unique=False)
+    op.create_index('ix_user_watch_movie_created_at', 'user_watch_movie', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_watch_movie_created_at', table_name='user_watch_movie')
+    op.drop_index('ix_user_rate_movie_created_at', table_name='user_rate_movie')
@@ -0,0 +1,46 @@
+"""Trigram indexes for substring search
+
+Revision ID: b7e1c4d2a905
+Revises: f96001f69b92
+Create Date: 2026-10-17 11:05:27.480113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1c4d2a905'
+down_revision: Union[str, Sequence[str], None] = 'f96001f69b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRIGRAM_INDEXES = (
+    ('ix_movies_title_trgm', 'movies', 'title'),
+    ('ix_genres_name_trgm', 'genres', 'name'),
+    ('ix_users_first_name_trgm', 'users', 'first_name'),
+    ('ix_users_last_name_trgm', 'users', 'last_name'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table_name, column_name in _TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The pg_trgm extension is left installed; other objects may depend on it.
+    for index_name, table_name, _ in reversed(_TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table_name, postgresql_using='gin')
@@ -0,0 +1,34 @@
+"""Movie full-text search vector
+
+Revision ID: c41d9a7e2f63
+Revises: b7e1c4d2a905
+Create Date: 2026-10-17 13:42:08.219564
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d9a7e2f63'
+down_revision: Union[str, Sequence[str], None] = 'b7e1c4d2a905'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE movies ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+    )
+    op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_search_vector', table_name='movies', postgresql_using='gin')
+    op.drop_column('movies', 'search_vector')
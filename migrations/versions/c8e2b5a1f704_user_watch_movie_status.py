@@ -0,0 +1,35 @@
+"""Watch status column missing from the initial watchlist migration
+
+Revision ID: c8e2b5a1f704
+Revises: c41d9a7e2f63
+Create Date: 2026-10-18 15:48:19.604127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2b5a1f704'
+down_revision: Union[str, Sequence[str], None] = 'c41d9a7e2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # UserWatchMovieEntity.status was never migrated; databases created from the models already have it,
+    # so both statements are conditional.
+    op.execute(
+        "ALTER TABLE user_watch_movie "
+        "ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'want_to_watch'"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_user_watch_movie_status ON user_watch_movie (status)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The upgrade cannot record whether it added the column or found it already there, and on databases
+    # created from the models it holds real data; it is left in place, so this is a no-op.
@@ -0,0 +1,54 @@
+"""Unique watch entry per user and movie
+
+Revision ID: d5a8f3b61e07
+Revises: c8e2b5a1f704
+Create Date: 2026-10-18 10:04:27.530911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8f3b61e07'
+down_revision: Union[str, Sequence[str], None] = 'c8e2b5a1f704'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Collapse duplicates left by the old check-then-insert path, keeping a "watched" entry (ratings
+    # require one) and otherwise the oldest.
+    op.execute(
+        """
+        DELETE FROM user_watch_movie
+        WHERE watch_uuid IN (
+            SELECT watch_uuid FROM (
+                SELECT watch_uuid,
+                       row_number() OVER (
+                           PARTITION BY user_uuid, movie_uuid
+                           ORDER BY (status = 'watched') DESC, created_at, watch_uuid
+                       ) AS position
+                FROM user_watch_movie
+            ) ranked
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_index(
+        'ux_user_watch_movie_user_uuid_movie_uuid',
+        'user_watch_movie',
+        ['user_uuid', 'movie_uuid'],
+        unique=True,
+    )
+    # Redundant with the leading column of the unique index.
+    op.drop_index('ix_user_watch_movie_user_uuid', table_name='user_watch_movie')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_user_watch_movie_user_uuid', 'user_watch_movie', ['user_uuid'], unique=False)
+    op.drop_index('ux_user_watch_movie_user_uuid_movie_uuid', table_name='user_watch_movie')
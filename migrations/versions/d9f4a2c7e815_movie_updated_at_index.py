@@ -0,0 +1,28 @@
+"""Movie updated_at index for the content index sync
+
+Revision ID: d9f4a2c7e815
+Revises: b5d2e8a4c163
+Create Date: 2026-10-18 21:04:12.583106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f4a2c7e815'
+down_revision: Union[str, Sequence[str], None] = 'b5d2e8a4c163'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_movies_updated_at', 'movies', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_updated_at', table_name='movies')
@@ -0,0 +1,53 @@
+"""Unique rating per user and movie
+
+Revision ID: e2c7a9d4f318
+Revises: d5a8f3b61e07
+Create Date: 2026-10-18 11:26:05.174362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c7a9d4f318'
+down_revision: Union[str, Sequence[str], None] = 'd5a8f3b61e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Collapse duplicates left by the old check-then-insert path, keeping the oldest rating.
+    op.execute(
+        """
+        DELETE FROM user_rate_movie
+        WHERE rate_uuid IN (
+            SELECT rate_uuid FROM (
+                SELECT rate_uuid,
+                       row_number() OVER (
+                           PARTITION BY user_uuid, movie_uuid
+                           ORDER BY created_at, rate_uuid
+                       ) AS position
+                FROM user_rate_movie
+            ) ranked
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_index(
+        'ux_user_rate_movie_user_uuid_movie_uuid',
+        'user_rate_movie',
+        ['user_uuid', 'movie_uuid'],
+        unique=True,
+    )
+    # Redundant with the leading column of the unique index.
+    op.drop_index('ix_user_rate_movie_user_uuid', table_name='user_rate_movie')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_user_rate_movie_user_uuid', 'user_rate_movie', ['user_uuid'], unique=False)
+    op.drop_index('ux_user_rate_movie_user_uuid_movie_uuid', table_name='user_rate_movie')
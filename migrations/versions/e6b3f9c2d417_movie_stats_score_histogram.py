@@ -0,0 +1,60 @@
+"""Per-movie rating histogram buckets on movie_stats
+
+Revision ID: e6b3f9c2d417
+Revises: a9c4e7f2d816
+Create Date: 2026-10-18 17:40:21.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3f9c2d417'
+down_revision: Union[str, Sequence[str], None] = 'a9c4e7f2d816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORES = range(1, 6)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The table was created with a 1-10 range while the entity and the API only accept 1-5; the histogram has
+    # one bucket per allowed score, so the database has to agree with the entity. Updating a rating still
+    # accepted up to 10 before this revision, so such scores are clamped to the top of the 1-5 scale first;
+    # the other ratings were all given on that scale.
+    op.drop_constraint('check_rating_range', 'user_rate_movie', type_='check')
+    op.execute("UPDATE user_rate_movie SET score = 5 WHERE score > 5")
+    op.create_check_constraint('check_rating_range', 'user_rate_movie', 'score >= 1 AND score <= 5')
+
+    for score in SCORES:
+        op.add_column(
+            'movie_stats',
+            sa.Column(f'score_{score}_count', sa.Integer(), server_default='0', nullable=False),
+        )
+    # rating_sum is recomputed as well, since it still counts the scores clamped above.
+    buckets = ', '.join(f'score_{score}_count = r.score_{score}_count' for score in SCORES)
+    aggregates = ', '.join(f'count(*) FILTER (WHERE score = {score}) AS score_{score}_count' for score in SCORES)
+    op.execute(
+        f"""
+        UPDATE movie_stats s
+        SET rating_sum = r.rating_sum, {buckets}
+        FROM (
+            SELECT movie_uuid, sum(score) AS rating_sum, {aggregates}
+            FROM user_rate_movie
+            GROUP BY movie_uuid
+        ) r
+        WHERE r.movie_uuid = s.movie_uuid
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for score in SCORES:
+        op.drop_column('movie_stats', f'score_{score}_count')
+    op.drop_constraint('check_rating_range', 'user_rate_movie', type_='check')
+    op.create_check_constraint('check_rating_range', 'user_rate_movie', 'score >= 1 AND score <= 10')
@@ -0,0 +1,53 @@
+"""Watch and rating listing indexes
+
+Revision ID: f3b8d1c5a742
+Revises: e2c7a9d4f318
+Create Date: 2026-10-18 13:41:52.806237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d1c5a742'
+down_revision: Union[str, Sequence[str], None] = 'e2c7a9d4f318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_user_watch_movie_user_uuid_created_at', 'user_watch_movie', ['user_uuid', 'created_at'], unique=False)
+    op.create_index(
+        'ix_user_watch_movie_user_uuid_status_created_at',
+        'user_watch_movie',
+        ['user_uuid', 'status', 'created_at'],
+        unique=False,
+    )
+    op.create_index('ix_user_watch_movie_movie_uuid_created_at', 'user_watch_movie', ['movie_uuid', 'created_at'], unique=False)
+    op.create_index(
+        'ix_user_watch_movie_movie_uuid_status_created_at',
+        'user_watch_movie',
+        ['movie_uuid', 'status', 'created_at'],
+        unique=False,
+    )
+    op.create_index('ix_user_rate_movie_movie_uuid_score', 'user_rate_movie', ['movie_uuid', 'score'], unique=False)
+    op.create_index('ix_user_rate_movie_user_uuid_created_at', 'user_rate_movie', ['user_uuid', 'created_at'], unique=False)
+    # Single-column indexes made redundant by the leading column of the composites above.
+    op.drop_index('ix_user_watch_movie_movie_uuid', table_name='user_watch_movie')
+    op.drop_index('ix_user_rate_movie_movie_uuid', table_name='user_rate_movie')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_user_rate_movie_movie_uuid', 'user_rate_movie', ['movie_uuid'], unique=False)
+    op.create_index('ix_user_watch_movie_movie_uuid', 'user_watch_movie', ['movie_uuid'], unique=False)
+    op.drop_index('ix_user_rate_movie_user_uuid_created_at', table_name='user_rate_movie')
+    op.drop_index('ix_user_rate_movie_movie_uuid_score', table_name='user_rate_movie')
+    op.drop_index('ix_user_watch_movie_movie_uuid_status_created_at', table_name='user_watch_movie')
+    op.drop_index('ix_user_watch_movie_movie_uuid_created_at', table_name='user_watch_movie')
+    op.drop_index('ix_user_watch_movie_user_uuid_status_created_at', table_name='user_watch_movie')
+    op.drop_index('ix_user_watch_movie_user_uuid_created_at', table_name='user_watch_movie')
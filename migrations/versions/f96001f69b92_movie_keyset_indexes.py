@@ -0,0 +1,30 @@
+"""Movie keyset pagination indexes
+
+Revision ID: f96001f69b92
+Revises: 03bc3452f63a
+Create Date: 2026-10-17 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f96001f69b92'
+down_revision: Union[str, Sequence[str], None] = '03bc3452f63a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_movies_title_movie_uuid', 'movies', ['title', 'movie_uuid'], unique=False)
+    op.create_index('ix_movies_created_at_movie_uuid', 'movies', ['created_at', 'movie_uuid'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_created_at_movie_uuid', table_name='movies')
+    op.drop_index('ix_movies_title_movie_uuid', table_name='movies')
@@ -0,0 +1,242 @@
+import argparse
+import logging
+import os
+import tempfile
+import time
+import uuid
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+from src.logics.recommendation.content_similarity_index import ContentSimilarityIndex
+from src.logics.recommendation.implicit_als_model import ImplicitALSModel
+from src.logics.recommendation.item_similarity_index import ItemSimilarityIndex
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def synthetic_interactions(
+    interactions: int,
+    users: int,
+    movies: int,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unique (user, movie, weight) triples with Zipf-like movie popularity and long-tailed user activity."""
+    rng = np.random.default_rng(seed)
+    movie_popularity = 1.0 / np.arange(1, movies + 1) ** 0.9
+    user_activity = rng.lognormal(sigma=1.0, size=users)
+    pairs = np.empty(0, dtype=np.int64)
+    while len(pairs) < interactions:
+        missing = interactions - len(pairs)
+        user_indices = rng.choice(users, size=missing, p=user_activity / user_activity.sum())
+        movie_indices = rng.choice(movies, size=missing, p=movie_popularity / movie_popularity.sum())
+        pairs = np.unique(np.concatenate([pairs, user_indices.astype(np.int64) * movies + movie_indices]))
+    pairs = rng.permutation(pairs)[:interactions]
+    # Same weights as RecommendationLogic: score / 5 when rated, else 0.6 watched / 0.3 want to watch.
+    weights = rng.choice(np.array([0.2, 0.4, 0.6, 0.8, 1.0, 0.6, 0.3], dtype=np.float32), size=interactions)
+    return (pairs // movies).astype(np.int32), (pairs % movies).astype(np.int32), weights
+
+
+def percentile_micros(samples: list[float], percentile: float) -> float:
+    return float(np.percentile(samples, percentile)) * 1e6
+
+
+def time_lookups(name: str, lookup: Callable[[int], object], keys: list[int]) -> None:
+    samples = []
+    for key in keys:
+        started = time.perf_counter()
+        lookup(key)
+        samples.append(time.perf_counter() - started)
+    logger.info(
+        "%s: p50 %.1fus, p99 %.1fus over %d lookups.",
+        name,
+        percentile_micros(samples, 50),
+        percentile_micros(samples, 99),
+        len(keys),
+    )
+
+
+def benchmark(
+    interactions: int,
+    users: int,
+    movies: int,
+    neighbors: int,
+    factors: int,
+    iterations: int,
+    content_neighbors: int,
+    queries: int,
+    seed: int,
+) -> None:
+    user_indices, movie_indices, weights = synthetic_interactions(interactions, users, movies, seed)
+    logger.info("Generated %d interactions of %d users over %d movies.", len(weights), users, movies)
+    benchmark_neighbors(user_indices, movie_indices, weights, users, movies, neighbors, queries, seed)
+    benchmark_factors(user_indices, movie_indices, weights, users, movies, factors, iterations, queries, seed)
+    benchmark_content(movies, content_neighbors, queries, seed)
+
+
+def benchmark_neighbors(
+    user_indices: np.ndarray,
+    movie_indices: np.ndarray,
+    weights: np.ndarray,
+    users: int,
+    movies: int,
+    neighbors: int,
+    queries: int,
+    seed: int,
+) -> None:
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = ItemSimilarityIndex.build(user_indices, movie_indices, weights, users, movies, neighbors)
+    build_seconds = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info("Build: %.2fs, peak %.1f MiB allocated while building.", build_seconds, peak_bytes / 2**20)
+    logger.info("Index: %.1f MiB resident (%d neighbours per movie).", index.nbytes / 2**20, neighbors)
+
+    rng = np.random.default_rng(seed + 1)
+    time_lookups("similar", lambda movie: index.similar_items(movie, 20), rng.integers(0, movies, queries).tolist())
+    time_lookups("recommended", lambda user: index.recommend(user, 20), rng.integers(0, users, queries).tolist())
+
+
+def benchmark_factors(
+    user_indices: np.ndarray,
+    movie_indices: np.ndarray,
+    weights: np.ndarray,
+    users: int,
+    movies: int,
+    factors: int,
+    iterations: int,
+    queries: int,
+    seed: int,
+) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    model = ImplicitALSModel.train(
+        user_indices,
+        movie_indices,
+        weights,
+        users,
+        movies,
+        factors=factors,
+        regularization=0.1,
+        alpha=10.0,
+        iterations=iterations,
+    )
+    train_seconds = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info("Training: %.2fs, peak %.1f MiB allocated while training.", train_seconds, peak_bytes / 2**20)
+    logger.info("Model: %.1f MiB resident (%d factors, %d iterations).", model.nbytes / 2**20, factors, iterations)
+
+    rng = np.random.default_rng(seed + 2)
+    # Fold-in re-solves a user's factors from their history plus one new interaction, as on every write.
+    time_lookups(
+        "fold-in",
+        lambda user: model.fold_in(*model_history_with(model, user, int(rng.integers(0, movies)))),
+        rng.integers(0, users, queries).tolist(),
+    )
+    time_lookups(
+        "factor recommended",
+        lambda user: model.recommend(model.user_factors(user), model.user_items(user)[0], 20),
+        rng.integers(0, users, queries).tolist(),
+    )
+
+
+def synthetic_descriptions(movies: int, vocabulary: int, words: int, seed: int) -> list[str]:
+    """Descriptions of ``words`` words drawn from a Zipf-like vocabulary of ``vocabulary`` made-up words.
+
+    The head of the distribution is cut off as stop-word removal does: the commonest word is in about one
+    description in ten.
+    """
+    rng = np.random.default_rng(seed)
+    frequency = 1.0 / np.arange(100, vocabulary + 100)
+    drawn = rng.choice(vocabulary, size=(movies, words), p=frequency / frequency.sum())
+    return [" ".join(f"w{word}" for word in row) for row in drawn]
+
+
+def benchmark_content(movies: int, neighbors: int, queries: int, seed: int) -> None:
+    descriptions = synthetic_descriptions(movies, 30_000, 60, seed)
+    movie_uuids = [uuid.UUID(int=movie + 1) for movie in range(movies)]
+    titles = [f"Movie {movie}" for movie in range(movies)]
+    genre_uuids = [uuid.UUID(int=movie % 20 + 1) for movie in range(movies)]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = ContentSimilarityIndex.build(movie_uuids, titles, descriptions, genre_uuids, neighbors)
+    build_seconds = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info("Content build: %.2fs, peak %.1f MiB allocated while building.", build_seconds, peak_bytes / 2**20)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "content_index.bin")
+        started = time.perf_counter()
+        index.save(path)
+        save_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        index = ContentSimilarityIndex.load(path)
+        load_seconds = time.perf_counter() - started
+        logger.info(
+            "Content index: %.1f MiB on disk, saved in %.2fs, mapped in %.1fms (%d neighbours per movie).",
+            os.path.getsize(path) / 2**20,
+            save_seconds,
+            load_seconds * 1e3,
+            neighbors,
+        )
+
+        rng = np.random.default_rng(seed + 3)
+        time_lookups(
+            "content similar",
+            lambda movie: index.similar_items(movie, 20),
+            rng.integers(0, movies, queries).tolist(),
+        )
+        # An edit re-ranks the movie and fixes up the rows it enters or leaves, as on every movie write.
+        rewrites = synthetic_descriptions(queries // 10, 30_000, 60, seed + 4)
+        time_lookups(
+            "content upsert",
+            lambda key: index.upsert(movie_uuids[key], titles[key], rewrites[key % len(rewrites)], genre_uuids[key]),
+            rng.integers(0, movies, len(rewrites)).tolist(),
+        )
+
+
+def model_history_with(model: ImplicitALSModel, user: int, movie: int) -> tuple[np.ndarray, np.ndarray]:
+    items, values = model.user_items(user)
+    return np.append(items, movie), np.append(values, np.float32(1.0))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure recommendation model build time, memory and lookup latency.")
+    parser.add_argument("--interactions", type=int, default=1_000_000, help="watch entries and ratings to index")
+    parser.add_argument("--users", type=int, default=100_000, help="distinct users")
+    parser.add_argument("--movies", type=int, default=20_000, help="distinct movies")
+    parser.add_argument("--neighbors", type=int, default=50, help="neighbours kept per movie (RECOMMENDATION__NEIGHBORS)")
+    parser.add_argument("--factors", type=int, default=32, help="latent factors (RECOMMENDATION__FACTORS)")
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10,
+        help="training sweeps (RECOMMENDATION__FACTORIZATION_ITERATIONS)",
+    )
+    parser.add_argument(
+        "--content-neighbors",
+        type=int,
+        default=20,
+        help="neighbours kept per movie in the content index (RECOMMENDATION__CONTENT_NEIGHBORS)",
+    )
+    parser.add_argument("--queries", type=int, default=10_000, help="lookups timed per endpoint")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the synthetic data")
+    args = parser.parse_args()
+    benchmark(
+        args.interactions,
+        args.users,
+        args.movies,
+        args.neighbors,
+        args.factors,
+        args.iterations,
+        args.content_neighbors,
+        args.queries,
+        args.seed,
+    )
@@ -9,7 +9,7 @@ from sqlalchemy import Column, String, select
 from sqlalchemy.exc import IntegrityError
 from src.configs.runtime_config import RuntimeConfig
 from src.models.entities.user_entity import UserEntity
-from src.utils.security_utils import SecurityUtils
+from src.utils.password_hasher import PasswordHasher
 
 configs = RuntimeConfig.global_config()
 from src.models.dtos.auth.domain.v1.auth_domain_interface_dtos import RegisterUserInputDTOV1
@@ -26,6 +26,7 @@ class SuperUserCreateDTO(RegisterUserInputDTOV1):
 async def init_super_user():
     adapter = AsyncPostgresSQLAlchemyAdapter()
     session = adapter.get_session()
+    password_hasher = PasswordHasher()
 
     try:
         # 1. Check if the superuser already exists
@@ -52,7 +53,7 @@ async def init_super_user():
         db_obj = UserEntity(
             **{
                 **user_in.model_dump(),
-                "hashed_password": SecurityUtils.get_password_hash(user_in_password)
+                "hashed_password": await password_hasher.hash_password(user_in_password)
             }
         )
         session.add(db_obj)
@@ -67,6 +68,7 @@ async def init_super_user():
     finally:
         # 3. Always close the session to prevent connection leaks
         await session.close()
+        password_hasher.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(init_super_user())
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
+
+from src.configs.runtime_config import RuntimeConfig
+from src.models.types.entity_type import EntityType
+from src.utils.invalidation_bus import EntityChangedEventDTO, PostgresInvalidationBus
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def measure_invalidation_lag(events: int, concurrency: int, uuids_per_event: int) -> None:
+    """Commit change events from one bus and report how long a second one, as another worker, took to get them."""
+    adapter = AsyncPostgresSQLAlchemyAdapter()
+    # A channel of its own, so the running workers neither hear the probe nor skew it.
+    config = RuntimeConfig.global_config().INVALIDATION.model_copy(
+        update={"CHANNEL": f"lag_probe_{uuid.uuid4().hex[:12]}"},
+    )
+    publisher = PostgresInvalidationBus(adapter=adapter, config=config)
+    listener = PostgresInvalidationBus(adapter=adapter, config=config)
+    handled = 0
+
+    async def on_change(_event: EntityChangedEventDTO) -> None:
+        nonlocal handled
+        handled += 1
+
+    listener.subscribe(EntityType.MOVIE, on_change)
+    listener.start()
+    while not listener.stats().is_listening:
+        await asyncio.sleep(0.01)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def write() -> None:
+        # Its own task, hence its own scoped session: one transaction per event, as one write request.
+        async with semaphore:
+            session = adapter.get_session()
+            try:
+                await publisher.publish(EntityType.MOVIE, [uuid.uuid4() for _ in range(uuids_per_event)])
+                await session.commit()
+            finally:
+                await session.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(asyncio.create_task(write()) for _ in range(events)))
+    published = publisher.stats().published
+    while handled < published:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    await listener.stop()
+
+    stats = listener.stats()
+    logger.info(
+        "%d events of %d UUIDs from %d concurrent writers in %.2fs (%.0f events/s).",
+        published,
+        uuids_per_event,
+        concurrency,
+        elapsed,
+        published / elapsed,
+    )
+    logger.info(
+        "Propagation lag over the last %d: p50 %.2fms, p99 %.2fms, max %.2fms.",
+        stats.lag_samples,
+        stats.lag_p50_seconds * 1e3,
+        stats.lag_p99_seconds * 1e3,
+        stats.lag_max_seconds * 1e3,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure how long an entity change takes to reach another worker.")
+    parser.add_argument("--events", type=int, default=1_000, help="change events to commit")
+    parser.add_argument("--concurrency", type=int, default=1, help="transactions committing at the same time")
+    parser.add_argument("--uuids", type=int, default=1, help="UUIDs per event; more than 100 are split")
+    args = parser.parse_args()
+    asyncio.run(measure_invalidation_lag(events=args.events, concurrency=args.concurrency, uuids_per_event=args.uuids))
@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+import logging
+
+from src.configs.containers import ServiceContainer
+from src.models.dtos.movie_stats.domain.v1.movie_stats_domain_interface_dtos import ReconcileMovieStatsInputDTOV1
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_movie_stats(repair: bool) -> int:
+    """Report movies whose movie_stats counters drifted from their ratings and watch entries.
+
+    Returns the number of drifted movies, so cron/CI can alert on a non-zero exit status.
+    """
+    logic = ServiceContainer().movie_stats_logic()
+    result = await logic.reconcile(input_dto=ReconcileMovieStatsInputDTOV1(repair=repair))
+
+    for drift in result.drifts:
+        logger.warning(
+            "Movie %s drifted: stored %s, actual %s",
+            drift.movie_uuid,
+            drift.stored.model_dump(),
+            drift.actual.model_dump(),
+        )
+    if not result.drifts:
+        logger.info("movie_stats matches ratings and watch entries.")
+    elif result.repaired:
+        logger.info("Repaired movie_stats for %d movie(s).", len(result.drifts))
+    else:
+        logger.info("%d movie(s) drifted; rerun with --repair to rewrite them.", len(result.drifts))
+    return len(result.drifts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check movie_stats against user_rate_movie and user_watch_movie.")
+    parser.add_argument("--repair", action="store_true", help="rewrite drifted rows from the source tables")
+    args = parser.parse_args()
+    drifted = asyncio.run(reconcile_movie_stats(repair=args.repair))
+    raise SystemExit(1 if drifted and not args.repair else 0)
@@ -1,28 +1,75 @@
 from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
+from archipy.adapters.redis.adapters import AsyncRedisAdapter
 from dependency_injector import containers, providers
 
 from src.configs.runtime_config import RuntimeConfig
 from src.logics.auth.auth_logic import AuthLogic
 from src.logics.genre.genre_logic import GenreLogic
+from src.logics.leaderboard.leaderboard_logic import LeaderboardLogic
 from src.logics.movie.movie_logic import MovieLogic
+from src.logics.movie_stats.movie_stats_logic import MovieStatsLogic
 from src.logics.rating.rating_logic import RatingLogic
+from src.logics.recommendation.content_similarity_logic import ContentSimilarityLogic
+from src.logics.recommendation.recommendation_logic import RecommendationLogic
 from src.logics.user.user_logic import UserLogic
 from src.logics.watch.watch_logic import WatchLogic
 from src.repositories.genre.adapters.genre_postgres_adapter import GenrePostgresAdapter
 from src.repositories.genre.genre_repository import GenreRepository
+from src.repositories.leaderboard.adapters.leaderboard_postgres_adapter import LeaderboardPostgresAdapter
+from src.repositories.leaderboard.leaderboard_repository import LeaderboardRepository
 from src.repositories.movie.adapters.movie_postgres_adapter import MoviePostgresAdapter
 from src.repositories.movie.movie_repository import MovieRepository
+from src.repositories.movie_stats.adapters.movie_stats_postgres_adapter import MovieStatsPostgresAdapter
+from src.repositories.movie_stats.movie_stats_repository import MovieStatsRepository
 from src.repositories.rating.adapters.rating_postgres_adapter import RatingPostgresAdapter
 from src.repositories.rating.rating_repository import RatingRepository
+from src.repositories.recommendation.adapters.recommendation_postgres_adapter import RecommendationPostgresAdapter
+from src.repositories.recommendation.recommendation_repository import RecommendationRepository
 from src.repositories.user.adapters.user_postgres_adapter import UserPostgresAdapter
 from src.repositories.user.user_repository import UserRepository
 from src.repositories.watch.adapters.watch_postgres_adapter import WatchPostgresAdapter
 from src.repositories.watch.watch_repository import WatchRepository
+from src.utils.invalidation_bus import PostgresInvalidationBus
+from src.utils.password_hasher import PasswordHasher
+from src.utils.periodic_task import PeriodicTask
+from src.utils.principal_cache import PrincipalCache
+from src.utils.response_cache import InMemoryResponseCacheBackend, RedisResponseCacheBackend, ResponseCache
+from src.utils.single_flight import SingleFlight
 
 
 class ServiceContainer(containers.DeclarativeContainer):
     _config: RuntimeConfig = RuntimeConfig.global_config()
     _postgres_adapter: AsyncPostgresSQLAlchemyAdapter = providers.ThreadSafeSingleton(AsyncPostgresSQLAlchemyAdapter)
+    password_hasher = providers.ThreadSafeSingleton(PasswordHasher)
+    principal_cache = providers.ThreadSafeSingleton(PrincipalCache)
+    invalidation_bus = providers.ThreadSafeSingleton(PostgresInvalidationBus, adapter=_postgres_adapter)
+
+    _response_cache_backend = providers.Selector(
+        providers.Object(_config.RESPONSE_CACHE.BACKEND),
+        memory=providers.ThreadSafeSingleton(InMemoryResponseCacheBackend),
+        redis=providers.ThreadSafeSingleton(
+            RedisResponseCacheBackend,
+            adapter=providers.ThreadSafeSingleton(AsyncRedisAdapter),
+        ),
+    )
+    response_cache = providers.ThreadSafeSingleton(
+        ResponseCache,
+        backend=_response_cache_backend,
+        invalidation_bus=invalidation_bus,
+    )
+    response_cache_stats_logger = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="response-cache-stats",
+        callback=response_cache.provided.log_stats,
+        interval_seconds=_config.RESPONSE_CACHE.STATS_LOG_INTERVAL_SECONDS,
+    )
+    single_flight = providers.ThreadSafeSingleton(SingleFlight)
+    single_flight_stats_logger = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="single-flight-stats",
+        callback=single_flight.provided.log_stats,
+        interval_seconds=_config.SINGLE_FLIGHT.STATS_LOG_INTERVAL_SECONDS,
+    )
 
     _user_postgres_adapter = providers.ThreadSafeSingleton(
         UserPostgresAdapter,
@@ -35,10 +82,17 @@ class ServiceContainer(containers.DeclarativeContainer):
     user_logic = providers.ThreadSafeSingleton(
         UserLogic,
         repository=_user_repository,
+        principal_cache=principal_cache,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
     )
     auth_logic = providers.ThreadSafeSingleton(
         AuthLogic,
         user_repository=_user_repository,
+        password_hasher=password_hasher,
+        principal_cache=principal_cache,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
     )
 
     _genre_postgres_adapter = providers.ThreadSafeSingleton(
@@ -52,6 +106,34 @@ class ServiceContainer(containers.DeclarativeContainer):
     genre_logic = providers.ThreadSafeSingleton(
         GenreLogic,
         repository=_genre_repository,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
+    )
+    genre_catalog_refresher = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="genre-catalog-refresh",
+        callback=genre_logic.provided.refresh,
+        interval_seconds=_config.GENRE.CATALOG_REFRESH_INTERVAL_SECONDS,
+    )
+
+    _recommendation_postgres_adapter = providers.ThreadSafeSingleton(
+        RecommendationPostgresAdapter,
+        adapter=_postgres_adapter,
+    )
+    _recommendation_repository = providers.ThreadSafeSingleton(
+        RecommendationRepository,
+        postgres_adapter=_recommendation_postgres_adapter,
+    )
+    content_similarity_logic = providers.ThreadSafeSingleton(
+        ContentSimilarityLogic,
+        repository=_recommendation_repository,
+        invalidation_bus=invalidation_bus,
+    )
+    content_index_syncer = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="content-index-sync",
+        callback=content_similarity_logic.provided.sync,
+        interval_seconds=_config.RECOMMENDATION.CONTENT_SYNC_INTERVAL_SECONDS,
     )
 
     _movie_postgres_adapter = providers.ThreadSafeSingleton(
@@ -65,6 +147,44 @@ class ServiceContainer(containers.DeclarativeContainer):
     movie_logic = providers.ThreadSafeSingleton(
         MovieLogic,
         repository=_movie_repository,
+        genre_logic=genre_logic,
+        content_similarity_logic=content_similarity_logic,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
+        single_flight=single_flight,
+    )
+
+    _movie_stats_postgres_adapter = providers.ThreadSafeSingleton(
+        MovieStatsPostgresAdapter,
+        adapter=_postgres_adapter,
+    )
+    _movie_stats_repository = providers.ThreadSafeSingleton(
+        MovieStatsRepository,
+        postgres_adapter=_movie_stats_postgres_adapter,
+    )
+    movie_stats_logic = providers.ThreadSafeSingleton(
+        MovieStatsLogic,
+        repository=_movie_stats_repository,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
+    )
+
+    recommendation_logic = providers.ThreadSafeSingleton(
+        RecommendationLogic,
+        repository=_recommendation_repository,
+        content_similarity_logic=content_similarity_logic,
+    )
+    recommendation_refresher = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="recommendation-refresh",
+        callback=recommendation_logic.provided.refresh,
+        interval_seconds=_config.RECOMMENDATION.REFRESH_INTERVAL_SECONDS,
+    )
+    recommendation_trainer = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="recommendation-training",
+        callback=recommendation_logic.provided.retrain,
+        interval_seconds=_config.RECOMMENDATION.FACTORIZATION_INTERVAL_SECONDS,
     )
 
     _watch_postgres_adapter = providers.ThreadSafeSingleton(
@@ -78,6 +198,11 @@ class ServiceContainer(containers.DeclarativeContainer):
     watch_logic = providers.ThreadSafeSingleton(
         WatchLogic,
         repository=_watch_repository,
+        movie_stats_repository=_movie_stats_repository,
+        recommendation_logic=recommendation_logic,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
+        single_flight=single_flight,
     )
 
     _rating_postgres_adapter = providers.ThreadSafeSingleton(
@@ -91,5 +216,28 @@ class ServiceContainer(containers.DeclarativeContainer):
     rating_logic = providers.ThreadSafeSingleton(
         RatingLogic,
         repository=_rating_repository,
-        watch_repository=_watch_repository,
+        movie_stats_repository=_movie_stats_repository,
+        recommendation_logic=recommendation_logic,
+        invalidation_bus=invalidation_bus,
+        response_cache=response_cache,
+        single_flight=single_flight,
+    )
+
+    _leaderboard_postgres_adapter = providers.ThreadSafeSingleton(
+        LeaderboardPostgresAdapter,
+        adapter=_postgres_adapter,
+    )
+    _leaderboard_repository = providers.ThreadSafeSingleton(
+        LeaderboardRepository,
+        postgres_adapter=_leaderboard_postgres_adapter,
+    )
+    leaderboard_logic = providers.ThreadSafeSingleton(
+        LeaderboardLogic,
+        repository=_leaderboard_repository,
+    )
+    leaderboard_refresher = providers.ThreadSafeSingleton(
+        PeriodicTask,
+        name="leaderboard-refresh",
+        callback=leaderboard_logic.provided.refresh,
+        interval_seconds=_config.LEADERBOARD.REFRESH_INTERVAL_SECONDS,
     )
@@ -1,5 +1,205 @@
+from typing import Literal
+
 from archipy.configs.base_config import BaseConfig
-from pydantic import EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+
+class PasswordHasherConfig(BaseModel):
+    EXECUTOR_TYPE: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Worker pool used for bcrypt calls; bcrypt releases the GIL so threads are usually enough",
+    )
+    MAX_WORKERS: int = Field(default=4, ge=1, description="Number of workers in the hashing pool")
+    MAX_QUEUE_DEPTH: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum hash/verify jobs queued or running before new ones are rejected",
+    )
+
+
+class TokenCacheConfig(BaseModel):
+    IS_ENABLED: bool = Field(default=True, description="Cache verified JWT claims until the token expires")
+    MAX_SIZE: int = Field(default=10_000, ge=1, description="Maximum number of decoded tokens kept in memory")
+
+
+class PrincipalConfig(BaseModel):
+    CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="How long a user's role/active flags are trusted before they are re-read from the database",
+    )
+    CACHE_MAX_SIZE: int = Field(default=10_000, ge=1, description="Maximum number of cached principals")
+    TRUST_ROLE_CLAIM: bool = Field(
+        default=False,
+        description="Authorize admins from the signed is_super_user access-token claim; the active flag is still checked",
+    )
+
+
+class MovieImportConfig(BaseModel):
+    CHUNK_SIZE: int = Field(default=1_000, ge=1, le=5_000, description="Rows validated and inserted per transaction")
+    MAX_LINE_BYTES: int = Field(default=64 * 1024, ge=1, description="Longest accepted NDJSON line or CSV record")
+    MAX_REPORTED_ERRORS: int = Field(
+        default=100,
+        ge=0,
+        description="Invalid rows listed individually in the import summary; the rest are only counted",
+    )
+
+
+class PaginationConfig(BaseModel):
+    ESTIMATED_TOTAL_CAP: int = Field(
+        default=1_000,
+        ge=1,
+        description="Rows counted exactly when include_total=estimated; larger results fall back to planner statistics",
+    )
+
+
+class TransactionConfig(BaseModel):
+    SERIALIZATION_RETRY_ATTEMPTS: int = Field(
+        default=8,
+        ge=1,
+        description="Times a write transaction is run before a serialization failure is returned to the client",
+    )
+    SERIALIZATION_RETRY_BACKOFF_SECONDS: float = Field(
+        default=0.01,
+        ge=0,
+        description="Upper bound of the random delay before the first retry; doubles on every further attempt",
+    )
+
+
+class HttpCacheConfig(BaseModel):
+    RATING_HISTOGRAM_MAX_AGE_SECONDS: int = Field(
+        default=60,
+        ge=0,
+        description="Cache-Control max-age of the rating histogram; 0 makes clients revalidate on every read",
+    )
+
+
+class GenreConfig(BaseModel):
+    CATALOG_REFRESH_INTERVAL_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="How often each worker reloads its genre snapshot to pick up changes made outside the API",
+    )
+
+
+class LeaderboardConfig(BaseModel):
+    REFRESH_INTERVAL_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="How often each worker recomputes the top-rated and trending snapshots",
+    )
+    SIZE: int = Field(default=100, ge=1, le=1_000, description="Movies kept per leaderboard, overall and per genre")
+    PRIOR_VOTES: float = Field(
+        default=10.0,
+        ge=0,
+        description="Weight of the catalog-wide mean in the Bayesian average, in ratings",
+    )
+    TRENDING_WINDOW_HOURS: float = Field(
+        default=14 * 24.0,
+        gt=0,
+        description="Only watch and rating activity this recent counts towards trending",
+    )
+    TRENDING_HALF_LIFE_HOURS: float = Field(
+        default=48.0,
+        gt=0,
+        description="Age at which an activity counts half as much towards trending",
+    )
+
+
+class RecommendationConfig(BaseModel):
+    REFRESH_INTERVAL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="How often each worker reloads watch entries and ratings and rebuilds the similarity table",
+    )
+    NEIGHBORS: int = Field(
+        default=50,
+        ge=1,
+        le=500,
+        description="Most similar movies kept per movie; bounds both /similar and the candidates of /recommended",
+    )
+    FACTORIZATION_INTERVAL_SECONDS: float = Field(
+        default=3_600.0,
+        gt=0,
+        description="How often each worker retrains the factorization model; fold-ins cover the activity in between",
+    )
+    FACTORS: int = Field(default=32, ge=1, le=256, description="Latent factors per user and movie")
+    FACTORIZATION_ITERATIONS: int = Field(default=10, ge=1, le=100, description="Alternating least-squares sweeps")
+    FACTORIZATION_REGULARIZATION: float = Field(default=0.1, gt=0, description="L2 penalty on the factors")
+    FACTORIZATION_CONFIDENCE_ALPHA: float = Field(
+        default=10.0,
+        ge=0,
+        description="Confidence of an interaction is 1 + alpha * its weight (score / 5, or its watch status)",
+    )
+    CONTENT_INDEX_PATH: str = Field(
+        default="var/content_index.bin",
+        description="File the content index is saved to and memory-mapped from; built from the database if missing",
+    )
+    CONTENT_NEIGHBORS: int = Field(default=20, ge=1, le=200, description="Most similar movies kept per movie by text")
+    CONTENT_SYNC_INTERVAL_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="How often each worker applies movies changed elsewhere to its content index and saves it",
+    )
+
+
+class InvalidationConfig(BaseModel):
+    CHANNEL: str = Field(
+        default="entity_changed",
+        min_length=1,
+        max_length=63,
+        description="Postgres NOTIFY channel workers publish entity changes on and listen to",
+    )
+    RECONNECT_DELAY_SECONDS: float = Field(
+        default=1.0,
+        gt=0,
+        description="Delay before the listener reconnects after losing its connection; doubles up to 30 seconds",
+    )
+    HEALTH_CHECK_INTERVAL_SECONDS: float = Field(
+        default=15.0,
+        gt=0,
+        description="How often an idle listener pings its connection, so a dead one is noticed and replaced",
+    )
+
+
+class ResponseCacheConfig(BaseModel):
+    IS_ENABLED: bool = Field(default=True, description="Cache the responses of the busiest read endpoints")
+    BACKEND: Literal["memory", "redis"] = Field(
+        default="memory",
+        description="Where entries live: each worker's own LRU, or the Redis server in REDIS__* shared by all",
+    )
+    TTL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Longest an entry is served; bounds staleness should an eviction be missed",
+    )
+    MAX_ENTRIES: int = Field(default=10_000, ge=1, description="Most entries the memory backend keeps per worker")
+    MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1,
+        description="Most bytes of keys and serialized responses the memory backend keeps per worker",
+    )
+    REDIS_KEY_PREFIX: str = Field(
+        default="response-cache:",
+        description="Prefix of every key the Redis backend writes, so the server can be shared",
+    )
+    STATS_LOG_INTERVAL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="How often each worker logs the hit ratio and memory use of every cached route",
+    )
+
+
+class SingleFlightConfig(BaseModel):
+    IS_ENABLED: bool = Field(
+        default=True,
+        description="Run concurrent identical movie, raters and watchers reads once and share the result",
+    )
+    STATS_LOG_INTERVAL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="How often each worker logs its calls and coalesced calls per read",
+    )
 
 
 class RuntimeConfig(BaseConfig):
@@ -9,5 +209,19 @@ class RuntimeConfig(BaseConfig):
     FIRST_SUPERUSER_USERNAME: str
     FIRST_SUPERUSER_PASSWORD: str
 
+    PASSWORD_HASHER: PasswordHasherConfig = PasswordHasherConfig()
+    TOKEN_CACHE: TokenCacheConfig = TokenCacheConfig()
+    PRINCIPAL: PrincipalConfig = PrincipalConfig()
+    MOVIE_IMPORT: MovieImportConfig = MovieImportConfig()
+    PAGINATION: PaginationConfig = PaginationConfig()
+    TRANSACTION: TransactionConfig = TransactionConfig()
+    HTTP_CACHE: HttpCacheConfig = HttpCacheConfig()
+    GENRE: GenreConfig = GenreConfig()
+    LEADERBOARD: LeaderboardConfig = LeaderboardConfig()
+    RECOMMENDATION: RecommendationConfig = RecommendationConfig()
+    INVALIDATION: InvalidationConfig = InvalidationConfig()
+    RESPONSE_CACHE: ResponseCacheConfig = ResponseCacheConfig()
+    SINGLE_FLIGHT: SingleFlightConfig = SingleFlightConfig()
+
 
 BaseConfig.set_global(RuntimeConfig())
@@ -2,7 +2,7 @@ from uuid import UUID
 
 from archipy.models.errors import AlreadyExistsError, NotFoundError, PermissionDeniedError, UnauthenticatedError
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 from fastapi.responses import Response
 
 from src.configs.containers import ServiceContainer
@@ -24,7 +24,9 @@ from src.models.dtos.genre.domain.v1.genre_domain_interface_dtos import (
 )
 from src.models.types.api_router_type import ApiRouterType
 from src.models.types.genre_sort_type import GenreSortColumnType
+from src.models.types.total_mode_type import TotalModeType
 from src.utils.auth_dependencies import get_current_admin_user_uuid
+from src.utils.etag_utils import ETagUtils
 from src.utils.utils import Utils
 
 routerV1: APIRouter = APIRouter(tags=[ApiRouterType.GENRE])
@@ -63,7 +65,7 @@ async def bulk_create_genres(
     genre_logic: GenreLogic = Depends(Provide[ServiceContainer.genre_logic]),
 ) -> BulkCreateGenreOutputDTOV1:
     logic_dto = BulkCreateGenreInputDTOV1(
-        genres=[CreateGenreInputDTOV1(name=g.name, description=g.description) for g in input_dto.genres]
+        genres=[CreateGenreInputDTOV1(name=g.name, description=g.description) for g in input_dto.genres],
     )
     return await genre_logic.bulk_create_genre(input_dto=logic_dto)
 
@@ -76,22 +78,34 @@ async def bulk_create_genres(
 )
 @inject
 async def search_genres(
+    response: Response,
     _admin_uuid: UUID = Depends(get_current_admin_user_uuid),
     name: str | None = None,
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=10, ge=1, le=100, description="Number of items per page"),
     sort_column: GenreSortColumnType = Query(default=GenreSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
+    if_none_match: str | None = Header(default=None),
     genre_logic: GenreLogic = Depends(Provide[ServiceContainer.genre_logic]),
-) -> SearchGenreOutputDTOV1:
+) -> SearchGenreOutputDTOV1 | Response:
     input_dto = SearchGenreInputDTOV1.create(
         name=name,
         page=page,
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
     )
-    return await genre_logic.search_genres(input_dto=input_dto)
+    etag = ETagUtils.of(input_dto, genre_logic.get_genres_version())
+    if ETagUtils.matches(if_none_match, etag):
+        return ETagUtils.not_modified(etag)
+    output = await genre_logic.search_genres(input_dto=input_dto)
+    ETagUtils.set_headers(response, etag)
+    return output
 
 
 @routerV1.get(
@@ -103,11 +117,18 @@ async def search_genres(
 @inject
 async def get_genre(
     genre_uuid: UUID,
+    response: Response,
     _admin_uuid: UUID = Depends(get_current_admin_user_uuid),
+    if_none_match: str | None = Header(default=None),
     genre_logic: GenreLogic = Depends(Provide[ServiceContainer.genre_logic]),
-) -> GetGenreOutputDTOV1:
+) -> GetGenreOutputDTOV1 | Response:
     input_dto = GetGenreInputDTOV1(genre_uuid=genre_uuid)
-    return await genre_logic.get_genre(input_dto=input_dto)
+    genre = await genre_logic.get_genre(input_dto=input_dto)
+    etag = ETagUtils.of(genre)
+    if ETagUtils.matches(if_none_match, etag):
+        return ETagUtils.not_modified(etag)
+    ETagUtils.set_headers(response, etag)
+    return genre
 
 
 @routerV1.patch(
@@ -1,12 +1,27 @@
 from uuid import UUID
 
-from archipy.models.errors import AlreadyExistsError, NotFoundError, PermissionDeniedError, UnauthenticatedError
+from archipy.models.errors import (
+    AlreadyExistsError,
+    InvalidArgumentError,
+    NotFoundError,
+    PermissionDeniedError,
+    UnauthenticatedError,
+)
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Request, status
 from fastapi.responses import Response
 
 from src.configs.containers import ServiceContainer
+from src.configs.runtime_config import RuntimeConfig
+from src.logics.leaderboard.leaderboard_logic import LeaderboardLogic
 from src.logics.movie.movie_logic import MovieLogic
+from src.logics.recommendation.recommendation_logic import RecommendationLogic
+from src.models.dtos.leaderboard.domain.v1.leaderboard_domain_interface_dtos import (
+    GetLeaderboardInputDTOV1,
+    GetTopRatedMoviesOutputDTOV1,
+    GetTrendingMoviesOutputDTOV1,
+    LeaderboardSnapshotInfoDTOV1,
+)
 from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import (
     BulkCreateMovieInputDTOV1,
     BulkCreateMovieOutputDTOV1,
@@ -17,14 +32,28 @@ from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import (
     DeleteMovieInputDTOV1,
     GetMovieInputDTOV1,
     GetMovieOutputDTOV1,
+    ImportMoviesOutputDTOV1,
     SearchMovieInputDTOV1,
     SearchMovieOutputDTOV1,
     UpdateMovieInputDTOV1,
     UpdateMovieRestInputDTOV1,
 )
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import (
+    GetRecommendedMoviesInputDTOV1,
+    GetRecommendedMoviesOutputDTOV1,
+    GetSimilarMoviesInputDTOV1,
+    GetSimilarMoviesOutputDTOV1,
+    RecommendationSnapshotInfoDTOV1,
+)
 from src.models.types.api_router_type import ApiRouterType
+from src.models.types.movie_import_format_type import MovieImportFormatType
 from src.models.types.movie_sort_type import MovieSortColumnType
+from src.models.types.recommendation_strategy_type import RecommendationStrategyType
+from src.models.types.similarity_strategy_type import SimilarityStrategyType
+from src.models.types.total_mode_type import TotalModeType
 from src.utils.auth_dependencies import get_current_admin_user_uuid, get_current_user_uuid
+from src.utils.etag_utils import ETagUtils
+from src.utils.import_utils import ImportUtils
 from src.utils.utils import Utils
 
 routerV1: APIRouter = APIRouter(tags=[ApiRouterType.MOVIE])
@@ -33,12 +62,18 @@ _ADMIN_AUTH_RESPONSES = Utils.get_fastapi_exception_responses(
     [UnauthenticatedError, PermissionDeniedError],
 )
 
+_IMPORT_CONTENT_TYPES: dict[str, MovieImportFormatType] = {
+    "application/x-ndjson": MovieImportFormatType.NDJSON,
+    "application/jsonl": MovieImportFormatType.NDJSON,
+    "text/csv": MovieImportFormatType.CSV,
+}
+
 
 @routerV1.post(
     path="/",
     response_model=CreateMovieOutputDTOV1,
     status_code=status.HTTP_201_CREATED,
-    responses=Utils.get_fastapi_exception_responses([AlreadyExistsError]) | _ADMIN_AUTH_RESPONSES,
+    responses=Utils.get_fastapi_exception_responses([AlreadyExistsError, InvalidArgumentError]) | _ADMIN_AUTH_RESPONSES,
 )
 @inject
 async def create_movie(
@@ -58,7 +93,7 @@ async def create_movie(
     path="/bulk",
     response_model=BulkCreateMovieOutputDTOV1,
     status_code=status.HTTP_201_CREATED,
-    responses=Utils.get_fastapi_exception_responses([AlreadyExistsError]) | _ADMIN_AUTH_RESPONSES,
+    responses=Utils.get_fastapi_exception_responses([AlreadyExistsError, InvalidArgumentError]) | _ADMIN_AUTH_RESPONSES,
 )
 @inject
 async def bulk_create_movies(
@@ -70,28 +105,79 @@ async def bulk_create_movies(
         movies=[
             CreateMovieInputDTOV1(title=m.title, description=m.description, genre_uuid=m.genre_uuid)
             for m in input_dto.movies
-        ]
+        ],
     )
     return await movie_logic.bulk_create_movie(input_dto=logic_dto)
 
 
+@routerV1.post(
+    path="/import",
+    response_model=ImportMoviesOutputDTOV1,
+    status_code=status.HTTP_200_OK,
+    responses=Utils.get_fastapi_exception_responses([InvalidArgumentError]) | _ADMIN_AUTH_RESPONSES,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                content_type: {"schema": {"type": "string", "format": "binary"}}
+                for content_type in _IMPORT_CONTENT_TYPES
+            },
+        },
+    },
+)
+@inject
+async def import_movies(
+    request: Request,
+    import_format: MovieImportFormatType | None = Query(None, alias="format"),
+    _admin_uuid: UUID = Depends(get_current_admin_user_uuid),
+    movie_logic: MovieLogic = Depends(Provide[ServiceContainer.movie_logic]),
+) -> ImportMoviesOutputDTOV1:
+    if import_format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        import_format = _IMPORT_CONTENT_TYPES.get(content_type)
+    if import_format is None:
+        raise InvalidArgumentError(argument_name="format")
+
+    max_line_bytes = RuntimeConfig.global_config().MOVIE_IMPORT.MAX_LINE_BYTES
+    if import_format == MovieImportFormatType.CSV:
+        records = ImportUtils.iter_csv_records(request.stream(), max_line_bytes=max_line_bytes)
+    else:
+        records = ImportUtils.iter_ndjson_records(request.stream(), max_line_bytes=max_line_bytes)
+    return await movie_logic.import_movies(records=records)
+
+
 @routerV1.get(
     path="/",
     response_model=SearchMovieOutputDTOV1,
     status_code=status.HTTP_200_OK,
-    responses=_ADMIN_AUTH_RESPONSES,
+    responses=Utils.get_fastapi_exception_responses([InvalidArgumentError]) | _ADMIN_AUTH_RESPONSES,
 )
 @inject
 async def search_movies(
+    response: Response,
     _admin_uuid: UUID = Depends(get_current_user_uuid),
     title: str | None = None,
+    search: str | None = Query(
+        default=None,
+        max_length=255,
+        description="Full-text query over title and description; results are ordered by relevance",
+    ),
     genre_uuid: UUID | None = None,
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=10, ge=1, le=100, description="Number of items per page"),
     sort_column: MovieSortColumnType = Query(default=MovieSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="next_cursor of the previous page; pages by keyset instead of page number and skips the total",
+    ),
+    if_none_match: str | None = Header(default=None),
     movie_logic: MovieLogic = Depends(Provide[ServiceContainer.movie_logic]),
-) -> SearchMovieOutputDTOV1:
+) -> SearchMovieOutputDTOV1 | Response:
     input_dto = SearchMovieInputDTOV1.create(
         title=title,
         genre_uuid=genre_uuid,
@@ -99,8 +185,86 @@ async def search_movies(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
+        cursor=cursor,
+        search=search,
     )
-    return await movie_logic.search_movies(input_dto=input_dto)
+    # Taken before the search, so a write committing during it leaves the tag older than the page, never newer.
+    etag = ETagUtils.of(input_dto, movie_logic.get_movies_version())
+    if ETagUtils.matches(if_none_match, etag):
+        return ETagUtils.not_modified(etag)
+    output = await movie_logic.search_movies(input_dto=input_dto)
+    ETagUtils.set_headers(response, etag)
+    return output
+
+
+@routerV1.get(
+    path="/top",
+    response_model=GetTopRatedMoviesOutputDTOV1,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_top_rated_movies(
+    response: Response,
+    genre_uuid: UUID | None = None,
+    limit: int = Query(default=20, ge=1, le=100, description="Number of movies to return"),
+    leaderboard_logic: LeaderboardLogic = Depends(Provide[ServiceContainer.leaderboard_logic]),
+) -> GetTopRatedMoviesOutputDTOV1:
+    input_dto = GetLeaderboardInputDTOV1(genre_uuid=genre_uuid, limit=limit)
+    output = await leaderboard_logic.get_top_rated(input_dto=input_dto)
+    _set_snapshot_headers(response, output)
+    return output
+
+
+@routerV1.get(
+    path="/trending",
+    response_model=GetTrendingMoviesOutputDTOV1,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_trending_movies(
+    response: Response,
+    genre_uuid: UUID | None = None,
+    limit: int = Query(default=20, ge=1, le=100, description="Number of movies to return"),
+    leaderboard_logic: LeaderboardLogic = Depends(Provide[ServiceContainer.leaderboard_logic]),
+) -> GetTrendingMoviesOutputDTOV1:
+    input_dto = GetLeaderboardInputDTOV1(genre_uuid=genre_uuid, limit=limit)
+    output = await leaderboard_logic.get_trending(input_dto=input_dto)
+    _set_snapshot_headers(response, output)
+    return output
+
+
+@routerV1.get(
+    path="/recommended",
+    response_model=GetRecommendedMoviesOutputDTOV1,
+    status_code=status.HTTP_200_OK,
+    responses=Utils.get_fastapi_exception_responses([UnauthenticatedError]),
+)
+@inject
+async def get_recommended_movies(
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100, description="Number of movies to return"),
+    strategy: RecommendationStrategyType = Query(
+        default=RecommendationStrategyType.NEIGHBORS,
+        description="neighbors: item-item similarity; factors: matrix factorization",
+    ),
+    user_uuid: UUID = Depends(get_current_user_uuid),
+    recommendation_logic: RecommendationLogic = Depends(Provide[ServiceContainer.recommendation_logic]),
+) -> GetRecommendedMoviesOutputDTOV1:
+    input_dto = GetRecommendedMoviesInputDTOV1(user_uuid=user_uuid, limit=limit, strategy=strategy)
+    output = await recommendation_logic.get_recommended_movies(input_dto=input_dto)
+    _set_snapshot_headers(response, output, visibility="private")
+    return output
+
+
+def _set_snapshot_headers(
+    response: Response,
+    snapshot: LeaderboardSnapshotInfoDTOV1 | RecommendationSnapshotInfoDTOV1,
+    visibility: str = "public",
+) -> None:
+    # Caches count Age against max-age, so a copy stays fresh until the next refresh is due.
+    response.headers["Age"] = str(int(snapshot.age_seconds))
+    response.headers["Cache-Control"] = f"{visibility}, max-age={int(snapshot.refresh_interval_seconds)}"
 
 
 @routerV1.get(
@@ -112,17 +276,49 @@ async def search_movies(
 @inject
 async def get_movie(
     movie_uuid: UUID,
+    response: Response,
     _admin_uuid: UUID = Depends(get_current_user_uuid),
+    if_none_match: str | None = Header(default=None),
     movie_logic: MovieLogic = Depends(Provide[ServiceContainer.movie_logic]),
-) -> GetMovieOutputDTOV1:
+) -> GetMovieOutputDTOV1 | Response:
     input_dto = GetMovieInputDTOV1(movie_uuid=movie_uuid)
-    return await movie_logic.get_movie(input_dto=input_dto)
+    # Mostly a response cache hit, so a revalidation neither queries nor serializes the response.
+    movie = await movie_logic.get_movie(input_dto=input_dto)
+    etag = ETagUtils.of(movie)
+    if ETagUtils.matches(if_none_match, etag):
+        return ETagUtils.not_modified(etag)
+    ETagUtils.set_headers(response, etag)
+    return movie
+
+
+@routerV1.get(
+    path="/{movie_uuid}/similar",
+    response_model=GetSimilarMoviesOutputDTOV1,
+    status_code=status.HTTP_200_OK,
+    responses=Utils.get_fastapi_exception_responses([UnauthenticatedError]),
+)
+@inject
+async def get_similar_movies(
+    response: Response,
+    movie_uuid: UUID,
+    limit: int = Query(default=20, ge=1, le=100, description="Number of movies to return"),
+    strategy: SimilarityStrategyType = Query(
+        default=SimilarityStrategyType.AUDIENCE,
+        description="audience: watched and rated by the same users; content: similar title and description",
+    ),
+    _user_uuid: UUID = Depends(get_current_user_uuid),
+    recommendation_logic: RecommendationLogic = Depends(Provide[ServiceContainer.recommendation_logic]),
+) -> GetSimilarMoviesOutputDTOV1:
+    input_dto = GetSimilarMoviesInputDTOV1(movie_uuid=movie_uuid, limit=limit, strategy=strategy)
+    output = await recommendation_logic.get_similar_movies(input_dto=input_dto)
+    _set_snapshot_headers(response, output, visibility="private")
+    return output
 
 
 @routerV1.patch(
     path="/{movie_uuid}",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses=Utils.get_fastapi_exception_responses([NotFoundError]) | _ADMIN_AUTH_RESPONSES,
+    responses=Utils.get_fastapi_exception_responses([NotFoundError, InvalidArgumentError]) | _ADMIN_AUTH_RESPONSES,
 )
 @inject
 async def update_movie(
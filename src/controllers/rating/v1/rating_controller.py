@@ -6,10 +6,13 @@ from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import Response
 
 from src.configs.containers import ServiceContainer
+from src.configs.runtime_config import RuntimeConfig
 from src.logics.rating.rating_logic import RatingLogic
 from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import (
     GetMovieRatersInputDTOV1,
     GetMovieRatersOutputDTOV1,
+    GetMovieRatingHistogramInputDTOV1,
+    GetMovieRatingHistogramOutputDTOV1,
     GetMyRatingsInputDTOV1,
     GetMyRatingsOutputDTOV1,
     GetUserRatingsInputDTOV1,
@@ -21,6 +24,7 @@ from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import (
     UpdateRatingRestInputDTOV1,
 )
 from src.models.types.rating_sort_type import RatingSortColumnType
+from src.models.types.total_mode_type import TotalModeType
 from src.utils.auth_dependencies import get_current_admin_user_uuid, get_current_user_uuid
 from src.utils.utils import Utils
 
@@ -81,6 +85,10 @@ async def get_my_ratings(
     page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
     sort_column: RatingSortColumnType = Query(default=RatingSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
     rating_logic: RatingLogic = Depends(Provide[ServiceContainer.rating_logic]),
 ) -> GetMyRatingsOutputDTOV1:
     input_dto = GetMyRatingsInputDTOV1.create(
@@ -89,6 +97,7 @@ async def get_my_ratings(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
     )
     return await rating_logic.get_my_ratings(input_dto=input_dto)
 
@@ -107,6 +116,10 @@ async def get_user_ratings(
     page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
     sort_column: RatingSortColumnType = Query(default=RatingSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
     rating_logic: RatingLogic = Depends(Provide[ServiceContainer.rating_logic]),
 ) -> GetUserRatingsOutputDTOV1:
     input_dto = GetUserRatingsInputDTOV1.create(
@@ -115,6 +128,7 @@ async def get_user_ratings(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
     )
     return await rating_logic.get_user_ratings(input_dto=input_dto)
 
@@ -133,6 +147,10 @@ async def get_movie_raters(
     page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
     sort_column: RatingSortColumnType = Query(default=RatingSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
     rating_logic: RatingLogic = Depends(Provide[ServiceContainer.rating_logic]),
 ) -> GetMovieRatersOutputDTOV1:
     input_dto = GetMovieRatersInputDTOV1.create(
@@ -141,5 +159,27 @@ async def get_movie_raters(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
     )
     return await rating_logic.get_movie_raters(input_dto=input_dto)
+
+
+@routerV1.get(
+    path="/movie/{movie_uuid}/histogram",
+    response_model=GetMovieRatingHistogramOutputDTOV1,
+    status_code=status.HTTP_200_OK,
+    responses=Utils.get_fastapi_exception_responses([UnauthenticatedError, NotFoundError]),
+)
+@inject
+async def get_movie_rating_histogram(
+    movie_uuid: UUID,
+    response: Response,
+    _current_user_uuid: UUID = Depends(get_current_user_uuid),
+    rating_logic: RatingLogic = Depends(Provide[ServiceContainer.rating_logic]),
+) -> GetMovieRatingHistogramOutputDTOV1:
+    input_dto = GetMovieRatingHistogramInputDTOV1(movie_uuid=movie_uuid)
+    histogram = await rating_logic.get_movie_rating_histogram(input_dto=input_dto)
+    # Same for every caller, but only authenticated clients may read it, so shared caches must not keep it.
+    max_age = RuntimeConfig.global_config().HTTP_CACHE.RATING_HISTOGRAM_MAX_AGE_SECONDS
+    response.headers["Cache-Control"] = f"private, max-age={max_age}"
+    return histogram
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from archipy.models.errors import AlreadyExistsError, NotFoundError, PermissionDeniedError, UnauthenticatedError
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 from fastapi.responses import Response
 
 from src.configs.containers import ServiceContainer
@@ -20,8 +20,10 @@ from src.models.dtos.user.domain.v1.user_domain_interface_dtos import (
     UpdateUserRestInputDTOV1,
 )
 from src.models.types.api_router_type import ApiRouterType
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.user_sort_type import UserSortColumnType
 from src.utils.auth_dependencies import get_current_admin_user_uuid
+from src.utils.etag_utils import ETagUtils
 from src.utils.utils import Utils
 
 routerV1: APIRouter = APIRouter(tags=[ApiRouterType.USER])
@@ -60,11 +62,18 @@ async def create_user(
 @inject
 async def get_user(
     user_uuid: UUID,
+    response: Response,
     _admin_uuid: UUID = Depends(get_current_admin_user_uuid),
+    if_none_match: str | None = Header(default=None),
     logic: UserLogic = Depends(Provide[ServiceContainer.user_logic]),
-) -> GetUserOutputDTOV1:
+) -> GetUserOutputDTOV1 | Response:
     input_dto = GetUserInputDTOV1(user_uuid=user_uuid)
-    return await logic.get_user(input_dto=input_dto)
+    user = await logic.get_user(input_dto=input_dto)
+    etag = ETagUtils.of(user)
+    if ETagUtils.matches(if_none_match, etag):
+        return ETagUtils.not_modified(etag)
+    ETagUtils.set_headers(response, etag)
+    return user
 
 
 @routerV1.get(
@@ -74,6 +83,7 @@ async def get_user(
 )
 @inject
 async def search_users(
+    response: Response,
     _admin_uuid: UUID = Depends(get_current_admin_user_uuid),
     first_name: str | None = None,
     last_name: str | None = None,
@@ -83,8 +93,13 @@ async def search_users(
     page_size: int = Query(default=10, ge=1, le=100, description="Number of items per page"),
     sort_column: UserSortColumnType = Query(default=UserSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
+    if_none_match: str | None = Header(default=None),
     logic: UserLogic = Depends(Provide[ServiceContainer.user_logic]),
-) -> SearchUserOutputDTOV1:
+) -> SearchUserOutputDTOV1 | Response:
     input_dto = SearchUserInputDTOV1.create(
         first_name=first_name,
         last_name=last_name,
@@ -94,8 +109,14 @@ async def search_users(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
     )
-    return await logic.search_users(input_dto=input_dto)
+    etag = ETagUtils.of(input_dto, logic.get_users_version())
+    if ETagUtils.matches(if_none_match, etag):
+        return ETagUtils.not_modified(etag)
+    output = await logic.search_users(input_dto=input_dto)
+    ETagUtils.set_headers(response, etag)
+    return output
 
 
 @routerV1.patch(
@@ -28,6 +28,7 @@ from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import (
     WatchMovieOutputDTOV1,
     WatchMovieRestInputDTOV1,
 )
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.watch_sort_type import WatchSortColumnType
 from src.models.types.watch_status_type import WatchStatusType
 from src.utils.auth_dependencies import get_current_admin_user_uuid, get_current_user_uuid
@@ -69,6 +70,10 @@ async def get_my_watch_history(
     page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
     sort_column: WatchSortColumnType = Query(default=WatchSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
     status_filter: WatchStatusType | None = Query(default=None),
     watch_logic: WatchLogic = Depends(Provide[ServiceContainer.watch_logic]),
 ) -> GetMyWatchHistoryOutputDTOV1:
@@ -78,6 +83,7 @@ async def get_my_watch_history(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
         status_filter=status_filter,
     )
     return await watch_logic.get_my_watch_history(input_dto=input_dto)
@@ -97,6 +103,10 @@ async def get_user_watch_history(
     page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
     sort_column: WatchSortColumnType = Query(default=WatchSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
     status_filter: WatchStatusType | None = Query(default=None),
     watch_logic: WatchLogic = Depends(Provide[ServiceContainer.watch_logic]),
 ) -> GetUserWatchHistoryOutputDTOV1:
@@ -106,6 +116,7 @@ async def get_user_watch_history(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
         status_filter=status_filter,
     )
     return await watch_logic.get_user_watch_history(input_dto=input_dto)
@@ -125,6 +136,10 @@ async def get_movie_watchers(
     page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
     sort_column: WatchSortColumnType = Query(default=WatchSortColumnType.CREATED_AT),
     sort_order: str = Query(default="desc"),
+    include_total: TotalModeType = Query(
+        default=TotalModeType.EXACT,
+        description="exact counts every match, estimated caps the count and may fall back to planner statistics",
+    ),
     status_filter: WatchStatusType | None = Query(default=None),
     watch_logic: WatchLogic = Depends(Provide[ServiceContainer.watch_logic]),
 ) -> GetMovieWatchersOutputDTOV1:
@@ -134,6 +149,7 @@ async def get_movie_watchers(
         page_size=page_size,
         sort_column=sort_column,
         sort_order=sort_order,
+        include_total=include_total,
         status_filter=status_filter,
     )
     return await watch_logic.get_movie_watchers(input_dto=input_dto)
@@ -11,24 +11,47 @@ from src.models.dtos.auth.domain.v1.auth_domain_interface_dtos import (
     RefreshTokenOutputDTOV1,
     RegisterUserInputDTOV1,
     RegisterUserOutputDTOV1,
+    UserPrincipalOutputDTOV1,
 )
 from src.models.dtos.user.repository.user_repository_interface_dtos import (
     CreateUserCommandDTO,
     GetUserByEmailQueryDTO,
     GetUserFullByUUIDQueryDTO,
+    GetUserPrincipalQueryDTO,
 )
+from src.models.types.entity_type import EntityType
 from src.repositories.user.user_repository import UserRepository
+from src.utils.invalidation_bus import InvalidationBus
 from src.utils.jwt_utils import JWTUtils
-from src.utils.security_utils import SecurityUtils
+from src.utils.password_hasher import PasswordHasher
+from src.utils.principal_cache import PrincipalCache
+from src.utils.response_cache import ResponseCache
 
 
 class AuthLogic:
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        principal_cache: PrincipalCache,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+    ) -> None:
         self._user_repository = user_repository
+        self._password_hasher = password_hasher
+        self._principal_cache = principal_cache
+        self._invalidation_bus = invalidation_bus
+        self._response_cache = response_cache
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def register_user(self, input_dto: RegisterUserInputDTOV1) -> RegisterUserOutputDTOV1:
-        hashed_password = SecurityUtils.get_password_hash(input_dto.password)
+        output = await self._register_user(input_dto=input_dto)
+        # Moves the users list on to a new version once the user has committed.
+        await self._response_cache.invalidate(EntityType.USER, [output.user_uuid])
+        return output
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _register_user(self, input_dto: RegisterUserInputDTOV1) -> RegisterUserOutputDTOV1:
+        hashed_password = await self._password_hasher.hash_password(input_dto.password)
 
         command_dto = CreateUserCommandDTO(
             email=input_dto.email,
@@ -40,6 +63,7 @@ class AuthLogic:
         )
 
         repo_response = await self._user_repository.create_user(input_dto=command_dto)
+        await self._invalidation_bus.publish(EntityType.USER, [repo_response.user_uuid])
 
         return RegisterUserOutputDTOV1.model_validate(obj=repo_response)
 
@@ -50,11 +74,11 @@ class AuthLogic:
             user = await self._user_repository.get_user_by_email(input_dto=query)
         except NotFoundError:
             raise UnauthenticatedError()
-        if not SecurityUtils.verify_password(input_dto.password, user.hashed_password):
+        if not await self._password_hasher.verify_password(input_dto.password, user.hashed_password):
             raise UnauthenticatedError()
         if not user.is_active:
             raise UnauthenticatedError()
-        access_token = JWTUtils.create_access_token(user.user_uuid)
+        access_token = JWTUtils.create_access_token(user.user_uuid, is_super_user=user.is_super_user)
         refresh_token = JWTUtils.create_refresh_token(user.user_uuid)
         return LoginOutputDTOV1(access_token=access_token, refresh_token=refresh_token, token_type="bearer")
 
@@ -68,7 +92,7 @@ class AuthLogic:
             raise InvalidTokenError()
         if not user.is_active:
             raise InvalidTokenError()
-        access_token = JWTUtils.create_access_token(user_uuid)
+        access_token = JWTUtils.create_access_token(user_uuid, is_super_user=user.is_super_user)
         return RefreshTokenOutputDTOV1(access_token=access_token, token_type="bearer")
 
     @async_postgres_sqlalchemy_atomic_decorator
@@ -76,3 +100,16 @@ class AuthLogic:
         query = GetUserFullByUUIDQueryDTO(user_uuid=user_uuid)
         response = await self._user_repository.get_user_full_by_uuid(input_dto=query)
         return GetMeOutputDTOV1.model_validate(obj=response)
+
+    async def get_principal(self, user_uuid: UUID) -> UserPrincipalOutputDTOV1:
+        principal = self._principal_cache.get(user_uuid)
+        if principal is None:
+            principal = await self._load_principal(user_uuid=user_uuid)
+            self._principal_cache.put(user_uuid, principal)
+        return principal
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _load_principal(self, user_uuid: UUID) -> UserPrincipalOutputDTOV1:
+        query = GetUserPrincipalQueryDTO(user_uuid=user_uuid)
+        response = await self._user_repository.get_user_principal(input_dto=query)
+        return UserPrincipalOutputDTOV1.model_validate(obj=response)
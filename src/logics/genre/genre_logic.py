@@ -1,4 +1,12 @@
+import asyncio
+import logging
+import time
+from uuid import UUID
+
 from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
+from archipy.models.errors import NotFoundError
+from archipy.models.types.sort_order_type import SortOrderType
+from pydantic import BaseModel
 
 from src.models.dtos.genre.domain.v1.genre_domain_interface_dtos import (
     BulkCreateGenreInputDTOV1,
@@ -6,6 +14,9 @@ from src.models.dtos.genre.domain.v1.genre_domain_interface_dtos import (
     CreateGenreInputDTOV1,
     CreateGenreOutputDTOV1,
     DeleteGenreInputDTOV1,
+    GenreItemDTOV1,
+    GetExistingGenreUUIDsInputDTOV1,
+    GetExistingGenreUUIDsOutputDTOV1,
     GetGenreInputDTOV1,
     GetGenreOutputDTOV1,
     SearchGenreInputDTOV1,
@@ -16,51 +27,217 @@ from src.models.dtos.genre.repository.genre_repository_interface_dtos import (
     BulkCreateGenreCommandDTO,
     CreateGenreCommandDTO,
     DeleteGenreCommandDTO,
-    GetGenreQueryDTO,
-    SearchGenreQueryDTO,
+    GetAllGenresResponseDTO,
+    GetExistingGenreUUIDsQueryDTO,
+    GetExistingGenreUUIDsResponseDTO,
     UpdateGenreCommandDTO,
 )
+from src.models.entities.genre_entity import GenreEntity
+from src.models.types.entity_type import EntityType
+from src.models.types.genre_sort_type import GenreSortColumnType
 from src.repositories.genre.genre_repository import GenreRepository
+from src.utils.invalidation_bus import EntityChangedEventDTO, InvalidationBus
+from src.utils.pagination_utils import PaginationUtils
+from src.utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+_SEARCH_GENRES_ROUTE = "GET /api/v1/genres/"
+
+
+class _GenreCatalog(BaseModel):
+    genres: dict[UUID, GetGenreOutputDTOV1]
+    # Every genre in ascending order of each sort column.
+    orders: dict[GenreSortColumnType, list[GetGenreOutputDTOV1]]
 
 
 class GenreLogic:
-    def __init__(self, repository: GenreRepository) -> None:
+    """Genre CRUD, with reads served from a snapshot of the whole table held by every worker.
+
+    Writes through this worker drop the snapshot once they commit and the next read loads it again; other
+    workers drop theirs when the write's change event reaches them. ``refresh`` runs on a timer started in
+    ``manage.py`` and bounds how long a change made outside the API, or a lost event, goes unseen; cached
+    search responses are dropped whenever it finds the table changed.
+    """
+
+    def __init__(
+        self,
+        repository: GenreRepository,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+    ) -> None:
         self._repository: GenreRepository = repository
+        self._invalidation_bus: InvalidationBus = invalidation_bus
+        self._response_cache: ResponseCache = response_cache
+        self._catalog: _GenreCatalog | None = None
+        # Bumped by every write, so a load that read the table before the write is not kept.
+        self._generation = 0
+        self._load_lock = asyncio.Lock()
+        invalidation_bus.subscribe(EntityType.GENRE, self._on_genres_changed)
+
+    async def refresh(self) -> None:
+        started = time.monotonic()
+        previous = self._catalog
+        catalog = await self._load_catalog()
+        if previous is None or previous.genres != catalog.genres:
+            await self._response_cache.invalidate(EntityType.GENRE, [])
+        logger.info("Genre catalog refreshed in %.3fs: %d genres", time.monotonic() - started, len(catalog.genres))
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next read loads it again."""
+        self._generation += 1
+        self._catalog = None
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def create_genre(self, input_dto: CreateGenreInputDTOV1) -> CreateGenreOutputDTOV1:
+        output = await self._create_genre(input_dto=input_dto)
+        self.invalidate()
+        await self._response_cache.invalidate(EntityType.GENRE, [output.genre_uuid])
+        return output
+
+    async def bulk_create_genre(self, input_dto: BulkCreateGenreInputDTOV1) -> BulkCreateGenreOutputDTOV1:
+        output = await self._bulk_create_genre(input_dto=input_dto)
+        self.invalidate()
+        await self._response_cache.invalidate(EntityType.GENRE, [genre.genre_uuid for genre in output.genres])
+        return output
+
+    async def get_genre(self, input_dto: GetGenreInputDTOV1) -> GetGenreOutputDTOV1:
+        catalog = await self._current_catalog()
+        genre = catalog.genres.get(input_dto.genre_uuid)
+        if genre is None:
+            raise NotFoundError(resource_type=GenreEntity.__name__)
+        return genre
+
+    async def get_existing_genre_uuids(
+        self,
+        input_dto: GetExistingGenreUUIDsInputDTOV1,
+    ) -> GetExistingGenreUUIDsOutputDTOV1:
+        """Those of the given genre UUIDs that exist. Only UUIDs missing from the snapshot reach the database."""
+        catalog = await self._current_catalog()
+        existing = {genre_uuid for genre_uuid in input_dto.genre_uuids if genre_uuid in catalog.genres}
+        unknown = set(input_dto.genre_uuids) - existing
+        if unknown:
+            found = await self._find_genres(query=GetExistingGenreUUIDsQueryDTO(genre_uuids=list(unknown)))
+            if found.genre_uuids:
+                # Created through another worker since the last refresh.
+                self.invalidate()
+            existing |= found.genre_uuids
+        return GetExistingGenreUUIDsOutputDTOV1(genre_uuids=existing)
+
+    def get_genres_version(self) -> str:
+        return self._response_cache.collection_version([EntityType.GENRE])
+
+    async def search_genres(self, input_dto: SearchGenreInputDTOV1) -> SearchGenreOutputDTOV1:
+        return await self._response_cache.get_or_load(
+            route=_SEARCH_GENRES_ROUTE,
+            params=input_dto,
+            output_type=SearchGenreOutputDTOV1,
+            load=lambda: self._search_genres(input_dto=input_dto),
+            # A new genre may land on any page.
+            tags=lambda _output: [EntityType.GENRE],
+        )
+
+    async def _search_genres(self, input_dto: SearchGenreInputDTOV1) -> SearchGenreOutputDTOV1:
+        catalog = await self._current_catalog()
+        genres = catalog.orders[input_dto.sort_info.column]
+        if input_dto.sort_info.order == SortOrderType.DESCENDING:
+            genres = genres[::-1]
+        if input_dto.name:
+            genres = [genre for genre in genres if self._name_matches(genre.name, input_dto.name)]
+
+        offset = input_dto.pagination.offset
+        page = genres[offset : offset + input_dto.pagination.page_size]
+        total, total_is_exact = PaginationUtils.resolve_counted_total(
+            len(genres),
+            input_dto.pagination,
+            page_length=len(page),
+            include_total=input_dto.include_total,
+        )
+        return SearchGenreOutputDTOV1(
+            genres=[GenreItemDTOV1(**genre.model_dump(exclude={"updated_at"})) for genre in page],
+            total=total,
+            total_is_exact=total_is_exact,
+        )
+
+    async def update_genre(self, input_dto: UpdateGenreInputDTOV1) -> None:
+        await self._update_genre(input_dto=input_dto)
+        self.invalidate()
+        await self._response_cache.invalidate(EntityType.GENRE, [input_dto.genre_uuid])
+
+    async def delete_genre(self, input_dto: DeleteGenreInputDTOV1) -> None:
+        await self._delete_genre(input_dto=input_dto)
+        self.invalidate()
+        await self._response_cache.invalidate(EntityType.GENRE, [input_dto.genre_uuid])
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _create_genre(self, input_dto: CreateGenreInputDTOV1) -> CreateGenreOutputDTOV1:
         command: CreateGenreCommandDTO = CreateGenreCommandDTO.model_validate(obj=input_dto.model_dump())
         response = await self._repository.create_genre(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.GENRE, [response.genre_uuid])
         return CreateGenreOutputDTOV1.model_validate(obj=response)
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def bulk_create_genre(self, input_dto: BulkCreateGenreInputDTOV1) -> BulkCreateGenreOutputDTOV1:
+    async def _bulk_create_genre(self, input_dto: BulkCreateGenreInputDTOV1) -> BulkCreateGenreOutputDTOV1:
         command = BulkCreateGenreCommandDTO(
-            genres=[CreateGenreCommandDTO.model_validate(obj=g.model_dump()) for g in input_dto.genres]
+            genres=[CreateGenreCommandDTO.model_validate(obj=g.model_dump()) for g in input_dto.genres],
+            skip_conflicts=input_dto.skip_conflicts,
         )
         response = await self._repository.bulk_create_genre(input_dto=command)
+        if response.genres:
+            await self._invalidation_bus.publish(EntityType.GENRE, [genre.genre_uuid for genre in response.genres])
         return BulkCreateGenreOutputDTOV1(
-            genres=[CreateGenreOutputDTOV1.model_validate(obj=g) for g in response.genres]
+            genres=[CreateGenreOutputDTOV1.model_validate(obj=g) for g in response.genres],
+            conflicting_indexes=response.conflicting_indexes,
         )
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def get_genre(self, input_dto: GetGenreInputDTOV1) -> GetGenreOutputDTOV1:
-        query: GetGenreQueryDTO = GetGenreQueryDTO.model_validate(obj=input_dto.model_dump())
-        response = await self._repository.get_genre(input_dto=query)
-        return GetGenreOutputDTOV1.model_validate(obj=response)
-
-    @async_postgres_sqlalchemy_atomic_decorator
-    async def search_genres(self, input_dto: SearchGenreInputDTOV1) -> SearchGenreOutputDTOV1:
-        query: SearchGenreQueryDTO = SearchGenreQueryDTO.model_validate(obj=input_dto.model_dump())
-        response = await self._repository.search_genres(input_dto=query)
-        return SearchGenreOutputDTOV1.model_validate(obj=response)
-
-    @async_postgres_sqlalchemy_atomic_decorator
-    async def update_genre(self, input_dto: UpdateGenreInputDTOV1) -> None:
+    async def _update_genre(self, input_dto: UpdateGenreInputDTOV1) -> None:
         command: UpdateGenreCommandDTO = UpdateGenreCommandDTO.model_validate(obj=input_dto.model_dump())
         await self._repository.update_genre(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.GENRE, [input_dto.genre_uuid])
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def delete_genre(self, input_dto: DeleteGenreInputDTOV1) -> None:
+    async def _delete_genre(self, input_dto: DeleteGenreInputDTOV1) -> None:
         command: DeleteGenreCommandDTO = DeleteGenreCommandDTO.model_validate(obj=input_dto.model_dump())
         await self._repository.delete_genre(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.GENRE, [input_dto.genre_uuid])
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _find_genres(self, query: GetExistingGenreUUIDsQueryDTO) -> GetExistingGenreUUIDsResponseDTO:
+        return await self._repository.get_existing_genre_uuids(input_dto=query)
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _load_genres(self) -> GetAllGenresResponseDTO:
+        return await self._repository.get_all_genres()
+
+    async def _on_genres_changed(self, _event: EntityChangedEventDTO) -> None:
+        self.invalidate()
+
+    async def _current_catalog(self) -> _GenreCatalog:
+        catalog = self._catalog
+        if catalog is None:
+            async with self._load_lock:
+                catalog = self._catalog
+                if catalog is None:
+                    catalog = await self._load_catalog()
+        return catalog
+
+    async def _load_catalog(self) -> _GenreCatalog:
+        generation = self._generation
+        response = await self._load_genres()
+        genres = [GetGenreOutputDTOV1.model_validate(obj=genre.model_dump()) for genre in response.genres]
+        catalog = _GenreCatalog(
+            genres={genre.genre_uuid: genre for genre in genres},
+            orders={
+                # Case-folded first, which is closer to a database collation than code point order.
+                GenreSortColumnType.NAME: sorted(genres, key=lambda g: (g.name.casefold(), g.name, g.genre_uuid)),
+                GenreSortColumnType.CREATED_AT: sorted(genres, key=lambda g: (g.created_at, g.genre_uuid)),
+            },
+        )
+        if generation == self._generation:
+            self._catalog = catalog
+        return catalog
+
+    @staticmethod
+    def _name_matches(name: str, term: str) -> bool:
+        """``SQLUtils.contains`` in memory: a case-insensitive substring match."""
+        return term.lower() in name.lower()
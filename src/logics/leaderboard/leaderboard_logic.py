@@ -0,0 +1,144 @@
+# src/logics/leaderboard/leaderboard_logic.py
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TypeVar
+from uuid import UUID
+
+from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
+from pydantic import BaseModel
+
+from src.configs.runtime_config import LeaderboardConfig, RuntimeConfig
+from src.models.dtos.leaderboard.domain.v1.leaderboard_domain_interface_dtos import (
+    GetLeaderboardInputDTOV1,
+    GetTopRatedMoviesOutputDTOV1,
+    GetTrendingMoviesOutputDTOV1,
+    LeaderboardSnapshotInfoDTOV1,
+    TopRatedMovieItemDTOV1,
+    TrendingMovieItemDTOV1,
+)
+from src.models.dtos.leaderboard.repository.leaderboard_repository_interface_dtos import (
+    GetTopRatedQueryDTO,
+    GetTrendingQueryDTO,
+)
+from src.repositories.leaderboard.leaderboard_repository import LeaderboardRepository
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT", TopRatedMovieItemDTOV1, TrendingMovieItemDTOV1)
+
+
+class _LeaderboardSnapshot(BaseModel):
+    generated_at: datetime
+    # Keyed by genre_uuid; None holds the overall ranking.
+    top_rated: dict[UUID | None, list[TopRatedMovieItemDTOV1]]
+    trending: dict[UUID | None, list[TrendingMovieItemDTOV1]]
+
+
+class LeaderboardLogic:
+    """Top-rated and trending leaderboards served from an in-process snapshot.
+
+    ``refresh`` recomputes both rankings and swaps the snapshot in a single assignment, so readers never
+    see a partial one. It runs on a timer started in ``manage.py``, and once on demand if a request
+    arrives before the first run has finished.
+    """
+
+    def __init__(self, repository: LeaderboardRepository, config: LeaderboardConfig | None = None) -> None:
+        self._repository = repository
+        self._config: LeaderboardConfig = config or RuntimeConfig.global_config().LEADERBOARD
+        self._snapshot: _LeaderboardSnapshot | None = None
+        self._first_refresh_lock = asyncio.Lock()
+
+    async def refresh(self) -> LeaderboardSnapshotInfoDTOV1:
+        started = time.monotonic()
+        self._snapshot = await self._build_snapshot()
+        logger.info(
+            "Leaderboards refreshed in %.3fs: %d top-rated, %d trending",
+            time.monotonic() - started,
+            len(self._snapshot.top_rated[None]),
+            len(self._snapshot.trending[None]),
+        )
+        return self._snapshot_info(self._snapshot)
+
+    async def get_top_rated(self, input_dto: GetLeaderboardInputDTOV1) -> GetTopRatedMoviesOutputDTOV1:
+        snapshot = await self._current_snapshot()
+        return GetTopRatedMoviesOutputDTOV1(
+            **self._snapshot_info(snapshot).model_dump(),
+            movies=snapshot.top_rated.get(input_dto.genre_uuid, [])[: input_dto.limit],
+        )
+
+    async def get_trending(self, input_dto: GetLeaderboardInputDTOV1) -> GetTrendingMoviesOutputDTOV1:
+        snapshot = await self._current_snapshot()
+        return GetTrendingMoviesOutputDTOV1(
+            **self._snapshot_info(snapshot).model_dump(),
+            movies=snapshot.trending.get(input_dto.genre_uuid, [])[: input_dto.limit],
+        )
+
+    async def _current_snapshot(self) -> _LeaderboardSnapshot:
+        if self._snapshot is None:
+            async with self._first_refresh_lock:
+                if self._snapshot is None:
+                    await self.refresh()
+        return self._snapshot
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _build_snapshot(self) -> _LeaderboardSnapshot:
+        now = datetime.now(UTC)
+        top_rated = await self._repository.get_top_rated(
+            input_dto=GetTopRatedQueryDTO(prior_votes=self._config.PRIOR_VOTES, size=self._config.SIZE),
+        )
+        trending = await self._repository.get_trending(
+            input_dto=GetTrendingQueryDTO(
+                now=now,
+                since=now - timedelta(hours=self._config.TRENDING_WINDOW_HOURS),
+                half_life_seconds=self._config.TRENDING_HALF_LIFE_HOURS * 3600,
+                size=self._config.SIZE,
+            ),
+        )
+        return _LeaderboardSnapshot(
+            generated_at=now,
+            top_rated=self._by_genre(
+                [
+                    TopRatedMovieItemDTOV1(
+                        movie_uuid=movie.movie_uuid,
+                        title=movie.title,
+                        genre_uuid=movie.genre_uuid,
+                        weighted_rating=round(movie.weighted_rating, 3),
+                        rating_count=movie.rating_count,
+                        average_rating=round(movie.rating_sum / movie.rating_count, 2),
+                    )
+                    for movie in top_rated.movies
+                ],
+            ),
+            trending=self._by_genre(
+                [
+                    TrendingMovieItemDTOV1(
+                        movie_uuid=movie.movie_uuid,
+                        title=movie.title,
+                        genre_uuid=movie.genre_uuid,
+                        trending_score=round(movie.trending_score, 3),
+                        activity_count=movie.activity_count,
+                    )
+                    for movie in trending.movies
+                ],
+            ),
+        )
+
+    def _by_genre(self, items: list[ItemT]) -> dict[UUID | None, list[ItemT]]:
+        """Split a ranking into per-genre rankings; the overall one is its head.
+
+        The repository returns each genre's best ``SIZE`` movies in overall order, which always contains
+        the overall best ``SIZE``.
+        """
+        rankings: dict[UUID | None, list[ItemT]] = {None: items[: self._config.SIZE]}
+        for item in items:
+            rankings.setdefault(item.genre_uuid, []).append(item)
+        return rankings
+
+    def _snapshot_info(self, snapshot: _LeaderboardSnapshot) -> LeaderboardSnapshotInfoDTOV1:
+        return LeaderboardSnapshotInfoDTOV1(
+            generated_at=snapshot.generated_at,
+            age_seconds=round((datetime.now(UTC) - snapshot.generated_at).total_seconds(), 3),
+            refresh_interval_seconds=self._config.REFRESH_INTERVAL_SECONDS,
+        )
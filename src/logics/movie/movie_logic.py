@@ -1,13 +1,27 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
 from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
+from archipy.models.errors import InvalidArgumentError
+from pydantic import ValidationError
 
+from src.configs.runtime_config import RuntimeConfig
+from src.logics.genre.genre_logic import GenreLogic
+from src.logics.recommendation.content_similarity_logic import ContentSimilarityLogic
+from src.models.dtos.genre.domain.v1.genre_domain_interface_dtos import GetExistingGenreUUIDsInputDTOV1
 from src.models.dtos.movie.domain.v1.movie_domain_interface_dtos import (
     BulkCreateMovieInputDTOV1,
     BulkCreateMovieOutputDTOV1,
     CreateMovieInputDTOV1,
     CreateMovieOutputDTOV1,
+    CreateMovieRestInputDTOV1,
     DeleteMovieInputDTOV1,
     GetMovieInputDTOV1,
     GetMovieOutputDTOV1,
+    ImportMovieErrorDTOV1,
+    ImportMoviesOutputDTOV1,
+    MovieItemDTOV1,
+    MovieStatsDTOV1,
     SearchMovieInputDTOV1,
     SearchMovieOutputDTOV1,
     UpdateMovieInputDTOV1,
@@ -16,51 +30,283 @@ from src.models.dtos.movie.repository.movie_repository_interface_dtos import (
     BulkCreateMovieCommandDTO,
     CreateMovieCommandDTO,
     DeleteMovieCommandDTO,
+    GetExistingMovieKeysQueryDTO,
     GetMovieQueryDTO,
+    MovieCursorDTO,
     SearchMovieQueryDTO,
     UpdateMovieCommandDTO,
 )
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import MovieStatsDTO
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import IndexMoviesInputDTOV1
+from src.models.types.entity_type import EntityType
 from src.repositories.movie.movie_repository import MovieRepository
+from src.utils.cursor_utils import CursorUtils
+from src.utils.import_utils import ImportRecordDTO
+from src.utils.invalidation_bus import InvalidationBus
+from src.utils.response_cache import ResponseCache
+from src.utils.single_flight import SingleFlight
+
+_GET_MOVIE_ROUTE = "GET /api/v1/movies/{movie_uuid}"
+# A listed movie shows its stats too, which watches and ratings change.
+_SEARCH_MOVIES_ENTITY_TYPES = (EntityType.MOVIE, EntityType.GENRE, EntityType.WATCH, EntityType.RATING)
 
 
 class MovieLogic:
-    def __init__(self, repository: MovieRepository) -> None:
+    def __init__(
+        self,
+        repository: MovieRepository,
+        genre_logic: GenreLogic,
+        content_similarity_logic: ContentSimilarityLogic,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+        single_flight: SingleFlight,
+    ) -> None:
         self._repository: MovieRepository = repository
+        self._genre_logic: GenreLogic = genre_logic
+        self._content_similarity_logic = content_similarity_logic
+        self._invalidation_bus: InvalidationBus = invalidation_bus
+        self._response_cache: ResponseCache = response_cache
+        self._single_flight: SingleFlight = single_flight
 
-    @async_postgres_sqlalchemy_atomic_decorator
+    # The content index and cached responses are updated once the write has committed, so they never hold a
+    # rolled-back title; the content index is queued and updated in the background.
     async def create_movie(self, input_dto: CreateMovieInputDTOV1) -> CreateMovieOutputDTOV1:
+        await self._require_genres([input_dto.genre_uuid])
+        output = await self._create_movie(input_dto=input_dto)
+        await self._response_cache.invalidate(EntityType.MOVIE, [output.movie_uuid])
+        self._content_similarity_logic.index_movies(
+            input_dto=IndexMoviesInputDTOV1(movie_uuids=[output.movie_uuid]),
+        )
+        return output
+
+    async def bulk_create_movie(self, input_dto: BulkCreateMovieInputDTOV1) -> BulkCreateMovieOutputDTOV1:
+        await self._require_genres([movie.genre_uuid for movie in input_dto.movies])
+        output = await self._bulk_create_movie(input_dto=input_dto)
+        if output.movies:
+            await self._response_cache.invalidate(EntityType.MOVIE, [movie.movie_uuid for movie in output.movies])
+            self._content_similarity_logic.index_movies(
+                input_dto=IndexMoviesInputDTOV1(movie_uuids=[movie.movie_uuid for movie in output.movies]),
+            )
+        return output
+
+    async def update_movie(self, input_dto: UpdateMovieInputDTOV1) -> None:
+        if input_dto.genre_uuid is not None:
+            await self._require_genres([input_dto.genre_uuid])
+        await self._update_movie(input_dto=input_dto)
+        await self._response_cache.invalidate(EntityType.MOVIE, [input_dto.movie_uuid])
+        self._content_similarity_logic.index_movies(
+            input_dto=IndexMoviesInputDTOV1(movie_uuids=[input_dto.movie_uuid]),
+        )
+
+    async def delete_movie(self, input_dto: DeleteMovieInputDTOV1) -> None:
+        await self._delete_movie(input_dto=input_dto)
+        await self._response_cache.invalidate(EntityType.MOVIE, [input_dto.movie_uuid])
+        self._content_similarity_logic.index_movies(
+            input_dto=IndexMoviesInputDTOV1(movie_uuids=[input_dto.movie_uuid]),
+        )
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _create_movie(self, input_dto: CreateMovieInputDTOV1) -> CreateMovieOutputDTOV1:
         command: CreateMovieCommandDTO = CreateMovieCommandDTO.model_validate(obj=input_dto.model_dump())
         response = await self._repository.create_movie(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.MOVIE, [response.movie_uuid])
         return CreateMovieOutputDTOV1.model_validate(obj=response)
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def bulk_create_movie(self, input_dto: BulkCreateMovieInputDTOV1) -> BulkCreateMovieOutputDTOV1:
+    async def _bulk_create_movie(self, input_dto: BulkCreateMovieInputDTOV1) -> BulkCreateMovieOutputDTOV1:
         command = BulkCreateMovieCommandDTO(
-            movies=[CreateMovieCommandDTO.model_validate(obj=m.model_dump()) for m in input_dto.movies]
+            movies=[CreateMovieCommandDTO.model_validate(obj=m.model_dump()) for m in input_dto.movies],
         )
         response = await self._repository.bulk_create_movie(input_dto=command)
+        if response.movies:
+            await self._invalidation_bus.publish(EntityType.MOVIE, [movie.movie_uuid for movie in response.movies])
         return BulkCreateMovieOutputDTOV1(
-            movies=[CreateMovieOutputDTOV1.model_validate(obj=m) for m in response.movies]
+            movies=[CreateMovieOutputDTOV1.model_validate(obj=m) for m in response.movies],
         )
 
+    async def import_movies(self, records: AsyncIterator[ImportRecordDTO]) -> ImportMoviesOutputDTOV1:
+        """Validate and insert streamed records chunk by chunk; each chunk is committed on its own."""
+        config = RuntimeConfig.global_config().MOVIE_IMPORT
+        inserted = 0
+        duplicates = 0
+        invalid = 0
+        errors: list[ImportMovieErrorDTOV1] = []
+
+        def reject(line: int, reason: str) -> None:
+            nonlocal invalid
+            invalid += 1
+            if len(errors) < config.MAX_REPORTED_ERRORS:
+                errors.append(ImportMovieErrorDTOV1(line=line, reason=reason))
+
+        async def flush(rows: list[tuple[int, CreateMovieRestInputDTOV1]]) -> None:
+            nonlocal inserted, duplicates
+            movie_uuids, chunk_duplicates, unknown_genre_lines = await self._import_movie_chunk(rows=rows)
+            if movie_uuids:
+                # Only new movies, which no cached movie shows; their type's entries are dropped.
+                await self._response_cache.invalidate(EntityType.MOVIE, [])
+                self._content_similarity_logic.index_movies(input_dto=IndexMoviesInputDTOV1(movie_uuids=movie_uuids))
+            inserted += len(movie_uuids)
+            duplicates += chunk_duplicates
+            for line in unknown_genre_lines:
+                reject(line, "genre_uuid: genre does not exist")
+
+        chunk: list[tuple[int, CreateMovieRestInputDTOV1]] = []
+        async for record in records:
+            if record.error is not None:
+                reject(record.line, record.error)
+                continue
+            try:
+                chunk.append((record.line, CreateMovieRestInputDTOV1.model_validate(obj=record.data)))
+            except ValidationError as exc:
+                error = exc.errors()[0]
+                reject(record.line, f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}")
+                continue
+            if len(chunk) >= config.CHUNK_SIZE:
+                await flush(chunk)
+                chunk = []
+        if chunk:
+            await flush(chunk)
+
+        return ImportMoviesOutputDTOV1(inserted=inserted, duplicates=duplicates, invalid=invalid, errors=errors)
+
     @async_postgres_sqlalchemy_atomic_decorator
+    async def _import_movie_chunk(
+        self,
+        rows: list[tuple[int, CreateMovieRestInputDTOV1]],
+    ) -> tuple[list[UUID], int, list[int]]:
+        """Insert one chunk, skipping rows whose (title, genre_uuid) already exists or repeats in the file.
+
+        Returns the UUIDs of the inserted movies, the number of duplicates and the lines with unknown genres.
+        """
+        genres = await self._genre_logic.get_existing_genre_uuids(
+            input_dto=GetExistingGenreUUIDsInputDTOV1(genre_uuids=list({movie.genre_uuid for _, movie in rows})),
+        )
+        existing = await self._repository.get_existing_movie_keys(
+            input_dto=GetExistingMovieKeysQueryDTO(titles=[movie.title for _, movie in rows]),
+        )
+
+        seen_keys = set(existing.keys)
+        unknown_genre_lines: list[int] = []
+        duplicates = 0
+        commands: list[CreateMovieCommandDTO] = []
+        for line, movie in rows:
+            if movie.genre_uuid not in genres.genre_uuids:
+                unknown_genre_lines.append(line)
+                continue
+            key = (movie.title, movie.genre_uuid)
+            if key in seen_keys:
+                duplicates += 1
+                continue
+            seen_keys.add(key)
+            commands.append(CreateMovieCommandDTO.model_validate(obj=movie.model_dump()))
+
+        response = await self._repository.bulk_create_movie(
+            input_dto=BulkCreateMovieCommandDTO(movies=commands),
+        )
+        movie_uuids = [movie.movie_uuid for movie in response.movies]
+        if movie_uuids:
+            await self._invalidation_bus.publish(EntityType.MOVIE, movie_uuids)
+        return movie_uuids, duplicates, unknown_genre_lines
+
     async def get_movie(self, input_dto: GetMovieInputDTOV1) -> GetMovieOutputDTOV1:
+        return await self._response_cache.get_or_load(
+            route=_GET_MOVIE_ROUTE,
+            params=input_dto,
+            output_type=GetMovieOutputDTOV1,
+            # Concurrent misses on the same movie share one query.
+            load=lambda: self._single_flight.do(
+                _GET_MOVIE_ROUTE,
+                input_dto,
+                lambda: self._get_movie(input_dto=input_dto),
+                generation=self._response_cache.generation,
+            ),
+            tags=lambda movie: [movie.movie_uuid],
+        )
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _get_movie(self, input_dto: GetMovieInputDTOV1) -> GetMovieOutputDTOV1:
         query: GetMovieQueryDTO = GetMovieQueryDTO.model_validate(obj=input_dto.model_dump())
         response = await self._repository.get_movie(input_dto=query)
-        return GetMovieOutputDTOV1.model_validate(obj=response)
+        return GetMovieOutputDTOV1(
+            **response.model_dump(exclude={"stats"}),
+            stats=self._to_stats_dto(response.stats),
+        )
+
+    def get_movies_version(self) -> str:
+        return self._response_cache.collection_version(_SEARCH_MOVIES_ENTITY_TYPES)
 
     @async_postgres_sqlalchemy_atomic_decorator
     async def search_movies(self, input_dto: SearchMovieInputDTOV1) -> SearchMovieOutputDTOV1:
-        query: SearchMovieQueryDTO = SearchMovieQueryDTO.model_validate(obj=input_dto.model_dump())
+        sort_column = input_dto.sort_info.column
+        after = None
+        if input_dto.cursor:
+            # Relevance order has no stable key to resume from, so full-text search pages by number only.
+            if input_dto.search:
+                raise InvalidArgumentError(argument_name="cursor")
+            value, movie_uuid = CursorUtils.decode(input_dto.cursor, sort_info=input_dto.sort_info)
+            after = MovieCursorDTO(value=value, movie_uuid=movie_uuid)
+        query = SearchMovieQueryDTO(
+            title=input_dto.title,
+            search=input_dto.search,
+            genre_uuid=input_dto.genre_uuid,
+            pagination=input_dto.pagination,
+            sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
+            after=after,
+        )
         response = await self._repository.search_movies(input_dto=query)
-        return SearchMovieOutputDTOV1.model_validate(obj=response)
+
+        next_cursor = None
+        if response.has_more and response.movies and not input_dto.search:
+            last = response.movies[-1]
+            next_cursor = CursorUtils.encode(
+                input_dto.sort_info,
+                value=getattr(last, sort_column.value),
+                item_uuid=last.movie_uuid,
+            )
+        return SearchMovieOutputDTOV1(
+            movies=[
+                MovieItemDTOV1(**movie.model_dump(exclude={"stats"}), stats=self._to_stats_dto(movie.stats))
+                for movie in response.movies
+            ],
+            total=response.total,
+            total_is_exact=response.total_is_exact,
+            next_cursor=next_cursor,
+        )
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def update_movie(self, input_dto: UpdateMovieInputDTOV1) -> None:
+    async def _update_movie(self, input_dto: UpdateMovieInputDTOV1) -> None:
         command: UpdateMovieCommandDTO = UpdateMovieCommandDTO.model_validate(obj=input_dto.model_dump())
         await self._repository.update_movie(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.MOVIE, [input_dto.movie_uuid])
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def delete_movie(self, input_dto: DeleteMovieInputDTOV1) -> None:
+    async def _delete_movie(self, input_dto: DeleteMovieInputDTOV1) -> None:
         command: DeleteMovieCommandDTO = DeleteMovieCommandDTO.model_validate(obj=input_dto.model_dump())
         await self._repository.delete_movie(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.MOVIE, [input_dto.movie_uuid])
+
+    async def _require_genres(self, genre_uuids: list[UUID]) -> None:
+        """Reject unknown genres before the write is sent, instead of failing on the foreign key."""
+        existing = await self._genre_logic.get_existing_genre_uuids(
+            input_dto=GetExistingGenreUUIDsInputDTOV1(genre_uuids=genre_uuids),
+        )
+        unknown_indexes = [
+            index for index, genre_uuid in enumerate(genre_uuids) if genre_uuid not in existing.genre_uuids
+        ]
+        if unknown_indexes:
+            raise InvalidArgumentError(
+                argument_name="genre_uuid",
+                additional_data={"unknown_genre_indexes": unknown_indexes},
+            )
+
+    @staticmethod
+    def _to_stats_dto(stats: MovieStatsDTO | None) -> MovieStatsDTOV1:
+        if stats is None:
+            return MovieStatsDTOV1()
+        return MovieStatsDTOV1(
+            rating_count=stats.rating_count,
+            average_rating=round(stats.rating_sum / stats.rating_count, 2) if stats.rating_count else None,
+            watched_count=stats.watched_count,
+            want_to_watch_count=stats.want_to_watch_count,
+        )
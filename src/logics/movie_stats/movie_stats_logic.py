@@ -0,0 +1,56 @@
+# src/logics/movie_stats/movie_stats_logic.py
+from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
+
+from src.models.dtos.movie_stats.domain.v1.movie_stats_domain_interface_dtos import (
+    MovieStatsCountersDTOV1,
+    MovieStatsDriftDTOV1,
+    ReconcileMovieStatsInputDTOV1,
+    ReconcileMovieStatsOutputDTOV1,
+)
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import (
+    RepairMovieStatsCommandDTO,
+)
+from src.models.types.entity_type import EntityType
+from src.repositories.movie_stats.movie_stats_repository import MovieStatsRepository
+from src.utils.invalidation_bus import InvalidationBus
+from src.utils.response_cache import ResponseCache
+
+
+class MovieStatsLogic:
+    def __init__(
+        self,
+        repository: MovieStatsRepository,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+    ) -> None:
+        self._repository = repository
+        self._invalidation_bus = invalidation_bus
+        self._response_cache = response_cache
+
+    async def reconcile(self, input_dto: ReconcileMovieStatsInputDTOV1) -> ReconcileMovieStatsOutputDTOV1:
+        """Compare every movie's stored counters with the source tables, optionally rewriting the drifted ones.
+
+        Detection and repair share one snapshot, so a repair writes exactly the values that were reported.
+        """
+        output = await self._reconcile(input_dto=input_dto)
+        if output.repaired:
+            await self._response_cache.invalidate(EntityType.MOVIE, [drift.movie_uuid for drift in output.drifts])
+        return output
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _reconcile(self, input_dto: ReconcileMovieStatsInputDTOV1) -> ReconcileMovieStatsOutputDTOV1:
+        response = await self._repository.find_drift()
+        drifts = [
+            MovieStatsDriftDTOV1(
+                movie_uuid=drift.movie_uuid,
+                stored=MovieStatsCountersDTOV1.model_validate(obj=drift.stored.model_dump()),
+                actual=MovieStatsCountersDTOV1.model_validate(obj=drift.actual.model_dump()),
+            )
+            for drift in response.drifts
+        ]
+        repaired = input_dto.repair and bool(drifts)
+        if repaired:
+            movie_uuids = [drift.movie_uuid for drift in drifts]
+            await self._repository.repair(input_dto=RepairMovieStatsCommandDTO(movie_uuids=movie_uuids))
+            await self._invalidation_bus.publish(EntityType.MOVIE, movie_uuids)
+        return ReconcileMovieStatsOutputDTOV1(drifts=drifts, repaired=repaired)
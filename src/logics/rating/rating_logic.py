@@ -1,10 +1,17 @@
 # src/logics/rating/rating_logic.py
 from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
-from archipy.models.errors import AlreadyExistsError, InvalidArgumentError
 
+from src.logics.recommendation.recommendation_logic import RecommendationLogic
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import (
+    ApplyMovieStatsDeltaCommandDTO,
+    GetMovieStatsQueryDTO,
+    MovieStatsDTO,
+)
 from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import (
     GetMovieRatersInputDTOV1,
     GetMovieRatersOutputDTOV1,
+    GetMovieRatingHistogramInputDTOV1,
+    GetMovieRatingHistogramOutputDTOV1,
     GetMyRatingsInputDTOV1,
     GetMyRatingsOutputDTOV1,
     GetUserRatingsInputDTOV1,
@@ -13,61 +20,124 @@ from src.models.dtos.rating.domain.v1.rating_domain_interface_dtos import (
     RateMovieInputDTOV1,
     RateMovieOutputDTOV1,
     RaterUserItemDTOV1,
+    RatingHistogramBucketDTOV1,
     UpdateRatingInputDTOV1,
+    UpdateRatingOutputDTOV1,
 )
 from src.models.dtos.rating.repository.rating_repository_interface_dtos import (
-    CheckRatingExistsQueryDTO,
     CreateRatingCommandDTO,
     GetMovieRatersQueryDTO,
     GetMyRatingsQueryDTO,
     GetUserRatingsQueryDTO,
     UpdateRatingCommandDTO,
 )
-from src.models.dtos.watch.repository.watch_repository_interface_dtos import CheckWatchedQueryDTO
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import RecordInteractionInputDTOV1
+from src.models.entities.user_rate_movie_entity import RATING_SCORES
+from src.models.types.entity_type import EntityType
+from src.models.types.watch_status_type import WatchStatusType
+from src.repositories.movie_stats.movie_stats_repository import MovieStatsRepository
 from src.repositories.rating.rating_repository import RatingRepository
-from src.repositories.watch.watch_repository import WatchRepository
+from src.utils.invalidation_bus import InvalidationBus
+from src.utils.response_cache import ResponseCache
+from src.utils.single_flight import SingleFlight
+from src.utils.transaction_utils import retry_on_serialization_failure
+
+_GET_MOVIE_RATERS_ROUTE = "GET /api/v1/ratings/movie/{movie_uuid}/raters"
 
 
 class RatingLogic:
-    def __init__(self, repository: RatingRepository, watch_repository: WatchRepository) -> None:
+    def __init__(
+        self,
+        repository: RatingRepository,
+        movie_stats_repository: MovieStatsRepository,
+        recommendation_logic: RecommendationLogic,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+        single_flight: SingleFlight,
+    ) -> None:
         self._repository = repository
-        self._watch_repository = watch_repository
+        self._movie_stats_repository = movie_stats_repository
+        self._recommendation_logic = recommendation_logic
+        self._invalidation_bus = invalidation_bus
+        self._response_cache = response_cache
+        self._single_flight = single_flight
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def rate_movie(self, input_dto: RateMovieInputDTOV1) -> RateMovieOutputDTOV1:
-        # Guard: the user must have a WATCHED record for this movie before rating.
-        watched_query = CheckWatchedQueryDTO(
-            user_uuid=input_dto.user_uuid,
-            movie_uuid=input_dto.movie_uuid,
+        output = await self._create_rating(input_dto=input_dto)
+        await self._response_cache.invalidate(
+            EntityType.RATING,
+            [output.rate_uuid],
+            related_uuids=[output.movie_uuid, output.user_uuid],
         )
-        has_watched = await self._watch_repository.check_movie_watched(input_dto=watched_query)
-        if not has_watched:
-            raise InvalidArgumentError()
-
-        exists_query = CheckRatingExistsQueryDTO(
-            user_uuid=input_dto.user_uuid,
-            movie_uuid=input_dto.movie_uuid,
+        # Only once committed, so a rolled-back rating never reaches the recommendation model.
+        self._recommendation_logic.record_interaction(
+            input_dto=RecordInteractionInputDTOV1(
+                user_uuid=output.user_uuid,
+                movie_uuid=output.movie_uuid,
+                status=WatchStatusType.WATCHED,
+                score=output.score,
+            ),
         )
-        already_rated = await self._repository.check_rating_exists(input_dto=exists_query)
-        if already_rated:
-            raise AlreadyExistsError(resource_type="UserRateMovieEntity")
+        return output
 
+    @retry_on_serialization_failure
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _create_rating(self, input_dto: RateMovieInputDTOV1) -> RateMovieOutputDTOV1:
+        # create_rating enforces both guards in the insert itself: InvalidArgumentError unless the user has a
+        # WATCHED record for the movie, AlreadyExistsError if they already rated it.
         command = CreateRatingCommandDTO(
             user_uuid=input_dto.user_uuid,
             movie_uuid=input_dto.movie_uuid,
             score=input_dto.score,
         )
         response = await self._repository.create_rating(input_dto=command)
+        await self._movie_stats_repository.apply_delta(
+            input_dto=ApplyMovieStatsDeltaCommandDTO(
+                movie_uuid=response.movie_uuid,
+                rating_count=1,
+                rating_sum=response.score,
+                **{self._score_bucket(response.score): 1},
+            ),
+        )
+        await self._invalidation_bus.publish(
+            EntityType.RATING,
+            [response.rate_uuid],
+            related_uuids=[response.movie_uuid, response.user_uuid],
+        )
         return RateMovieOutputDTOV1.model_validate(obj=response)
 
+    async def update_rating(self, input_dto: UpdateRatingInputDTOV1) -> UpdateRatingOutputDTOV1:
+        output = await self._update_rating(input_dto=input_dto)
+        await self._response_cache.invalidate(
+            EntityType.RATING,
+            [output.rate_uuid],
+            related_uuids=[output.movie_uuid, output.user_uuid],
+        )
+        return output
+
+    @retry_on_serialization_failure
     @async_postgres_sqlalchemy_atomic_decorator
-    async def update_rating(self, input_dto: UpdateRatingInputDTOV1) -> None:
+    async def _update_rating(self, input_dto: UpdateRatingInputDTOV1) -> UpdateRatingOutputDTOV1:
         command = UpdateRatingCommandDTO(
             rate_uuid=input_dto.rate_uuid,
             user_uuid=input_dto.user_uuid,
             score=input_dto.score,
         )
-        await self._repository.update_rating(input_dto=command)
+        response = await self._repository.update_rating(input_dto=command)
+        if response.score != response.previous_score:
+            await self._movie_stats_repository.apply_delta(
+                input_dto=ApplyMovieStatsDeltaCommandDTO(
+                    movie_uuid=response.movie_uuid,
+                    rating_sum=response.score - response.previous_score,
+                    **{self._score_bucket(response.previous_score): -1, self._score_bucket(response.score): 1},
+                ),
+            )
+        await self._invalidation_bus.publish(
+            EntityType.RATING,
+            [response.rate_uuid],
+            related_uuids=[response.movie_uuid, response.user_uuid],
+        )
+        return UpdateRatingOutputDTOV1.model_validate(obj=response)
 
     @async_postgres_sqlalchemy_atomic_decorator
     async def get_my_ratings(self, input_dto: GetMyRatingsInputDTOV1) -> GetMyRatingsOutputDTOV1:
@@ -75,6 +145,7 @@ class RatingLogic:
             user_uuid=input_dto.user_uuid,
             pagination=input_dto.pagination,
             sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
         )
         response = await self._repository.get_my_ratings(input_dto=query)
         return GetMyRatingsOutputDTOV1(
@@ -91,6 +162,7 @@ class RatingLogic:
                 for r in response.ratings
             ],
             total=response.total,
+            total_is_exact=response.total_is_exact,
         )
 
     @async_postgres_sqlalchemy_atomic_decorator
@@ -99,6 +171,7 @@ class RatingLogic:
             user_uuid=input_dto.user_uuid,
             pagination=input_dto.pagination,
             sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
         )
         response = await self._repository.get_user_ratings(input_dto=query)
         return GetUserRatingsOutputDTOV1(
@@ -115,14 +188,31 @@ class RatingLogic:
                 for r in response.ratings
             ],
             total=response.total,
+            total_is_exact=response.total_is_exact,
         )
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def get_movie_raters(self, input_dto: GetMovieRatersInputDTOV1) -> GetMovieRatersOutputDTOV1:
+        return await self._response_cache.get_or_load(
+            route=_GET_MOVIE_RATERS_ROUTE,
+            params=input_dto,
+            output_type=GetMovieRatersOutputDTOV1,
+            load=lambda: self._single_flight.do(
+                _GET_MOVIE_RATERS_ROUTE,
+                input_dto,
+                lambda: self._get_movie_raters(input_dto=input_dto),
+                generation=self._response_cache.generation,
+            ),
+            # The raters' names and emails are shown too.
+            tags=lambda output: [input_dto.movie_uuid, *(rater.user_uuid for rater in output.raters)],
+        )
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _get_movie_raters(self, input_dto: GetMovieRatersInputDTOV1) -> GetMovieRatersOutputDTOV1:
         query = GetMovieRatersQueryDTO(
             movie_uuid=input_dto.movie_uuid,
             pagination=input_dto.pagination,
             sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
         )
         response = await self._repository.get_movie_raters(input_dto=query)
         return GetMovieRatersOutputDTOV1(
@@ -139,4 +229,30 @@ class RatingLogic:
                 for u in response.raters
             ],
             total=response.total,
+            total_is_exact=response.total_is_exact,
         )
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def get_movie_rating_histogram(
+        self,
+        input_dto: GetMovieRatingHistogramInputDTOV1,
+    ) -> GetMovieRatingHistogramOutputDTOV1:
+        # Served from the movie_stats buckets kept by rate_movie/update_rating, never by grouping the ratings.
+        response = await self._movie_stats_repository.get_movie_stats(
+            input_dto=GetMovieStatsQueryDTO(movie_uuid=input_dto.movie_uuid),
+        )
+        stats = response.stats or MovieStatsDTO()
+        return GetMovieRatingHistogramOutputDTOV1(
+            movie_uuid=response.movie_uuid,
+            rating_count=stats.rating_count,
+            average_rating=round(stats.rating_sum / stats.rating_count, 2) if stats.rating_count else None,
+            buckets=[
+                RatingHistogramBucketDTOV1(score=score, count=getattr(stats, self._score_bucket(score)))
+                for score in RATING_SCORES
+            ],
+        )
+
+    @staticmethod
+    def _score_bucket(score: int) -> str:
+        """Name of the movie_stats histogram counter for a score."""
+        return f"score_{score}_count"
@@ -0,0 +1,517 @@
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from itertools import pairwise
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+
+from src.logics.recommendation.item_similarity_index import cosine_neighbors, ragged_positions, top_k
+
+_FORMAT_MAGIC = b"MWLCIDX\x00"
+_FORMAT_VERSION = 1
+# Arrays start on cache-line boundaries so every mapped view is aligned.
+_ALIGNMENT = 64
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_STOP_WORDS = frozenset(
+    "a about after all also an and any are as at be been but by can for from has have he her his how in into "
+    "is it its more not of on one or out over she so than that the their them then there they this to up was "
+    "were what when which while who will with you your".split(),
+)
+# Title terms count this many times over description terms.
+_TITLE_WEIGHT = 2
+# Neighbour rows recomputed per scatter; bounds the (rows x movies) similarity temporaries.
+_RECOMPUTE_BATCH = 64
+
+
+class ContentSimilarityIndex:
+    """Top-k cosine neighbours of movies by the TF-IDF vectors of their title and description.
+
+    Built once from the whole catalog, then kept current one movie at a time: ``upsert`` and ``remove`` fix
+    up only the rows of the neighbour table they affect. A movie's term weights use the document
+    frequencies of the moment it was indexed, so they drift slowly from a fresh build as the catalog grows.
+
+    ``save`` writes everything to a single file that ``load`` memory-maps: the vectors and postings stay
+    read-only pages shared by every worker, the neighbour table is mapped copy-on-write. Movies changed since
+    loading are kept apart from the mapped arrays until the next ``save``.
+    """
+
+    def __init__(
+        self,
+        movie_uuids: list[UUID],
+        titles: list[str],
+        genre_uuids: list[UUID],
+        text_hashes: list[int],
+        terms: list[str],
+        document_frequency: np.ndarray,
+        documents: "_Sparse",
+        postings: "_Sparse",
+        neighbor_items: np.ndarray,
+        neighbor_scores: np.ndarray,
+        watermark: datetime | None,
+    ) -> None:
+        self._movie_uuids = movie_uuids
+        self._titles = titles
+        self._genre_uuids = genre_uuids
+        self._text_hashes = text_hashes
+        self._positions = {movie_uuid: position for position, movie_uuid in enumerate(movie_uuids)}
+        self._removed: set[int] = set()
+        self._terms = terms
+        self._term_ids = {term: term_id for term_id, term in enumerate(terms)}
+        self._document_frequency = np.array(document_frequency, dtype=np.int32)
+        # Vectors by movie and by term as of the build or last load; rows changed since live in _changed.
+        self._documents = documents
+        self._postings = postings
+        self._changed: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self._changed_postings: dict[int, dict[int, float]] = {}
+        self._neighbor_items = neighbor_items
+        self._neighbor_scores = neighbor_scores
+        # Latest movies.updated_at reflected in the index.
+        self.watermark = watermark
+
+    @property
+    def size(self) -> int:
+        return len(self._positions)
+
+    @property
+    def neighbors(self) -> int:
+        return self._neighbor_items.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in (
+                self._document_frequency,
+                self._documents.indptr,
+                self._documents.indices,
+                self._documents.weights,
+                self._postings.indptr,
+                self._postings.indices,
+                self._postings.weights,
+                self._neighbor_items,
+                self._neighbor_scores,
+            )
+        )
+
+    @classmethod
+    def build(
+        cls,
+        movie_uuids: list[UUID],
+        titles: list[str],
+        descriptions: list[str | None],
+        genre_uuids: list[UUID],
+        neighbors: int,
+        watermark: datetime | None = None,
+    ) -> "ContentSimilarityIndex":
+        term_ids: dict[str, int] = {}
+        rows: list[int] = []
+        columns: list[int] = []
+        counts: list[int] = []
+        for position, (title, description) in enumerate(zip(titles, descriptions, strict=True)):
+            for token, count in _term_counts(title, description).items():
+                rows.append(position)
+                columns.append(term_ids.setdefault(token, len(term_ids)))
+                counts.append(count)
+        movie_indices = np.asarray(rows, dtype=np.int32)
+        term_indices = np.asarray(columns, dtype=np.int32)
+        document_frequency = np.bincount(term_indices, minlength=len(term_ids)).astype(np.int32)
+        weights = _tf_idf(np.asarray(counts, dtype=np.float32), document_frequency[term_indices], len(movie_uuids))
+        norms = np.sqrt(np.bincount(movie_indices, weights=weights.astype(np.float64) ** 2, minlength=len(titles)))
+        weights = (weights / norms[movie_indices]).astype(np.float32)
+
+        table_items, table_scores = cosine_neighbors(
+            term_indices,
+            movie_indices,
+            weights,
+            len(term_ids),
+            len(movie_uuids),
+            min(neighbors, max(len(movie_uuids) - 1, 0)),
+        )
+        neighbor_items = np.full((len(movie_uuids), neighbors), -1, dtype=np.int32)
+        neighbor_scores = np.zeros((len(movie_uuids), neighbors), dtype=np.float32)
+        neighbor_items[:, : table_items.shape[1]] = table_items
+        neighbor_scores[:, : table_scores.shape[1]] = table_scores
+        return cls(
+            movie_uuids=list(movie_uuids),
+            titles=list(titles),
+            genre_uuids=list(genre_uuids),
+            text_hashes=[
+                _text_hash(title, description) for title, description in zip(titles, descriptions, strict=True)
+            ],
+            terms=list(term_ids),
+            document_frequency=document_frequency,
+            documents=_Sparse.group(movie_indices, term_indices, weights, len(movie_uuids)),
+            postings=_Sparse.group(term_indices, movie_indices, weights, len(term_ids)),
+            neighbor_items=neighbor_items,
+            neighbor_scores=neighbor_scores,
+            watermark=watermark,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ContentSimilarityIndex":
+        """Map a file written by ``save``; raises ``ValueError`` if it is not one or has an older format."""
+        with Path(path).open("rb") as file:
+            if file.read(len(_FORMAT_MAGIC)) != _FORMAT_MAGIC:
+                message = f"{path} is not a content index"
+                raise ValueError(message)
+            header = json.loads(file.read(int.from_bytes(file.read(8), "little")))
+        if header["version"] != _FORMAT_VERSION:
+            message = f"{path} has format version {header['version']}, expected {_FORMAT_VERSION}"
+            raise ValueError(message)
+
+        def mapped(name: str, mode: str = "r") -> np.ndarray:
+            spec = header["arrays"][name]
+            shape = tuple(spec["shape"])
+            if 0 in shape:
+                return np.empty(shape, dtype=spec["dtype"])
+            return np.memmap(path, dtype=spec["dtype"], mode=mode, offset=spec["offset"], shape=shape)
+
+        watermark = header["watermark"]
+        return cls(
+            movie_uuids=_decode_uuids(mapped("movie_uuids")),
+            titles=_decode_strings(mapped("title_offsets"), mapped("title_bytes")),
+            genre_uuids=_decode_uuids(mapped("genre_uuids")),
+            text_hashes=mapped("text_hashes").tolist(),
+            terms=_decode_strings(mapped("term_offsets"), mapped("term_bytes")),
+            document_frequency=mapped("document_frequency"),
+            documents=_Sparse(mapped("document_indptr"), mapped("document_terms"), mapped("document_weights")),
+            postings=_Sparse(mapped("posting_indptr"), mapped("posting_movies"), mapped("posting_weights")),
+            neighbor_items=mapped("neighbor_items", mode="c"),
+            neighbor_scores=mapped("neighbor_scores", mode="c"),
+            watermark=datetime.fromisoformat(watermark) if watermark else None,
+        )
+
+    def save(self, path: str) -> None:
+        """Write the index, without removed movies, to ``path`` atomically.
+
+        Only reads the index, so lookups may go on meanwhile; changes must wait until it returns.
+        """
+        kept = np.asarray(
+            [position for position in range(len(self._movie_uuids)) if position not in self._removed],
+            dtype=np.int64,
+        )
+        renumbered = np.full(len(self._movie_uuids), -1, dtype=np.int32)
+        renumbered[kept] = np.arange(len(kept), dtype=np.int32)
+
+        vectors = [self._vector(position) for position in kept.tolist()]
+        lengths = np.asarray([len(terms) for terms, _ in vectors], dtype=np.int64)
+        document_terms = np.concatenate([terms for terms, _ in vectors] or [np.empty(0, np.int32)]).astype(np.int32)
+        document_weights = np.concatenate([weights for _, weights in vectors] or [np.empty(0, np.float32)])
+        document_movies = np.repeat(np.arange(len(kept), dtype=np.int32), lengths)
+        documents = _Sparse.group(document_movies, document_terms, document_weights.astype(np.float32), len(kept))
+        postings = _Sparse.group(document_terms, document_movies, documents.weights, len(self._terms))
+
+        neighbor_items = self._neighbor_items[kept]
+        present = neighbor_items >= 0
+        neighbor_items = np.where(present, renumbered[np.where(present, neighbor_items, 0)], -1).astype(np.int32)
+
+        title_offsets, title_bytes = _encode_strings([self._titles[position] for position in kept.tolist()])
+        term_offsets, term_bytes = _encode_strings(self._terms)
+        _write_arrays(
+            path,
+            {
+                "version": _FORMAT_VERSION,
+                "watermark": self.watermark.isoformat() if self.watermark else None,
+            },
+            {
+                "movie_uuids": _encode_uuids([self._movie_uuids[position] for position in kept.tolist()]),
+                "genre_uuids": _encode_uuids([self._genre_uuids[position] for position in kept.tolist()]),
+                "title_offsets": title_offsets,
+                "title_bytes": title_bytes,
+                "text_hashes": np.asarray([self._text_hashes[position] for position in kept.tolist()], np.uint64),
+                "term_offsets": term_offsets,
+                "term_bytes": term_bytes,
+                "document_frequency": self._document_frequency[: len(self._terms)],
+                "document_indptr": documents.indptr,
+                "document_terms": documents.indices,
+                "document_weights": documents.weights,
+                "posting_indptr": postings.indptr,
+                "posting_movies": postings.indices,
+                "posting_weights": postings.weights,
+                "neighbor_items": neighbor_items,
+                "neighbor_scores": np.where(present, self._neighbor_scores[kept], 0.0).astype(np.float32),
+            },
+        )
+
+    def position(self, movie_uuid: UUID) -> int | None:
+        return self._positions.get(movie_uuid)
+
+    def movie(self, position: int) -> tuple[UUID, str, UUID]:
+        """The movie_uuid, title and genre_uuid of the movie at ``position``."""
+        return self._movie_uuids[position], self._titles[position], self._genre_uuids[position]
+
+    def similar_items(self, position: int, limit: int) -> tuple[np.ndarray, np.ndarray]:
+        """The ``limit`` movies most similar to the one at ``position`` and their cosine similarities."""
+        items = self._neighbor_items[position, :limit]
+        present = items >= 0
+        return np.asarray(items[present]), np.asarray(self._neighbor_scores[position, :limit][present])
+
+    def upsert(self, movie_uuid: UUID, title: str, description: str | None, genre_uuid: UUID) -> bool:
+        """Index a new movie or re-index a changed one; returns whether its neighbours were recomputed."""
+        text_hash = _text_hash(title, description)
+        position = self._positions.get(movie_uuid)
+        if position is None:
+            position = self._append(movie_uuid, title, genre_uuid, text_hash)
+        else:
+            self._titles[position] = title
+            self._genre_uuids[position] = genre_uuid
+            if self._text_hashes[position] == text_hash:
+                return False
+            self._text_hashes[position] = text_hash
+            previous_terms, _ = self._vector(position)
+            self._document_frequency[previous_terms] -= 1
+
+        counts = _term_counts(title, description)
+        terms = np.asarray([self._term_id(token) for token in counts], dtype=np.int32)
+        self._document_frequency[terms] += 1
+        weights = _tf_idf(
+            np.asarray(list(counts.values()), dtype=np.float32),
+            self._document_frequency[terms],
+            len(self._positions),
+        )
+        norm = np.sqrt(np.dot(weights.astype(np.float64), weights))
+        self._set_vector(position, terms, (weights / norm).astype(np.float32) if norm > 0 else weights)
+
+        similarities = self._similarities(np.array([position]))[0]
+        self._rank(position, similarities)
+        recomputed = self._detach(position, similarities)
+        self._offer(position, similarities, recomputed)
+        return True
+
+    def remove(self, movie_uuid: UUID) -> bool:
+        position = self._positions.pop(movie_uuid, None)
+        if position is None:
+            return False
+        terms, _ = self._vector(position)
+        self._document_frequency[terms] -= 1
+        self._set_vector(position, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32))
+        self._removed.add(position)
+        self._neighbor_items[position] = -1
+        self._neighbor_scores[position] = 0.0
+        self._detach(position, None)
+        return True
+
+    def movie_uuids(self) -> set[UUID]:
+        return set(self._positions)
+
+    def _append(self, movie_uuid: UUID, title: str, genre_uuid: UUID, text_hash: int) -> int:
+        position = len(self._movie_uuids)
+        self._movie_uuids.append(movie_uuid)
+        self._titles.append(title)
+        self._genre_uuids.append(genre_uuid)
+        self._text_hashes.append(text_hash)
+        self._positions[movie_uuid] = position
+        if position >= len(self._neighbor_items):
+            # Grow geometrically; rows past the last movie stay empty.
+            rows = max(len(self._neighbor_items), 64)
+            self._neighbor_items = np.concatenate(
+                [self._neighbor_items, np.full((rows, self.neighbors), -1, dtype=np.int32)],
+            )
+            self._neighbor_scores = np.concatenate(
+                [self._neighbor_scores, np.zeros((rows, self.neighbors), dtype=np.float32)],
+            )
+        return position
+
+    def _term_id(self, token: str) -> int:
+        term_id = self._term_ids.get(token)
+        if term_id is None:
+            term_id = self._term_ids[token] = len(self._terms)
+            self._terms.append(token)
+            if term_id >= len(self._document_frequency):
+                self._document_frequency = np.concatenate(
+                    [self._document_frequency, np.zeros(max(len(self._document_frequency), 64), dtype=np.int32)],
+                )
+        return term_id
+
+    def _vector(self, position: int) -> tuple[np.ndarray, np.ndarray]:
+        """Term ids and unit-length TF-IDF weights of the movie at ``position``."""
+        changed = self._changed.get(position)
+        if changed is not None:
+            return changed
+        begin, end = self._documents.indptr[position], self._documents.indptr[position + 1]
+        return self._documents.indices[begin:end], self._documents.weights[begin:end]
+
+    def _set_vector(self, position: int, terms: np.ndarray, weights: np.ndarray) -> None:
+        if position in self._changed:
+            for term in self._changed[position][0].tolist():
+                del self._changed_postings[term][position]
+        self._changed[position] = (terms, weights)
+        for term, weight in zip(terms.tolist(), weights.tolist(), strict=True):
+            self._changed_postings.setdefault(term, {})[position] = weight
+
+    def _similarities(self, positions: np.ndarray) -> np.ndarray:
+        """Cosine similarities of the movies at ``positions`` to every position; self and removed ones are 0."""
+        size = len(self._movie_uuids)
+        vectors = [self._vector(position) for position in positions.tolist()]
+        terms = np.concatenate([terms for terms, _ in vectors]).astype(np.int64)
+        weights = np.concatenate([weights for _, weights in vectors])
+        owners = np.repeat(np.arange(len(vectors), dtype=np.int64), [len(terms) for terms, _ in vectors])
+
+        # One scatter over the mapped postings of every term of every row.
+        base = terms < len(self._postings.indptr) - 1
+        starts = self._postings.indptr[terms[base]]
+        lengths = self._postings.indptr[terms[base] + 1] - starts
+        entries = ragged_positions(starts, lengths)
+        cells = np.repeat(owners[base] * size, lengths) + self._postings.indices[entries]
+        contributions = np.repeat(weights[base], lengths) * self._postings.weights[entries]
+        similarities = np.bincount(cells, weights=contributions, minlength=len(vectors) * size)
+        similarities = similarities.reshape(len(vectors), size).astype(np.float32)
+        if self._changed:
+            # The mapped postings hold the old vectors of changed movies; use their current ones instead.
+            similarities[:, np.fromiter(self._changed, dtype=np.int64, count=len(self._changed))] = 0.0
+            for owner, term, weight in zip(owners.tolist(), terms.tolist(), weights.tolist(), strict=True):
+                for other, other_weight in self._changed_postings.get(term, {}).items():
+                    similarities[owner, other] += weight * other_weight
+        similarities[np.arange(len(vectors)), positions] = 0.0
+        return similarities
+
+    def _rank(self, row: int, similarities: np.ndarray) -> None:
+        """Fill ``row`` of the neighbour table from its similarities to every position."""
+        width = min(self.neighbors, len(similarities))
+        self._neighbor_items[row] = -1
+        self._neighbor_scores[row] = 0.0
+        top_k(
+            similarities[None, :],
+            width,
+            self._neighbor_items[row : row + 1, :width],
+            self._neighbor_scores[row : row + 1, :width],
+        )
+
+    def _detach(self, position: int, similarities: np.ndarray | None) -> np.ndarray:
+        """Drop ``position`` from every row holding it; rows that may have lost their k-th best are recomputed.
+
+        That is a full row whose similarity to ``position`` went down (or away): some movie outside the row
+        may now belong in it. Returns the recomputed rows.
+        """
+        size = len(self._movie_uuids)
+        rows, columns = np.nonzero(self._neighbor_items[:size] == position)
+        if not len(rows):
+            return rows
+        current = similarities[rows] if similarities is not None else np.zeros(len(rows), dtype=np.float32)
+        dropped = self._neighbor_scores[rows, columns] > current
+        recomputed = rows[dropped & (self._neighbor_items[rows, -1] >= 0)]
+
+        held_items, held_scores = self._neighbor_items[rows], self._neighbor_scores[rows]
+        kept = held_items != position
+        order = np.argsort(~kept, axis=1, kind="stable")
+        kept = np.take_along_axis(kept, order, axis=1)
+        self._neighbor_items[rows] = np.where(kept, np.take_along_axis(held_items, order, axis=1), -1)
+        self._neighbor_scores[rows] = np.where(kept, np.take_along_axis(held_scores, order, axis=1), 0.0)
+
+        for start in range(0, len(recomputed), _RECOMPUTE_BATCH):
+            batch = recomputed[start : start + _RECOMPUTE_BATCH]
+            for row, row_similarities in zip(batch.tolist(), self._similarities(batch), strict=True):
+                self._rank(row, row_similarities)
+        return recomputed
+
+    def _offer(self, position: int, similarities: np.ndarray, skipped: np.ndarray) -> None:
+        """Insert ``position`` into every other row it now ranks in, except ``skipped`` rows."""
+        rows = np.flatnonzero(similarities > 0)
+        rows = rows[similarities[rows] > self._neighbor_scores[rows, -1]]
+        rows = rows[~np.isin(rows, skipped)]
+        if not len(rows):
+            return
+        items = np.concatenate([self._neighbor_items[rows], np.full((len(rows), 1), position, np.int32)], axis=1)
+        scores = np.concatenate([self._neighbor_scores[rows], similarities[rows, None]], axis=1)
+        order = np.argsort(-scores, axis=1, kind="stable")[:, : self.neighbors]
+        self._neighbor_items[rows] = np.take_along_axis(items, order, axis=1)
+        self._neighbor_scores[rows] = np.take_along_axis(scores, order, axis=1)
+
+
+class _Sparse:
+    """Compressed rows: ``indices[indptr[i]:indptr[i + 1]]`` and ``weights`` likewise belong to row ``i``."""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def group(cls, rows: np.ndarray, columns: np.ndarray, weights: np.ndarray, size: int) -> "_Sparse":
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+        return cls(indptr, columns[order].astype(np.int32), weights[order].astype(np.float32))
+
+
+def _term_counts(title: str, description: str | None) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for text, weight in ((title, _TITLE_WEIGHT), (description or "", 1)):
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            if len(token) > 1 and token not in _STOP_WORDS:
+                counts[token] += weight
+    return counts
+
+
+def _tf_idf(counts: np.ndarray, document_frequency: np.ndarray, documents: int) -> np.ndarray:
+    """Sublinear term frequency times smoothed inverse document frequency."""
+    inverse_frequency = np.log((1.0 + documents) / (1.0 + document_frequency)) + 1.0
+    return ((1.0 + np.log(counts)) * inverse_frequency).astype(np.float32)
+
+
+def _text_hash(title: str, description: str | None) -> int:
+    digest = hashlib.blake2b(f"{title}\x00{description or ''}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _encode_uuids(uuids: list[UUID]) -> np.ndarray:
+    return np.frombuffer(b"".join(uuid.bytes for uuid in uuids), dtype=np.uint8).reshape(len(uuids), 16)
+
+
+def _decode_uuids(array: np.ndarray) -> list[UUID]:
+    raw = array.tobytes()
+    return [UUID(bytes=raw[offset : offset + 16]) for offset in range(0, len(raw), 16)]
+
+
+def _encode_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    encoded = [string.encode() for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _decode_strings(offsets: np.ndarray, data: np.ndarray) -> list[str]:
+    raw = data.tobytes()
+    bounds = offsets.tolist()
+    return [raw[begin:end].decode() for begin, end in pairwise(bounds)]
+
+
+def _write_arrays(path: str, header: dict, arrays: dict[str, np.ndarray]) -> None:
+    """Magic, header length, JSON header, then each array's raw bytes at an aligned offset.
+
+    Written next to ``path`` and renamed over it, so readers see the old file or the new one, never a mix;
+    workers that mapped the old file keep its pages until they load again.
+    """
+    specs = {}
+    offset = 0
+    for name, array in arrays.items():
+        specs[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+    # Offsets so far are relative to the data section; it starts after the aligned header.
+    prefix = len(_FORMAT_MAGIC) + 8
+    encoded = json.dumps({**header, "arrays": specs}).encode()
+    # Room for the offsets to grow by data_start's digits once it is added to each of them.
+    data_start = -(-(prefix + len(encoded) + 16 * len(specs)) // _ALIGNMENT) * _ALIGNMENT
+    for spec in specs.values():
+        spec["offset"] += data_start
+    encoded = json.dumps({**header, "arrays": specs}).encode().ljust(data_start - prefix)
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.parent / f".{target.name}.{os.getpid()}.tmp"
+    with temporary.open("wb") as file:
+        file.write(_FORMAT_MAGIC)
+        file.write(len(encoded).to_bytes(8, "little"))
+        file.write(encoded)
+        for name, array in arrays.items():
+            file.seek(specs[name]["offset"])
+            file.write(np.ascontiguousarray(array).tobytes())
+        file.flush()
+        os.fsync(file.fileno())
+    temporary.replace(target)
@@ -0,0 +1,241 @@
+# src/logics/recommendation/content_similarity_logic.py
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
+
+from src.configs.runtime_config import RecommendationConfig, RuntimeConfig
+from src.logics.recommendation.content_similarity_index import ContentSimilarityIndex
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import (
+    GetSimilarMoviesInputDTOV1,
+    GetSimilarMoviesOutputDTOV1,
+    IndexMoviesInputDTOV1,
+    RecommendationSnapshotInfoDTOV1,
+    SimilarMovieItemDTOV1,
+)
+from src.models.dtos.recommendation.repository.recommendation_repository_interface_dtos import (
+    GetMovieTextsQueryDTO,
+    GetMovieTextsResponseDTO,
+    GetMovieUUIDsResponseDTO,
+    MovieTextDTO,
+)
+from src.models.types.entity_type import EntityType
+from src.repositories.recommendation.recommendation_repository import RecommendationRepository
+from src.utils.invalidation_bus import EntityChangedEventDTO, InvalidationBus
+
+logger = logging.getLogger(__name__)
+
+# A transaction stamps updated_at when it starts but may commit after a sync has moved past that time, so
+# every sync fetches this much before the watermark again. Unchanged movies are skipped by their text hash.
+_SYNC_OVERLAP = timedelta(minutes=5)
+
+
+class ContentSimilarityLogic:
+    """Similar movies by title and description, from a TF-IDF index saved to disk and mapped by every worker.
+
+    ``sync`` runs on a timer started in ``manage.py``. Its first run maps the saved index, or builds one
+    from the database and saves it; every run then applies the movies changed since the index's watermark,
+    drops deleted ones, and saves the index again if anything changed. Movie writes made through this worker
+    are queued through ``index_movies`` as soon as they commit, and those made through other workers when
+    their change event arrives; a background task indexes the queue. Change events only queue work, so a
+    sync holding the index never holds up the invalidation bus.
+    """
+
+    def __init__(
+        self,
+        repository: RecommendationRepository,
+        invalidation_bus: InvalidationBus,
+        config: RecommendationConfig | None = None,
+    ) -> None:
+        self._repository = repository
+        self._config: RecommendationConfig = config or RuntimeConfig.global_config().RECOMMENDATION
+        self._index: ContentSimilarityIndex | None = None
+        self._synced_at: datetime | None = None
+        self._unsaved = False
+        self._lock = asyncio.Lock()
+        self._pending: set[UUID] = set()
+        # Set when change events were missed, so any movie may have changed; the indexer then runs a sync.
+        self._resync = False
+        self._indexer: asyncio.Task | None = None
+        invalidation_bus.subscribe(EntityType.MOVIE, self._on_movies_changed)
+
+    async def sync(self) -> RecommendationSnapshotInfoDTOV1:
+        async with self._lock:
+            return await self._sync()
+
+    def index_movies(self, input_dto: IndexMoviesInputDTOV1) -> None:
+        """Queue these movies to be re-indexed in the background from their committed rows.
+
+        Returns at once: indexing waits on the lock that a sync holds through a full build or a save, which
+        must not hold up the write that queued it. Movies queued meanwhile are indexed together.
+        """
+        self._pending.update(input_dto.movie_uuids)
+        self._start_indexer()
+
+    async def wait_indexed(self) -> None:
+        """Wait until every movie queued so far, and any sync queued by a change event, has been indexed."""
+        while self._indexer is not None and not self._indexer.done():
+            await asyncio.shield(self._indexer)
+
+    def _start_indexer(self) -> None:
+        if self._indexer is None or self._indexer.done():
+            self._indexer = asyncio.get_running_loop().create_task(self._index_pending())
+
+    async def _index_pending(self) -> None:
+        while self._resync or self._pending:
+            if self._resync:
+                self._resync = False
+                try:
+                    await self.sync()
+                except Exception:
+                    logger.exception("Content sync after missed movie changes failed; the next timed sync retries")
+            if self._pending:
+                movie_uuids = list(self._pending)
+                self._pending.clear()
+                await self._index_now(movie_uuids)
+
+    async def _index_now(self, movie_uuids: list[UUID]) -> None:
+        """Re-index these movies from their committed rows; those no longer in the database are dropped.
+
+        Best effort: the write has already committed, so a failure is logged and left to the next sync.
+        """
+        if self._index is None:
+            # The first sync reads every movie anyway.
+            return
+        try:
+            async with self._lock:
+                texts = await self._load_texts(GetMovieTextsQueryDTO(movie_uuids=movie_uuids))
+                found = {movie.movie_uuid for movie in texts.movies}
+                missing = [movie_uuid for movie_uuid in movie_uuids if movie_uuid not in found]
+                await asyncio.to_thread(self._apply, self._index, texts.movies, missing)
+        except Exception:
+            logger.exception("Indexing %d movies failed; the next content sync retries", len(movie_uuids))
+
+    async def get_similar_movies(self, input_dto: GetSimilarMoviesInputDTOV1) -> GetSimilarMoviesOutputDTOV1:
+        index = await self._current_index()
+        position = index.position(input_dto.movie_uuid)
+        movies = []
+        if position is not None:
+            positions, similarities = index.similar_items(position, input_dto.limit)
+            for other, similarity in zip(positions.tolist(), similarities.tolist(), strict=True):
+                movie_uuid, title, genre_uuid = index.movie(other)
+                movies.append(
+                    SimilarMovieItemDTOV1(
+                        movie_uuid=movie_uuid,
+                        title=title,
+                        genre_uuid=genre_uuid,
+                        similarity=round(similarity, 4),
+                    ),
+                )
+        return GetSimilarMoviesOutputDTOV1(**self._snapshot_info().model_dump(), movies=movies)
+
+    async def _on_movies_changed(self, event: EntityChangedEventDTO) -> None:
+        if event.entity_uuids is None:
+            self._resync = True
+            self._start_indexer()
+        elif event.entity_uuids:
+            self.index_movies(input_dto=IndexMoviesInputDTOV1(movie_uuids=event.entity_uuids))
+
+    async def _current_index(self) -> ContentSimilarityIndex:
+        if self._index is None:
+            async with self._lock:
+                if self._index is None:
+                    await self._sync()
+        return self._index
+
+    async def _sync(self) -> RecommendationSnapshotInfoDTOV1:
+        started = time.monotonic()
+        if self._index is None:
+            self._index = await self._open()
+        index = self._index
+
+        since = index.watermark - _SYNC_OVERLAP if index.watermark else None
+        texts, count = await self._load_changes(GetMovieTextsQueryDTO(updated_since=since))
+        changed = await asyncio.to_thread(self._apply, index, texts.movies, [])
+        if texts.movies:
+            latest = max(movie.updated_at for movie in texts.movies)
+            index.watermark = max(index.watermark, latest) if index.watermark else latest
+        if count != index.size:
+            # Deletes leave no row to notice them by; compare the full set only when the counts disagree.
+            existing = set((await self._load_movie_uuids()).movie_uuids)
+            changed += await asyncio.to_thread(self._apply, index, [], list(index.movie_uuids() - existing))
+            unseen = list(existing - index.movie_uuids())
+            if unseen:
+                texts = await self._load_texts(GetMovieTextsQueryDTO(movie_uuids=unseen))
+                changed += await asyncio.to_thread(self._apply, index, texts.movies, [])
+
+        if self._unsaved:
+            # Saving only reads the index; mapping the new file afterwards drops the in-memory overlay.
+            path = self._config.CONTENT_INDEX_PATH
+            await asyncio.to_thread(index.save, path)
+            self._index = await asyncio.to_thread(ContentSimilarityIndex.load, path)
+            self._unsaved = False
+        self._synced_at = datetime.now(UTC)
+        logger.info(
+            "Content index synced in %.3fs: %d movies, %d changed, %d bytes",
+            time.monotonic() - started,
+            self._index.size,
+            changed,
+            self._index.nbytes,
+        )
+        return self._snapshot_info()
+
+    async def _open(self) -> ContentSimilarityIndex:
+        path = self._config.CONTENT_INDEX_PATH
+        try:
+            index = await asyncio.to_thread(ContentSimilarityIndex.load, path)
+        except FileNotFoundError:
+            logger.info("No content index at %s; building one", path)
+        except (OSError, ValueError, KeyError):
+            logger.warning("Content index at %s is unreadable; rebuilding it", path, exc_info=True)
+        else:
+            if index.neighbors == self._config.CONTENT_NEIGHBORS:
+                return index
+            logger.info("Content index at %s keeps %d neighbours; rebuilding it", path, index.neighbors)
+
+        texts = await self._load_texts(GetMovieTextsQueryDTO())
+        movies = texts.movies
+        self._unsaved = True
+        return await asyncio.to_thread(
+            ContentSimilarityIndex.build,
+            [movie.movie_uuid for movie in movies],
+            [movie.title for movie in movies],
+            [movie.description for movie in movies],
+            [movie.genre_uuid for movie in movies],
+            self._config.CONTENT_NEIGHBORS,
+            max((movie.updated_at for movie in movies), default=None),
+        )
+
+    def _apply(self, index: ContentSimilarityIndex, movies: list[MovieTextDTO], removed: list[UUID]) -> int:
+        """Upsert and remove movies in the index; returns how many actually changed."""
+        changed = 0
+        for movie in movies:
+            changed += index.upsert(movie.movie_uuid, movie.title, movie.description, movie.genre_uuid)
+        for movie_uuid in removed:
+            changed += index.remove(movie_uuid)
+        self._unsaved = self._unsaved or changed > 0
+        return changed
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _load_texts(self, query: GetMovieTextsQueryDTO) -> GetMovieTextsResponseDTO:
+        return await self._repository.get_movie_texts(input_dto=query)
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _load_changes(self, query: GetMovieTextsQueryDTO) -> tuple[GetMovieTextsResponseDTO, int]:
+        texts = await self._repository.get_movie_texts(input_dto=query)
+        return texts, (await self._repository.count_movies()).count
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _load_movie_uuids(self) -> GetMovieUUIDsResponseDTO:
+        return await self._repository.get_movie_uuids()
+
+    def _snapshot_info(self) -> RecommendationSnapshotInfoDTOV1:
+        synced_at = self._synced_at or datetime.now(UTC)
+        return RecommendationSnapshotInfoDTOV1(
+            generated_at=synced_at,
+            age_seconds=round((datetime.now(UTC) - synced_at).total_seconds(), 3),
+            refresh_interval_seconds=self._config.CONTENT_SYNC_INTERVAL_SECONDS,
+        )
@@ -0,0 +1,195 @@
+import numpy as np
+
+# Interactions handled per chunk while applying the per-row systems; bounds the (entries x factors) temporaries.
+_CHUNK_ENTRIES = 1 << 18
+# Conjugate-gradient steps per row and sweep; warm starts from the previous sweep make a few enough.
+_CG_STEPS = 3
+
+
+class ImplicitALSModel:
+    """Implicit-feedback matrix factorization (Hu, Koren and Volinsky) trained by alternating least squares.
+
+    Every interaction counts as a preference of 1 with confidence ``1 + alpha * value``; everything else is
+    a preference of 0 with confidence 1. Each sweep updates all user rows, then all item rows, with a few
+    conjugate-gradient steps run for every row at once. Factors are float32.
+    """
+
+    def __init__(
+        self,
+        user_factors: np.ndarray,
+        item_factors: np.ndarray,
+        user_indptr: np.ndarray,
+        user_items: np.ndarray,
+        user_values: np.ndarray,
+        regularization: float,
+        alpha: float,
+    ) -> None:
+        self._user_factors = user_factors
+        self._item_factors = item_factors
+        # The training interactions as CSR rows per user: the base of every fold-in.
+        self._user_indptr = user_indptr
+        self._user_items = user_items
+        self._user_values = user_values
+        self._alpha = alpha
+        # Y^T Y + lambda I, shared by every fold-in.
+        self._gram = _gram(item_factors, regularization)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in (
+                self._user_factors,
+                self._item_factors,
+                self._user_indptr,
+                self._user_items,
+                self._user_values,
+                self._gram,
+            )
+        )
+
+    @classmethod
+    def train(
+        cls,
+        user_indices: np.ndarray,
+        item_indices: np.ndarray,
+        values: np.ndarray,
+        n_users: int,
+        n_items: int,
+        factors: int,
+        regularization: float,
+        alpha: float,
+        iterations: int,
+        seed: int = 0,
+    ) -> "ImplicitALSModel":
+        """Train from one ``(user, item, value)`` triple per interaction; pairs must be unique."""
+        user_indices = np.asarray(user_indices, dtype=np.int32)
+        item_indices = np.asarray(item_indices, dtype=np.int32)
+        values = np.asarray(values, dtype=np.float32)
+        confidence = (1.0 + alpha * values).astype(np.float32)
+
+        by_user = np.argsort(user_indices, kind="stable")
+        by_item = np.argsort(item_indices, kind="stable")
+        user_rows = _Rows(_indptr(user_indices, n_users), item_indices[by_user], confidence[by_user])
+        item_rows = _Rows(_indptr(item_indices, n_items), user_indices[by_item], confidence[by_item])
+
+        rng = np.random.default_rng(seed)
+        user_factors = (rng.standard_normal((n_users, factors)) * 0.01).astype(np.float32)
+        item_factors = (rng.standard_normal((n_items, factors)) * 0.01).astype(np.float32)
+        for _ in range(iterations):
+            _least_squares_sweep(user_factors, item_factors, user_rows, regularization)
+            _least_squares_sweep(item_factors, user_factors, item_rows, regularization)
+        return cls(
+            user_factors,
+            item_factors,
+            user_rows.indptr,
+            user_rows.columns,
+            values[by_user],
+            regularization,
+            alpha,
+        )
+
+    def user_factors(self, user: int) -> np.ndarray:
+        return self._user_factors[user]
+
+    def user_items(self, user: int) -> tuple[np.ndarray, np.ndarray]:
+        """Items the user interacted with in the training data, and the interaction values."""
+        begin, end = self._user_indptr[user], self._user_indptr[user + 1]
+        return self._user_items[begin:end], self._user_values[begin:end]
+
+    def fold_in(self, items: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Factors of a user with these interactions, solved exactly against the fixed item factors.
+
+        This is one user-side least-squares step, so new activity is reflected without retraining.
+        """
+        item_factors = self._item_factors[items].astype(np.float64)
+        confidence = 1.0 + self._alpha * np.asarray(values, dtype=np.float64)
+        system = self._gram + (item_factors.T * (confidence - 1.0)) @ item_factors
+        return np.linalg.solve(system, item_factors.T @ confidence).astype(np.float32)
+
+    def recommend(self, user_factors: np.ndarray, exclude: np.ndarray, limit: int) -> tuple[np.ndarray, np.ndarray]:
+        """The ``limit`` items with the highest positive predicted preference, skipping ``exclude``."""
+        scores = self._item_factors @ user_factors
+        scores[exclude] = -np.inf
+        limit = min(limit, len(scores))
+        if limit <= 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        top = np.argpartition(-scores, limit - 1)[:limit] if limit < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top = top[scores[top] > 0]
+        return top.astype(np.int32), scores[top]
+
+
+class _Rows:
+    """Interactions grouped by the side being solved: CSR offsets, the other side's indices, confidences."""
+
+    def __init__(self, indptr: np.ndarray, columns: np.ndarray, confidence: np.ndarray) -> None:
+        self.indptr = indptr
+        self.columns = columns
+        self.confidence = confidence
+        # Row boundaries of chunks holding at most about _CHUNK_ENTRIES interactions each.
+        targets = np.arange(_CHUNK_ENTRIES, indptr[-1], _CHUNK_ENTRIES)
+        bounds = np.searchsorted(indptr, targets, side="right") - 1
+        self.chunks = np.unique(np.concatenate([[0], bounds, [len(indptr) - 1]]))
+
+
+def _indptr(indices: np.ndarray, size: int) -> np.ndarray:
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=size), out=indptr[1:])
+    return indptr
+
+
+def _gram(factors: np.ndarray, regularization: float) -> np.ndarray:
+    gram = factors.T.astype(np.float64) @ factors
+    gram[np.diag_indices_from(gram)] += regularization
+    return gram
+
+
+def _segment_sum(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """Row sums of ``values`` grouped by ``indptr``; empty rows sum to zero."""
+    sums = np.zeros((len(indptr) - 1, values.shape[1]), dtype=values.dtype)
+    nonempty = indptr[:-1] < indptr[1:]
+    if nonempty.any():
+        sums[nonempty] = np.add.reduceat(values, indptr[:-1][nonempty] - indptr[0], axis=0)
+    return sums
+
+
+def _least_squares_sweep(solved: np.ndarray, fixed: np.ndarray, rows: _Rows, regularization: float) -> None:
+    """Move every row of ``solved`` towards its least-squares optimum given ``fixed``, in place.
+
+    Row ``u`` solves ``(F^T F + lambda I + F_u^T (C_u - I) F_u) x = F_u^T C_u 1``. The shared ``F^T F``
+    term is one matrix product for all rows; the per-row corrections are segment sums over interactions.
+    """
+    gram = _gram(fixed, regularization).astype(np.float32)
+
+    def apply(vectors: np.ndarray) -> np.ndarray:
+        product = vectors @ gram
+        for start, end in zip(rows.chunks[:-1], rows.chunks[1:], strict=True):
+            lo, hi = rows.indptr[start], rows.indptr[end]
+            # np.take gathers rows markedly faster than fancy indexing.
+            neighbours = np.take(fixed, rows.columns[lo:hi], axis=0)
+            owners = np.repeat(np.arange(start, end), np.diff(rows.indptr[start : end + 1]))
+            own = np.take(vectors, owners, axis=0)
+            weights = np.einsum("ij,ij->i", neighbours, own) * (rows.confidence[lo:hi] - 1.0)
+            product[start:end] += _segment_sum(neighbours * weights[:, None], rows.indptr[start : end + 1])
+        return product
+
+    targets = np.zeros_like(solved)
+    for start, end in zip(rows.chunks[:-1], rows.chunks[1:], strict=True):
+        lo, hi = rows.indptr[start], rows.indptr[end]
+        weighted = np.take(fixed, rows.columns[lo:hi], axis=0) * rows.confidence[lo:hi, None]
+        targets[start:end] = _segment_sum(weighted, rows.indptr[start : end + 1])
+
+    residual = targets - apply(solved)
+    direction = residual.copy()
+    residual_norm = np.einsum("ij,ij->i", residual, residual)
+    for _ in range(_CG_STEPS):
+        applied = apply(direction)
+        curvature = np.einsum("ij,ij->i", direction, applied)
+        step = np.divide(residual_norm, curvature, out=np.zeros_like(curvature), where=curvature > 0)
+        solved += step[:, None] * direction
+        residual -= step[:, None] * applied
+        next_norm = np.einsum("ij,ij->i", residual, residual)
+        momentum = np.divide(next_norm, residual_norm, out=np.zeros_like(next_norm), where=residual_norm > 0)
+        direction = residual + momentum[:, None] * direction
+        residual_norm = next_norm
@@ -0,0 +1,220 @@
+import numpy as np
+
+# Limits on one block of item rows: expanded (item, user, co-item) triples and dense similarity cells.
+_BLOCK_PAIR_BUDGET = 8_000_000
+_BLOCK_CELL_BUDGET = 4_000_000
+
+
+class ItemSimilarityIndex:
+    """Top-k item-item cosine neighbours over an implicit-feedback user x item matrix.
+
+    Users and items are dense integer indices. The matrix is kept as CSR rows per user for recommendations;
+    the neighbour table holds ``k`` items per item, best first, padded with ``-1``.
+    """
+
+    def __init__(
+        self,
+        neighbor_items: np.ndarray,
+        neighbor_scores: np.ndarray,
+        user_indptr: np.ndarray,
+        user_items: np.ndarray,
+        user_values: np.ndarray,
+    ) -> None:
+        self._neighbor_items = neighbor_items
+        self._neighbor_scores = neighbor_scores
+        self._user_indptr = user_indptr
+        self._user_items = user_items
+        self._user_values = user_values
+
+    @property
+    def n_users(self) -> int:
+        return len(self._user_indptr) - 1
+
+    @property
+    def n_items(self) -> int:
+        return len(self._neighbor_items)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in (
+                self._neighbor_items,
+                self._neighbor_scores,
+                self._user_indptr,
+                self._user_items,
+                self._user_values,
+            )
+        )
+
+    @classmethod
+    def build(
+        cls,
+        user_indices: np.ndarray,
+        item_indices: np.ndarray,
+        values: np.ndarray,
+        n_users: int,
+        n_items: int,
+        neighbors: int,
+    ) -> "ItemSimilarityIndex":
+        """Build the index from one ``(user, item, value)`` triple per interaction; pairs must be unique."""
+        user_indices = np.asarray(user_indices, dtype=np.int32)
+        item_indices = np.asarray(item_indices, dtype=np.int32)
+        values = np.asarray(values, dtype=np.float32)
+        neighbor_items, neighbor_scores = cosine_neighbors(
+            user_indices,
+            item_indices,
+            values,
+            n_users,
+            n_items,
+            min(neighbors, max(n_items - 1, 0)),
+        )
+        user_indptr, user_order = _compress(user_indices, n_users)
+        return cls(neighbor_items, neighbor_scores, user_indptr, item_indices[user_order], values[user_order])
+
+    def similar_items(self, item: int, limit: int) -> tuple[np.ndarray, np.ndarray]:
+        """The ``limit`` items most similar to ``item`` and their cosine similarities."""
+        items = self._neighbor_items[item, :limit]
+        present = items >= 0
+        return items[present], self._neighbor_scores[item, :limit][present]
+
+    def recommend(self, user: int, limit: int) -> tuple[np.ndarray, np.ndarray]:
+        """Items the user has not interacted with, scored by their similarity to the ones they have."""
+        begin, end = self._user_indptr[user], self._user_indptr[user + 1]
+        seen = self._user_items[begin:end]
+        # A catalog of one item has no neighbour columns at all, hence no candidates.
+        if not len(seen) or not self._neighbor_items.shape[1]:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        candidates = self._neighbor_items[seen].ravel()
+        weights = (self._neighbor_scores[seen] * self._user_values[begin:end, None]).ravel()
+        # Sum per candidate over the few hundred neighbours rather than a dense vector of every item.
+        order = np.argsort(candidates, kind="stable")
+        candidates, weights = candidates[order], weights[order]
+        starts = np.flatnonzero(np.r_[True, candidates[1:] != candidates[:-1]])
+        candidates, scores = candidates[starts], np.add.reduceat(weights, starts)
+        scores[candidates < 0] = 0.0
+        positions = np.minimum(np.searchsorted(candidates, seen), len(candidates) - 1)
+        scores[positions[candidates[positions] == seen]] = 0.0
+        best, best_scores = _best(scores, limit)
+        return candidates[best], best_scores
+
+
+def cosine_neighbors(
+    user_indices: np.ndarray,
+    item_indices: np.ndarray,
+    values: np.ndarray,
+    n_users: int,
+    n_items: int,
+    neighbors: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """The ``neighbors`` most cosine-similar items of every item, best first, padded with ``-1`` and ``0``.
+
+    Items are the columns of a sparse user x item matrix given as one ``(user, item, value)`` triple per
+    non-zero; pairs must be unique.
+    """
+    user_indices = np.asarray(user_indices, dtype=np.int32)
+    item_indices = np.asarray(item_indices, dtype=np.int32)
+    values = np.asarray(values, dtype=np.float32)
+
+    # Unit-length item columns turn every dot product below into a cosine.
+    norms = np.sqrt(np.bincount(item_indices, weights=values.astype(np.float64) ** 2, minlength=n_items))
+    normalized = (values / np.where(norms > 0, norms, 1.0)[item_indices]).astype(np.float32)
+
+    user_indptr, user_order = _compress(user_indices, n_users)
+    item_indptr, item_order = _compress(item_indices, n_items)
+    rows_items, rows_values = item_indices[user_order], normalized[user_order]
+    columns_users, columns_values = user_indices[item_order], normalized[item_order]
+
+    neighbor_items = np.full((n_items, neighbors), -1, dtype=np.int32)
+    neighbor_scores = np.zeros((n_items, neighbors), dtype=np.float32)
+    if neighbors == 0:
+        return neighbor_items, neighbor_scores
+
+    # Work per item row: every co-interaction of every user who touched it.
+    user_degrees = np.diff(user_indptr)
+    item_costs = np.bincount(item_indices, weights=user_degrees[user_indices], minlength=n_items)
+    max_block_rows = max(1, _BLOCK_CELL_BUDGET // n_items)
+    start = 0
+    while start < n_items:
+        cumulative = np.cumsum(item_costs[start : start + max_block_rows])
+        end = start + max(1, int(np.searchsorted(cumulative, _BLOCK_PAIR_BUDGET, side="right")))
+        similarities = _block_similarities(
+            start,
+            end,
+            n_items,
+            item_indptr,
+            columns_users,
+            columns_values,
+            user_indptr,
+            rows_items,
+            rows_values,
+        )
+        top_k(similarities, neighbors, neighbor_items[start:end], neighbor_scores[start:end])
+        start = end
+    return neighbor_items, neighbor_scores
+
+
+def _compress(indices: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """CSR offsets for ``indices`` grouped by value, and the stable order that groups them."""
+    order = np.argsort(indices, kind="stable")
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=size), out=indptr[1:])
+    return indptr, order
+
+
+def ragged_positions(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """``concatenate([arange(s, s + n) for s, n in zip(starts, lengths)])`` without the Python loop."""
+    total = int(lengths.sum())
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total, dtype=np.int64)
+
+
+def _block_similarities(
+    start: int,
+    end: int,
+    n_items: int,
+    item_indptr: np.ndarray,
+    columns_users: np.ndarray,
+    columns_values: np.ndarray,
+    user_indptr: np.ndarray,
+    rows_items: np.ndarray,
+    rows_values: np.ndarray,
+) -> np.ndarray:
+    """Dense cosine similarities of items ``start:end`` against every item."""
+    lo, hi = item_indptr[start], item_indptr[end]
+    block_rows = np.repeat(np.arange(end - start, dtype=np.int64), np.diff(item_indptr[start : end + 1]))
+    users, user_values = columns_users[lo:hi], columns_values[lo:hi]
+    lengths = user_indptr[users + 1] - user_indptr[users]
+    positions = ragged_positions(user_indptr[users], lengths)
+    cells = np.repeat(block_rows * n_items, lengths) + rows_items[positions]
+    contributions = np.repeat(user_values, lengths) * rows_values[positions]
+    similarities = np.bincount(cells, weights=contributions, minlength=(end - start) * n_items)
+    similarities = similarities.reshape(end - start, n_items)
+    similarities[np.arange(end - start), np.arange(start, end)] = 0.0
+    return similarities
+
+
+def top_k(similarities: np.ndarray, k: int, items_out: np.ndarray, scores_out: np.ndarray) -> None:
+    """Write each row's ``k`` best positive columns, best first, into the output slices."""
+    if k < similarities.shape[1]:
+        candidates = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(similarities.shape[1]), similarities.shape)
+    candidate_scores = np.take_along_axis(similarities, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    best_items = np.take_along_axis(candidates, order, axis=1)
+    best_scores = np.take_along_axis(candidate_scores, order, axis=1)
+    positive = best_scores > 0
+    items_out[:] = np.where(positive, best_items, -1)
+    scores_out[:] = np.where(positive, best_scores, 0.0)
+
+
+def _best(scores: np.ndarray, limit: int) -> tuple[np.ndarray, np.ndarray]:
+    """Indices and values of the ``limit`` largest positive scores, best first."""
+    limit = min(limit, len(scores))
+    if limit <= 0:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    top = np.argpartition(-scores, limit - 1)[:limit] if limit < len(scores) else np.arange(len(scores))
+    top = top[np.argsort(-scores[top], kind="stable")]
+    top = top[scores[top] > 0]
+    return top.astype(np.int32), scores[top].astype(np.float32)
@@ -0,0 +1,364 @@
+# src/logics/recommendation/recommendation_logic.py
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import UTC, datetime
+from uuid import UUID
+
+import numpy as np
+from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
+from pydantic import BaseModel, ConfigDict
+
+from src.configs.runtime_config import RecommendationConfig, RuntimeConfig
+from src.logics.recommendation.content_similarity_logic import ContentSimilarityLogic
+from src.logics.recommendation.implicit_als_model import ImplicitALSModel
+from src.logics.recommendation.item_similarity_index import ItemSimilarityIndex
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import (
+    GetRecommendedMoviesInputDTOV1,
+    GetRecommendedMoviesOutputDTOV1,
+    GetSimilarMoviesInputDTOV1,
+    GetSimilarMoviesOutputDTOV1,
+    RecommendationSnapshotInfoDTOV1,
+    RecommendedMovieItemDTOV1,
+    RecordInteractionInputDTOV1,
+    SimilarMovieItemDTOV1,
+)
+from src.models.dtos.recommendation.repository.recommendation_repository_interface_dtos import (
+    GetInteractionsResponseDTO,
+    GetRecommendationMoviesResponseDTO,
+    RecommendationMovieDTO,
+)
+from src.models.types.recommendation_strategy_type import RecommendationStrategyType
+from src.models.types.similarity_strategy_type import SimilarityStrategyType
+from src.models.types.watch_status_type import WatchStatusType
+from src.repositories.recommendation.recommendation_repository import RecommendationRepository
+
+logger = logging.getLogger(__name__)
+
+# Implicit feedback strength: a rating counts score / 5, an unrated watch entry by its status.
+_MAX_SCORE = 5.0
+_WATCHED_WEIGHT = 0.6
+_WANT_TO_WATCH_WEIGHT = 0.3
+
+# Interactions kept for replay onto the next factorization model, should training keep failing.
+_MAX_RECORDED_INTERACTIONS = 100_000
+
+
+class _RecommendationSnapshot(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    generated_at: datetime
+    index: ItemSimilarityIndex
+    # Row i of the index is movies[i]; the maps go the other way.
+    movies: list[RecommendationMovieDTO]
+    movie_indices: dict[UUID, int]
+    user_indices: dict[UUID, int]
+
+
+class _FoldedUser(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Movie index -> interaction weight: the training interactions plus everything recorded since.
+    interactions: dict[int, float]
+    factors: np.ndarray
+
+
+class _FactorizationSnapshot(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    generated_at: datetime
+    model: ImplicitALSModel
+    movies: list[RecommendationMovieDTO]
+    movie_indices: dict[UUID, int]
+    user_indices: dict[UUID, int]
+    # Users with activity since training, including users the model has never seen.
+    folded_users: dict[UUID, _FoldedUser] = {}
+
+
+class _RecordedInteraction(BaseModel):
+    recorded_at: float
+    user_uuid: UUID
+    movie_uuid: UUID
+    weight: float
+
+
+class RecommendationLogic:
+    """Similar movies and personal recommendations served from in-process models.
+
+    ``refresh`` rebuilds the item-item index and ``retrain`` the factorization model, each on its own timer
+    started in ``manage.py``. Both read every watch entry and rating, do the numeric work off the event loop
+    and swap their snapshot in a single assignment; a request that arrives before the first run has
+    finished waits for it. Between trainings, ``record_interaction`` folds new activity into the factors
+    of the users concerned. Similar movies by content come from ``ContentSimilarityLogic``.
+    """
+
+    def __init__(
+        self,
+        repository: RecommendationRepository,
+        content_similarity_logic: ContentSimilarityLogic,
+        config: RecommendationConfig | None = None,
+    ) -> None:
+        self._repository = repository
+        self._content_similarity_logic = content_similarity_logic
+        self._config: RecommendationConfig = config or RuntimeConfig.global_config().RECOMMENDATION
+        self._snapshot: _RecommendationSnapshot | None = None
+        self._factorization: _FactorizationSnapshot | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._retrain_lock = asyncio.Lock()
+        # Activity since the running (or last) training started, replayed onto the model it produces.
+        self._recorded: deque[_RecordedInteraction] = deque(maxlen=_MAX_RECORDED_INTERACTIONS)
+
+    async def refresh(self) -> RecommendationSnapshotInfoDTOV1:
+        async with self._refresh_lock:
+            return await self._refresh()
+
+    async def retrain(self) -> RecommendationSnapshotInfoDTOV1:
+        async with self._retrain_lock:
+            return await self._retrain()
+
+    def record_interaction(self, input_dto: RecordInteractionInputDTOV1) -> None:
+        """Fold a committed watch entry or rating into the user's factors; the next training includes it."""
+        interaction = _RecordedInteraction(
+            recorded_at=time.monotonic(),
+            user_uuid=input_dto.user_uuid,
+            movie_uuid=input_dto.movie_uuid,
+            weight=self._interaction_weight(input_dto.status, input_dto.score),
+        )
+        self._recorded.append(interaction)
+        if self._factorization is not None:
+            self._fold_in(self._factorization, interaction)
+
+    async def get_similar_movies(self, input_dto: GetSimilarMoviesInputDTOV1) -> GetSimilarMoviesOutputDTOV1:
+        if input_dto.strategy == SimilarityStrategyType.CONTENT:
+            return await self._content_similarity_logic.get_similar_movies(input_dto=input_dto)
+
+        snapshot = await self._current_snapshot()
+        movie_index = snapshot.movie_indices.get(input_dto.movie_uuid)
+        movies = []
+        if movie_index is not None:
+            indices, similarities = snapshot.index.similar_items(movie_index, input_dto.limit)
+            movies = [
+                SimilarMovieItemDTOV1(
+                    **snapshot.movies[index].model_dump(),
+                    similarity=round(float(similarity), 4),
+                )
+                for index, similarity in zip(indices.tolist(), similarities.tolist(), strict=True)
+            ]
+        return GetSimilarMoviesOutputDTOV1(
+            **self._snapshot_info(snapshot.generated_at, self._config.REFRESH_INTERVAL_SECONDS).model_dump(),
+            movies=movies,
+        )
+
+    async def get_recommended_movies(
+        self,
+        input_dto: GetRecommendedMoviesInputDTOV1,
+    ) -> GetRecommendedMoviesOutputDTOV1:
+        if input_dto.strategy == RecommendationStrategyType.FACTORS:
+            return await self._recommend_by_factors(input_dto)
+
+        snapshot = await self._current_snapshot()
+        user_index = snapshot.user_indices.get(input_dto.user_uuid)
+        movies = []
+        if user_index is not None:
+            indices, scores = snapshot.index.recommend(user_index, input_dto.limit)
+            movies = self._recommended_items(snapshot.movies, indices, scores)
+        return GetRecommendedMoviesOutputDTOV1(
+            **self._snapshot_info(snapshot.generated_at, self._config.REFRESH_INTERVAL_SECONDS).model_dump(),
+            movies=movies,
+        )
+
+    async def _recommend_by_factors(
+        self,
+        input_dto: GetRecommendedMoviesInputDTOV1,
+    ) -> GetRecommendedMoviesOutputDTOV1:
+        snapshot = await self._current_factorization()
+        movies = []
+        folded = snapshot.folded_users.get(input_dto.user_uuid)
+        user_index = snapshot.user_indices.get(input_dto.user_uuid)
+        if folded is not None:
+            seen = np.fromiter(folded.interactions, dtype=np.int32, count=len(folded.interactions))
+            indices, scores = snapshot.model.recommend(folded.factors, seen, input_dto.limit)
+            movies = self._recommended_items(snapshot.movies, indices, scores)
+        elif user_index is not None:
+            seen, _ = snapshot.model.user_items(user_index)
+            indices, scores = snapshot.model.recommend(snapshot.model.user_factors(user_index), seen, input_dto.limit)
+            movies = self._recommended_items(snapshot.movies, indices, scores)
+        return GetRecommendedMoviesOutputDTOV1(
+            **self._snapshot_info(snapshot.generated_at, self._config.FACTORIZATION_INTERVAL_SECONDS).model_dump(),
+            movies=movies,
+        )
+
+    async def _current_snapshot(self) -> _RecommendationSnapshot:
+        if self._snapshot is None:
+            async with self._refresh_lock:
+                if self._snapshot is None:
+                    await self._refresh()
+        return self._snapshot
+
+    async def _current_factorization(self) -> _FactorizationSnapshot:
+        if self._factorization is None:
+            async with self._retrain_lock:
+                if self._factorization is None:
+                    await self._retrain()
+        return self._factorization
+
+    async def _refresh(self) -> RecommendationSnapshotInfoDTOV1:
+        started = time.monotonic()
+        generated_at = datetime.now(UTC)
+        movies, interactions = await self._load()
+        # Building is CPU-bound; NumPy releases the GIL, so requests keep being served meanwhile.
+        self._snapshot = await asyncio.to_thread(self._build_snapshot, generated_at, movies, interactions)
+        logger.info(
+            "Recommendations refreshed in %.3fs: %d movies, %d users, %d interactions, %d bytes",
+            time.monotonic() - started,
+            len(self._snapshot.movies),
+            len(self._snapshot.user_indices),
+            len(interactions.user_uuids),
+            self._snapshot.index.nbytes,
+        )
+        return self._snapshot_info(generated_at, self._config.REFRESH_INTERVAL_SECONDS)
+
+    async def _retrain(self) -> RecommendationSnapshotInfoDTOV1:
+        started = time.monotonic()
+        generated_at = datetime.now(UTC)
+        movies, interactions = await self._load()
+        snapshot = await asyncio.to_thread(self._train_factorization, generated_at, movies, interactions)
+        # Activity recorded since the load began may be missing from the model; replay it before anyone reads.
+        while self._recorded and self._recorded[0].recorded_at < started:
+            self._recorded.popleft()
+        for interaction in self._recorded:
+            self._fold_in(snapshot, interaction)
+        self._factorization = snapshot
+        logger.info(
+            "Factorization retrained in %.3fs: %d movies, %d users, %d interactions, %d replayed, %d bytes",
+            time.monotonic() - started,
+            len(snapshot.movies),
+            len(snapshot.user_indices),
+            len(interactions.user_uuids),
+            len(self._recorded),
+            snapshot.model.nbytes,
+        )
+        return self._snapshot_info(generated_at, self._config.FACTORIZATION_INTERVAL_SECONDS)
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _load(self) -> tuple[GetRecommendationMoviesResponseDTO, GetInteractionsResponseDTO]:
+        return await self._repository.get_movies(), await self._repository.get_interactions()
+
+    def _build_snapshot(
+        self,
+        generated_at: datetime,
+        movies: GetRecommendationMoviesResponseDTO,
+        interactions: GetInteractionsResponseDTO,
+    ) -> _RecommendationSnapshot:
+        movie_indices, user_indices = self._indices(movies, interactions)
+        index = ItemSimilarityIndex.build(
+            *self._encode(movie_indices, user_indices, interactions),
+            n_users=len(user_indices),
+            n_items=len(movie_indices),
+            neighbors=self._config.NEIGHBORS,
+        )
+        return _RecommendationSnapshot(
+            generated_at=generated_at,
+            index=index,
+            movies=movies.movies,
+            movie_indices=movie_indices,
+            user_indices=user_indices,
+        )
+
+    def _train_factorization(
+        self,
+        generated_at: datetime,
+        movies: GetRecommendationMoviesResponseDTO,
+        interactions: GetInteractionsResponseDTO,
+    ) -> _FactorizationSnapshot:
+        movie_indices, user_indices = self._indices(movies, interactions)
+        model = ImplicitALSModel.train(
+            *self._encode(movie_indices, user_indices, interactions),
+            n_users=len(user_indices),
+            n_items=len(movie_indices),
+            factors=self._config.FACTORS,
+            regularization=self._config.FACTORIZATION_REGULARIZATION,
+            alpha=self._config.FACTORIZATION_CONFIDENCE_ALPHA,
+            iterations=self._config.FACTORIZATION_ITERATIONS,
+        )
+        return _FactorizationSnapshot(
+            generated_at=generated_at,
+            model=model,
+            movies=movies.movies,
+            movie_indices=movie_indices,
+            user_indices=user_indices,
+        )
+
+    def _fold_in(self, snapshot: _FactorizationSnapshot, interaction: _RecordedInteraction) -> None:
+        movie_index = snapshot.movie_indices.get(interaction.movie_uuid)
+        if movie_index is None:
+            # Created after the training; it has no factors until the next one.
+            return
+        folded = snapshot.folded_users.get(interaction.user_uuid)
+        if folded is None:
+            trained: dict[int, float] = {}
+            user_index = snapshot.user_indices.get(interaction.user_uuid)
+            if user_index is not None:
+                items, values = snapshot.model.user_items(user_index)
+                trained = dict(zip(items.tolist(), values.tolist(), strict=True))
+            folded = _FoldedUser(interactions=trained, factors=np.empty(0, dtype=np.float32))
+            snapshot.folded_users[interaction.user_uuid] = folded
+        folded.interactions[movie_index] = interaction.weight
+        count = len(folded.interactions)
+        folded.factors = snapshot.model.fold_in(
+            np.fromiter(folded.interactions.keys(), dtype=np.int32, count=count),
+            np.fromiter(folded.interactions.values(), dtype=np.float32, count=count),
+        )
+
+    @staticmethod
+    def _indices(
+        movies: GetRecommendationMoviesResponseDTO,
+        interactions: GetInteractionsResponseDTO,
+    ) -> tuple[dict[UUID, int], dict[UUID, int]]:
+        movie_indices = {movie.movie_uuid: index for index, movie in enumerate(movies.movies)}
+        user_indices: dict[UUID, int] = {}
+        for user_uuid in interactions.user_uuids:
+            user_indices.setdefault(user_uuid, len(user_indices))
+        return movie_indices, user_indices
+
+    @staticmethod
+    def _encode(
+        movie_indices: dict[UUID, int],
+        user_indices: dict[UUID, int],
+        interactions: GetInteractionsResponseDTO,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The interactions as parallel (user index, movie index, weight) arrays."""
+        scores = np.fromiter((score or 0 for score in interactions.scores), dtype=np.float32)
+        watched = np.fromiter((status == WatchStatusType.WATCHED for status in interactions.statuses), dtype=bool)
+        status_weights = np.where(watched, _WATCHED_WEIGHT, _WANT_TO_WATCH_WEIGHT)
+        return (
+            np.fromiter((user_indices[uuid] for uuid in interactions.user_uuids), dtype=np.int32),
+            np.fromiter((movie_indices[uuid] for uuid in interactions.movie_uuids), dtype=np.int32),
+            np.where(scores > 0, scores / _MAX_SCORE, status_weights).astype(np.float32),
+        )
+
+    @staticmethod
+    def _interaction_weight(status: WatchStatusType, score: int | None) -> float:
+        if score:
+            return score / _MAX_SCORE
+        return _WATCHED_WEIGHT if status == WatchStatusType.WATCHED else _WANT_TO_WATCH_WEIGHT
+
+    @staticmethod
+    def _recommended_items(
+        movies: list[RecommendationMovieDTO],
+        indices: np.ndarray,
+        scores: np.ndarray,
+    ) -> list[RecommendedMovieItemDTOV1]:
+        return [
+            RecommendedMovieItemDTOV1(**movies[index].model_dump(), score=round(float(score), 4))
+            for index, score in zip(indices.tolist(), scores.tolist(), strict=True)
+        ]
+
+    @staticmethod
+    def _snapshot_info(generated_at: datetime, interval_seconds: float) -> RecommendationSnapshotInfoDTOV1:
+        return RecommendationSnapshotInfoDTOV1(
+            generated_at=generated_at,
+            age_seconds=round((datetime.now(UTC) - generated_at).total_seconds(), 3),
+            refresh_interval_seconds=interval_seconds,
+        )
@@ -21,37 +21,94 @@ from src.models.dtos.user.repository.user_repository_interface_dtos import (
     SearchUserResponseDTO,
     UpdateUserCommandDTO,
 )
+from src.models.types.entity_type import EntityType
 from src.repositories.user.user_repository import UserRepository
+from src.utils.invalidation_bus import EntityChangedEventDTO, InvalidationBus
+from src.utils.principal_cache import PrincipalCache
+from src.utils.response_cache import ResponseCache
+
+_GET_USER_ROUTE = "GET /api/v1/users/{user_uuid}"
 
 
 class UserLogic:
-    def __init__(self, repository: UserRepository) -> None:
+    def __init__(
+        self,
+        repository: UserRepository,
+        principal_cache: PrincipalCache,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+    ) -> None:
         self._repository: UserRepository = repository
+        self._principal_cache: PrincipalCache = principal_cache
+        self._invalidation_bus: InvalidationBus = invalidation_bus
+        self._response_cache: ResponseCache = response_cache
+        # Principals changed through other workers are dropped here as soon as their event arrives.
+        invalidation_bus.subscribe(EntityType.USER, self._on_users_changed)
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def create_user(self, input_dto: CreateUserInputDTOV1) -> CreateUserOutputDTOV1:
+        output = await self._create_user(input_dto=input_dto)
+        # Nothing cached shows the new user, but the users list version must change.
+        await self._response_cache.invalidate(EntityType.USER, [output.user_uuid])
+        return output
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _create_user(self, input_dto: CreateUserInputDTOV1) -> CreateUserOutputDTOV1:
         command: CreateUserCommandDTO = CreateUserCommandDTO.model_validate(obj=input_dto)
         response: CreateUserResponseDTO = await self._repository.create_user(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.USER, [response.user_uuid])
         return CreateUserOutputDTOV1.model_validate(obj=response)
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def get_user(self, input_dto: GetUserInputDTOV1) -> GetUserOutputDTOV1:
+        return await self._response_cache.get_or_load(
+            route=_GET_USER_ROUTE,
+            params=input_dto,
+            output_type=GetUserOutputDTOV1,
+            load=lambda: self._get_user(input_dto=input_dto),
+            tags=lambda user: [user.user_uuid],
+        )
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _get_user(self, input_dto: GetUserInputDTOV1) -> GetUserOutputDTOV1:
         query: GetUserQueryDTO = GetUserQueryDTO.model_validate(obj=input_dto)
         response: GetUserResponseDTO = await self._repository.get_user(input_dto=query)
         return GetUserOutputDTOV1.model_validate(obj=response)
 
+    def get_users_version(self) -> str:
+        return self._response_cache.collection_version([EntityType.USER])
+
     @async_postgres_sqlalchemy_atomic_decorator
     async def search_users(self, input_dto: SearchUserInputDTOV1) -> SearchUserOutputDTOV1:
         repository_dto = SearchUserQueryDTO.model_validate(input_dto)
         response: SearchUserResponseDTO = await self._repository.search_users(input_dto=repository_dto)
         return SearchUserOutputDTOV1.model_validate(obj=response)
 
-    @async_postgres_sqlalchemy_atomic_decorator
+    # The principal and cached responses showing the user, such as a movie's raters, are dropped once the write
+    # has committed; dropping them earlier would let a concurrent read cache the old row again.
     async def update_user(self, input_dto: UpdateUserInputDTOV1) -> None:
+        await self._update_user(input_dto=input_dto)
+        self._principal_cache.invalidate(input_dto.user_uuid)
+        await self._response_cache.invalidate(EntityType.USER, [input_dto.user_uuid])
+
+    async def delete_user(self, input_dto: DeleteUserInputDTOV1) -> None:
+        await self._delete_user(input_dto=input_dto)
+        self._principal_cache.invalidate(input_dto.user_uuid)
+        await self._response_cache.invalidate(EntityType.USER, [input_dto.user_uuid])
+
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _update_user(self, input_dto: UpdateUserInputDTOV1) -> None:
         command: UpdateUserCommandDTO = UpdateUserCommandDTO.model_validate(obj=input_dto)
         await self._repository.update_user(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.USER, [input_dto.user_uuid])
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def delete_user(self, input_dto: DeleteUserInputDTOV1) -> None:
+    async def _delete_user(self, input_dto: DeleteUserInputDTOV1) -> None:
         command: DeleteUserCommandDTO = DeleteUserCommandDTO.model_validate(obj=input_dto)
         await self._repository.delete_user(input_dto=command)
+        await self._invalidation_bus.publish(EntityType.USER, [input_dto.user_uuid])
+
+    async def _on_users_changed(self, event: EntityChangedEventDTO) -> None:
+        if event.entity_uuids is None:
+            self._principal_cache.clear()
+            return
+        for user_uuid in event.entity_uuids:
+            self._principal_cache.invalidate(user_uuid)
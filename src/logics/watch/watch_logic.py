@@ -1,7 +1,11 @@
 # src/logics/watch/watch_logic.py
 from archipy.helpers.decorators.sqlalchemy_atomic import async_postgres_sqlalchemy_atomic_decorator
-from archipy.models.errors import AlreadyExistsError
 
+from src.logics.recommendation.recommendation_logic import RecommendationLogic
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import (
+    ApplyMovieStatsDeltaCommandDTO,
+)
+from src.models.dtos.recommendation.domain.v1.recommendation_domain_interface_dtos import RecordInteractionInputDTOV1
 from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import (
     DeleteWatchInputDTOV1,
     GetMovieWatchersInputDTOV1,
@@ -11,42 +15,92 @@ from src.models.dtos.watch.domain.v1.watch_domain_interface_dtos import (
     GetUserWatchHistoryInputDTOV1,
     GetUserWatchHistoryOutputDTOV1,
     UpdateWatchStatusInputDTOV1,
+    UpdateWatchStatusOutputDTOV1,
     WatchedMovieItemDTOV1,
     WatcherUserItemDTOV1,
     WatchMovieInputDTOV1,
     WatchMovieOutputDTOV1,
 )
 from src.models.dtos.watch.repository.watch_repository_interface_dtos import (
-    CheckWatchExistsQueryDTO,
     CreateWatchCommandDTO,
     DeleteWatchCommandDTO,
     GetMovieWatchersQueryDTO,
     GetUserWatchHistoryQueryDTO,
     UpdateWatchStatusCommandDTO,
 )
+from src.models.types.entity_type import EntityType
+from src.models.types.watch_status_type import WatchStatusType
+from src.repositories.movie_stats.movie_stats_repository import MovieStatsRepository
 from src.repositories.watch.watch_repository import WatchRepository
+from src.utils.invalidation_bus import InvalidationBus
+from src.utils.response_cache import ResponseCache
+from src.utils.single_flight import SingleFlight
+from src.utils.transaction_utils import retry_on_serialization_failure
+
+_GET_MOVIE_WATCHERS_ROUTE = "GET /api/v1/watchlist/movie/{movie_uuid}/watchers"
+
+# movie_stats counter kept for each watch status.
+_STATUS_COUNTERS = {
+    WatchStatusType.WATCHED: "watched_count",
+    WatchStatusType.WANT_TO_WATCH: "want_to_watch_count",
+}
 
 
 class WatchLogic:
-    def __init__(self, repository: WatchRepository) -> None:
+    def __init__(
+        self,
+        repository: WatchRepository,
+        movie_stats_repository: MovieStatsRepository,
+        recommendation_logic: RecommendationLogic,
+        invalidation_bus: InvalidationBus,
+        response_cache: ResponseCache,
+        single_flight: SingleFlight,
+    ) -> None:
         self._repository = repository
+        self._movie_stats_repository = movie_stats_repository
+        self._recommendation_logic = recommendation_logic
+        self._invalidation_bus = invalidation_bus
+        self._response_cache = response_cache
+        self._single_flight = single_flight
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def watch_movie(self, input_dto: WatchMovieInputDTOV1) -> WatchMovieOutputDTOV1:
-        exists_query = CheckWatchExistsQueryDTO(
-            user_uuid=input_dto.user_uuid,
-            movie_uuid=input_dto.movie_uuid,
+        output = await self._create_watch(input_dto=input_dto)
+        await self._response_cache.invalidate(
+            EntityType.WATCH,
+            [output.watch_uuid],
+            related_uuids=[output.movie_uuid, output.user_uuid],
+        )
+        # Only once committed, so a rolled-back watch entry never reaches the recommendation model.
+        self._recommendation_logic.record_interaction(
+            input_dto=RecordInteractionInputDTOV1(
+                user_uuid=output.user_uuid,
+                movie_uuid=output.movie_uuid,
+                status=output.status,
+            ),
         )
-        already_watched = await self._repository.check_watch_exists(input_dto=exists_query)
-        if already_watched:
-            raise AlreadyExistsError(resource_type="UserWatchMovieEntity")
+        return output
 
+    @retry_on_serialization_failure
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _create_watch(self, input_dto: WatchMovieInputDTOV1) -> WatchMovieOutputDTOV1:
+        # create_watch raises AlreadyExistsError itself when the user already tracks the movie.
         command = CreateWatchCommandDTO(
             user_uuid=input_dto.user_uuid,
             movie_uuid=input_dto.movie_uuid,
             status=input_dto.status,
         )
         response = await self._repository.create_watch(input_dto=command)
+        await self._movie_stats_repository.apply_delta(
+            input_dto=ApplyMovieStatsDeltaCommandDTO(
+                movie_uuid=response.movie_uuid,
+                **{_STATUS_COUNTERS[response.status]: 1},
+            ),
+        )
+        await self._invalidation_bus.publish(
+            EntityType.WATCH,
+            [response.watch_uuid],
+            related_uuids=[response.movie_uuid, response.user_uuid],
+        )
         return WatchMovieOutputDTOV1.model_validate(obj=response)
 
     @async_postgres_sqlalchemy_atomic_decorator
@@ -58,6 +112,7 @@ class WatchLogic:
             user_uuid=input_dto.user_uuid,
             pagination=input_dto.pagination,
             sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
             status_filter=input_dto.status_filter,
         )
         response = await self._repository.get_user_watch_history(input_dto=query)
@@ -75,6 +130,7 @@ class WatchLogic:
                 for w in response.watches
             ],
             total=response.total,
+            total_is_exact=response.total_is_exact,
         )
 
     @async_postgres_sqlalchemy_atomic_decorator
@@ -86,6 +142,7 @@ class WatchLogic:
             user_uuid=input_dto.user_uuid,
             pagination=input_dto.pagination,
             sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
             status_filter=input_dto.status_filter,
         )
         response = await self._repository.get_user_watch_history(input_dto=query)
@@ -103,10 +160,20 @@ class WatchLogic:
                 for w in response.watches
             ],
             total=response.total,
+            total_is_exact=response.total_is_exact,
+        )
+
+    async def get_movie_watchers(self, input_dto: GetMovieWatchersInputDTOV1) -> GetMovieWatchersOutputDTOV1:
+        # Watch writes evict cached responses, which bumps the generation, so no caller joins an older read.
+        return await self._single_flight.do(
+            _GET_MOVIE_WATCHERS_ROUTE,
+            input_dto,
+            lambda: self._get_movie_watchers(input_dto=input_dto),
+            generation=self._response_cache.generation,
         )
 
     @async_postgres_sqlalchemy_atomic_decorator
-    async def get_movie_watchers(
+    async def _get_movie_watchers(
         self,
         input_dto: GetMovieWatchersInputDTOV1,
     ) -> GetMovieWatchersOutputDTOV1:
@@ -114,6 +181,7 @@ class WatchLogic:
             movie_uuid=input_dto.movie_uuid,
             pagination=input_dto.pagination,
             sort_info=input_dto.sort_info,
+            include_total=input_dto.include_total,
             status_filter=input_dto.status_filter,
         )
         response = await self._repository.get_movie_watchers(input_dto=query)
@@ -131,21 +199,63 @@ class WatchLogic:
                 for u in response.watchers
             ],
             total=response.total,
+            total_is_exact=response.total_is_exact,
+        )
+
+    async def update_watch_status(self, input_dto: UpdateWatchStatusInputDTOV1) -> UpdateWatchStatusOutputDTOV1:
+        output = await self._update_watch_status(input_dto=input_dto)
+        await self._response_cache.invalidate(
+            EntityType.WATCH,
+            [output.watch_uuid],
+            related_uuids=[output.movie_uuid, output.user_uuid],
         )
+        return output
 
+    @retry_on_serialization_failure
     @async_postgres_sqlalchemy_atomic_decorator
-    async def update_watch_status(self, input_dto: UpdateWatchStatusInputDTOV1) -> None:
+    async def _update_watch_status(self, input_dto: UpdateWatchStatusInputDTOV1) -> UpdateWatchStatusOutputDTOV1:
         command = UpdateWatchStatusCommandDTO(
             watch_uuid=input_dto.watch_uuid,
             user_uuid=input_dto.user_uuid,
             status=input_dto.status,
         )
-        await self._repository.update_watch_status(input_dto=command)
+        response = await self._repository.update_watch_status(input_dto=command)
+        if response.previous_status != response.status:
+            await self._movie_stats_repository.apply_delta(
+                input_dto=ApplyMovieStatsDeltaCommandDTO(
+                    movie_uuid=response.movie_uuid,
+                    **{_STATUS_COUNTERS[response.previous_status]: -1, _STATUS_COUNTERS[response.status]: 1},
+                ),
+            )
+        await self._invalidation_bus.publish(
+            EntityType.WATCH,
+            [response.watch_uuid],
+            related_uuids=[response.movie_uuid, response.user_uuid],
+        )
+        return UpdateWatchStatusOutputDTOV1.model_validate(obj=response)
 
-    @async_postgres_sqlalchemy_atomic_decorator
     async def delete_watch(self, input_dto: DeleteWatchInputDTOV1) -> None:
+        await self._delete_watch(input_dto=input_dto)
+        await self._response_cache.invalidate(
+            EntityType.WATCH,
+            [],
+            related_uuids=[input_dto.movie_uuid, input_dto.user_uuid],
+        )
+
+    @retry_on_serialization_failure
+    @async_postgres_sqlalchemy_atomic_decorator
+    async def _delete_watch(self, input_dto: DeleteWatchInputDTOV1) -> None:
         command = DeleteWatchCommandDTO(
             user_uuid=input_dto.user_uuid,
             movie_uuid=input_dto.movie_uuid,
         )
-        await self._repository.delete_watch(input_dto=command)
+        response = await self._repository.delete_watch(input_dto=command)
+        # delete_watch only removes "want_to_watch" entries.
+        await self._movie_stats_repository.apply_delta(
+            input_dto=ApplyMovieStatsDeltaCommandDTO(movie_uuid=input_dto.movie_uuid, want_to_watch_count=-1),
+        )
+        await self._invalidation_bus.publish(
+            EntityType.WATCH,
+            [response.watch_uuid],
+            related_uuids=[input_dto.movie_uuid, input_dto.user_uuid],
+        )
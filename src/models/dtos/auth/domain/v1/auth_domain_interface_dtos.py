@@ -84,3 +84,11 @@ class GetMeOutputDTOV1(BaseModel):
     is_active: bool
     is_super_user: bool
     created_at: datetime
+
+
+class UserPrincipalOutputDTOV1(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    user_uuid: UUID
+    is_active: bool
+    is_super_user: bool
@@ -7,6 +7,8 @@ from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.types.genre_sort_type import GenreSortColumnType
+from src.models.types.total_mode_type import TotalModeType
+from src.utils.utils import Utils
 
 
 class CreateGenreRestInputDTOV1(BaseModel):
@@ -41,10 +43,12 @@ class BulkCreateGenreInputDTOV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     genres: list[CreateGenreInputDTOV1]
+    skip_conflicts: bool = False
 
 
 class BulkCreateGenreOutputDTOV1(BaseDTO):
     genres: list[CreateGenreOutputDTOV1]
+    conflicting_indexes: list[int] = Field(default_factory=list)
 
 
 class GetGenreInputDTOV1(BaseDTO):
@@ -70,6 +74,7 @@ class SearchGenreInputDTOV1(BaseDTO):
     name: str | None = None
     pagination: PaginationDTO
     sort_info: SortDTO[GenreSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
     @classmethod
     def create(
@@ -79,17 +84,20 @@ class SearchGenreInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: GenreSortColumnType = GenreSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
     ) -> "SearchGenreInputDTOV1":
         return cls(
             name=name,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[GenreSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[GenreSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
         )
 
 
 class SearchGenreOutputDTOV1(BaseDTO):
     genres: list[GenreItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class UpdateGenreRestInputDTOV1(BaseDTO):
@@ -103,3 +111,11 @@ class UpdateGenreInputDTOV1(UpdateGenreRestInputDTOV1):
 
 class DeleteGenreInputDTOV1(BaseDTO):
     genre_uuid: UUID
+
+
+class GetExistingGenreUUIDsInputDTOV1(BaseDTO):
+    genre_uuids: list[UUID]
+
+
+class GetExistingGenreUUIDsOutputDTOV1(BaseDTO):
+    genre_uuids: set[UUID]
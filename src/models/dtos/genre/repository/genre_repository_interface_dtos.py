@@ -7,6 +7,7 @@ from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict
 
 from src.models.types.genre_sort_type import GenreSortColumnType
+from src.models.types.total_mode_type import TotalModeType
 
 
 class CreateGenreCommandDTO(BaseModel):
@@ -30,10 +31,12 @@ class BulkCreateGenreCommandDTO(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     genres: list[CreateGenreCommandDTO]
+    skip_conflicts: bool = False
 
 
 class BulkCreateGenreResponseDTO(BaseModel):
     genres: list[CreateGenreResponseDTO]
+    conflicting_indexes: list[int] = []
 
 
 class GetGenreQueryDTO(BaseDTO):
@@ -48,6 +51,10 @@ class GetGenreResponseDTO(BaseDTO):
     updated_at: datetime
 
 
+class GetAllGenresResponseDTO(BaseDTO):
+    genres: list[GetGenreResponseDTO]
+
+
 class GenreItemDTO(BaseDTO):
     genre_uuid: UUID
     name: str
@@ -59,11 +66,13 @@ class SearchGenreQueryDTO(BaseDTO):
     name: str | None = None
     pagination: PaginationDTO
     sort_info: SortDTO[GenreSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
 
 class SearchGenreResponseDTO(BaseDTO):
     genres: list[GenreItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class UpdateGenreCommandDTO(BaseDTO):
@@ -74,3 +83,11 @@ class UpdateGenreCommandDTO(BaseDTO):
 
 class DeleteGenreCommandDTO(BaseDTO):
     genre_uuid: UUID
+
+
+class GetExistingGenreUUIDsQueryDTO(BaseDTO):
+    genre_uuids: list[UUID]
+
+
+class GetExistingGenreUUIDsResponseDTO(BaseDTO):
+    genre_uuids: set[UUID]
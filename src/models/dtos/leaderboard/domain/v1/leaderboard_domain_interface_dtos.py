@@ -0,0 +1,42 @@
+from datetime import datetime
+from uuid import UUID
+
+from archipy.models.dtos.base_dtos import BaseDTO
+
+
+class GetLeaderboardInputDTOV1(BaseDTO):
+    genre_uuid: UUID | None = None
+    limit: int = 20
+
+
+class TopRatedMovieItemDTOV1(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+    # Average pulled towards the catalog mean until the movie has enough ratings.
+    weighted_rating: float
+    rating_count: int
+    average_rating: float
+
+
+class TrendingMovieItemDTOV1(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+    # Recent watch and rating activity, each weighted down by its age.
+    trending_score: float
+    activity_count: int
+
+
+class LeaderboardSnapshotInfoDTOV1(BaseDTO):
+    generated_at: datetime
+    age_seconds: float
+    refresh_interval_seconds: float
+
+
+class GetTopRatedMoviesOutputDTOV1(LeaderboardSnapshotInfoDTOV1):
+    movies: list[TopRatedMovieItemDTOV1]
+
+
+class GetTrendingMoviesOutputDTOV1(LeaderboardSnapshotInfoDTOV1):
+    movies: list[TrendingMovieItemDTOV1]
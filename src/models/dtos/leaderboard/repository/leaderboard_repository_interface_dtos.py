@@ -0,0 +1,43 @@
+from datetime import datetime
+from uuid import UUID
+
+from archipy.models.dtos.base_dtos import BaseDTO
+
+
+class GetTopRatedQueryDTO(BaseDTO):
+    # Weight of the catalog-wide mean, in ratings.
+    prior_votes: float
+    # Movies kept per genre; the overall ranking is drawn from the union.
+    size: int
+
+
+class TopRatedMovieDTO(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+    weighted_rating: float
+    rating_count: int
+    rating_sum: int
+
+
+class GetTopRatedResponseDTO(BaseDTO):
+    movies: list[TopRatedMovieDTO]
+
+
+class GetTrendingQueryDTO(BaseDTO):
+    now: datetime
+    since: datetime
+    half_life_seconds: float
+    size: int
+
+
+class TrendingMovieDTO(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+    trending_score: float
+    activity_count: int
+
+
+class GetTrendingResponseDTO(BaseDTO):
+    movies: list[TrendingMovieDTO]
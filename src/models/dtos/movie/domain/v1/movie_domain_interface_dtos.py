@@ -7,6 +7,8 @@ from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.types.movie_sort_type import MovieSortColumnType
+from src.models.types.total_mode_type import TotalModeType
+from src.utils.utils import Utils
 
 
 class CreateMovieRestInputDTOV1(BaseModel):
@@ -50,10 +52,30 @@ class BulkCreateMovieOutputDTOV1(BaseDTO):
     movies: list[CreateMovieOutputDTOV1]
 
 
+class ImportMovieErrorDTOV1(BaseDTO):
+    line: int
+    reason: str
+
+
+class ImportMoviesOutputDTOV1(BaseDTO):
+    inserted: int
+    duplicates: int
+    invalid: int
+    errors: list[ImportMovieErrorDTOV1]
+
+
 class GetMovieInputDTOV1(BaseDTO):
     movie_uuid: UUID
 
 
+class MovieStatsDTOV1(BaseDTO):
+    rating_count: int = 0
+    # None until the movie has been rated.
+    average_rating: float | None = None
+    watched_count: int = 0
+    want_to_watch_count: int = 0
+
+
 class GetMovieOutputDTOV1(BaseDTO):
     movie_uuid: UUID
     title: str
@@ -61,6 +83,7 @@ class GetMovieOutputDTOV1(BaseDTO):
     genre_uuid: UUID
     created_at: datetime
     updated_at: datetime
+    stats: MovieStatsDTOV1 = MovieStatsDTOV1()
 
 
 class MovieItemDTOV1(BaseDTO):
@@ -69,13 +92,18 @@ class MovieItemDTOV1(BaseDTO):
     description: str | None = None
     genre_uuid: UUID
     created_at: datetime
+    stats: MovieStatsDTOV1 = MovieStatsDTOV1()
 
 
 class SearchMovieInputDTOV1(BaseDTO):
     title: str | None = None
+    # Full-text query over title and description; results are ordered by relevance.
+    search: str | None = None
     genre_uuid: UUID | None = None
     pagination: PaginationDTO
     sort_info: SortDTO[MovieSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
+    cursor: str | None = None
 
     @classmethod
     def create(
@@ -86,18 +114,27 @@ class SearchMovieInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: MovieSortColumnType = MovieSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
+        cursor: str | None = None,
+        search: str | None = None,
     ) -> "SearchMovieInputDTOV1":
         return cls(
             title=title,
+            search=search,
             genre_uuid=genre_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[MovieSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[MovieSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
+            cursor=cursor,
         )
 
 
 class SearchMovieOutputDTOV1(BaseDTO):
     movies: list[MovieItemDTOV1]
-    total: int
+    # Not computed when paging by cursor.
+    total: int | None
+    total_is_exact: bool = True
+    next_cursor: str | None = None
 
 
 class UpdateMovieRestInputDTOV1(BaseDTO):
@@ -6,7 +6,9 @@ from archipy.models.dtos.pagination_dto import PaginationDTO
 from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict
 
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import MovieStatsDTO
 from src.models.types.movie_sort_type import MovieSortColumnType
+from src.models.types.total_mode_type import TotalModeType
 
 
 class CreateMovieCommandDTO(BaseModel):
@@ -49,6 +51,8 @@ class GetMovieResponseDTO(BaseDTO):
     genre_uuid: UUID
     created_at: datetime
     updated_at: datetime
+    # None when the movie has no movie_stats row yet, i.e. no ratings or watch entries.
+    stats: MovieStatsDTO | None = None
 
 
 class MovieItemDTO(BaseDTO):
@@ -57,18 +61,31 @@ class MovieItemDTO(BaseDTO):
     description: str | None = None
     genre_uuid: UUID
     created_at: datetime
+    stats: MovieStatsDTO | None = None
+
+
+class MovieCursorDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    value: str | datetime
+    movie_uuid: UUID
 
 
 class SearchMovieQueryDTO(BaseDTO):
     title: str | None = None
+    search: str | None = None
     genre_uuid: UUID | None = None
     pagination: PaginationDTO
     sort_info: SortDTO[MovieSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
+    after: MovieCursorDTO | None = None
 
 
 class SearchMovieResponseDTO(BaseDTO):
     movies: list[MovieItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
+    has_more: bool = False
 
 
 class UpdateMovieCommandDTO(BaseDTO):
@@ -80,3 +97,13 @@ class UpdateMovieCommandDTO(BaseDTO):
 
 class DeleteMovieCommandDTO(BaseDTO):
     movie_uuid: UUID
+
+
+class GetExistingMovieKeysQueryDTO(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    titles: list[str]
+
+
+class GetExistingMovieKeysResponseDTO(BaseDTO):
+    keys: set[tuple[str, UUID]]
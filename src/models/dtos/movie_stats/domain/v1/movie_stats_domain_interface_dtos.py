@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from archipy.models.dtos.base_dtos import BaseDTO
+
+
+class MovieStatsCountersDTOV1(BaseDTO):
+    rating_count: int
+    rating_sum: int
+    score_1_count: int
+    score_2_count: int
+    score_3_count: int
+    score_4_count: int
+    score_5_count: int
+    watched_count: int
+    want_to_watch_count: int
+
+
+class MovieStatsDriftDTOV1(BaseDTO):
+    movie_uuid: UUID
+    stored: MovieStatsCountersDTOV1
+    actual: MovieStatsCountersDTOV1
+
+
+class ReconcileMovieStatsInputDTOV1(BaseDTO):
+    # Only report drift unless set.
+    repair: bool = False
+
+
+class ReconcileMovieStatsOutputDTOV1(BaseDTO):
+    drifts: list[MovieStatsDriftDTOV1]
+    repaired: bool
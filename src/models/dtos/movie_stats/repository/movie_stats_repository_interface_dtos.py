@@ -0,0 +1,57 @@
+from uuid import UUID
+
+from archipy.models.dtos.base_dtos import BaseDTO
+from pydantic import BaseModel, ConfigDict
+
+
+class MovieStatsDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    rating_count: int = 0
+    rating_sum: int = 0
+    score_1_count: int = 0
+    score_2_count: int = 0
+    score_3_count: int = 0
+    score_4_count: int = 0
+    score_5_count: int = 0
+    watched_count: int = 0
+    want_to_watch_count: int = 0
+
+
+class ApplyMovieStatsDeltaCommandDTO(BaseDTO):
+    """Signed changes to add to a movie's counters; the row is created on first use."""
+
+    movie_uuid: UUID
+    rating_count: int = 0
+    rating_sum: int = 0
+    score_1_count: int = 0
+    score_2_count: int = 0
+    score_3_count: int = 0
+    score_4_count: int = 0
+    score_5_count: int = 0
+    watched_count: int = 0
+    want_to_watch_count: int = 0
+
+
+class GetMovieStatsQueryDTO(BaseDTO):
+    movie_uuid: UUID
+
+
+class GetMovieStatsResponseDTO(BaseDTO):
+    movie_uuid: UUID
+    # None if the movie exists but has no stats row yet.
+    stats: MovieStatsDTO | None = None
+
+
+class MovieStatsDriftDTO(BaseDTO):
+    movie_uuid: UUID
+    stored: MovieStatsDTO
+    actual: MovieStatsDTO
+
+
+class FindMovieStatsDriftResponseDTO(BaseDTO):
+    drifts: list[MovieStatsDriftDTO]
+
+
+class RepairMovieStatsCommandDTO(BaseDTO):
+    movie_uuids: list[UUID]
@@ -7,6 +7,8 @@ from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.types.rating_sort_type import RatingSortColumnType
+from src.models.types.total_mode_type import TotalModeType
+from src.utils.utils import Utils
 
 
 class RateMovieRestInputDTOV1(BaseModel):
@@ -34,7 +36,7 @@ class RateMovieOutputDTOV1(BaseDTO):
 
 
 class UpdateRatingRestInputDTOV1(BaseDTO):
-    score: int = Field(..., ge=1, le=10)
+    score: int = Field(..., ge=1, le=5)
 
 
 class UpdateRatingInputDTOV1(BaseDTO):
@@ -43,6 +45,15 @@ class UpdateRatingInputDTOV1(BaseDTO):
     score: int
 
 
+class UpdateRatingOutputDTOV1(BaseDTO):
+    rate_uuid: UUID
+    user_uuid: UUID
+    movie_uuid: UUID
+    score: int
+    created_at: datetime
+    updated_at: datetime
+
+
 class RatedMovieItemDTOV1(BaseDTO):
     rate_uuid: UUID
     movie_uuid: UUID
@@ -57,6 +68,7 @@ class GetMyRatingsInputDTOV1(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[RatingSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
     @classmethod
     def create(
@@ -66,23 +78,27 @@ class GetMyRatingsInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: RatingSortColumnType = RatingSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
     ) -> "GetMyRatingsInputDTOV1":
         return cls(
             user_uuid=user_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[RatingSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[RatingSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
         )
 
 
 class GetMyRatingsOutputDTOV1(BaseDTO):
     ratings: list[RatedMovieItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class GetUserRatingsInputDTOV1(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[RatingSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
     @classmethod
     def create(
@@ -92,17 +108,20 @@ class GetUserRatingsInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: RatingSortColumnType = RatingSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
     ) -> "GetUserRatingsInputDTOV1":
         return cls(
             user_uuid=user_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[RatingSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[RatingSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
         )
 
 
 class GetUserRatingsOutputDTOV1(BaseDTO):
     ratings: list[RatedMovieItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class RaterUserItemDTOV1(BaseDTO):
@@ -119,6 +138,7 @@ class GetMovieRatersInputDTOV1(BaseDTO):
     movie_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[RatingSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
     @classmethod
     def create(
@@ -128,14 +148,35 @@ class GetMovieRatersInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: RatingSortColumnType = RatingSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
     ) -> "GetMovieRatersInputDTOV1":
         return cls(
             movie_uuid=movie_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[RatingSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[RatingSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
         )
 
 
 class GetMovieRatersOutputDTOV1(BaseDTO):
     raters: list[RaterUserItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
+
+
+class GetMovieRatingHistogramInputDTOV1(BaseDTO):
+    movie_uuid: UUID
+
+
+class RatingHistogramBucketDTOV1(BaseDTO):
+    score: int
+    count: int
+
+
+class GetMovieRatingHistogramOutputDTOV1(BaseDTO):
+    movie_uuid: UUID
+    rating_count: int
+    # None until the movie has been rated.
+    average_rating: float | None = None
+    # One bucket per possible score, lowest first; empty buckets are included.
+    buckets: list[RatingHistogramBucketDTOV1]
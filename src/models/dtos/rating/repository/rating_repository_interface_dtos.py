@@ -7,6 +7,7 @@ from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict
 
 from src.models.types.rating_sort_type import RatingSortColumnType
+from src.models.types.total_mode_type import TotalModeType
 
 
 class CreateRatingCommandDTO(BaseModel):
@@ -28,11 +29,6 @@ class CreateRatingResponseDTO(BaseModel):
     updated_at: datetime
 
 
-class CheckRatingExistsQueryDTO(BaseDTO):
-    user_uuid: UUID
-    movie_uuid: UUID
-
-
 class GetRatingQueryDTO(BaseDTO):
     rate_uuid: UUID
     user_uuid: UUID
@@ -53,6 +49,18 @@ class UpdateRatingCommandDTO(BaseDTO):
     score: int
 
 
+class UpdateRatingResponseDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    rate_uuid: UUID
+    user_uuid: UUID
+    movie_uuid: UUID
+    score: int
+    previous_score: int
+    created_at: datetime
+    updated_at: datetime
+
+
 class RatedMovieItemDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -69,22 +77,26 @@ class GetMyRatingsQueryDTO(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[RatingSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
 
 class GetMyRatingsResponseDTO(BaseDTO):
     ratings: list[RatedMovieItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class GetUserRatingsQueryDTO(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[RatingSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
 
 class GetUserRatingsResponseDTO(BaseDTO):
     ratings: list[RatedMovieItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class RaterUserItemDTO(BaseModel):
@@ -103,8 +115,10 @@ class GetMovieRatersQueryDTO(BaseDTO):
     movie_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[RatingSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
 
 class GetMovieRatersResponseDTO(BaseDTO):
     raters: list[RaterUserItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
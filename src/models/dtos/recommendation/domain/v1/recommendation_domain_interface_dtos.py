@@ -0,0 +1,61 @@
+from datetime import datetime
+from uuid import UUID
+
+from archipy.models.dtos.base_dtos import BaseDTO
+
+from src.models.types.recommendation_strategy_type import RecommendationStrategyType
+from src.models.types.similarity_strategy_type import SimilarityStrategyType
+from src.models.types.watch_status_type import WatchStatusType
+
+
+class GetSimilarMoviesInputDTOV1(BaseDTO):
+    movie_uuid: UUID
+    limit: int = 20
+    strategy: SimilarityStrategyType = SimilarityStrategyType.AUDIENCE
+
+
+class GetRecommendedMoviesInputDTOV1(BaseDTO):
+    user_uuid: UUID
+    limit: int = 20
+    strategy: RecommendationStrategyType = RecommendationStrategyType.NEIGHBORS
+
+
+class RecordInteractionInputDTOV1(BaseDTO):
+    user_uuid: UUID
+    movie_uuid: UUID
+    status: WatchStatusType
+    score: int | None = None
+
+
+class IndexMoviesInputDTOV1(BaseDTO):
+    movie_uuids: list[UUID]
+
+
+class SimilarMovieItemDTOV1(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+    # Cosine similarity of the two movies' audiences, or of their title and description, by strategy; 0 to 1.
+    similarity: float
+
+
+class RecommendedMovieItemDTOV1(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+    # Higher is better: summed similarity to the user's movies, or the predicted preference, by strategy.
+    score: float
+
+
+class RecommendationSnapshotInfoDTOV1(BaseDTO):
+    generated_at: datetime
+    age_seconds: float
+    refresh_interval_seconds: float
+
+
+class GetSimilarMoviesOutputDTOV1(RecommendationSnapshotInfoDTOV1):
+    movies: list[SimilarMovieItemDTOV1]
+
+
+class GetRecommendedMoviesOutputDTOV1(RecommendationSnapshotInfoDTOV1):
+    movies: list[RecommendedMovieItemDTOV1]
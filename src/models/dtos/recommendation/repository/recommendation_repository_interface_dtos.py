@@ -0,0 +1,47 @@
+from datetime import datetime
+from uuid import UUID
+
+from archipy.models.dtos.base_dtos import BaseDTO
+
+from src.models.types.watch_status_type import WatchStatusType
+
+
+class RecommendationMovieDTO(BaseDTO):
+    movie_uuid: UUID
+    title: str
+    genre_uuid: UUID
+
+
+class GetRecommendationMoviesResponseDTO(BaseDTO):
+    movies: list[RecommendationMovieDTO]
+
+
+class GetInteractionsResponseDTO(BaseDTO):
+    # One entry per watch entry, column by column; score is None until the user rates the movie.
+    user_uuids: list[UUID]
+    movie_uuids: list[UUID]
+    statuses: list[WatchStatusType]
+    scores: list[int | None]
+
+
+class MovieTextDTO(RecommendationMovieDTO):
+    description: str | None = None
+    updated_at: datetime
+
+
+class GetMovieTextsQueryDTO(BaseDTO):
+    # Both filters are optional; without either, every movie is returned.
+    movie_uuids: list[UUID] | None = None
+    updated_since: datetime | None = None
+
+
+class GetMovieTextsResponseDTO(BaseDTO):
+    movies: list[MovieTextDTO]
+
+
+class GetMovieUUIDsResponseDTO(BaseDTO):
+    movie_uuids: list[UUID]
+
+
+class CountMoviesResponseDTO(BaseDTO):
+    count: int
@@ -7,7 +7,9 @@ from archipy.models.dtos.range_dtos import DateRangeDTO
 from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import StrictStr
 
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.user_sort_type import UserSortColumnType
+from src.utils.utils import Utils
 
 
 class CreateUserInputDTOV1(BaseDTO):
@@ -49,6 +51,7 @@ class SearchUserInputDTOV1(BaseDTO):
     birth_date_range: DateRangeDTO | None = None
     pagination: PaginationDTO
     sort_info: SortDTO[UserSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
     @classmethod
     def create(
@@ -61,9 +64,10 @@ class SearchUserInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: UserSortColumnType = UserSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
     ):
         pagination = PaginationDTO(page=page, page_size=page_size)
-        sort_info = SortDTO[UserSortColumnType](column=sort_column, order=sort_order)
+        sort_info = SortDTO[UserSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order))
         birth_date_range = None
         if birth_date_from or birth_date_to:
             birth_date_range = DateRangeDTO(from_=birth_date_from, to=birth_date_to)
@@ -74,12 +78,14 @@ class SearchUserInputDTOV1(BaseDTO):
             birth_date_range=birth_date_range,
             pagination=pagination,
             sort_info=sort_info,
+            include_total=include_total,
         )
 
 
 class SearchUserOutputDTOV1(BaseDTO):
     users: list[UserItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class UpdateUserRestInputDTOV1(BaseDTO):
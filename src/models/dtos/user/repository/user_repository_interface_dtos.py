@@ -7,6 +7,7 @@ from archipy.models.dtos.range_dtos import DateRangeDTO
 from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict, EmailStr, StrictStr
 
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.user_sort_type import UserSortColumnType
 
 
@@ -62,11 +63,13 @@ class SearchUserQueryDTO(BaseDTO):
     birth_date_range: DateRangeDTO | None = None
     pagination: PaginationDTO
     sort_info: SortDTO[UserSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
 
 
 class SearchUserResponseDTO(BaseDTO):
     users: list[UserItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class UpdateUserCommandDTO(BaseDTO):
@@ -115,3 +118,15 @@ class GetUserFullByUUIDResponseDTO(BaseModel):
     is_active: bool
     is_super_user: bool
     created_at: datetime
+
+
+class GetUserPrincipalQueryDTO(BaseDTO):
+    user_uuid: UUID
+
+
+class GetUserPrincipalResponseDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    user_uuid: UUID
+    is_active: bool
+    is_super_user: bool
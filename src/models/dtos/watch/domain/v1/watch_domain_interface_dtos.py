@@ -7,8 +7,10 @@ from archipy.models.dtos.pagination_dto import PaginationDTO
 from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict
 
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.watch_sort_type import WatchSortColumnType
 from src.models.types.watch_status_type import WatchStatusType
+from src.utils.utils import Utils
 
 
 class WatchMovieRestInputDTOV1(BaseModel):
@@ -59,6 +61,7 @@ class GetMyWatchHistoryInputDTOV1(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[WatchSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
     status_filter: WatchStatusType | None = None
 
     @classmethod
@@ -69,25 +72,29 @@ class GetMyWatchHistoryInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: WatchSortColumnType = WatchSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
         status_filter: WatchStatusType | None = None,
     ) -> "GetMyWatchHistoryInputDTOV1":
         return cls(
             user_uuid=user_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[WatchSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[WatchSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
             status_filter=status_filter,
         )
 
 
 class GetMyWatchHistoryOutputDTOV1(BaseDTO):
     watches: list[WatchedMovieItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class GetUserWatchHistoryInputDTOV1(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[WatchSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
     status_filter: WatchStatusType | None = None
 
     @classmethod
@@ -98,25 +105,29 @@ class GetUserWatchHistoryInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: WatchSortColumnType = WatchSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
         status_filter: WatchStatusType | None = None,
     ) -> "GetUserWatchHistoryInputDTOV1":
         return cls(
             user_uuid=user_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[WatchSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[WatchSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
             status_filter=status_filter,
         )
 
 
 class GetUserWatchHistoryOutputDTOV1(BaseDTO):
     watches: list[WatchedMovieItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class GetMovieWatchersInputDTOV1(BaseDTO):
     movie_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[WatchSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
     status_filter: WatchStatusType | None = None
 
     @classmethod
@@ -127,19 +138,22 @@ class GetMovieWatchersInputDTOV1(BaseDTO):
         page_size: int = 10,
         sort_column: WatchSortColumnType = WatchSortColumnType.CREATED_AT,
         sort_order: str = "desc",
+        include_total: TotalModeType = TotalModeType.EXACT,
         status_filter: WatchStatusType | None = None,
     ) -> "GetMovieWatchersInputDTOV1":
         return cls(
             movie_uuid=movie_uuid,
             pagination=PaginationDTO(page=page, page_size=page_size),
-            sort_info=SortDTO[WatchSortColumnType](column=sort_column, order=sort_order),
+            sort_info=SortDTO[WatchSortColumnType](column=sort_column, order=Utils.get_sort_order(sort_order)),
+            include_total=include_total,
             status_filter=status_filter,
         )
 
 
 class GetMovieWatchersOutputDTOV1(BaseDTO):
     watchers: list[WatcherUserItemDTOV1]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class UpdateWatchStatusRestInputDTOV1(BaseDTO):
@@ -152,6 +166,15 @@ class UpdateWatchStatusInputDTOV1(BaseDTO):
     status: WatchStatusType
 
 
+class UpdateWatchStatusOutputDTOV1(BaseDTO):
+    watch_uuid: UUID
+    user_uuid: UUID
+    movie_uuid: UUID
+    status: WatchStatusType
+    created_at: datetime
+    updated_at: datetime
+
+
 class DeleteWatchInputDTOV1(BaseDTO):
     """Domain input for deleting a watch entry owned by the authenticated user."""
 
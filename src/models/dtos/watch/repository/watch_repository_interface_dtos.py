@@ -6,6 +6,7 @@ from archipy.models.dtos.pagination_dto import PaginationDTO
 from archipy.models.dtos.sort_dto import SortDTO
 from pydantic import BaseModel, ConfigDict
 
+from src.models.types.total_mode_type import TotalModeType
 from src.models.types.watch_sort_type import WatchSortColumnType
 from src.models.types.watch_status_type import WatchStatusType
 
@@ -29,18 +30,6 @@ class CreateWatchResponseDTO(BaseModel):
     updated_at: datetime
 
 
-class CheckWatchExistsQueryDTO(BaseDTO):
-    user_uuid: UUID
-    movie_uuid: UUID
-
-
-class CheckWatchedQueryDTO(BaseDTO):
-    """Query to verify a user has a WATCHED-status record for the given movie."""
-
-    user_uuid: UUID
-    movie_uuid: UUID
-
-
 class WatchedMovieItemDTO(BaseModel):
     """One row returned when listing a user's watched movies."""
 
@@ -59,12 +48,14 @@ class GetUserWatchHistoryQueryDTO(BaseDTO):
     user_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[WatchSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
     status_filter: WatchStatusType | None = None
 
 
 class GetUserWatchHistoryResponseDTO(BaseDTO):
     watches: list[WatchedMovieItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class WatcherUserItemDTO(BaseModel):
@@ -85,12 +76,14 @@ class GetMovieWatchersQueryDTO(BaseDTO):
     movie_uuid: UUID
     pagination: PaginationDTO
     sort_info: SortDTO[WatchSortColumnType]
+    include_total: TotalModeType = TotalModeType.EXACT
     status_filter: WatchStatusType | None = None
 
 
 class GetMovieWatchersResponseDTO(BaseDTO):
     watchers: list[WatcherUserItemDTO]
-    total: int
+    total: int | None
+    total_is_exact: bool = True
 
 
 class UpdateWatchStatusCommandDTO(BaseDTO):
@@ -99,8 +92,26 @@ class UpdateWatchStatusCommandDTO(BaseDTO):
     status: WatchStatusType
 
 
+class UpdateWatchStatusResponseDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    watch_uuid: UUID
+    user_uuid: UUID
+    movie_uuid: UUID
+    status: WatchStatusType
+    previous_status: WatchStatusType
+    created_at: datetime
+    updated_at: datetime
+
+
 class DeleteWatchCommandDTO(BaseDTO):
     """Command to delete a watch record — only permitted when status is WANT_TO_WATCH."""
 
     user_uuid: UUID
     movie_uuid: UUID
+
+
+class DeleteWatchResponseDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    watch_uuid: UUID
@@ -1,6 +1,7 @@
 # src/models/entities/__init__.py
 from .genre_entity import GenreEntity
 from .movie_entity import MovieEntity
+from .movie_stats_entity import MovieStatsEntity
 from .user_entity import UserEntity
 from .user_rate_movie_entity import UserRateMovieEntity
 from .user_watch_movie_entity import UserWatchMovieEntity
@@ -8,6 +9,7 @@ from .user_watch_movie_entity import UserWatchMovieEntity
 __all__ = [
     "UserEntity",
     "MovieEntity",
+    "MovieStatsEntity",
     "GenreEntity",
     "UserWatchMovieEntity",
     "UserRateMovieEntity",
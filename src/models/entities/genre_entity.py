@@ -3,7 +3,7 @@ import uuid
 from archipy.models.entities.sqlalchemy.base_entities import (
     UpdatableDeletableEntity,
 )
-from sqlalchemy import TEXT, UUID, VARCHAR, Column
+from sqlalchemy import TEXT, UUID, VARCHAR, Column, Index
 from sqlalchemy.orm import Mapped, Synonym, mapped_column, relationship
 
 from src.models.entities.mixins.timestamp import TimestampMixin
@@ -19,3 +19,8 @@ class GenreEntity(UpdatableDeletableEntity, TimestampMixin):
     description: Mapped[str] = mapped_column(type_=TEXT, nullable=True)
 
     movies = relationship("MovieEntity", back_populates="genre")
+
+    # Substring search on name (requires pg_trgm).
+    __table_args__ = (
+        Index("ix_genres_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
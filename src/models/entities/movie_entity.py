@@ -3,7 +3,7 @@ import uuid
 from archipy.models.entities.sqlalchemy.base_entities import (
     UpdatableDeletableEntity,
 )
-from sqlalchemy import TEXT, UUID, VARCHAR, Column, ForeignKey
+from sqlalchemy import DDL, TEXT, UUID, VARCHAR, Column, ForeignKey, Index, event
 from sqlalchemy.orm import Mapped, Synonym, mapped_column, relationship
 
 from src.models.entities.mixins.timestamp import TimestampMixin
@@ -27,3 +27,55 @@ class MovieEntity(UpdatableDeletableEntity, TimestampMixin):
     # Many-to-Many relationships via association tables
     watchers = relationship("UserWatchMovieEntity", back_populates="movie")
     ratings = relationship("UserRateMovieEntity", back_populates="movie")
+    # Denormalized counters; loaded explicitly (joinedload) by the reads that expose them.
+    stats = relationship("MovieStatsEntity", back_populates="movie", uselist=False, passive_deletes=True)
+
+    __table_args__ = (
+        # Keyset pagination walks (sort column, movie_uuid) in either direction.
+        Index("ix_movies_title_movie_uuid", "title", "movie_uuid"),
+        Index("ix_movies_created_at_movie_uuid", "created_at", "movie_uuid"),
+        # The content index catches up on movies changed since its last sync.
+        Index("ix_movies_updated_at", "updated_at"),
+        # Substring search on title (requires pg_trgm).
+        Index("ix_movies_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+
+
+# Full-text search lives outside the mapped columns so ORM selects never load it; the database keeps it
+# current on every insert and update. PostgreSQL uses a stored tsvector, SQLite (tests) an FTS5 table.
+MOVIE_SEARCH_CONFIG = "english"
+MOVIE_SEARCH_FTS_TABLE = "movies_fts"
+
+_POSTGRES_SEARCH_DDL = (
+    "ALTER TABLE movies ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{MOVIE_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{MOVIE_SEARCH_CONFIG}', coalesce(description, '')), 'B')) STORED",
+    "CREATE INDEX ix_movies_search_vector ON movies USING gin (search_vector)",
+)
+# Only the constants above are interpolated into these statements.
+_SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE {MOVIE_SEARCH_FTS_TABLE} USING fts5("
+    "title, description, content='movies', content_rowid='rowid', tokenize='porter unicode61')",
+    f"CREATE TRIGGER movies_fts_ai AFTER INSERT ON movies BEGIN "  # noqa: S608
+    f"INSERT INTO {MOVIE_SEARCH_FTS_TABLE}(rowid, title, description) VALUES (new.rowid, new.title, new.description); "
+    "END",
+    f"CREATE TRIGGER movies_fts_ad AFTER DELETE ON movies BEGIN "  # noqa: S608
+    f"INSERT INTO {MOVIE_SEARCH_FTS_TABLE}({MOVIE_SEARCH_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description); "
+    "END",
+    f"CREATE TRIGGER movies_fts_au AFTER UPDATE ON movies BEGIN "  # noqa: S608
+    f"INSERT INTO {MOVIE_SEARCH_FTS_TABLE}({MOVIE_SEARCH_FTS_TABLE}, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description); "
+    f"INSERT INTO {MOVIE_SEARCH_FTS_TABLE}(rowid, title, description) VALUES (new.rowid, new.title, new.description); "
+    "END",
+)
+
+for _statement in _POSTGRES_SEARCH_DDL:
+    event.listen(MovieEntity.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in _SQLITE_SEARCH_DDL:
+    event.listen(MovieEntity.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    MovieEntity.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {MOVIE_SEARCH_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,30 @@
+from archipy.models.entities.sqlalchemy.base_entities import UpdatableEntity
+from sqlalchemy import UUID, BigInteger, Column, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, Synonym, mapped_column, relationship
+
+
+class MovieStatsEntity(UpdatableEntity):
+    """Per-movie rating and watch counters.
+
+    Maintained by the rating and watch write paths in the same transaction as the row they change, so
+    movie reads never aggregate ``user_rate_movie``/``user_watch_movie``. A movie without activity may
+    have no row at all, which reads as all zeros. ``score_<n>_count`` is the rating histogram, one bucket per
+    score allowed by ``check_rating_range``; the buckets always add up to ``rating_count``.
+    """
+
+    __tablename__ = "movie_stats"
+
+    movie_uuid = Column(UUID(as_uuid=True), ForeignKey("movies.movie_uuid", ondelete="CASCADE"), primary_key=True)
+    pk_uuid = Synonym("movie_uuid")
+
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    score_1_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    score_2_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    score_3_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    score_4_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    score_5_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    watched_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    want_to_watch_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    movie = relationship("MovieEntity", back_populates="stats")
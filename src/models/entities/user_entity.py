@@ -4,7 +4,7 @@ from datetime import datetime
 from archipy.models.entities.sqlalchemy.base_entities import (
     UpdatableDeletableEntity,
 )
-from sqlalchemy import UUID, VARCHAR, Boolean, Column, Date, DateTime
+from sqlalchemy import UUID, VARCHAR, Boolean, Column, Date, DateTime, Index
 from sqlalchemy.orm import Mapped, Synonym, mapped_column, relationship
 
 from src.models.entities.mixins.timestamp import TimestampMixin
@@ -28,3 +28,19 @@ class UserEntity(UpdatableDeletableEntity, TimestampMixin):
 
     watched_movies = relationship("UserWatchMovieEntity", back_populates="user")
     movie_ratings = relationship("UserRateMovieEntity", back_populates="user")
+
+    # Substring search on first/last name (requires pg_trgm).
+    __table_args__ = (
+        Index(
+            "ix_users_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+    )
@@ -3,11 +3,14 @@ import uuid
 from archipy.models.entities.sqlalchemy.base_entities import (
     UpdatableDeletableEntity,
 )
-from sqlalchemy import UUID, CheckConstraint, Column, ForeignKey, Integer
+from sqlalchemy import UUID, CheckConstraint, Column, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, Synonym, mapped_column, relationship
 
 from src.models.entities.mixins.timestamp import TimestampMixin
 
+# Scores allowed by check_rating_range, and so the buckets of the per-movie rating histogram.
+RATING_SCORES = range(1, 6)
+
 
 class UserRateMovieEntity(UpdatableDeletableEntity, TimestampMixin):
     __tablename__ = "user_rate_movie"
@@ -15,8 +18,10 @@ class UserRateMovieEntity(UpdatableDeletableEntity, TimestampMixin):
     rate_uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     pk_uuid = Synonym("rate_uuid")
 
-    user_uuid = Column(UUID(as_uuid=True), ForeignKey("users.user_uuid"), nullable=False, index=True)
-    movie_uuid = Column(UUID(as_uuid=True), ForeignKey("movies.movie_uuid"), nullable=False, index=True)
+    # Leading column of the unique (user_uuid, movie_uuid) index, which also serves per-user lookups.
+    user_uuid = Column(UUID(as_uuid=True), ForeignKey("users.user_uuid"), nullable=False)
+    # Leading column of the (movie_uuid, score) index below.
+    movie_uuid = Column(UUID(as_uuid=True), ForeignKey("movies.movie_uuid"), nullable=False)
 
     # e.g. rating out of 10 or 5. Adding a CheckConstraint ensures valid DB state
     score: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -25,4 +30,13 @@ class UserRateMovieEntity(UpdatableDeletableEntity, TimestampMixin):
     user = relationship("UserEntity", back_populates="movie_ratings")
     movie = relationship("MovieEntity", back_populates="ratings")
 
-    __table_args__ = (CheckConstraint("score >= 1 AND score <= 5", name="check_rating_range"),)
+    __table_args__ = (
+        CheckConstraint("score >= 1 AND score <= 5", name="check_rating_range"),
+        # One rating per user and movie; also the conflict target of create_rating.
+        Index("ux_user_rate_movie_user_uuid_movie_uuid", "user_uuid", "movie_uuid", unique=True),
+        # Movie raters by score and a user's ratings by date, read in index order.
+        Index("ix_user_rate_movie_movie_uuid_score", "movie_uuid", "score"),
+        Index("ix_user_rate_movie_user_uuid_created_at", "user_uuid", "created_at"),
+        # Bounds the trending leaderboard's scan to recent ratings.
+        Index("ix_user_rate_movie_created_at", "created_at"),
+    )
@@ -2,7 +2,7 @@
 import uuid
 
 from archipy.models.entities.sqlalchemy.base_entities import UpdatableDeletableEntity
-from sqlalchemy import UUID, VARCHAR, Column, ForeignKey
+from sqlalchemy import UUID, VARCHAR, Column, ForeignKey, Index
 from sqlalchemy.orm import Mapped, Synonym, mapped_column, relationship
 
 from src.models.entities.mixins.timestamp import TimestampMixin
@@ -15,8 +15,10 @@ class UserWatchMovieEntity(UpdatableDeletableEntity, TimestampMixin):
     watch_uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     pk_uuid = Synonym("watch_uuid")
 
-    user_uuid = Column(UUID(as_uuid=True), ForeignKey("users.user_uuid"), nullable=False, index=True)
-    movie_uuid = Column(UUID(as_uuid=True), ForeignKey("movies.movie_uuid"), nullable=False, index=True)
+    # Leading column of the unique (user_uuid, movie_uuid) index, which also serves per-user lookups.
+    user_uuid = Column(UUID(as_uuid=True), ForeignKey("users.user_uuid"), nullable=False)
+    # Leading column of the (movie_uuid, ...) listing indexes below.
+    movie_uuid = Column(UUID(as_uuid=True), ForeignKey("movies.movie_uuid"), nullable=False)
 
     # Watch status stored as plain VARCHAR to avoid PostgreSQL ENUM migrations
     status: Mapped[str] = mapped_column(
@@ -30,3 +32,16 @@ class UserWatchMovieEntity(UpdatableDeletableEntity, TimestampMixin):
     # Back-populating relationships
     user = relationship("UserEntity", back_populates="watched_movies")
     movie = relationship("MovieEntity", back_populates="watchers")
+
+    __table_args__ = (
+        # One watch entry per user and movie; also the conflict target of create_watch.
+        Index("ux_user_watch_movie_user_uuid_movie_uuid", "user_uuid", "movie_uuid", unique=True),
+        # Watch history and movie watchers are listed newest first, with or without a status filter;
+        # these let both be read in index order instead of sorting every matching row.
+        Index("ix_user_watch_movie_user_uuid_created_at", "user_uuid", "created_at"),
+        Index("ix_user_watch_movie_user_uuid_status_created_at", "user_uuid", "status", "created_at"),
+        Index("ix_user_watch_movie_movie_uuid_created_at", "movie_uuid", "created_at"),
+        Index("ix_user_watch_movie_movie_uuid_status_created_at", "movie_uuid", "status", "created_at"),
+        # Bounds the trending leaderboard's scan to recent watch entries.
+        Index("ix_user_watch_movie_created_at", "created_at"),
+    )
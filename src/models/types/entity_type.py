@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class EntityType(str, Enum):
+    GENRE = "genre"
+    MOVIE = "movie"
+    USER = "user"
+    WATCH = "watch"
+    RATING = "rating"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class MovieImportFormatType(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class RecommendationStrategyType(str, Enum):
+    # Similarity of each unseen movie to the user's movies, from the item-item table.
+    NEIGHBORS = "neighbors"
+    # Predicted preference from the factorization model, including activity since the last training.
+    FACTORS = "factors"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class SimilarityStrategyType(str, Enum):
+    # Movies watched and rated by the same users.
+    AUDIENCE = "audience"
+    # Movies with similar titles and descriptions, by TF-IDF; covers movies nobody has watched yet.
+    CONTENT = "content"
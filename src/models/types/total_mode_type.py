@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TotalModeType(str, Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
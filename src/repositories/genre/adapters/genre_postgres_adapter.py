@@ -1,8 +1,13 @@
-from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
+import uuid
+
+from archipy.adapters.base.sqlalchemy.adapters import (
+    SQLAlchemyFilterMixin,
+    SQLAlchemyPaginationMixin,
+    SQLAlchemySortMixin,
+)
 from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
 from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
 from archipy.models.errors import AlreadyExistsError, NotFoundError
-from archipy.models.types.base_types import FilterOperationType
 from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.expression import Select
@@ -13,6 +18,9 @@ from src.models.dtos.genre.repository.genre_repository_interface_dtos import (
     CreateGenreCommandDTO,
     CreateGenreResponseDTO,
     DeleteGenreCommandDTO,
+    GetAllGenresResponseDTO,
+    GetExistingGenreUUIDsQueryDTO,
+    GetExistingGenreUUIDsResponseDTO,
     GetGenreQueryDTO,
     GetGenreResponseDTO,
     SearchGenreQueryDTO,
@@ -20,9 +28,11 @@ from src.models.dtos.genre.repository.genre_repository_interface_dtos import (
     UpdateGenreCommandDTO,
 )
 from src.models.entities.genre_entity import GenreEntity
+from src.utils.pagination_utils import PaginationUtils
+from src.utils.sql_utils import SQLUtils
 
 
-class GenrePostgresAdapter(SQLAlchemyFilterMixin):
+class GenrePostgresAdapter(SQLAlchemyFilterMixin, SQLAlchemyPaginationMixin, SQLAlchemySortMixin):
     def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
         self._adapter: AsyncSQLAlchemyPort = adapter
 
@@ -38,18 +48,43 @@ class GenrePostgresAdapter(SQLAlchemyFilterMixin):
             raise exc
 
     async def bulk_create_genre(self, input_dto: BulkCreateGenreCommandDTO) -> BulkCreateGenreResponseDTO:
-        results: list[CreateGenreResponseDTO] = []
-        for genre_dto in input_dto.genres:
-            genre: GenreEntity = GenreEntity(**genre_dto.model_dump())
-            try:
-                result = await self._adapter.create(entity=genre)
-                results.append(CreateGenreResponseDTO.model_validate(obj=result))
-            except IntegrityError as exc:
-                error_message = str(exc.orig).lower() if exc.orig else ""
-                if "unique" in error_message or "duplicate" in error_message:
-                    raise AlreadyExistsError(resource_type=GenreEntity.__name__) from exc
-                raise exc
-        return BulkCreateGenreResponseDTO(genres=results)
+        if not input_dto.genres:
+            return BulkCreateGenreResponseDTO(genres=[])
+
+        # UUIDs are generated up front so rows skipped by ON CONFLICT can be traced back to the payload.
+        rows = [{"genre_uuid": uuid.uuid4(), "is_deleted": False, **genre.model_dump()} for genre in input_dto.genres]
+        insert_query = (
+            SQLUtils.insert(self._adapter, GenreEntity)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(
+                GenreEntity.genre_uuid,
+                GenreEntity.name,
+                GenreEntity.description,
+                GenreEntity.created_at,
+                GenreEntity.updated_at,
+            )
+        )
+        result = await self._adapter.execute(statement=insert_query)
+        inserted = {row.genre_uuid: row for row in result}
+
+        conflicting_indexes = [index for index, row in enumerate(rows) if row["genre_uuid"] not in inserted]
+        if conflicting_indexes and not input_dto.skip_conflicts:
+            raise AlreadyExistsError(
+                resource_type=GenreEntity.__name__,
+                additional_data={
+                    "conflicting_indexes": conflicting_indexes,
+                    "conflicting_names": [rows[index]["name"] for index in conflicting_indexes],
+                },
+            )
+        return BulkCreateGenreResponseDTO(
+            genres=[
+                CreateGenreResponseDTO.model_validate(obj=inserted[row["genre_uuid"]])
+                for row in rows
+                if row["genre_uuid"] in inserted
+            ],
+            conflicting_indexes=conflicting_indexes,
+        )
 
     async def get_genre(self, input_dto: GetGenreQueryDTO) -> GetGenreResponseDTO:
         select_query = select(GenreEntity).where(GenreEntity.genre_uuid == input_dto.genre_uuid)
@@ -59,25 +94,40 @@ class GenrePostgresAdapter(SQLAlchemyFilterMixin):
             raise NotFoundError(resource_type=GenreEntity.__name__)
         return GetGenreResponseDTO.model_validate(obj=genre)
 
+    async def get_all_genres(self) -> GetAllGenresResponseDTO:
+        result = await self._adapter.execute(statement=select(GenreEntity))
+        return GetAllGenresResponseDTO(
+            genres=[GetGenreResponseDTO.model_validate(obj=genre) for genre in result.scalars()],
+        )
+
+    async def get_existing_genre_uuids(
+        self,
+        input_dto: GetExistingGenreUUIDsQueryDTO,
+    ) -> GetExistingGenreUUIDsResponseDTO:
+        if not input_dto.genre_uuids:
+            return GetExistingGenreUUIDsResponseDTO(genre_uuids=set())
+        select_query = select(GenreEntity.genre_uuid).where(GenreEntity.genre_uuid.in_(input_dto.genre_uuids))
+        result = await self._adapter.execute(statement=select_query)
+        return GetExistingGenreUUIDsResponseDTO(genre_uuids=set(result.scalars()))
+
     async def search_genres(self, input_dto: SearchGenreQueryDTO) -> SearchGenreResponseDTO:
         query: Select = select(GenreEntity)
 
         if input_dto.name:
-            query = self._apply_filter(
-                query=query,
-                field=GenreEntity.name,
-                value=f"%{input_dto.name}%",
-                operation=FilterOperationType.ILIKE,
-            )
+            query = query.where(SQLUtils.contains(GenreEntity.name, input_dto.name))
 
-        genres, total = await self._adapter.execute_search_query(
+        genres, total, total_is_exact = await PaginationUtils.execute_search_query(
+            self._adapter,
             query=query,
-            entity=GenreEntity,
-            sort_info=input_dto.sort_info,
+            page_query=self._apply_pagination(
+                self._apply_sorting(GenreEntity, query, input_dto.sort_info),
+                input_dto.pagination,
+            ),
             pagination=input_dto.pagination,
+            include_total=input_dto.include_total,
         )
 
-        return SearchGenreResponseDTO(genres=genres, total=total)
+        return SearchGenreResponseDTO(genres=genres, total=total, total_is_exact=total_is_exact)
 
     async def update_genre(self, input_dto: UpdateGenreCommandDTO) -> None:
         update_data = input_dto.model_dump(exclude={"genre_uuid"}, exclude_none=True)
@@ -4,6 +4,9 @@ from src.models.dtos.genre.repository.genre_repository_interface_dtos import (
     CreateGenreCommandDTO,
     CreateGenreResponseDTO,
     DeleteGenreCommandDTO,
+    GetAllGenresResponseDTO,
+    GetExistingGenreUUIDsQueryDTO,
+    GetExistingGenreUUIDsResponseDTO,
     GetGenreQueryDTO,
     GetGenreResponseDTO,
     SearchGenreQueryDTO,
@@ -26,6 +29,15 @@ class GenreRepository:
     async def get_genre(self, input_dto: GetGenreQueryDTO) -> GetGenreResponseDTO:
         return await self._postgres_adapter.get_genre(input_dto=input_dto)
 
+    async def get_all_genres(self) -> GetAllGenresResponseDTO:
+        return await self._postgres_adapter.get_all_genres()
+
+    async def get_existing_genre_uuids(
+        self,
+        input_dto: GetExistingGenreUUIDsQueryDTO,
+    ) -> GetExistingGenreUUIDsResponseDTO:
+        return await self._postgres_adapter.get_existing_genre_uuids(input_dto=input_dto)
+
     async def search_genres(self, input_dto: SearchGenreQueryDTO) -> SearchGenreResponseDTO:
         return await self._postgres_adapter.search_genres(input_dto=input_dto)
 
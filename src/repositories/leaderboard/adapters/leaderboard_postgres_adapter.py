@@ -0,0 +1,129 @@
+# src/repositories/leaderboard/adapters/leaderboard_postgres_adapter.py
+import math
+from datetime import UTC
+
+from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
+from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
+from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
+from sqlalchemy import Float, func, literal, select, union_all
+
+from src.models.dtos.leaderboard.repository.leaderboard_repository_interface_dtos import (
+    GetTopRatedQueryDTO,
+    GetTopRatedResponseDTO,
+    GetTrendingQueryDTO,
+    GetTrendingResponseDTO,
+    TopRatedMovieDTO,
+    TrendingMovieDTO,
+)
+from src.models.entities.movie_entity import MovieEntity
+from src.models.entities.movie_stats_entity import MovieStatsEntity
+from src.models.entities.user_rate_movie_entity import UserRateMovieEntity
+from src.models.entities.user_watch_movie_entity import UserWatchMovieEntity
+from src.utils.sql_utils import SQLUtils
+
+
+class LeaderboardPostgresAdapter(SQLAlchemyFilterMixin):
+    def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
+        self._adapter: AsyncSQLAlchemyPort = adapter
+
+    async def get_top_rated(self, input_dto: GetTopRatedQueryDTO) -> GetTopRatedResponseDTO:
+        """The best movies of every genre by Bayesian average, best first.
+
+        Reads only ``movie_stats``: ``(C * m + sum) / (C + count)`` with ``m`` the catalog-wide mean and
+        ``C`` the prior weight, so a movie with a handful of perfect scores does not outrank a well-rated
+        classic.
+        """
+        totals = await self._adapter.execute(
+            statement=select(func.sum(MovieStatsEntity.rating_sum), func.sum(MovieStatsEntity.rating_count)),
+        )
+        rating_sum, rating_count = totals.one()
+        if not rating_count:
+            return GetTopRatedResponseDTO(movies=[])
+        # SUM over bigint comes back as a Decimal on PostgreSQL.
+        mean_rating = float(rating_sum) / float(rating_count)
+
+        weighted_rating = (literal(input_dto.prior_votes * mean_rating, Float) + MovieStatsEntity.rating_sum) / (
+            literal(input_dto.prior_votes, Float) + MovieStatsEntity.rating_count
+        )
+        ranked = (
+            select(
+                MovieEntity.movie_uuid,
+                MovieEntity.title,
+                MovieEntity.genre_uuid,
+                weighted_rating.label("weighted_rating"),
+                MovieStatsEntity.rating_count,
+                MovieStatsEntity.rating_sum,
+                func.row_number()
+                .over(
+                    partition_by=MovieEntity.genre_uuid,
+                    order_by=(weighted_rating.desc(), MovieStatsEntity.rating_count.desc(), MovieEntity.movie_uuid),
+                )
+                .label("genre_rank"),
+            )
+            .join(MovieStatsEntity, MovieStatsEntity.movie_uuid == MovieEntity.movie_uuid)
+            .where(MovieStatsEntity.rating_count > 0)
+            .subquery()
+        )
+        query = (
+            select(ranked)
+            .where(ranked.c.genre_rank <= input_dto.size)
+            .order_by(ranked.c.weighted_rating.desc(), ranked.c.rating_count.desc(), ranked.c.movie_uuid)
+        )
+        result = await self._adapter.execute(statement=query)
+        movies = [TopRatedMovieDTO.model_validate(obj=row, from_attributes=True) for row in result]
+        return GetTopRatedResponseDTO(movies=movies)
+
+    async def get_trending(self, input_dto: GetTrendingQueryDTO) -> GetTrendingResponseDTO:
+        """The most active movies of every genre, most active first.
+
+        Every watch entry and rating created since ``since`` counts ``2 ** (-age / half_life)``, so a burst of
+        activity today outweighs the same burst last week. Both scans are bounded by the ``created_at`` indexes.
+        """
+        # The migrated tables keep created_at as a timestamp without time zone, written in UTC.
+        since = input_dto.since.astimezone(UTC).replace(tzinfo=None)
+        events = union_all(
+            select(UserRateMovieEntity.movie_uuid, UserRateMovieEntity.created_at).where(
+                UserRateMovieEntity.created_at >= since,
+            ),
+            select(UserWatchMovieEntity.movie_uuid, UserWatchMovieEntity.created_at).where(
+                UserWatchMovieEntity.created_at >= since,
+            ),
+        ).subquery()
+        age_seconds = literal(input_dto.now.timestamp(), Float) - SQLUtils.epoch_seconds(
+            self._adapter,
+            events.c.created_at,
+        )
+        activity = (
+            select(
+                events.c.movie_uuid,
+                func.sum(func.exp(age_seconds * -(math.log(2) / input_dto.half_life_seconds))).label("trending_score"),
+                func.count().label("activity_count"),
+            )
+            .group_by(events.c.movie_uuid)
+            .subquery()
+        )
+        ranked = (
+            select(
+                MovieEntity.movie_uuid,
+                MovieEntity.title,
+                MovieEntity.genre_uuid,
+                activity.c.trending_score,
+                activity.c.activity_count,
+                func.row_number()
+                .over(
+                    partition_by=MovieEntity.genre_uuid,
+                    order_by=(activity.c.trending_score.desc(), MovieEntity.movie_uuid),
+                )
+                .label("genre_rank"),
+            )
+            .join(activity, activity.c.movie_uuid == MovieEntity.movie_uuid)
+            .subquery()
+        )
+        query = (
+            select(ranked)
+            .where(ranked.c.genre_rank <= input_dto.size)
+            .order_by(ranked.c.trending_score.desc(), ranked.c.movie_uuid)
+        )
+        result = await self._adapter.execute(statement=query)
+        movies = [TrendingMovieDTO.model_validate(obj=row, from_attributes=True) for row in result]
+        return GetTrendingResponseDTO(movies=movies)
@@ -0,0 +1,19 @@
+# src/repositories/leaderboard/leaderboard_repository.py
+from src.models.dtos.leaderboard.repository.leaderboard_repository_interface_dtos import (
+    GetTopRatedQueryDTO,
+    GetTopRatedResponseDTO,
+    GetTrendingQueryDTO,
+    GetTrendingResponseDTO,
+)
+from src.repositories.leaderboard.adapters.leaderboard_postgres_adapter import LeaderboardPostgresAdapter
+
+
+class LeaderboardRepository:
+    def __init__(self, postgres_adapter: LeaderboardPostgresAdapter) -> None:
+        self._postgres_adapter = postgres_adapter
+
+    async def get_top_rated(self, input_dto: GetTopRatedQueryDTO) -> GetTopRatedResponseDTO:
+        return await self._postgres_adapter.get_top_rated(input_dto=input_dto)
+
+    async def get_trending(self, input_dto: GetTrendingQueryDTO) -> GetTrendingResponseDTO:
+        return await self._postgres_adapter.get_trending(input_dto=input_dto)
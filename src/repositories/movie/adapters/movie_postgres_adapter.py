@@ -1,10 +1,29 @@
-from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
+import re
+import uuid
+
+from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin, SQLAlchemyPaginationMixin
 from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
 from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
 from archipy.models.errors import AlreadyExistsError, NotFoundError
 from archipy.models.types.base_types import FilterOperationType
-from sqlalchemy import delete, select, update
+from archipy.models.types.sort_order_type import SortOrderType
+from sqlalchemy import (
+    cast,
+    column,
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
 from sqlalchemy.sql.expression import Select
 
 from src.models.dtos.movie.repository.movie_repository_interface_dtos import (
@@ -13,19 +32,44 @@ from src.models.dtos.movie.repository.movie_repository_interface_dtos import (
     CreateMovieCommandDTO,
     CreateMovieResponseDTO,
     DeleteMovieCommandDTO,
+    GetExistingMovieKeysQueryDTO,
+    GetExistingMovieKeysResponseDTO,
     GetMovieQueryDTO,
     GetMovieResponseDTO,
     SearchMovieQueryDTO,
     SearchMovieResponseDTO,
     UpdateMovieCommandDTO,
 )
-from src.models.entities.movie_entity import MovieEntity
+from src.models.entities.movie_entity import MOVIE_SEARCH_CONFIG, MOVIE_SEARCH_FTS_TABLE, MovieEntity
+from src.utils.pagination_utils import PaginationUtils
+from src.utils.sql_utils import SQLUtils
 
 
-class MoviePostgresAdapter(SQLAlchemyFilterMixin):
+class MoviePostgresAdapter(SQLAlchemyFilterMixin, SQLAlchemyPaginationMixin):
     def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
         self._adapter: AsyncSQLAlchemyPort = adapter
 
+    @staticmethod
+    def apply_full_text_search(query: Select, search: str, dialect_name: str) -> Select:
+        """Keep movies whose title or description match ``search``, most relevant first."""
+        if dialect_name == "sqlite":
+            # Quote every word so user input is never parsed as FTS5 query syntax; words are ANDed.
+            words = re.findall(r"\w+", search)
+            if not words:
+                return query.where(false())
+            fts = table(MOVIE_SEARCH_FTS_TABLE, column("rowid"))
+            return (
+                query.join(fts, fts.c.rowid == literal_column("movies.rowid"))
+                .where(literal_column(MOVIE_SEARCH_FTS_TABLE).op("MATCH")(" ".join(f'"{word}"' for word in words)))
+                .order_by(literal_column(f"{MOVIE_SEARCH_FTS_TABLE}.rank"))
+            )
+
+        search_vector = literal_column("movies.search_vector", type_=TSVECTOR)
+        ts_query = func.websearch_to_tsquery(cast(literal(MOVIE_SEARCH_CONFIG), REGCONFIG), search)
+        return query.where(search_vector.bool_op("@@")(ts_query)).order_by(
+            func.ts_rank_cd(search_vector, ts_query).desc(),
+        )
+
     async def create_movie(self, input_dto: CreateMovieCommandDTO) -> CreateMovieResponseDTO:
         movie: MovieEntity = MovieEntity(**input_dto.model_dump())
         try:
@@ -38,37 +82,59 @@ class MoviePostgresAdapter(SQLAlchemyFilterMixin):
             raise exc
 
     async def bulk_create_movie(self, input_dto: BulkCreateMovieCommandDTO) -> BulkCreateMovieResponseDTO:
-        results: list[CreateMovieResponseDTO] = []
-        for movie_dto in input_dto.movies:
-            movie: MovieEntity = MovieEntity(**movie_dto.model_dump())
-            try:
-                result = await self._adapter.create(entity=movie)
-                results.append(CreateMovieResponseDTO.model_validate(obj=result))
-            except IntegrityError as exc:
-                error_message = str(exc.orig).lower() if exc.orig else ""
-                if "unique" in error_message or "duplicate" in error_message:
-                    raise AlreadyExistsError(resource_type=MovieEntity.__name__) from exc
-                raise exc
-        return BulkCreateMovieResponseDTO(movies=results)
+        if not input_dto.movies:
+            return BulkCreateMovieResponseDTO(movies=[])
+
+        # Movies have no natural key, so nothing can conflict; UUIDs are generated up front only to return the
+        # rows in payload order, which RETURNING does not guarantee.
+        rows = [{"movie_uuid": uuid.uuid4(), "is_deleted": False, **movie.model_dump()} for movie in input_dto.movies]
+        insert_query = (
+            insert(MovieEntity)
+            .values(rows)
+            .returning(
+                MovieEntity.movie_uuid,
+                MovieEntity.title,
+                MovieEntity.description,
+                MovieEntity.genre_uuid,
+                MovieEntity.created_at,
+                MovieEntity.updated_at,
+            )
+        )
+        result = await self._adapter.execute(statement=insert_query)
+        inserted = {row.movie_uuid: row for row in result}
+        return BulkCreateMovieResponseDTO(
+            movies=[CreateMovieResponseDTO.model_validate(obj=inserted[row["movie_uuid"]]) for row in rows],
+        )
 
     async def get_movie(self, input_dto: GetMovieQueryDTO) -> GetMovieResponseDTO:
-        select_query = select(MovieEntity).where(MovieEntity.movie_uuid == input_dto.movie_uuid)
+        select_query = (
+            select(MovieEntity)
+            .options(joinedload(MovieEntity.stats))
+            .where(MovieEntity.movie_uuid == input_dto.movie_uuid)
+        )
         result = await self._adapter.execute(statement=select_query)
         movie = result.scalar()
         if not movie:
             raise NotFoundError(resource_type=MovieEntity.__name__)
         return GetMovieResponseDTO.model_validate(obj=movie)
 
+    async def get_existing_movie_keys(
+        self,
+        input_dto: GetExistingMovieKeysQueryDTO,
+    ) -> GetExistingMovieKeysResponseDTO:
+        if not input_dto.titles:
+            return GetExistingMovieKeysResponseDTO(keys=set())
+        select_query = select(MovieEntity.title, MovieEntity.genre_uuid).where(
+            MovieEntity.title.in_(set(input_dto.titles)),
+        )
+        result = await self._adapter.execute(statement=select_query)
+        return GetExistingMovieKeysResponseDTO(keys={(row.title, row.genre_uuid) for row in result})
+
     async def search_movies(self, input_dto: SearchMovieQueryDTO) -> SearchMovieResponseDTO:
-        query: Select = select(MovieEntity)
+        query: Select = select(MovieEntity).options(joinedload(MovieEntity.stats))
 
         if input_dto.title:
-            query = self._apply_filter(
-                query=query,
-                field=MovieEntity.title,
-                value=f"%{input_dto.title}%",
-                operation=FilterOperationType.ILIKE,
-            )
+            query = query.where(SQLUtils.contains(MovieEntity.title, input_dto.title))
 
         if input_dto.genre_uuid:
             query = self._apply_filter(
@@ -78,14 +144,63 @@ class MoviePostgresAdapter(SQLAlchemyFilterMixin):
                 operation=FilterOperationType.EQUAL,
             )
 
-        movies, total = await self._adapter.execute_search_query(
+        if input_dto.search:
+            query = self.apply_full_text_search(query, input_dto.search, SQLUtils.dialect_name(self._adapter))
+
+        # movie_uuid breaks ties so offset pages and cursor pages walk the same total order.
+        sort_column = getattr(MovieEntity, input_dto.sort_info.column.value)
+        descending = input_dto.sort_info.order == SortOrderType.DESCENDING
+        if descending:
+            query = query.order_by(sort_column.desc(), MovieEntity.movie_uuid.desc())
+        else:
+            query = query.order_by(sort_column.asc(), MovieEntity.movie_uuid.asc())
+
+        if input_dto.after is not None:
+            return await self._search_movies_after(
+                query=query,
+                sort_column=sort_column,
+                descending=descending,
+                input_dto=input_dto,
+            )
+
+        # Already sorted above, with movie_uuid as the tie-breaker.
+        movies, total, total_is_exact = await PaginationUtils.execute_search_query(
+            self._adapter,
             query=query,
-            entity=MovieEntity,
-            sort_info=input_dto.sort_info,
+            page_query=self._apply_pagination(query, input_dto.pagination),
             pagination=input_dto.pagination,
+            include_total=input_dto.include_total,
         )
 
-        return SearchMovieResponseDTO(movies=movies, total=total)
+        if total_is_exact:
+            has_more = input_dto.pagination.offset + len(movies) < total
+        else:
+            has_more = len(movies) == input_dto.pagination.page_size
+        return SearchMovieResponseDTO(movies=movies, total=total, total_is_exact=total_is_exact, has_more=has_more)
+
+    async def _search_movies_after(
+        self,
+        query: Select,
+        sort_column: InstrumentedAttribute,
+        *,
+        descending: bool,
+        input_dto: SearchMovieQueryDTO,
+    ) -> SearchMovieResponseDTO:
+        after = input_dto.after
+        page_size = input_dto.pagination.page_size
+        key = tuple_(sort_column, MovieEntity.movie_uuid)
+        bound = tuple_(literal(after.value, sort_column.type), literal(after.movie_uuid, MovieEntity.movie_uuid.type))
+        # One extra row tells whether another page exists without counting the table.
+        query = query.where(key < bound if descending else key > bound).limit(page_size + 1)
+
+        result = await self._adapter.execute(statement=query)
+        movies = list(result.scalars().all())
+        return SearchMovieResponseDTO(
+            movies=movies[:page_size],
+            total=None,
+            total_is_exact=False,
+            has_more=len(movies) > page_size,
+        )
 
     async def update_movie(self, input_dto: UpdateMovieCommandDTO) -> None:
         update_data = input_dto.model_dump(exclude={"movie_uuid"}, exclude_none=True)
@@ -4,6 +4,8 @@ from src.models.dtos.movie.repository.movie_repository_interface_dtos import (
     CreateMovieCommandDTO,
     CreateMovieResponseDTO,
     DeleteMovieCommandDTO,
+    GetExistingMovieKeysQueryDTO,
+    GetExistingMovieKeysResponseDTO,
     GetMovieQueryDTO,
     GetMovieResponseDTO,
     SearchMovieQueryDTO,
@@ -26,6 +28,12 @@ class MovieRepository:
     async def get_movie(self, input_dto: GetMovieQueryDTO) -> GetMovieResponseDTO:
         return await self._postgres_adapter.get_movie(input_dto=input_dto)
 
+    async def get_existing_movie_keys(
+        self,
+        input_dto: GetExistingMovieKeysQueryDTO,
+    ) -> GetExistingMovieKeysResponseDTO:
+        return await self._postgres_adapter.get_existing_movie_keys(input_dto=input_dto)
+
     async def search_movies(self, input_dto: SearchMovieQueryDTO) -> SearchMovieResponseDTO:
         return await self._postgres_adapter.search_movies(input_dto=input_dto)
 
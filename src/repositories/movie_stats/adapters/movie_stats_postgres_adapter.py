@@ -0,0 +1,146 @@
+# src/repositories/movie_stats/adapters/movie_stats_postgres_adapter.py
+from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
+from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
+from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
+from archipy.models.errors import NotFoundError
+from sqlalchemy import Select, func, or_, select
+
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import (
+    ApplyMovieStatsDeltaCommandDTO,
+    FindMovieStatsDriftResponseDTO,
+    GetMovieStatsQueryDTO,
+    GetMovieStatsResponseDTO,
+    MovieStatsDriftDTO,
+    MovieStatsDTO,
+    RepairMovieStatsCommandDTO,
+)
+from src.models.entities.movie_entity import MovieEntity
+from src.models.entities.movie_stats_entity import MovieStatsEntity
+from src.models.entities.user_rate_movie_entity import RATING_SCORES, UserRateMovieEntity
+from src.models.entities.user_watch_movie_entity import UserWatchMovieEntity
+from src.models.types.watch_status_type import WatchStatusType
+from src.utils.sql_utils import SQLUtils
+
+_SCORE_BUCKETS = tuple(f"score_{score}_count" for score in RATING_SCORES)
+_COUNTERS = ("rating_count", "rating_sum", *_SCORE_BUCKETS, "watched_count", "want_to_watch_count")
+
+
+class MovieStatsPostgresAdapter(SQLAlchemyFilterMixin):
+    def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
+        self._adapter: AsyncSQLAlchemyPort = adapter
+
+    async def apply_delta(self, input_dto: ApplyMovieStatsDeltaCommandDTO) -> None:
+        """Add the delta to the movie's counters in one upsert; the first write for a movie creates its row."""
+        insert_query = SQLUtils.insert(self._adapter, MovieStatsEntity).values(**input_dto.model_dump())
+        upsert_query = insert_query.on_conflict_do_update(
+            index_elements=["movie_uuid"],
+            set_={
+                **{
+                    counter: getattr(MovieStatsEntity, counter) + getattr(insert_query.excluded, counter)
+                    for counter in _COUNTERS
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await self._adapter.execute(statement=upsert_query)
+
+    async def get_movie_stats(self, input_dto: GetMovieStatsQueryDTO) -> GetMovieStatsResponseDTO:
+        """The movie's stored counters; a single primary-key read, never an aggregate."""
+        query = (
+            select(MovieEntity.movie_uuid, MovieStatsEntity)
+            .outerjoin(MovieStatsEntity, MovieStatsEntity.movie_uuid == MovieEntity.movie_uuid)
+            .where(MovieEntity.movie_uuid == input_dto.movie_uuid)
+        )
+        result = await self._adapter.execute(statement=query)
+        row = result.first()
+        if row is None:
+            raise NotFoundError(resource_type=MovieEntity.__name__)
+        stats = MovieStatsDTO.model_validate(obj=row.MovieStatsEntity) if row.MovieStatsEntity else None
+        return GetMovieStatsResponseDTO(movie_uuid=row.movie_uuid, stats=stats)
+
+    async def find_drift(self) -> FindMovieStatsDriftResponseDTO:
+        """Movies whose stored counters differ from a fresh aggregate of ratings and watch entries."""
+        actual = self._actual_counters_query().subquery()
+        stored = {counter: func.coalesce(getattr(MovieStatsEntity, counter), 0) for counter in _COUNTERS}
+        query = (
+            select(
+                actual.c.movie_uuid,
+                *(stored[counter].label(f"stored_{counter}") for counter in _COUNTERS),
+                *(getattr(actual.c, counter).label(f"actual_{counter}") for counter in _COUNTERS),
+            )
+            .select_from(actual)
+            .outerjoin(MovieStatsEntity, MovieStatsEntity.movie_uuid == actual.c.movie_uuid)
+            .where(or_(*(stored[counter] != getattr(actual.c, counter) for counter in _COUNTERS)))
+            .order_by(actual.c.movie_uuid)
+        )
+        result = await self._adapter.execute(statement=query)
+        drifts = [
+            MovieStatsDriftDTO(
+                movie_uuid=row.movie_uuid,
+                stored=MovieStatsDTO(**{counter: getattr(row, f"stored_{counter}") for counter in _COUNTERS}),
+                actual=MovieStatsDTO(**{counter: getattr(row, f"actual_{counter}") for counter in _COUNTERS}),
+            )
+            for row in result
+        ]
+        return FindMovieStatsDriftResponseDTO(drifts=drifts)
+
+    async def repair(self, input_dto: RepairMovieStatsCommandDTO) -> None:
+        """Overwrite the given movies' counters with freshly aggregated values."""
+        if not input_dto.movie_uuids:
+            return
+        actual_query = self._actual_counters_query().where(MovieEntity.movie_uuid.in_(input_dto.movie_uuids))
+        insert_query = SQLUtils.insert(self._adapter, MovieStatsEntity).from_select(
+            ["movie_uuid", *_COUNTERS],
+            actual_query,
+        )
+        upsert_query = insert_query.on_conflict_do_update(
+            index_elements=["movie_uuid"],
+            set_={
+                **{counter: getattr(insert_query.excluded, counter) for counter in _COUNTERS},
+                "updated_at": func.now(),
+            },
+        )
+        await self._adapter.execute(statement=upsert_query)
+
+    @staticmethod
+    def _actual_counters_query() -> Select:
+        """Every movie with its counters aggregated from the source tables."""
+        ratings = (
+            select(
+                UserRateMovieEntity.movie_uuid,
+                func.count().label("rating_count"),
+                func.sum(UserRateMovieEntity.score).label("rating_sum"),
+                *(
+                    func.count().filter(UserRateMovieEntity.score == score).label(bucket)
+                    for score, bucket in zip(RATING_SCORES, _SCORE_BUCKETS, strict=True)
+                ),
+            )
+            .group_by(UserRateMovieEntity.movie_uuid)
+            .subquery()
+        )
+        watches = (
+            select(
+                UserWatchMovieEntity.movie_uuid,
+                func.count()
+                .filter(UserWatchMovieEntity.status == WatchStatusType.WATCHED.value)
+                .label("watched_count"),
+                func.count()
+                .filter(UserWatchMovieEntity.status == WatchStatusType.WANT_TO_WATCH.value)
+                .label("want_to_watch_count"),
+            )
+            .group_by(UserWatchMovieEntity.movie_uuid)
+            .subquery()
+        )
+        return (
+            select(
+                MovieEntity.movie_uuid,
+                func.coalesce(ratings.c.rating_count, 0).label("rating_count"),
+                func.coalesce(ratings.c.rating_sum, 0).label("rating_sum"),
+                *(func.coalesce(getattr(ratings.c, bucket), 0).label(bucket) for bucket in _SCORE_BUCKETS),
+                func.coalesce(watches.c.watched_count, 0).label("watched_count"),
+                func.coalesce(watches.c.want_to_watch_count, 0).label("want_to_watch_count"),
+            )
+            .select_from(MovieEntity)
+            .outerjoin(ratings, ratings.c.movie_uuid == MovieEntity.movie_uuid)
+            .outerjoin(watches, watches.c.movie_uuid == MovieEntity.movie_uuid)
+        )
@@ -0,0 +1,26 @@
+# src/repositories/movie_stats/movie_stats_repository.py
+from src.models.dtos.movie_stats.repository.movie_stats_repository_interface_dtos import (
+    ApplyMovieStatsDeltaCommandDTO,
+    FindMovieStatsDriftResponseDTO,
+    GetMovieStatsQueryDTO,
+    GetMovieStatsResponseDTO,
+    RepairMovieStatsCommandDTO,
+)
+from src.repositories.movie_stats.adapters.movie_stats_postgres_adapter import MovieStatsPostgresAdapter
+
+
+class MovieStatsRepository:
+    def __init__(self, postgres_adapter: MovieStatsPostgresAdapter) -> None:
+        self._postgres_adapter = postgres_adapter
+
+    async def apply_delta(self, input_dto: ApplyMovieStatsDeltaCommandDTO) -> None:
+        await self._postgres_adapter.apply_delta(input_dto=input_dto)
+
+    async def get_movie_stats(self, input_dto: GetMovieStatsQueryDTO) -> GetMovieStatsResponseDTO:
+        return await self._postgres_adapter.get_movie_stats(input_dto=input_dto)
+
+    async def find_drift(self) -> FindMovieStatsDriftResponseDTO:
+        return await self._postgres_adapter.find_drift()
+
+    async def repair(self, input_dto: RepairMovieStatsCommandDTO) -> None:
+        await self._postgres_adapter.repair(input_dto=input_dto)
@@ -1,12 +1,14 @@
+import uuid
+
 from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
 from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
 from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
-from archipy.models.errors import AlreadyExistsError, NotFoundError
-from sqlalchemy import asc, desc, func, select, update
-from sqlalchemy.exc import IntegrityError
+from archipy.models.errors import AlreadyExistsError, InvalidArgumentError, NotFoundError
+from archipy.models.types.sort_order_type import SortOrderType
+from sqlalchemy import UUID, Row, asc, desc, exists, false, literal, select, update
+from sqlalchemy.sql.expression import ColumnElement, Exists
 
 from src.models.dtos.rating.repository.rating_repository_interface_dtos import (
-    CheckRatingExistsQueryDTO,
     CreateRatingCommandDTO,
     CreateRatingResponseDTO,
     GetMovieRatersQueryDTO,
@@ -18,110 +20,175 @@ from src.models.dtos.rating.repository.rating_repository_interface_dtos import (
     RatedMovieItemDTO,
     RaterUserItemDTO,
     UpdateRatingCommandDTO,
+    UpdateRatingResponseDTO,
 )
 from src.models.entities.movie_entity import MovieEntity
 from src.models.entities.user_entity import UserEntity
 from src.models.entities.user_rate_movie_entity import UserRateMovieEntity
+from src.models.entities.user_watch_movie_entity import UserWatchMovieEntity
 from src.models.types.rating_sort_type import RatingSortColumnType
+from src.models.types.watch_status_type import WatchStatusType
+from src.utils.pagination_utils import PaginationUtils
+from src.utils.sql_utils import SQLUtils
 
 
 class RatingPostgresAdapter(SQLAlchemyFilterMixin):
     def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
         self._adapter: AsyncSQLAlchemyPort = adapter
 
-    async def check_rating_exists(self, input_dto: CheckRatingExistsQueryDTO) -> bool:
-        select_query = select(UserRateMovieEntity).where(
-            UserRateMovieEntity.user_uuid == input_dto.user_uuid,
-            UserRateMovieEntity.movie_uuid == input_dto.movie_uuid,
-        )
-        result = await self._adapter.execute(statement=select_query)
-        return result.scalar() is not None
-
     async def create_rating(self, input_dto: CreateRatingCommandDTO) -> CreateRatingResponseDTO:
-        rating: UserRateMovieEntity = UserRateMovieEntity(**input_dto.model_dump())
-        try:
-            result = await self._adapter.create(entity=rating)
-            return CreateRatingResponseDTO.model_validate(obj=result)
-        except IntegrityError as exc:
-            raise AlreadyExistsError(resource_type=UserRateMovieEntity.__name__) from exc
+        """Insert the rating if the user has watched the movie and not rated it yet.
+
+        Both guards live in one INSERT ... SELECT WHERE EXISTS ... ON CONFLICT DO NOTHING. Only when it
+        inserts nothing is the watch state read again, to tell which guard failed: InvalidArgumentError
+        for an unwatched movie, AlreadyExistsError for an existing rating. A concurrent rating committed
+        after the snapshot surfaces as a serialization failure, which the logic's retry settles.
+        """
+        watched = self._watched_clause(input_dto.user_uuid, input_dto.movie_uuid)
+        insert_query = (
+            SQLUtils.insert(self._adapter, UserRateMovieEntity)
+            .from_select(
+                ["rate_uuid", "user_uuid", "movie_uuid", "score", "is_deleted"],
+                select(
+                    literal(uuid.uuid4(), UUID(as_uuid=True)),
+                    literal(input_dto.user_uuid, UUID(as_uuid=True)),
+                    literal(input_dto.movie_uuid, UUID(as_uuid=True)),
+                    literal(input_dto.score),
+                    false(),
+                ).where(watched),
+            )
+            .on_conflict_do_nothing(index_elements=["user_uuid", "movie_uuid"])
+            .returning(
+                UserRateMovieEntity.rate_uuid,
+                UserRateMovieEntity.user_uuid,
+                UserRateMovieEntity.movie_uuid,
+                UserRateMovieEntity.score,
+                UserRateMovieEntity.created_at,
+                UserRateMovieEntity.updated_at,
+            )
+        )
+        result = await self._adapter.execute(statement=insert_query)
+        row = result.first()
+        if row is not None:
+            return CreateRatingResponseDTO.model_validate(obj=row)
+
+        watched_result = await self._adapter.execute(statement=select(watched))
+        if not watched_result.scalar():
+            raise InvalidArgumentError()
+        raise AlreadyExistsError(resource_type=UserRateMovieEntity.__name__)
+
+    @staticmethod
+    def _watched_clause(user_uuid: uuid.UUID, movie_uuid: uuid.UUID) -> Exists:
+        return exists().where(
+            UserWatchMovieEntity.user_uuid == user_uuid,
+            UserWatchMovieEntity.movie_uuid == movie_uuid,
+            UserWatchMovieEntity.status == WatchStatusType.WATCHED.value,
+        )
 
-    async def update_rating(self, input_dto: UpdateRatingCommandDTO) -> None:
-        update_query = (
-            update(UserRateMovieEntity)
+    async def update_rating(self, input_dto: UpdateRatingCommandDTO) -> UpdateRatingResponseDTO:
+        # The previous score feeds the movie_stats delta. The locked sub-select reads it in the same statement,
+        # and RETURNING hands it back next to the new one.
+        old = (
+            select(UserRateMovieEntity.rate_uuid, UserRateMovieEntity.score)
             .where(UserRateMovieEntity.rate_uuid == input_dto.rate_uuid)
             .where(UserRateMovieEntity.user_uuid == input_dto.user_uuid)
+            .with_for_update()
+            .subquery("old")
+        )
+        previous_score = await SQLUtils.previous_value(self._adapter, old.c.score)
+        update_query = (
+            update(UserRateMovieEntity)
+            .where(UserRateMovieEntity.rate_uuid == old.c.rate_uuid)
             .values(score=input_dto.score)
+            .returning(
+                UserRateMovieEntity.rate_uuid,
+                UserRateMovieEntity.user_uuid,
+                UserRateMovieEntity.movie_uuid,
+                UserRateMovieEntity.score,
+                previous_score.label("previous_score"),
+                UserRateMovieEntity.created_at,
+                UserRateMovieEntity.updated_at,
+            )
         )
         result = await self._adapter.execute(statement=update_query)
-        if result.rowcount == 0:
+        row = result.first()
+        if row is None:
             raise NotFoundError(resource_type=UserRateMovieEntity.__name__)
+        return UpdateRatingResponseDTO.model_validate(obj=row)
 
     async def get_my_ratings(self, input_dto: GetMyRatingsQueryDTO) -> GetMyRatingsResponseDTO:
-        base_query = (
-            select(UserRateMovieEntity, MovieEntity)
-            .join(MovieEntity, UserRateMovieEntity.movie_uuid == MovieEntity.movie_uuid)
-            .where(UserRateMovieEntity.user_uuid == input_dto.user_uuid)
+        rows, total, total_is_exact = await self._fetch_rating_page(
+            MovieEntity,
+            UserRateMovieEntity.movie_uuid == MovieEntity.movie_uuid,
+            UserRateMovieEntity.user_uuid == input_dto.user_uuid,
+            input_dto,
         )
-
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._adapter.execute(statement=count_query)
-        total = count_result.scalar() or 0
-
-        order_fn = desc if input_dto.sort_info.order.value.lower() == "desc" else asc
-        sort_column = input_dto.sort_info.column
-        sort_field = (
-            UserRateMovieEntity.score if sort_column == RatingSortColumnType.SCORE else UserRateMovieEntity.created_at
+        return GetMyRatingsResponseDTO(
+            ratings=self._to_rated_movie_items(rows),
+            total=total,
+            total_is_exact=total_is_exact,
         )
 
-        page = input_dto.pagination.page
-        page_size = input_dto.pagination.page_size
-        offset = (page - 1) * page_size
-
-        data_query = base_query.order_by(order_fn(sort_field)).limit(page_size).offset(offset)
-        data_result = await self._adapter.execute(statement=data_query)
-        rows = data_result.all()
+    async def get_user_ratings(self, input_dto: GetUserRatingsQueryDTO) -> GetUserRatingsResponseDTO:
+        rows, total, total_is_exact = await self._fetch_rating_page(
+            MovieEntity,
+            UserRateMovieEntity.movie_uuid == MovieEntity.movie_uuid,
+            UserRateMovieEntity.user_uuid == input_dto.user_uuid,
+            input_dto,
+        )
+        return GetUserRatingsResponseDTO(
+            ratings=self._to_rated_movie_items(rows),
+            total=total,
+            total_is_exact=total_is_exact,
+        )
 
-        ratings = [
-            RatedMovieItemDTO(
+    async def get_movie_raters(self, input_dto: GetMovieRatersQueryDTO) -> GetMovieRatersResponseDTO:
+        rows, total, total_is_exact = await self._fetch_rating_page(
+            UserEntity,
+            UserRateMovieEntity.user_uuid == UserEntity.user_uuid,
+            UserRateMovieEntity.movie_uuid == input_dto.movie_uuid,
+            input_dto,
+        )
+        raters = [
+            RaterUserItemDTO(
                 rate_uuid=row.UserRateMovieEntity.rate_uuid,
-                movie_uuid=row.MovieEntity.movie_uuid,
-                title=row.MovieEntity.title,
-                description=row.MovieEntity.description,
-                genre_uuid=row.MovieEntity.genre_uuid,
+                user_uuid=row.UserEntity.user_uuid,
+                first_name=row.UserEntity.first_name,
+                last_name=row.UserEntity.last_name,
+                email=row.UserEntity.email,
                 score=row.UserRateMovieEntity.score,
                 rated_at=row.UserRateMovieEntity.created_at,
             )
             for row in rows
         ]
-
-        return GetMyRatingsResponseDTO(ratings=ratings, total=total)
-
-    async def get_user_ratings(self, input_dto: GetUserRatingsQueryDTO) -> GetUserRatingsResponseDTO:
-        base_query = (
-            select(UserRateMovieEntity, MovieEntity)
-            .join(MovieEntity, UserRateMovieEntity.movie_uuid == MovieEntity.movie_uuid)
-            .where(UserRateMovieEntity.user_uuid == input_dto.user_uuid)
-        )
-
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._adapter.execute(statement=count_query)
-        total = count_result.scalar() or 0
-
-        order_fn = desc if input_dto.sort_info.order.value.lower() == "desc" else asc
-        sort_column = input_dto.sort_info.column
+        return GetMovieRatersResponseDTO(raters=raters, total=total, total_is_exact=total_is_exact)
+
+    async def _fetch_rating_page(
+        self,
+        joined_entity: type[MovieEntity] | type[UserEntity],
+        join_clause: ColumnElement[bool],
+        where_clause: ColumnElement[bool],
+        input_dto: GetMyRatingsQueryDTO | GetUserRatingsQueryDTO | GetMovieRatersQueryDTO,
+    ) -> tuple[list[Row], int | None, bool]:
+        """Shared page query for the rating listings; only the joined side and the filter vary."""
+        query = select(UserRateMovieEntity, joined_entity).join(joined_entity, join_clause).where(where_clause)
         sort_field = (
-            UserRateMovieEntity.score if sort_column == RatingSortColumnType.SCORE else UserRateMovieEntity.created_at
+            UserRateMovieEntity.score
+            if input_dto.sort_info.column == RatingSortColumnType.SCORE
+            else UserRateMovieEntity.created_at
+        )
+        order_fn = desc if input_dto.sort_info.order == SortOrderType.DESCENDING else asc
+        return await PaginationUtils.fetch_page(
+            self._adapter,
+            query,
+            [order_fn(sort_field)],
+            input_dto.pagination,
+            input_dto.include_total,
         )
 
-        page = input_dto.pagination.page
-        page_size = input_dto.pagination.page_size
-        offset = (page - 1) * page_size
-
-        data_query = base_query.order_by(order_fn(sort_field)).limit(page_size).offset(offset)
-        data_result = await self._adapter.execute(statement=data_query)
-        rows = data_result.all()
-
-        ratings = [
+    @staticmethod
+    def _to_rated_movie_items(rows: list[Row]) -> list[RatedMovieItemDTO]:
+        return [
             RatedMovieItemDTO(
                 rate_uuid=row.UserRateMovieEntity.rate_uuid,
                 movie_uuid=row.MovieEntity.movie_uuid,
@@ -133,45 +200,3 @@ class RatingPostgresAdapter(SQLAlchemyFilterMixin):
             )
             for row in rows
         ]
-
-        return GetUserRatingsResponseDTO(ratings=ratings, total=total)
-
-    async def get_movie_raters(self, input_dto: GetMovieRatersQueryDTO) -> GetMovieRatersResponseDTO:
-        base_query = (
-            select(UserRateMovieEntity, UserEntity)
-            .join(UserEntity, UserRateMovieEntity.user_uuid == UserEntity.user_uuid)
-            .where(UserRateMovieEntity.movie_uuid == input_dto.movie_uuid)
-        )
-
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._adapter.execute(statement=count_query)
-        total = count_result.scalar() or 0
-
-        order_fn = desc if input_dto.sort_info.order.value.lower() == "desc" else asc
-        sort_column = input_dto.sort_info.column
-        sort_field = (
-            UserRateMovieEntity.score if sort_column == RatingSortColumnType.SCORE else UserRateMovieEntity.created_at
-        )
-
-        page = input_dto.pagination.page
-        page_size = input_dto.pagination.page_size
-        offset = (page - 1) * page_size
-
-        data_query = base_query.order_by(order_fn(sort_field)).limit(page_size).offset(offset)
-        data_result = await self._adapter.execute(statement=data_query)
-        rows = data_result.all()
-
-        raters = [
-            RaterUserItemDTO(
-                rate_uuid=row.UserRateMovieEntity.rate_uuid,
-                user_uuid=row.UserEntity.user_uuid,
-                first_name=row.UserEntity.first_name,
-                last_name=row.UserEntity.last_name,
-                email=row.UserEntity.email,
-                score=row.UserRateMovieEntity.score,
-                rated_at=row.UserRateMovieEntity.created_at,
-            )
-            for row in rows
-        ]
-
-        return GetMovieRatersResponseDTO(raters=raters, total=total)
@@ -0,0 +1,82 @@
+# src/repositories/recommendation/adapters/recommendation_postgres_adapter.py
+from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
+from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
+from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
+from sqlalchemy import and_, func, select
+
+from src.models.dtos.recommendation.repository.recommendation_repository_interface_dtos import (
+    CountMoviesResponseDTO,
+    GetInteractionsResponseDTO,
+    GetMovieTextsQueryDTO,
+    GetMovieTextsResponseDTO,
+    GetMovieUUIDsResponseDTO,
+    GetRecommendationMoviesResponseDTO,
+    MovieTextDTO,
+    RecommendationMovieDTO,
+)
+from src.models.entities.movie_entity import MovieEntity
+from src.models.entities.user_rate_movie_entity import UserRateMovieEntity
+from src.models.entities.user_watch_movie_entity import UserWatchMovieEntity
+
+
+class RecommendationPostgresAdapter(SQLAlchemyFilterMixin):
+    def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
+        self._adapter: AsyncSQLAlchemyPort = adapter
+
+    async def get_movies(self) -> GetRecommendationMoviesResponseDTO:
+        """Every movie in the catalog, with what a recommendation shows of it."""
+        query = select(MovieEntity.movie_uuid, MovieEntity.title, MovieEntity.genre_uuid)
+        result = await self._adapter.execute(statement=query)
+        movies = [RecommendationMovieDTO.model_validate(obj=row, from_attributes=True) for row in result]
+        return GetRecommendationMoviesResponseDTO(movies=movies)
+
+    async def get_interactions(self) -> GetInteractionsResponseDTO:
+        """Every watch entry with its rating, if any.
+
+        Rating a movie requires a watch entry, so the outer join covers every rating as well.
+        """
+        query = select(
+            UserWatchMovieEntity.user_uuid,
+            UserWatchMovieEntity.movie_uuid,
+            UserWatchMovieEntity.status,
+            UserRateMovieEntity.score,
+        ).outerjoin(
+            UserRateMovieEntity,
+            and_(
+                UserRateMovieEntity.user_uuid == UserWatchMovieEntity.user_uuid,
+                UserRateMovieEntity.movie_uuid == UserWatchMovieEntity.movie_uuid,
+            ),
+        )
+        result = await self._adapter.execute(statement=query)
+        rows = result.all()
+        return GetInteractionsResponseDTO(
+            user_uuids=[row.user_uuid for row in rows],
+            movie_uuids=[row.movie_uuid for row in rows],
+            statuses=[row.status for row in rows],
+            scores=[row.score for row in rows],
+        )
+
+    async def get_movie_texts(self, input_dto: GetMovieTextsQueryDTO) -> GetMovieTextsResponseDTO:
+        """Movies with the text the content index is built from."""
+        query = select(
+            MovieEntity.movie_uuid,
+            MovieEntity.title,
+            MovieEntity.genre_uuid,
+            MovieEntity.description,
+            MovieEntity.updated_at,
+        )
+        if input_dto.movie_uuids is not None:
+            query = query.where(MovieEntity.movie_uuid.in_(input_dto.movie_uuids))
+        if input_dto.updated_since is not None:
+            query = query.where(MovieEntity.updated_at >= input_dto.updated_since)
+        result = await self._adapter.execute(statement=query)
+        movies = [MovieTextDTO.model_validate(obj=row, from_attributes=True) for row in result]
+        return GetMovieTextsResponseDTO(movies=movies)
+
+    async def get_movie_uuids(self) -> GetMovieUUIDsResponseDTO:
+        result = await self._adapter.execute(statement=select(MovieEntity.movie_uuid))
+        return GetMovieUUIDsResponseDTO(movie_uuids=list(result.scalars()))
+
+    async def count_movies(self) -> CountMoviesResponseDTO:
+        result = await self._adapter.execute(statement=select(func.count()).select_from(MovieEntity))
+        return CountMoviesResponseDTO(count=result.scalar_one())
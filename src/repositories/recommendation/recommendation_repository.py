@@ -0,0 +1,30 @@
+# src/repositories/recommendation/recommendation_repository.py
+from src.models.dtos.recommendation.repository.recommendation_repository_interface_dtos import (
+    CountMoviesResponseDTO,
+    GetInteractionsResponseDTO,
+    GetMovieTextsQueryDTO,
+    GetMovieTextsResponseDTO,
+    GetMovieUUIDsResponseDTO,
+    GetRecommendationMoviesResponseDTO,
+)
+from src.repositories.recommendation.adapters.recommendation_postgres_adapter import RecommendationPostgresAdapter
+
+
+class RecommendationRepository:
+    def __init__(self, postgres_adapter: RecommendationPostgresAdapter) -> None:
+        self._postgres_adapter = postgres_adapter
+
+    async def get_movies(self) -> GetRecommendationMoviesResponseDTO:
+        return await self._postgres_adapter.get_movies()
+
+    async def get_interactions(self) -> GetInteractionsResponseDTO:
+        return await self._postgres_adapter.get_interactions()
+
+    async def get_movie_texts(self, input_dto: GetMovieTextsQueryDTO) -> GetMovieTextsResponseDTO:
+        return await self._postgres_adapter.get_movie_texts(input_dto=input_dto)
+
+    async def get_movie_uuids(self) -> GetMovieUUIDsResponseDTO:
+        return await self._postgres_adapter.get_movie_uuids()
+
+    async def count_movies(self) -> CountMoviesResponseDTO:
+        return await self._postgres_adapter.count_movies()
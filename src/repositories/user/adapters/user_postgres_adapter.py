@@ -1,4 +1,8 @@
-from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
+from archipy.adapters.base.sqlalchemy.adapters import (
+    SQLAlchemyFilterMixin,
+    SQLAlchemyPaginationMixin,
+    SQLAlchemySortMixin,
+)
 from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
 from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
 from archipy.models.errors import AlreadyExistsError, NotFoundError
@@ -15,6 +19,8 @@ from src.models.dtos.user.repository.user_repository_interface_dtos import (
     GetUserByEmailResponseDTO,
     GetUserFullByUUIDQueryDTO,
     GetUserFullByUUIDResponseDTO,
+    GetUserPrincipalQueryDTO,
+    GetUserPrincipalResponseDTO,
     GetUserQueryDTO,
     GetUserResponseDTO,
     SearchUserQueryDTO,
@@ -22,9 +28,11 @@ from src.models.dtos.user.repository.user_repository_interface_dtos import (
     UpdateUserCommandDTO,
 )
 from src.models.entities.user_entity import UserEntity
+from src.utils.pagination_utils import PaginationUtils
+from src.utils.sql_utils import SQLUtils
 
 
-class UserPostgresAdapter(SQLAlchemyFilterMixin):
+class UserPostgresAdapter(SQLAlchemyFilterMixin, SQLAlchemyPaginationMixin, SQLAlchemySortMixin):
     def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
         self._adapter: AsyncSQLAlchemyPort = adapter
 
@@ -66,24 +74,24 @@ class UserPostgresAdapter(SQLAlchemyFilterMixin):
             raise NotFoundError(resource_type=UserEntity.__name__)
         return GetUserFullByUUIDResponseDTO.model_validate(obj=user)
 
+    async def get_user_principal(self, input_dto: GetUserPrincipalQueryDTO) -> GetUserPrincipalResponseDTO:
+        select_query = select(UserEntity.user_uuid, UserEntity.is_active, UserEntity.is_super_user).where(
+            UserEntity.user_uuid == input_dto.user_uuid,
+        )
+        result = await self._adapter.execute(statement=select_query)
+        row = result.first()
+        if not row:
+            raise NotFoundError(resource_type=UserEntity.__name__)
+        return GetUserPrincipalResponseDTO.model_validate(obj=row)
+
     async def search_users(self, input_dto: SearchUserQueryDTO) -> SearchUserResponseDTO:
         query: Select = select(UserEntity)
 
         if input_dto.first_name:
-            query = self._apply_filter(
-                query=query,
-                field=UserEntity.first_name,
-                value=f"%{input_dto.first_name}%",
-                operation=FilterOperationType.ILIKE,
-            )
+            query = query.where(SQLUtils.contains(UserEntity.first_name, input_dto.first_name))
 
         if input_dto.last_name:
-            query = self._apply_filter(
-                query=query,
-                field=UserEntity.last_name,
-                value=f"%{input_dto.last_name}%",
-                operation=FilterOperationType.ILIKE,
-            )
+            query = query.where(SQLUtils.contains(UserEntity.last_name, input_dto.last_name))
 
         if input_dto.birth_date_range:
             if input_dto.birth_date_range.from_:
@@ -101,14 +109,18 @@ class UserPostgresAdapter(SQLAlchemyFilterMixin):
                     operation=FilterOperationType.LESS_THAN_OR_EQUAL,
                 )
 
-        users, total = await self._adapter.execute_search_query(
+        users, total, total_is_exact = await PaginationUtils.execute_search_query(
+            self._adapter,
             query=query,
-            entity=UserEntity,
-            sort_info=input_dto.sort_info,
+            page_query=self._apply_pagination(
+                self._apply_sorting(UserEntity, query, input_dto.sort_info),
+                input_dto.pagination,
+            ),
             pagination=input_dto.pagination,
+            include_total=input_dto.include_total,
         )
 
-        return SearchUserResponseDTO(users=users, total=total)
+        return SearchUserResponseDTO(users=users, total=total, total_is_exact=total_is_exact)
 
     async def update_user(self, input_dto: UpdateUserCommandDTO) -> None:
         update_data = input_dto.model_dump(exclude={"user_uuid"}, exclude_none=True)
@@ -6,6 +6,8 @@ from src.models.dtos.user.repository.user_repository_interface_dtos import (
     GetUserByEmailResponseDTO,
     GetUserFullByUUIDQueryDTO,
     GetUserFullByUUIDResponseDTO,
+    GetUserPrincipalQueryDTO,
+    GetUserPrincipalResponseDTO,
     GetUserQueryDTO,
     GetUserResponseDTO,
     SearchUserQueryDTO,
@@ -31,6 +33,9 @@ class UserRepository:
     async def get_user_full_by_uuid(self, input_dto: GetUserFullByUUIDQueryDTO) -> GetUserFullByUUIDResponseDTO:
         return await self._postgres_adapter.get_user_full_by_uuid(input_dto=input_dto)
 
+    async def get_user_principal(self, input_dto: GetUserPrincipalQueryDTO) -> GetUserPrincipalResponseDTO:
+        return await self._postgres_adapter.get_user_principal(input_dto=input_dto)
+
     async def search_users(self, input_dto: SearchUserQueryDTO) -> SearchUserResponseDTO:
         return await self._postgres_adapter.search_users(input_dto=input_dto)
 
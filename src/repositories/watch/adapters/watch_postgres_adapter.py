@@ -1,22 +1,24 @@
 # src/repositories/watch/adapters/watch_postgres_adapter.py
+import uuid
+
 from archipy.adapters.base.sqlalchemy.adapters import SQLAlchemyFilterMixin
 from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
 from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
 from archipy.models.errors import AlreadyExistsError, InvalidArgumentError, NotFoundError
-from sqlalchemy import asc, delete, desc, func, select, update as sa_update
-from sqlalchemy.exc import IntegrityError
+from archipy.models.types.sort_order_type import SortOrderType
+from sqlalchemy import asc, delete, desc, exists, select, update as sa_update
 
 from src.models.dtos.watch.repository.watch_repository_interface_dtos import (
-    CheckWatchedQueryDTO,
-    CheckWatchExistsQueryDTO,
     CreateWatchCommandDTO,
     CreateWatchResponseDTO,
     DeleteWatchCommandDTO,
+    DeleteWatchResponseDTO,
     GetMovieWatchersQueryDTO,
     GetMovieWatchersResponseDTO,
     GetUserWatchHistoryQueryDTO,
     GetUserWatchHistoryResponseDTO,
     UpdateWatchStatusCommandDTO,
+    UpdateWatchStatusResponseDTO,
     WatchedMovieItemDTO,
     WatcherUserItemDTO,
 )
@@ -24,39 +26,42 @@ from src.models.entities.movie_entity import MovieEntity
 from src.models.entities.user_entity import UserEntity
 from src.models.entities.user_watch_movie_entity import UserWatchMovieEntity
 from src.models.types.watch_status_type import WatchStatusType
+from src.utils.pagination_utils import PaginationUtils
+from src.utils.sql_utils import SQLUtils
 
 
 class WatchPostgresAdapter(SQLAlchemyFilterMixin):
     def __init__(self, adapter: AsyncPostgresSQLAlchemyAdapter) -> None:
         self._adapter: AsyncSQLAlchemyPort = adapter
 
-    async def check_watch_exists(self, input_dto: CheckWatchExistsQueryDTO) -> bool:
-        select_query = select(UserWatchMovieEntity).where(
-            UserWatchMovieEntity.user_uuid == input_dto.user_uuid,
-            UserWatchMovieEntity.movie_uuid == input_dto.movie_uuid,
-        )
-        result = await self._adapter.execute(statement=select_query)
-        return result.scalar() is not None
-
-    async def check_movie_watched(self, input_dto: CheckWatchedQueryDTO) -> bool:
-        """Return True only when a WATCHED-status record exists for this user+movie pair."""
-        select_query = select(UserWatchMovieEntity).where(
-            UserWatchMovieEntity.user_uuid == input_dto.user_uuid,
-            UserWatchMovieEntity.movie_uuid == input_dto.movie_uuid,
-            UserWatchMovieEntity.status == WatchStatusType.WATCHED.value,
-        )
-        result = await self._adapter.execute(statement=select_query)
-        return result.scalar() is not None
-
     async def create_watch(self, input_dto: CreateWatchCommandDTO) -> CreateWatchResponseDTO:
+        """Insert the watch entry, or raise AlreadyExistsError if the user already has one for the movie.
+
+        A single INSERT ... ON CONFLICT DO NOTHING RETURNING: the unique (user_uuid, movie_uuid) index
+        settles concurrent requests, and an empty RETURNING means another entry won. Under REPEATABLE READ
+        an entry committed after the snapshot surfaces as a serialization failure instead, which the
+        logic's retry turns into an empty RETURNING on the next attempt.
+        """
         # model_dump() yields the string value for WatchStatusType (it's a str-enum),
         # which matches the VARCHAR column directly.
-        watch: UserWatchMovieEntity = UserWatchMovieEntity(**input_dto.model_dump())
-        try:
-            result = await self._adapter.create(entity=watch)
-            return CreateWatchResponseDTO.model_validate(obj=result)
-        except IntegrityError as exc:
-            raise AlreadyExistsError(resource_type=UserWatchMovieEntity.__name__) from exc
+        insert_query = (
+            SQLUtils.insert(self._adapter, UserWatchMovieEntity)
+            .values(watch_uuid=uuid.uuid4(), is_deleted=False, **input_dto.model_dump())
+            .on_conflict_do_nothing(index_elements=["user_uuid", "movie_uuid"])
+            .returning(
+                UserWatchMovieEntity.watch_uuid,
+                UserWatchMovieEntity.user_uuid,
+                UserWatchMovieEntity.movie_uuid,
+                UserWatchMovieEntity.status,
+                UserWatchMovieEntity.created_at,
+                UserWatchMovieEntity.updated_at,
+            )
+        )
+        result = await self._adapter.execute(statement=insert_query)
+        row = result.first()
+        if row is None:
+            raise AlreadyExistsError(resource_type=UserWatchMovieEntity.__name__)
+        return CreateWatchResponseDTO.model_validate(obj=row)
 
     async def get_user_watch_history(
         self,
@@ -72,18 +77,14 @@ class WatchPostgresAdapter(SQLAlchemyFilterMixin):
         if input_dto.status_filter is not None:
             base_query = base_query.where(UserWatchMovieEntity.status == input_dto.status_filter.value)
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._adapter.execute(statement=count_query)
-        total = count_result.scalar() or 0
-
-        order_fn = desc if input_dto.sort_info.order.value.lower() == "desc" else asc
-        page = input_dto.pagination.page
-        page_size = input_dto.pagination.page_size
-        offset = (page - 1) * page_size
-
-        data_query = base_query.order_by(order_fn(UserWatchMovieEntity.created_at)).limit(page_size).offset(offset)
-        data_result = await self._adapter.execute(statement=data_query)
-        rows = data_result.all()
+        order_fn = desc if input_dto.sort_info.order == SortOrderType.DESCENDING else asc
+        rows, total, total_is_exact = await PaginationUtils.fetch_page(
+            self._adapter,
+            base_query,
+            [order_fn(UserWatchMovieEntity.created_at)],
+            input_dto.pagination,
+            input_dto.include_total,
+        )
 
         watches = [
             WatchedMovieItemDTO(
@@ -98,7 +99,7 @@ class WatchPostgresAdapter(SQLAlchemyFilterMixin):
             for row in rows
         ]
 
-        return GetUserWatchHistoryResponseDTO(watches=watches, total=total)
+        return GetUserWatchHistoryResponseDTO(watches=watches, total=total, total_is_exact=total_is_exact)
 
     async def get_movie_watchers(
         self,
@@ -114,18 +115,14 @@ class WatchPostgresAdapter(SQLAlchemyFilterMixin):
         if input_dto.status_filter is not None:
             base_query = base_query.where(UserWatchMovieEntity.status == input_dto.status_filter.value)
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self._adapter.execute(statement=count_query)
-        total = count_result.scalar() or 0
-
-        order_fn = desc if input_dto.sort_info.order.value.lower() == "descending" else asc
-        page = input_dto.pagination.page
-        page_size = input_dto.pagination.page_size
-        offset = (page - 1) * page_size
-
-        data_query = base_query.order_by(order_fn(UserWatchMovieEntity.created_at)).limit(page_size).offset(offset)
-        data_result = await self._adapter.execute(statement=data_query)
-        rows = data_result.all()
+        order_fn = desc if input_dto.sort_info.order == SortOrderType.DESCENDING else asc
+        rows, total, total_is_exact = await PaginationUtils.fetch_page(
+            self._adapter,
+            base_query,
+            [order_fn(UserWatchMovieEntity.created_at)],
+            input_dto.pagination,
+            input_dto.include_total,
+        )
 
         watchers = [
             WatcherUserItemDTO(
@@ -140,37 +137,64 @@ class WatchPostgresAdapter(SQLAlchemyFilterMixin):
             for row in rows
         ]
 
-        return GetMovieWatchersResponseDTO(watchers=watchers, total=total)
+        return GetMovieWatchersResponseDTO(watchers=watchers, total=total, total_is_exact=total_is_exact)
 
-    async def update_watch_status(self, input_dto: UpdateWatchStatusCommandDTO) -> None:
-        stmt = (
-            sa_update(UserWatchMovieEntity)
+    async def update_watch_status(self, input_dto: UpdateWatchStatusCommandDTO) -> UpdateWatchStatusResponseDTO:
+        # The previous status feeds the movie_stats delta. The locked sub-select reads it in the same statement,
+        # and RETURNING hands it back next to the new one.
+        old = (
+            select(UserWatchMovieEntity.watch_uuid, UserWatchMovieEntity.status)
             .where(UserWatchMovieEntity.watch_uuid == input_dto.watch_uuid)
             .where(UserWatchMovieEntity.user_uuid == input_dto.user_uuid)
+            .with_for_update()
+            .subquery("old")
+        )
+        previous_status = await SQLUtils.previous_value(self._adapter, old.c.status)
+        stmt = (
+            sa_update(UserWatchMovieEntity)
+            .where(UserWatchMovieEntity.watch_uuid == old.c.watch_uuid)
             .values(status=input_dto.status.value)
+            .returning(
+                UserWatchMovieEntity.watch_uuid,
+                UserWatchMovieEntity.user_uuid,
+                UserWatchMovieEntity.movie_uuid,
+                UserWatchMovieEntity.status,
+                previous_status.label("previous_status"),
+                UserWatchMovieEntity.created_at,
+                UserWatchMovieEntity.updated_at,
+            )
         )
         result = await self._adapter.execute(statement=stmt)
-        if result.rowcount == 0:
+        row = result.first()
+        if row is None:
             raise NotFoundError(resource_type=UserWatchMovieEntity.__name__)
-
-    async def delete_watch(self, input_dto: DeleteWatchCommandDTO) -> None:
-        # Fetch first to distinguish "not found" from "wrong status".
-        select_query = select(UserWatchMovieEntity).where(
-            UserWatchMovieEntity.user_uuid == input_dto.user_uuid,
-            UserWatchMovieEntity.movie_uuid == input_dto.movie_uuid,
+        return UpdateWatchStatusResponseDTO.model_validate(obj=row)
+
+    async def delete_watch(self, input_dto: DeleteWatchCommandDTO) -> DeleteWatchResponseDTO:
+        # Guard: deletion is only permitted while the entry is still "want_to_watch". The guard is part of
+        # the DELETE, so the status cannot change between the check and the delete.
+        delete_query = (
+            delete(UserWatchMovieEntity)
+            .where(
+                UserWatchMovieEntity.user_uuid == input_dto.user_uuid,
+                UserWatchMovieEntity.movie_uuid == input_dto.movie_uuid,
+                UserWatchMovieEntity.status == WatchStatusType.WANT_TO_WATCH.value,
+            )
+            .returning(UserWatchMovieEntity.watch_uuid)
         )
-        fetch_result = await self._adapter.execute(statement=select_query)
-        watch = fetch_result.scalar()
-
-        if watch is None:
-            raise NotFoundError(resource_type=UserWatchMovieEntity.__name__)
-
-        # Guard: deletion is only permitted while the entry is still "want_to_watch".
-        if watch.status != WatchStatusType.WANT_TO_WATCH.value:
-            raise InvalidArgumentError()
-
-        delete_query = delete(UserWatchMovieEntity).where(
-            UserWatchMovieEntity.user_uuid == input_dto.user_uuid,
-            UserWatchMovieEntity.movie_uuid == input_dto.movie_uuid,
+        result = await self._adapter.execute(statement=delete_query)
+        row = result.first()
+        if row is not None:
+            return DeleteWatchResponseDTO.model_validate(obj=row)
+
+        # Nothing deleted: only now look the entry up, to tell "not found" from "wrong status".
+        exists_query = select(
+            exists().where(
+                UserWatchMovieEntity.user_uuid == input_dto.user_uuid,
+                UserWatchMovieEntity.movie_uuid == input_dto.movie_uuid,
+            ),
         )
-        await self._adapter.execute(statement=delete_query)
+        exists_result = await self._adapter.execute(statement=exists_query)
+        if not exists_result.scalar():
+            raise NotFoundError(resource_type=UserWatchMovieEntity.__name__)
+        raise InvalidArgumentError()
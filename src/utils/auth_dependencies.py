@@ -6,26 +6,42 @@ from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.configs.containers import ServiceContainer
+from src.configs.runtime_config import RuntimeConfig
 from src.logics.auth.auth_logic import AuthLogic
 from src.utils.jwt_utils import JWTUtils
 
 _http_bearer = HTTPBearer(auto_error=False)
 
 
-async def get_current_user_uuid(
+async def get_current_access_payload(
     credentials: HTTPAuthorizationCredentials | None = Depends(_http_bearer),
-) -> UUID:
+) -> dict:
     if credentials is None:
         raise UnauthenticatedError()
-    return JWTUtils.get_user_uuid_from_token(credentials.credentials, expected_type="access")
+    return JWTUtils.get_payload_from_token(credentials.credentials, expected_type="access")
+
+
+async def get_current_user_uuid(
+    payload: dict = Depends(get_current_access_payload),
+) -> UUID:
+    return JWTUtils.get_user_uuid_from_payload(payload)
 
 
 @inject
 async def get_current_admin_user_uuid(
-    current_user_uuid: UUID = Depends(get_current_user_uuid),
+    payload: dict = Depends(get_current_access_payload),
     auth_logic: AuthLogic = Depends(Provide[ServiceContainer.auth_logic]),
 ) -> UUID:
-    user = await auth_logic.get_me(user_uuid=current_user_uuid)
-    if not user.is_super_user:
+    current_user_uuid = JWTUtils.get_user_uuid_from_payload(payload)
+    # Deactivation must apply at once, so the (cached) principal is read even when the role claim is trusted.
+    principal = await auth_logic.get_principal(user_uuid=current_user_uuid)
+    if not principal.is_active:
+        raise UnauthenticatedError()
+    is_super_user = None
+    if RuntimeConfig.global_config().PRINCIPAL.TRUST_ROLE_CLAIM:
+        is_super_user = JWTUtils.get_super_user_claim(payload)
+    if is_super_user is None:
+        is_super_user = principal.is_super_user
+    if not is_super_user:
         raise PermissionDeniedError()
     return current_user_uuid
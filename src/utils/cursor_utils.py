@@ -0,0 +1,44 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from archipy.models.dtos.sort_dto import SortDTO
+from archipy.models.errors import InvalidArgumentError
+
+
+class CursorUtils:
+    """Opaque keyset-pagination cursors.
+
+    A cursor records the sort the page was produced with plus the ``(sort value, uuid)`` of its last row,
+    so the next page can resume with ``WHERE (column, uuid) > (value, uuid)`` instead of an OFFSET scan.
+    """
+
+    @staticmethod
+    def encode(sort_info: SortDTO, value: str | datetime, item_uuid: UUID) -> str:
+        payload = {
+            "c": _enum_value(sort_info.column),
+            "o": _enum_value(sort_info.order),
+            "v": value.isoformat() if isinstance(value, datetime) else value,
+            "dt": isinstance(value, datetime),
+            "id": str(item_uuid),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @staticmethod
+    def decode(cursor: str, sort_info: SortDTO) -> tuple[str | datetime, UUID]:
+        """Return the ``(sort value, uuid)`` stored in ``cursor``; it must have been issued for ``sort_info``."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if payload["c"] != _enum_value(sort_info.column) or payload["o"] != _enum_value(sort_info.order):
+                raise InvalidArgumentError(argument_name="cursor")
+            value = datetime.fromisoformat(payload["v"]) if payload["dt"] else payload["v"]
+            return value, UUID(payload["id"])
+        except (ValueError, TypeError, KeyError) as exc:
+            raise InvalidArgumentError(argument_name="cursor") from exc
+
+
+def _enum_value(value: Enum | str) -> str:
+    return value.value if isinstance(value, Enum) else value
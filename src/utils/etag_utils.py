@@ -0,0 +1,43 @@
+import hashlib
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+class ETagUtils:
+    """Strong entity tags and ``If-None-Match`` handling for conditional GETs.
+
+    A tag is a digest of what decides the response: the DTO itself for a single resource, or the request
+    parameters and the version of the collections shown for a list. Responses carrying one are marked
+    ``no-cache``, so clients revalidate on every read and a 304 is never served from a stale copy.
+    """
+
+    @staticmethod
+    def of(*parts: BaseModel | str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update((part.model_dump_json() if isinstance(part, BaseModel) else part).encode())
+            # Keeps ("ab", "c") and ("a", "bc") apart.
+            digest.update(b"\0")
+        return f'"{digest.hexdigest()}"'
+
+    @staticmethod
+    def matches(if_none_match: str | None, etag: str) -> bool:
+        # If-None-Match is compared weakly (RFC 9110, 13.1.2), so W/ is ignored.
+        if if_none_match is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+    @staticmethod
+    def set_headers(response: Response, etag: str) -> None:
+        response.headers["ETag"] = etag
+        # Only authenticated clients may read these responses, so shared caches must not keep them.
+        response.headers["Cache-Control"] = "private, no-cache"
+
+    @staticmethod
+    def not_modified(etag: str) -> Response:
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        ETagUtils.set_headers(response, etag)
+        return response
@@ -0,0 +1,123 @@
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ImportRecordDTO(BaseModel):
+    line: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class ImportUtils:
+    """Incremental parsers for uploaded catalog files.
+
+    Only the current line (bounded by ``max_line_bytes``) is ever buffered, so memory use does not grow
+    with the size of the upload. Lines that cannot be parsed are yielded as records carrying ``error``
+    instead of aborting the whole import.
+    """
+
+    @staticmethod
+    async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes | None]:
+        """Split a byte stream into lines, yielding ``None`` for lines longer than ``max_line_bytes``."""
+        buffer = bytearray()
+        overflow = False
+        async for chunk in chunks:
+            start = 0
+            while True:
+                end = chunk.find(b"\n", start)
+                if end == -1:
+                    if not overflow:
+                        buffer += chunk[start:]
+                        if len(buffer) > max_line_bytes:
+                            overflow = True
+                            buffer.clear()
+                    break
+                if not overflow:
+                    buffer += chunk[start:end]
+                yield None if overflow or len(buffer) > max_line_bytes else bytes(buffer)
+                buffer.clear()
+                overflow = False
+                start = end + 1
+        if overflow:
+            yield None
+        elif buffer:
+            yield bytes(buffer)
+
+    @staticmethod
+    async def iter_ndjson_records(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[ImportRecordDTO]:
+        line_number = 0
+        async for raw_line in ImportUtils.iter_lines(chunks, max_line_bytes):
+            line_number += 1
+            if raw_line is None:
+                yield ImportRecordDTO(line=line_number, error=f"line exceeds {max_line_bytes} bytes")
+                continue
+            if not raw_line.strip():
+                continue
+            try:
+                data = json.loads(raw_line)
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                yield ImportRecordDTO(line=line_number, error=f"invalid JSON: {exc}")
+                continue
+            if not isinstance(data, dict):
+                yield ImportRecordDTO(line=line_number, error="expected a JSON object")
+                continue
+            yield ImportRecordDTO(line=line_number, data=data)
+
+    @staticmethod
+    async def iter_csv_records(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[ImportRecordDTO]:
+        """Parse CSV with a header row; quoted fields may span several lines."""
+        header: list[str] | None = None
+        line_number = 0
+        record_line = 0
+        pending = ""
+        async for raw_line in ImportUtils.iter_lines(chunks, max_line_bytes):
+            line_number += 1
+            if raw_line is None:
+                pending = ""
+                yield ImportRecordDTO(line=line_number, error=f"line exceeds {max_line_bytes} bytes")
+                continue
+            try:
+                text = raw_line.decode("utf-8-sig" if line_number == 1 else "utf-8")
+            except UnicodeDecodeError as exc:
+                pending = ""
+                yield ImportRecordDTO(line=line_number, error=f"invalid UTF-8: {exc}")
+                continue
+            if not pending:
+                if not text.strip():
+                    continue
+                record_line = line_number
+            pending += text + "\n"
+            # An odd number of quotes means a quoted field continues on the next line.
+            if pending.count('"') % 2:
+                if len(pending) > max_line_bytes:
+                    pending = ""
+                    yield ImportRecordDTO(line=record_line, error=f"record exceeds {max_line_bytes} bytes")
+                continue
+
+            try:
+                values = next(csv.reader([pending.rstrip("\r\n")]))
+            except csv.Error as exc:
+                yield ImportRecordDTO(line=record_line, error=f"invalid CSV: {exc}")
+                continue
+            finally:
+                pending = ""
+
+            if header is None:
+                header = [column.strip() for column in values]
+                continue
+            if len(values) != len(header):
+                yield ImportRecordDTO(
+                    line=record_line,
+                    error=f"expected {len(header)} columns, got {len(values)}",
+                )
+                continue
+            yield ImportRecordDTO(
+                line=record_line,
+                data={column: value or None for column, value in zip(header, values, strict=True)},
+            )
+        if pending:
+            yield ImportRecordDTO(line=record_line, error="unterminated quoted field")
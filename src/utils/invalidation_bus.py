@@ -0,0 +1,293 @@
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterable
+from uuid import UUID, uuid4
+
+import asyncpg
+from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter
+from archipy.configs.config_template import PostgresSQLAlchemyConfig
+from pydantic import BaseModel
+from sqlalchemy import func, select
+
+from src.configs.runtime_config import InvalidationConfig, RuntimeConfig
+from src.models.types.entity_type import EntityType
+
+logger = logging.getLogger(__name__)
+
+# Postgres caps a notification payload at 8000 bytes; this many UUIDs keep an event well below it.
+_MAX_UUIDS_PER_EVENT = 100
+# Most recent propagation lags kept for the percentiles in stats().
+_LAG_SAMPLES = 1_024
+_MAX_RECONNECT_DELAY_SECONDS = 30.0
+# What connecting or listening raises when the database is unreachable, restarts or stops answering.
+_CONNECTION_ERRORS = (OSError, TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError)
+
+
+class EntityChangedEventDTO(BaseModel):
+    entity_type: EntityType
+    # None when any row may have changed, e.g. after events were missed while the listener was reconnecting.
+    entity_uuids: list[UUID] | None
+    # Other entities whose views include the changed rows, such as the movie and user of a watch entry.
+    related_uuids: list[UUID] = []
+    origin: str
+    # Unix time on the publishing worker.
+    published_at: float
+
+
+class InvalidationBusStatsDTO(BaseModel):
+    origin: str
+    is_listening: bool
+    published: int
+    received: int
+    own_events: int
+    handler_failures: int
+    reconnects: int
+    lag_samples: int
+    lag_p50_seconds: float | None
+    lag_p99_seconds: float | None
+    lag_max_seconds: float | None
+
+
+EntityChangedHandler = Callable[[EntityChangedEventDTO], Awaitable[None]]
+
+
+class InvalidationBus(ABC):
+    """Publishes entity changes to every worker and runs the handlers each worker subscribed to them.
+
+    A worker applies its own writes to its caches as soon as they commit, so the events it published itself
+    come back too but are only counted. Every received event records its propagation lag: the time from
+    ``publish`` to its arrival, measured on the two workers' clocks. Handlers run one at a time, in the order
+    the events arrive, so each should only evict or queue its work and return.
+    """
+
+    def __init__(self) -> None:
+        self._origin = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._handlers: defaultdict[EntityType, list[EntityChangedHandler]] = defaultdict(list)
+        self._published = 0
+        self._received = 0
+        self._own_events = 0
+        self._handler_failures = 0
+        self._reconnects = 0
+        self._lags: deque[float] = deque(maxlen=_LAG_SAMPLES)
+
+    def subscribe(self, entity_type: EntityType, handler: EntityChangedHandler) -> None:
+        self._handlers[entity_type].append(handler)
+
+    async def publish(
+        self,
+        entity_type: EntityType,
+        entity_uuids: Iterable[UUID],
+        related_uuids: Iterable[UUID] = (),
+    ) -> None:
+        """Announce changed rows; call it inside the transaction that changes them."""
+        entity_uuids = list(dict.fromkeys(entity_uuids))
+        related_uuids = list(dict.fromkeys(related_uuids))
+        for start in range(0, max(len(entity_uuids), 1), _MAX_UUIDS_PER_EVENT):
+            event = EntityChangedEventDTO(
+                entity_type=entity_type,
+                entity_uuids=entity_uuids[start : start + _MAX_UUIDS_PER_EVENT],
+                related_uuids=related_uuids,
+                origin=self._origin,
+                published_at=time.time(),
+            )
+            await self._send(event)
+            self._published += 1
+
+    async def receive(self, event: EntityChangedEventDTO) -> None:
+        self._received += 1
+        if event.entity_uuids is not None:
+            # Events standing in for missed ones were not published by anyone.
+            self._lags.append(max(time.time() - event.published_at, 0.0))
+        if event.origin == self._origin:
+            self._own_events += 1
+            return
+        for handler in self._handlers.get(event.entity_type, []):
+            try:
+                await handler(event)
+            except Exception:
+                self._handler_failures += 1
+                logger.exception("Handling a %s change event failed", event.entity_type.value)
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start receiving events published by other processes."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop receiving events published by other processes."""
+
+    def stats(self) -> InvalidationBusStatsDTO:
+        lags = sorted(self._lags)
+        return InvalidationBusStatsDTO(
+            origin=self._origin,
+            is_listening=self._is_listening(),
+            published=self._published,
+            received=self._received,
+            own_events=self._own_events,
+            handler_failures=self._handler_failures,
+            reconnects=self._reconnects,
+            lag_samples=len(lags),
+            lag_p50_seconds=lags[len(lags) // 2] if lags else None,
+            lag_p99_seconds=lags[min(len(lags) - 1, len(lags) * 99 // 100)] if lags else None,
+            lag_max_seconds=lags[-1] if lags else None,
+        )
+
+    @abstractmethod
+    async def _send(self, event: EntityChangedEventDTO) -> None:
+        """Deliver the event to every worker, this one included."""
+
+    @abstractmethod
+    def _is_listening(self) -> bool:
+        """Whether events published by other processes are being received."""
+
+
+class InMemoryInvalidationBus(InvalidationBus):
+    """Delivers every event at once to each bus joined to it in this process; stands in for Postgres in tests.
+
+    ``join`` returns a bus for another simulated worker. Delivery ignores transactions.
+    """
+
+    def __init__(self, peers: list["InMemoryInvalidationBus"] | None = None) -> None:
+        super().__init__()
+        self._peers = peers if peers is not None else []
+        self._peers.append(self)
+
+    def join(self) -> "InMemoryInvalidationBus":
+        return InMemoryInvalidationBus(peers=self._peers)
+
+    def leave(self) -> None:
+        self._peers.remove(self)
+
+    def start(self) -> None:
+        # Peers receive from the moment they join, and nothing runs in the background.
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def _send(self, event: EntityChangedEventDTO) -> None:
+        for peer in list(self._peers):
+            await peer.receive(event)
+
+    def _is_listening(self) -> bool:
+        return self in self._peers
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """Publishes through ``pg_notify`` in the writer's transaction and listens on a connection of its own.
+
+    Postgres delivers a notification only when the transaction that sent it commits, and drops it on rollback,
+    so no worker evicts for a write that never happened. The listener reconnects with backoff when its connection
+    is lost; events may have been missed meanwhile, so every subscribed entity type is then handled as if any of
+    its rows had changed.
+    """
+
+    def __init__(
+        self,
+        adapter: AsyncPostgresSQLAlchemyAdapter,
+        config: InvalidationConfig | None = None,
+        postgres_config: PostgresSQLAlchemyConfig | None = None,
+    ) -> None:
+        super().__init__()
+        self._adapter = adapter
+        self._config: InvalidationConfig = config or RuntimeConfig.global_config().INVALIDATION
+        self._postgres_config = postgres_config or RuntimeConfig.global_config().POSTGRES_SQLALCHEMY
+        self._queue: asyncio.Queue[EntityChangedEventDTO] = asyncio.Queue()
+        self._connection: asyncpg.Connection | None = None
+        self._listener: asyncio.Task[None] | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._dispatcher = asyncio.create_task(self._dispatch_forever(), name="invalidation-dispatch")
+            self._listener = asyncio.create_task(self._listen_forever(), name="invalidation-listen")
+
+    async def stop(self) -> None:
+        for task in (self._listener, self._dispatcher):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._listener = None
+        self._dispatcher = None
+
+    async def _send(self, event: EntityChangedEventDTO) -> None:
+        await self._adapter.execute(statement=select(func.pg_notify(self._config.CHANNEL, event.model_dump_json())))
+
+    def _is_listening(self) -> bool:
+        return self._connection is not None
+
+    async def _dispatch_forever(self) -> None:
+        # One consumer, so events are handled in the order they were committed.
+        while True:
+            event = await self._queue.get()
+            await self.receive(event)
+
+    async def _listen_forever(self) -> None:
+        delay = self._config.RECONNECT_DELAY_SECONDS
+        connected_before = False
+        while True:
+            try:
+                connection = await self._connect()
+            except _CONNECTION_ERRORS:
+                logger.warning("Invalidation listener could not connect; retrying in %.1fs", delay, exc_info=True)
+            else:
+                delay = self._config.RECONNECT_DELAY_SECONDS
+                try:
+                    await self._listen(connection, missed_events=connected_before)
+                except _CONNECTION_ERRORS:
+                    logger.warning("Invalidation listener lost its connection; reconnecting in %.1fs", delay)
+                finally:
+                    self._connection = None
+                    with contextlib.suppress(Exception):
+                        await connection.close(timeout=delay)
+                connected_before = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RECONNECT_DELAY_SECONDS)
+
+    async def _connect(self) -> asyncpg.Connection:
+        config = self._postgres_config
+        return await asyncpg.connect(
+            host=config.HOST,
+            port=config.PORT,
+            user=config.USERNAME,
+            password=config.PASSWORD,
+            database=config.DATABASE,
+        )
+
+    async def _listen(self, connection: asyncpg.Connection, *, missed_events: bool) -> None:
+        """Receive notifications until the connection is lost or stops answering."""
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _connection: lost.set())
+        await connection.add_listener(self._config.CHANNEL, self._on_notification)
+        self._connection = connection
+        if missed_events:
+            self._reconnects += 1
+            for entity_type in list(self._handlers):
+                event = EntityChangedEventDTO(entity_type=entity_type, entity_uuids=None, origin="", published_at=0.0)
+                self._queue.put_nowait(event)
+        logger.info("Listening for entity changes on channel %s", self._config.CHANNEL)
+
+        interval = self._config.HEALTH_CHECK_INTERVAL_SECONDS
+        while True:
+            try:
+                await asyncio.wait_for(lost.wait(), timeout=interval)
+            except TimeoutError:
+                await asyncio.wait_for(connection.fetchval("SELECT 1"), timeout=interval)
+            else:
+                message = "Invalidation listener connection closed"
+                raise ConnectionError(message)
+
+    def _on_notification(self, _connection: asyncpg.Connection, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            event = EntityChangedEventDTO.model_validate_json(payload)
+        except ValueError:
+            logger.warning("Ignoring a malformed entity change event: %.200s", payload)
+            return
+        self._queue.put_nowait(event)
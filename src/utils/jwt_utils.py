@@ -5,11 +5,21 @@ from archipy.models.errors import InvalidTokenError, UnauthenticatedError
 from jose import JWTError, jwt
 
 from src.configs.runtime_config import RuntimeConfig
+from src.utils.token_cache import DecodedTokenCache
 
 
 class JWTUtils:
+    _token_cache: DecodedTokenCache | None = None
+
+    @classmethod
+    def token_cache(cls) -> DecodedTokenCache:
+        if cls._token_cache is None:
+            config = RuntimeConfig.global_config().TOKEN_CACHE
+            cls._token_cache = DecodedTokenCache(max_size=config.MAX_SIZE, is_enabled=config.IS_ENABLED)
+        return cls._token_cache
+
     @staticmethod
-    def create_access_token(user_uuid: UUID) -> str:
+    def create_access_token(user_uuid: UUID, is_super_user: bool | None = None) -> str:
         config = RuntimeConfig.global_config()
         iat = datetime.now(UTC)
         payload = {
@@ -18,6 +28,8 @@ class JWTUtils:
             "iat": iat,
             "exp": iat + timedelta(minutes=15),
         }
+        if is_super_user is not None:
+            payload["is_super_user"] = is_super_user
         return jwt.encode(payload, config.AUTH.SECRET_KEY.get_secret_value(), algorithm=config.AUTH.HASH_ALGORITHM)
 
     @staticmethod
@@ -34,19 +46,42 @@ class JWTUtils:
 
     @staticmethod
     def decode_token(token: str) -> dict:
+        token_cache = JWTUtils.token_cache()
+        cached_claims = token_cache.get(token)
+        if cached_claims is not None:
+            return cached_claims
         config = RuntimeConfig.global_config()
         try:
-            return jwt.decode(token, config.AUTH.SECRET_KEY.get_secret_value(), algorithms=[config.AUTH.HASH_ALGORITHM])
+            claims = jwt.decode(
+                token,
+                config.AUTH.SECRET_KEY.get_secret_value(),
+                algorithms=[config.AUTH.HASH_ALGORITHM],
+            )
         except JWTError as exc:
             raise InvalidTokenError() from exc
+        token_cache.put(token, claims)
+        return claims
 
     @staticmethod
-    def get_user_uuid_from_token(token: str, expected_type: str) -> UUID:
+    def get_payload_from_token(token: str, expected_type: str) -> dict:
         payload = JWTUtils.decode_token(token)
-        print("asdafsdkjfnaskfdn")
         if payload.get("type") != expected_type:
             raise InvalidTokenError()
+        return payload
+
+    @staticmethod
+    def get_user_uuid_from_token(token: str, expected_type: str) -> UUID:
+        payload = JWTUtils.get_payload_from_token(token, expected_type=expected_type)
+        return JWTUtils.get_user_uuid_from_payload(payload)
+
+    @staticmethod
+    def get_user_uuid_from_payload(payload: dict) -> UUID:
         sub = payload.get("sub")
         if not sub:
             raise InvalidTokenError()
         return UUID(sub)
+
+    @staticmethod
+    def get_super_user_claim(payload: dict) -> bool | None:
+        is_super_user = payload.get("is_super_user")
+        return is_super_user if isinstance(is_super_user, bool) else None
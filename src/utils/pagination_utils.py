@@ -0,0 +1,149 @@
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
+from archipy.models.dtos.pagination_dto import PaginationDTO
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, ColumnElement, Select
+
+from src.configs.runtime_config import RuntimeConfig
+from src.models.types.total_mode_type import TotalModeType
+from src.utils.sql_utils import SQLUtils
+
+_TOTAL_COLUMN = "total_count"
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a query, compiled with the query's own bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, query: Select) -> None:
+        self.query = query
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element: _ExplainJSON, compiler: SQLCompiler, **kw: object) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.query, **kw)}"
+
+
+class PaginationUtils:
+    @staticmethod
+    async def execute_search_query(
+        adapter: AsyncSQLAlchemyPort,
+        query: Select,
+        page_query: Select,
+        pagination: PaginationDTO,
+        include_total: TotalModeType,
+    ) -> tuple[list[Any], int | None, bool]:
+        """Like ``AsyncSQLAlchemyPort.execute_search_query``, but the total follows ``include_total``.
+
+        ``page_query`` is ``query`` sorted and paginated by the calling adapter's mixins.
+        """
+        result = await adapter.execute(statement=page_query)
+        rows = list(result.scalars().all())
+        total, total_is_exact = await PaginationUtils.resolve_total(
+            adapter,
+            query,
+            pagination,
+            page_length=len(rows),
+            include_total=include_total,
+        )
+        return rows, total, total_is_exact
+
+    @staticmethod
+    async def fetch_page(
+        adapter: AsyncSQLAlchemyPort,
+        query: Select,
+        order_by: Sequence[ColumnElement],
+        pagination: PaginationDTO,
+        include_total: TotalModeType,
+    ) -> tuple[list[Row], int | None, bool]:
+        """Fetch one page of ``query`` and its total in a single round trip.
+
+        In exact mode every row carries ``COUNT(*) OVER()``; the total is only counted separately for an
+        empty page past the first one, where there is no row to carry it.
+        """
+        page_query = query.order_by(*order_by).limit(pagination.page_size).offset(pagination.offset)
+        if include_total == TotalModeType.EXACT:
+            page_query = page_query.add_columns(func.count().over().label(_TOTAL_COLUMN))
+        result = await adapter.execute(statement=page_query)
+        rows = list(result.all())
+        if rows and include_total == TotalModeType.EXACT:
+            return rows, getattr(rows[0], _TOTAL_COLUMN), True
+        total, total_is_exact = await PaginationUtils.resolve_total(
+            adapter,
+            query,
+            pagination,
+            page_length=len(rows),
+            include_total=include_total,
+        )
+        return rows, total, total_is_exact
+
+    @staticmethod
+    async def resolve_total(
+        adapter: AsyncSQLAlchemyPort,
+        query: Select,
+        pagination: PaginationDTO,
+        page_length: int,
+        include_total: TotalModeType,
+    ) -> tuple[int | None, bool]:
+        """Return ``(total, total_is_exact)`` for a page of ``page_length`` rows fetched from ``query``.
+
+        Call it after fetching the page: a page shorter than ``page_size`` ends the result set, so its
+        position already is the exact total and no count query is issued.
+        """
+        if include_total == TotalModeType.NONE:
+            return None, False
+        offset = pagination.offset
+        if page_length < pagination.page_size and (page_length or not offset):
+            return offset + page_length, True
+
+        query = query.order_by(None)
+        if include_total == TotalModeType.EXACT:
+            result = await adapter.execute(statement=select(func.count()).select_from(query.subquery()))
+            return result.scalar_one(), True
+
+        cap = RuntimeConfig.global_config().PAGINATION.ESTIMATED_TOTAL_CAP
+        capped_query = select(func.count()).select_from(query.limit(cap + 1).subquery())
+        counted = (await adapter.execute(statement=capped_query)).scalar_one()
+        if counted <= cap:
+            return counted, True
+        if SQLUtils.dialect_name(adapter) != "postgresql":
+            return counted, False
+        return max(await PaginationUtils._planner_rows(adapter, query), counted), False
+
+    @staticmethod
+    def resolve_counted_total(
+        total: int,
+        pagination: PaginationDTO,
+        page_length: int,
+        include_total: TotalModeType,
+    ) -> tuple[int | None, bool]:
+        """``resolve_total`` for a result already counted in memory, so both report the same totals.
+
+        An estimate is capped as without a query planner: past ``ESTIMATED_TOTAL_CAP`` it is ``cap + 1``.
+        """
+        if include_total == TotalModeType.NONE:
+            return None, False
+        offset = pagination.offset
+        if page_length < pagination.page_size and (page_length or not offset):
+            return offset + page_length, True
+        if include_total == TotalModeType.EXACT:
+            return total, True
+        cap = RuntimeConfig.global_config().PAGINATION.ESTIMATED_TOTAL_CAP
+        if total <= cap:
+            return total, True
+        return cap + 1, False
+
+    @staticmethod
+    async def _planner_rows(adapter: AsyncSQLAlchemyPort, query: Select) -> int:
+        result = await adapter.execute(statement=_ExplainJSON(query))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
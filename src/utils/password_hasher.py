@@ -0,0 +1,123 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from typing import ParamSpec, TypeVar
+
+from archipy.models.errors import ResourceExhaustedError
+from pydantic import BaseModel
+
+from src.configs.runtime_config import PasswordHasherConfig, RuntimeConfig
+from src.utils.security_utils import SecurityUtils
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class PasswordHasherStatsDTO(BaseModel):
+    executor_type: str
+    max_workers: int
+    max_queue_depth: int
+    in_flight: int
+    submitted: int
+    completed: int
+    failed: int
+    rejected: int
+    total_seconds: float
+    max_seconds: float
+
+
+class PasswordHasher:
+    """Async facade over ``SecurityUtils`` that runs bcrypt on a bounded worker pool.
+
+    Jobs are counted as in flight from submission until the worker finishes them, so a
+    cancelled request still holds its slot until bcrypt returns. Once ``MAX_QUEUE_DEPTH``
+    jobs are in flight, new calls fail fast with ``ResourceExhaustedError`` instead of
+    piling up behind the pool.
+    """
+
+    def __init__(self, config: PasswordHasherConfig | None = None) -> None:
+        self._config: PasswordHasherConfig = config or RuntimeConfig.global_config().PASSWORD_HASHER
+        self._executor: Executor | None = None
+        self._lock = Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(SecurityUtils.get_password_hash, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(SecurityUtils.verify_password, plain_password, hashed_password)
+
+    def stats(self) -> PasswordHasherStatsDTO:
+        with self._lock:
+            return PasswordHasherStatsDTO(
+                executor_type=self._config.EXECUTOR_TYPE,
+                max_workers=self._config.MAX_WORKERS,
+                max_queue_depth=self._config.MAX_QUEUE_DEPTH,
+                in_flight=self._in_flight,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                rejected=self._rejected,
+                total_seconds=self._total_seconds,
+                max_seconds=self._max_seconds,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    async def _run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        with self._lock:
+            if self._in_flight >= self._config.MAX_QUEUE_DEPTH:
+                self._rejected += 1
+                raise ResourceExhaustedError(resource_type=PasswordHasher.__name__)
+            self._in_flight += 1
+            self._submitted += 1
+
+        started_at = time.perf_counter()
+        try:
+            future = self._get_executor().submit(func, *args, **kwargs)
+        except BaseException:
+            self._release(started_at=started_at, failed=True)
+            raise
+        future.add_done_callback(
+            lambda done: self._release(started_at=started_at, failed=_has_failed(done)),
+        )
+        return await asyncio.wrap_future(future)
+
+    def _release(self, *, started_at: float, failed: bool) -> None:
+        elapsed = time.perf_counter() - started_at
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            self._total_seconds += elapsed
+            self._max_seconds = max(self._max_seconds, elapsed)
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self._config.EXECUTOR_TYPE == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self._config.MAX_WORKERS)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._config.MAX_WORKERS,
+                        thread_name_prefix="password-hasher",
+                    )
+            return self._executor
+
+
+def _has_failed(future: Future) -> bool:
+    return future.cancelled() or future.exception() is not None
@@ -0,0 +1,78 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTaskStatsDTO(BaseModel):
+    name: str
+    interval_seconds: float
+    is_running: bool
+    runs: int
+    failures: int
+    last_started_at: datetime | None
+    last_duration_seconds: float | None
+
+
+class PeriodicTask:
+    """Runs ``callback`` on the event loop every ``interval_seconds`` between ``start`` and ``stop``.
+
+    The first run happens right away. A failed run is logged and counted, and the schedule carries on.
+    """
+
+    def __init__(self, name: str, callback: Callable[[], Awaitable[Any]], interval_seconds: float) -> None:
+        self._name = name
+        self._callback = callback
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._runs = 0
+        self._failures = 0
+        self._last_started_at: datetime | None = None
+        self._last_duration_seconds: float | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever(), name=self._name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> None:
+        self._runs += 1
+        self._last_started_at = datetime.now(UTC)
+        started = time.monotonic()
+        try:
+            await self._callback()
+        except Exception:
+            self._failures += 1
+            logger.exception("Periodic task %s failed", self._name)
+        finally:
+            self._last_duration_seconds = time.monotonic() - started
+
+    def stats(self) -> PeriodicTaskStatsDTO:
+        return PeriodicTaskStatsDTO(
+            name=self._name,
+            interval_seconds=self._interval_seconds,
+            is_running=self._task is not None,
+            runs=self._runs,
+            failures=self._failures,
+            last_started_at=self._last_started_at,
+            last_duration_seconds=self._last_duration_seconds,
+        )
+
+    async def _run_forever(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self._interval_seconds)
@@ -0,0 +1,13 @@
+from uuid import UUID
+
+from src.configs.runtime_config import PrincipalConfig, RuntimeConfig
+from src.models.dtos.auth.domain.v1.auth_domain_interface_dtos import UserPrincipalOutputDTOV1
+from src.utils.ttl_cache import TTLCache
+
+
+class PrincipalCache(TTLCache[UUID, UserPrincipalOutputDTOV1]):
+    """Per-process cache of the role/active flags the authorization guards need."""
+
+    def __init__(self, config: PrincipalConfig | None = None) -> None:
+        config = config or RuntimeConfig.global_config().PRINCIPAL
+        super().__init__(max_size=config.CACHE_MAX_SIZE, ttl_seconds=config.CACHE_TTL_SECONDS)
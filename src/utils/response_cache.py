@@ -0,0 +1,367 @@
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import NamedTuple, TypeVar
+from uuid import UUID, uuid4
+
+from archipy.adapters.redis.ports import AsyncRedisPort
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from src.configs.runtime_config import ResponseCacheConfig, RuntimeConfig
+from src.models.types.entity_type import EntityType
+from src.utils.invalidation_bus import EntityChangedEventDTO, InvalidationBus
+
+logger = logging.getLogger(__name__)
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+# What a backend that is unreachable or holds a malformed entry raises; ValueError covers JSON and validation errors.
+_BACKEND_ERRORS = (RedisError, OSError, ValueError, KeyError)
+
+# An entry's tags: the UUIDs of the entities it shows, and the entity types whose every row it may show.
+ResponseCacheTag = UUID | EntityType
+
+
+class ResponseCacheRouteStatsDTO(BaseModel):
+    route: str
+    hits: int
+    misses: int
+    hit_ratio: float | None
+    # What the backend holds for the route; None when it cannot tell, as with Redis.
+    entries: int | None
+    bytes: int | None
+
+
+class ResponseCacheStatsDTO(BaseModel):
+    backend: str
+    # Entries removed by invalidation; None when the backend cannot tell.
+    evictions: int | None
+    # Backend calls that failed; the request was served without the cache.
+    errors: int
+    routes: list[ResponseCacheRouteStatsDTO]
+
+
+class ResponseCacheBackend(ABC):
+    """Holds serialized responses under their keys, along with the tags they were stored with."""
+
+    name = ""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """The body stored under the key, unless it expired or was invalidated."""
+
+    @abstractmethod
+    async def set(self, key: str, route: str, body: str, tags: frozenset[str], ttl_seconds: float) -> None:
+        """Store the body under the key for ``ttl_seconds``, tagged for invalidation."""
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> int | None:
+        """Drop every entry carrying any of the tags; returns how many, if known."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry."""
+
+    def usage(self) -> dict[str, tuple[int, int]] | None:
+        """Entries and bytes held per route, if known."""
+        return None
+
+
+class _Entry(NamedTuple):
+    route: str
+    body: str
+    tags: frozenset[str]
+    size: int
+    expires_at: float
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """An LRU of this worker's own, bounded by entry count and by the size of keys and bodies.
+
+    Sizes are counted in characters of the key and the JSON body, close to its bytes for the mostly ASCII
+    responses cached here. Each tag indexes the keys stored with it, so invalidation visits only those.
+    """
+
+    name = "memory"
+
+    def __init__(self, config: ResponseCacheConfig | None = None) -> None:
+        config = config or RuntimeConfig.global_config().RESPONSE_CACHE
+        self._max_entries = config.MAX_ENTRIES
+        self._max_bytes = config.MAX_BYTES
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._entries_by_route: Counter[str] = Counter()
+        self._bytes_by_route: Counter[str] = Counter()
+        self._bytes = 0
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.body
+
+    async def set(self, key: str, route: str, body: str, tags: frozenset[str], ttl_seconds: float) -> None:
+        if key in self._entries:
+            self._remove(key)
+        size = len(key) + len(body)
+        if size > self._max_bytes:
+            return
+        self._entries[key] = _Entry(route, body, tags, size, time.monotonic() + ttl_seconds)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        self._entries_by_route[route] += 1
+        self._bytes_by_route[route] += size
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+                removed += 1
+        return removed
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self._entries_by_route.clear()
+        self._bytes_by_route.clear()
+        self._bytes = 0
+
+    def usage(self) -> dict[str, tuple[int, int]]:
+        return {route: (count, self._bytes_by_route[route]) for route, count in self._entries_by_route.items()}
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
+        self._entries_by_route[entry.route] -= 1
+        self._bytes_by_route[entry.route] -= entry.size
+        self._bytes -= entry.size
+
+
+class RedisResponseCacheBackend(ResponseCacheBackend):
+    """Entries on a Redis server shared by every worker.
+
+    Invalidating a tag stores a fresh token under it, and an entry keeps the tokens its tags had when it was
+    stored; it is served only while they all still match. Invalidation thus writes one key per tag whatever
+    the number of entries, and a token lives as long as any entry could, so nothing outlives the TTL.
+    """
+
+    name = "redis"
+
+    # Carried by every entry, so that clearing is invalidating it.
+    _EVERY_ENTRY_TAG = "*"
+
+    def __init__(self, adapter: AsyncRedisPort, config: ResponseCacheConfig | None = None) -> None:
+        config = config or RuntimeConfig.global_config().RESPONSE_CACHE
+        self._adapter = adapter
+        self._key_prefix = config.REDIS_KEY_PREFIX
+        self._ttl_seconds = math.ceil(config.TTL_SECONDS)
+
+    async def get(self, key: str) -> str | None:
+        raw = await self._adapter.get(self._entry_key(key))
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        tokens = entry["tokens"]
+        if await self._tokens(list(tokens)) != list(tokens.values()):
+            return None
+        return entry["body"]
+
+    async def set(self, key: str, _route: str, body: str, tags: frozenset[str], ttl_seconds: float) -> None:
+        tags = sorted(tags | {self._EVERY_ENTRY_TAG})
+        entry = {"tokens": dict(zip(tags, await self._tokens(tags), strict=True)), "body": body}
+        await self._adapter.set(self._entry_key(key), json.dumps(entry), ex=math.ceil(ttl_seconds))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        await asyncio.gather(
+            *(self._adapter.set(self._tag_key(tag), uuid4().hex, ex=self._ttl_seconds) for tag in tags),
+        )
+
+    async def clear(self) -> None:
+        await self.invalidate({self._EVERY_ENTRY_TAG})
+
+    async def _tokens(self, tags: list[str]) -> list[str | None]:
+        return await self._adapter.mget([self._tag_key(tag) for tag in tags])
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self._key_prefix}entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._key_prefix}tag:{tag}"
+
+
+class ResponseCache:
+    """Caches the responses of read endpoints by route and normalized parameters, evicted by tag.
+
+    An entry is tagged with the UUID of every entity it shows, or with an entity type when any new row of it
+    could show up. Writes on this worker call ``invalidate`` once they commit, and those on other workers arrive
+    as change events; both drop only the entries tagged with a changed entity, its related ones, or its type.
+    A response loaded while this worker committed a write is not stored, since it may predate the write.
+    Backend failures are logged and counted, and the request is served from the database.
+
+    The invalidations also version each entity type, for the validators of lists too costly to cache.
+    """
+
+    def __init__(
+        self,
+        backend: ResponseCacheBackend,
+        invalidation_bus: InvalidationBus,
+        config: ResponseCacheConfig | None = None,
+    ) -> None:
+        self._backend = backend
+        self._config: ResponseCacheConfig = config or RuntimeConfig.global_config().RESPONSE_CACHE
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._evictions = 0
+        self._errors = 0
+        # Bumped by every invalidation, so a load that started before it is not stored.
+        self._generation = 0
+        # Bumped like the generation, per entity type. The epoch keeps a version from matching one of another
+        # worker, or of this one before a restart, that counted other changes.
+        self._epoch = uuid4().hex
+        self._versions: Counter[EntityType] = Counter()
+        # With a shared backend too: an entry another worker stored from a read that raced the write is dropped.
+        for entity_type in EntityType:
+            invalidation_bus.subscribe(entity_type, self._on_entities_changed)
+
+    async def get_or_load(
+        self,
+        route: str,
+        params: BaseModel,
+        output_type: type[OutputT],
+        load: Callable[[], Awaitable[OutputT]],
+        tags: Callable[[OutputT], Iterable[ResponseCacheTag]],
+    ) -> OutputT:
+        """The cached response for ``route`` and ``params``, or ``load()``'s, stored with ``tags(output)``."""
+        if not self._config.IS_ENABLED:
+            return await load()
+        key = self._key(route, params)
+        try:
+            body = await self._backend.get(key)
+            cached = output_type.model_validate_json(body) if body is not None else None
+        except _BACKEND_ERRORS:
+            self._failed(f"Reading {route} from the response cache failed")
+            cached = None
+        if cached is not None:
+            self._hits[route] += 1
+            return cached
+
+        self._misses[route] += 1
+        generation = self._generation
+        output = await load()
+        if generation == self._generation:
+            entry_tags = frozenset(tag.value if isinstance(tag, EntityType) else str(tag) for tag in tags(output))
+            try:
+                await self._backend.set(key, route, output.model_dump_json(), entry_tags, self._config.TTL_SECONDS)
+            except _BACKEND_ERRORS:
+                self._failed(f"Storing {route} in the response cache failed")
+        return output
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every invalidation; a read started before a bump may predate the write behind it."""
+        return self._generation
+
+    def collection_version(self, entity_types: Iterable[EntityType]) -> str:
+        """Changes once a change to any row of ``entity_types`` has committed, as far as this worker has heard."""
+        counts = (f"{entity_type.value}.{self._versions[entity_type]}" for entity_type in sorted(set(entity_types)))
+        return ":".join([self._epoch, *counts])
+
+    async def invalidate(
+        self,
+        entity_type: EntityType,
+        entity_uuids: Iterable[UUID] | None,
+        related_uuids: Iterable[UUID] = (),
+    ) -> None:
+        """Drop the entries showing the changed rows or their type; None for the rows drops every entry."""
+        if entity_uuids is None:
+            await self.clear()
+            return
+        self._generation += 1
+        self._versions[entity_type] += 1
+        try:
+            tags = {entity_type.value, *(str(u) for u in entity_uuids), *(str(u) for u in related_uuids)}
+            removed = await self._backend.invalidate(tags)
+        except _BACKEND_ERRORS:
+            self._failed(f"Evicting {entity_type.value} changes from the response cache failed")
+            return
+        if removed is not None:
+            self._evictions += removed
+
+    async def clear(self) -> None:
+        self._generation += 1
+        for entity_type in EntityType:
+            self._versions[entity_type] += 1
+        try:
+            await self._backend.clear()
+        except _BACKEND_ERRORS:
+            self._failed("Clearing the response cache failed")
+
+    def stats(self) -> ResponseCacheStatsDTO:
+        usage = self._backend.usage()
+        routes = sorted(set(self._hits) | set(self._misses) | set(usage or {}))
+        return ResponseCacheStatsDTO(
+            backend=self._backend.name,
+            evictions=self._evictions if usage is not None else None,
+            errors=self._errors,
+            routes=[
+                ResponseCacheRouteStatsDTO(
+                    route=route,
+                    hits=self._hits[route],
+                    misses=self._misses[route],
+                    hit_ratio=(
+                        self._hits[route] / (self._hits[route] + self._misses[route])
+                        if self._hits[route] + self._misses[route]
+                        else None
+                    ),
+                    entries=usage.get(route, (0, 0))[0] if usage is not None else None,
+                    bytes=usage.get(route, (0, 0))[1] if usage is not None else None,
+                )
+                for route in routes
+            ],
+        )
+
+    async def log_stats(self) -> None:
+        stats = self.stats()
+        for route in stats.routes:
+            logger.info(
+                "Response cache (%s) %s: %d hits, %d misses, hit ratio %s, %s entries, %s bytes",
+                stats.backend,
+                route.route,
+                route.hits,
+                route.misses,
+                f"{route.hit_ratio:.3f}" if route.hit_ratio is not None else "n/a",
+                route.entries if route.entries is not None else "n/a",
+                route.bytes if route.bytes is not None else "n/a",
+            )
+
+    async def _on_entities_changed(self, event: EntityChangedEventDTO) -> None:
+        await self.invalidate(event.entity_type, event.entity_uuids, event.related_uuids)
+
+    def _failed(self, message: str) -> None:
+        self._errors += 1
+        logger.warning(message, exc_info=True)
+
+    @staticmethod
+    def _key(route: str, params: BaseModel) -> str:
+        # Sorted keys, so equal parameters give the same key whatever order they were given in.
+        normalized = json.dumps(params.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+        return f"{route}?{hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()}"
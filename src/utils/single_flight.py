@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.configs.runtime_config import RuntimeConfig, SingleFlightConfig
+
+logger = logging.getLogger(__name__)
+
+OutputT = TypeVar("OutputT")
+
+
+class SingleFlightStatsDTO(BaseModel):
+    name: str
+    calls: int
+    # Calls that joined a load already running instead of starting their own.
+    coalesced: int
+    failures: int
+    in_flight: int
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs concurrent identical reads once, and hands the one result, or error, to every caller.
+
+    Calls are identical when they share a name, parameters and ``generation``; a caller passes the generation
+    its cache bumps on every committed write, so no call joins a load that may have read the data before a write
+    the caller already saw. The load runs in a task of its own, so a caller that is cancelled, such as a client
+    that hung up, does not cancel it for the others; it is cancelled only once every caller waiting for it is
+    gone. A call made after the load finished starts a new one, so an error is only handed to the calls that
+    waited for it.
+    """
+
+    def __init__(self, config: SingleFlightConfig | None = None) -> None:
+        self._config: SingleFlightConfig = config or RuntimeConfig.global_config().SINGLE_FLIGHT
+        self._flights: dict[tuple[str, int, str], _Flight] = {}
+        self._calls: Counter[str] = Counter()
+        self._coalesced: Counter[str] = Counter()
+        self._failures: Counter[str] = Counter()
+
+    async def do(
+        self,
+        name: str,
+        params: BaseModel,
+        load: Callable[[], Awaitable[OutputT]],
+        generation: int = 0,
+    ) -> OutputT:
+        if not self._config.IS_ENABLED:
+            return await load()
+        self._calls[name] += 1
+        key = (name, generation, params.model_dump_json())
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(self._run(name, load)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task: self._land(key, flight))
+        else:
+            self._coalesced[name] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled; nobody is left to use the result.
+                self._land(key, flight)
+                flight.task.cancel()
+
+    def stats(self) -> list[SingleFlightStatsDTO]:
+        in_flight = Counter(name for name, _generation, _params in self._flights)
+        return [
+            SingleFlightStatsDTO(
+                name=name,
+                calls=self._calls[name],
+                coalesced=self._coalesced[name],
+                failures=self._failures[name],
+                in_flight=in_flight[name],
+            )
+            for name in sorted(self._calls)
+        ]
+
+    async def log_stats(self) -> None:
+        for stats in self.stats():
+            logger.info(
+                "Single flight %s: %d calls, %d coalesced, %d failed loads, %d in flight",
+                stats.name,
+                stats.calls,
+                stats.coalesced,
+                stats.failures,
+                stats.in_flight,
+            )
+
+    async def _run(self, name: str, load: Callable[[], Awaitable[OutputT]]) -> OutputT:
+        try:
+            return await load()
+        except Exception:
+            self._failures[name] += 1
+            raise
+
+    def _land(self, key: tuple[str, int, str], flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
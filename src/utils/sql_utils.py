@@ -0,0 +1,67 @@
+from archipy.adapters.base.sqlalchemy.ports import AsyncSQLAlchemyPort
+from archipy.models.entities import BaseEntity
+from sqlalchemy import ColumnElement, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import InstrumentedAttribute
+
+_SERIALIZATION_FAILURE_SQLSTATE = "40001"
+
+
+class SQLUtils:
+    @staticmethod
+    def dialect_name(adapter: AsyncSQLAlchemyPort) -> str:
+        return adapter.get_session().bind.dialect.name
+
+    @staticmethod
+    def insert(adapter: AsyncSQLAlchemyPort, entity: type[BaseEntity]) -> postgresql.Insert | sqlite.Insert:
+        # PostgreSQL in production, SQLite in the test container; both support ON CONFLICT ... RETURNING.
+        if SQLUtils.dialect_name(adapter) == "sqlite":
+            return sqlite.insert(entity)
+        return postgresql.insert(entity)
+
+    @staticmethod
+    def epoch_seconds(
+        adapter: AsyncSQLAlchemyPort,
+        column: ColumnElement | InstrumentedAttribute,
+    ) -> ColumnElement[float]:
+        """Seconds since the Unix epoch of a timestamp column, in the adapter's dialect."""
+        if SQLUtils.dialect_name(adapter) == "sqlite":
+            # SQLite keeps timestamps as UTC text; julianday() counts days from 4714 BC.
+            return (func.julianday(column) - 2440587.5) * 86400.0
+        return func.extract("epoch", column)
+
+    @staticmethod
+    async def previous_value(adapter: AsyncSQLAlchemyPort, column: ColumnElement) -> ColumnElement:
+        """``column`` of the locked sub-select an ``UPDATE ... FROM`` reads, for its RETURNING clause.
+
+        SQLite cannot return the columns of an UPDATE's FROM clause, so there the value is read first and
+        returned as a literal; the test container has no concurrent writers for the lock to keep out.
+        """
+        if SQLUtils.dialect_name(adapter) != "sqlite":
+            return column
+        result = await adapter.execute(statement=select(column))
+        return literal(result.scalar(), column.type)
+
+    @staticmethod
+    def is_serialization_failure(exception: BaseException) -> bool:
+        """Whether ``exception`` (or anything it was raised from) is a PostgreSQL serialization failure."""
+        current: BaseException | None = exception
+        while current is not None:
+            for error in (current, getattr(current, "orig", None)):
+                if getattr(error, "sqlstate", None) == _SERIALIZATION_FAILURE_SQLSTATE:
+                    return True
+            current = current.__cause__
+        return False
+
+    @staticmethod
+    def escape_like(term: str) -> str:
+        return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def contains(column: ColumnElement | InstrumentedAttribute, term: str) -> ColumnElement[bool]:
+        """Case-insensitive substring match that the ``gin_trgm_ops`` index on ``column`` can serve.
+
+        Terms of one or two characters yield no full trigram, so PostgreSQL scans for them instead; they
+        still match anywhere in the value, as they did before the index existed.
+        """
+        return column.ilike(f"%{SQLUtils.escape_like(term)}%", escape="\\")
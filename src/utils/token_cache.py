@@ -0,0 +1,113 @@
+import heapq
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from pydantic import BaseModel
+
+
+class DecodedTokenCacheStatsDTO(BaseModel):
+    is_enabled: bool
+    max_size: int
+    size: int
+    hits: int
+    misses: int
+    expired: int
+    evicted: int
+
+
+class DecodedTokenCache:
+    """Bounded LRU of already-verified JWTs and their claims.
+
+    Only tokens that passed signature verification are stored, and an entry never
+    outlives the token's own ``exp`` claim; tokens without ``exp`` are not cached.
+    """
+
+    def __init__(self, max_size: int, *, is_enabled: bool = True) -> None:
+        self._max_size = max_size
+        self._is_enabled = is_enabled
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    def set_enabled(self, *, is_enabled: bool) -> None:
+        self._is_enabled = is_enabled
+        if not is_enabled:
+            self.clear()
+
+    def get(self, token: str) -> dict | None:
+        if not self._is_enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+            entry = self._entries.get(token)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self._hits += 1
+            return dict(entry[1])
+
+    def put(self, token: str, claims: dict) -> None:
+        if not self._is_enabled:
+            return
+        exp = claims.get("exp")
+        if not isinstance(exp, int | float):
+            return
+        now = time.time()
+        if exp <= now:
+            return
+        with self._lock:
+            self._purge_expired(now)
+            self._entries[token] = (float(exp), dict(claims))
+            self._entries.move_to_end(token)
+            heapq.heappush(self._expiry_heap, (float(exp), token))
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+            if len(self._expiry_heap) > 2 * self._max_size:
+                self._rebuild_expiry_heap()
+
+    def invalidate(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+
+    def stats(self) -> DecodedTokenCacheStatsDTO:
+        with self._lock:
+            return DecodedTokenCacheStatsDTO(
+                is_enabled=self._is_enabled,
+                max_size=self._max_size,
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                evicted=self._evicted,
+            )
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            exp, token = heapq.heappop(heap)
+            entry = self._entries.get(token)
+            # The heap may still reference tokens that were evicted or re-inserted since.
+            if entry is not None and entry[0] == exp:
+                del self._entries[token]
+                self._expired += 1
+
+    def _rebuild_expiry_heap(self) -> None:
+        self._expiry_heap = [(exp, token) for token, (exp, _) in self._entries.items()]
+        heapq.heapify(self._expiry_heap)
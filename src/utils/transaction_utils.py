@@ -0,0 +1,45 @@
+import asyncio
+import functools
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import ParamSpec, TypeVar
+
+from archipy.models.errors import DatabaseError
+
+from src.configs.runtime_config import RuntimeConfig
+from src.utils.sql_utils import SQLUtils
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+def retry_on_serialization_failure(
+    function: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """Rerun a whole transaction when PostgreSQL reports a serialization failure.
+
+    Goes *above* ``async_postgres_sqlalchemy_atomic_decorator``, so every attempt gets a new session and
+    snapshot. Writes that share a hot row (e.g. a popular movie's ``movie_stats``) conflict this way under
+    REPEATABLE READ. Attempts back off with jitter so the racers do not collide again in lockstep.
+    """
+
+    @functools.wraps(function)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        config = RuntimeConfig.global_config().TRANSACTION
+        attempt = 1
+        while True:
+            try:
+                return await function(*args, **kwargs)
+            except DatabaseError as exc:
+                if attempt >= config.SERIALIZATION_RETRY_ATTEMPTS or not SQLUtils.is_serialization_failure(exc):
+                    raise
+                logger.debug("Serialization failure in %s, retrying (attempt %d)", function.__name__, attempt)
+            backoff = config.SERIALIZATION_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            # Jitter only spreads the retries out; nothing here needs unpredictable numbers.
+            await asyncio.sleep(random.uniform(0, backoff))  # noqa: S311
+            attempt += 1
+
+    return wrapper
@@ -1,6 +1,10 @@
 from datetime import datetime, timezone
 
 from archipy.helpers.utils.base_utils import BaseUtils
+from archipy.models.types.sort_order_type import SortOrderType
+
+# The REST API documents "asc"/"desc", while SortDTO only accepts the SortOrderType values.
+_SORT_ORDER_ALIASES = {"asc": SortOrderType.ASCENDING, "desc": SortOrderType.DESCENDING}
 
 
 class Utils(BaseUtils):
@@ -8,3 +12,7 @@ class Utils(BaseUtils):
     def get_datetime_utc_now() -> datetime:
         # Returns a naive datetime object representing UTC time
         return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def get_sort_order(sort_order: str) -> SortOrderType | str:
+        return _SORT_ORDER_ALIASES.get(sort_order.lower(), sort_order)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 
 # ── Provide required env-vars before any ArchiPy config is constructed ──────
 os.environ.setdefault("FIRST_SUPERUSER_EMAIL", "superuser@test.com")
@@ -60,7 +61,13 @@ os.environ.setdefault("POSTGRES_SQLALCHEMY__USERNAME", "test_user")
 os.environ.setdefault("POSTGRES_SQLALCHEMY__DRIVER_NAME", "postgresql+asyncpg")
 os.environ.setdefault("POSTGRES_SQLALCHEMY__HOST", "localhost")
 os.environ.setdefault("POSTGRES_SQLALCHEMY__PORT", "5432")
+# A fresh content index per run, so one left over from an earlier run is never mapped.
+os.environ.setdefault(
+    "RECOMMENDATION__CONTENT_INDEX_PATH",
+    os.path.join(tempfile.mkdtemp(prefix="movie_watchlist_test_"), "content_index.bin"),
+)
 
+from archipy.adapters.postgres.sqlalchemy.adapters import AsyncPostgresSQLAlchemyAdapter  # noqa: E402
 from archipy.adapters.sqlite.sqlalchemy.adapters import AsyncSQLiteSQLAlchemyAdapter  # noqa: E402
 from archipy.models.entities.sqlalchemy.base_entities import BaseEntity  # noqa: E402
 from sqlalchemy import text  # noqa: E402
@@ -70,26 +77,48 @@ from sqlalchemy.pool import StaticPool  # noqa: E402
 import src.models.entities  # noqa: E402, F401  (side-effect import)
 from src.logics.auth.auth_logic import AuthLogic  # noqa: E402
 from src.logics.genre.genre_logic import GenreLogic  # noqa: E402
+from src.logics.leaderboard.leaderboard_logic import LeaderboardLogic  # noqa: E402
 from src.logics.movie.movie_logic import MovieLogic  # noqa: E402
+from src.logics.movie_stats.movie_stats_logic import MovieStatsLogic  # noqa: E402
 from src.logics.rating.rating_logic import RatingLogic  # noqa: E402
+from src.logics.recommendation.content_similarity_logic import ContentSimilarityLogic  # noqa: E402
+from src.logics.recommendation.recommendation_logic import RecommendationLogic  # noqa: E402
 from src.logics.user.user_logic import UserLogic  # noqa: E402
 from src.logics.watch.watch_logic import WatchLogic  # noqa: E402
 from src.repositories.genre.adapters.genre_postgres_adapter import GenrePostgresAdapter  # noqa: E402
 from src.repositories.genre.genre_repository import GenreRepository  # noqa: E402
+from src.repositories.leaderboard.adapters.leaderboard_postgres_adapter import LeaderboardPostgresAdapter  # noqa: E402
+from src.repositories.leaderboard.leaderboard_repository import LeaderboardRepository  # noqa: E402
 from src.repositories.movie.adapters.movie_postgres_adapter import MoviePostgresAdapter  # noqa: E402
 from src.repositories.movie.movie_repository import MovieRepository  # noqa: E402
+from src.repositories.movie_stats.adapters.movie_stats_postgres_adapter import MovieStatsPostgresAdapter  # noqa: E402
+from src.repositories.movie_stats.movie_stats_repository import MovieStatsRepository  # noqa: E402
 from src.repositories.rating.adapters.rating_postgres_adapter import RatingPostgresAdapter  # noqa: E402
 from src.repositories.rating.rating_repository import RatingRepository  # noqa: E402
+from src.repositories.recommendation.adapters.recommendation_postgres_adapter import (  # noqa: E402
+    RecommendationPostgresAdapter,
+)
+from src.repositories.recommendation.recommendation_repository import RecommendationRepository  # noqa: E402
 from src.repositories.user.adapters.user_postgres_adapter import UserPostgresAdapter  # noqa: E402
 from src.repositories.user.user_repository import UserRepository  # noqa: E402
 from src.repositories.watch.adapters.watch_postgres_adapter import WatchPostgresAdapter  # noqa: E402
 from src.repositories.watch.watch_repository import WatchRepository  # noqa: E402
+from src.utils.invalidation_bus import InMemoryInvalidationBus  # noqa: E402
+from src.utils.password_hasher import PasswordHasher  # noqa: E402
+from src.utils.principal_cache import PrincipalCache  # noqa: E402
+from src.utils.response_cache import InMemoryResponseCacheBackend, ResponseCache  # noqa: E402
+from src.utils.single_flight import SingleFlight  # noqa: E402
 
 
 def _build_sqlite_adapter() -> AsyncSQLiteSQLAlchemyAdapter:
     return AsyncSQLiteSQLAlchemyAdapter()
 
 
+def build_postgres_adapter() -> AsyncPostgresSQLAlchemyAdapter:
+    """Adapter for the opt-in @postgres scenarios, configured by the POSTGRES_SQLALCHEMY__* env-vars."""
+    return AsyncPostgresSQLAlchemyAdapter()
+
+
 class TestServiceContainer:
     """
     Drop-in replacement for ServiceContainer that uses SQLite instead of
@@ -104,36 +133,106 @@ class TestServiceContainer:
     def __init__(self) -> None:
         # Single shared SQLite adapter – all adapters share the same connection.
         self._sqlite_adapter: AsyncSQLiteSQLAlchemyAdapter = _build_sqlite_adapter()
+        self._password_hasher = PasswordHasher()
+        self._principal_cache = PrincipalCache()
+        # Other workers are simulated with buses joined to this one.
+        self._invalidation_bus = InMemoryInvalidationBus()
+        self._response_cache = ResponseCache(
+            backend=InMemoryResponseCacheBackend(),
+            invalidation_bus=self._invalidation_bus,
+        )
+        self._single_flight = SingleFlight()
 
         # ── User layer ──────────────────────────────────────────────────────
         self._user_sqlite_adapter = UserPostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
         self._user_repository = UserRepository(postgres_adapter=self._user_sqlite_adapter)
-        self._user_logic = UserLogic(repository=self._user_repository)
-        self._auth_logic = AuthLogic(user_repository=self._user_repository)
+        self._user_logic = UserLogic(
+            repository=self._user_repository,
+            principal_cache=self._principal_cache,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+        )
+        self._auth_logic = AuthLogic(
+            user_repository=self._user_repository,
+            password_hasher=self._password_hasher,
+            principal_cache=self._principal_cache,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+        )
 
         # ── Genre layer ─────────────────────────────────────────────────────
         self._genre_sqlite_adapter = GenrePostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
         self._genre_repository = GenreRepository(postgres_adapter=self._genre_sqlite_adapter)
-        self._genre_logic = GenreLogic(repository=self._genre_repository)
+        self._genre_logic = GenreLogic(
+            repository=self._genre_repository,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+        )
+
+        # ── Content similarity layer ────────────────────────────────────────
+        self._recommendation_sqlite_adapter = RecommendationPostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
+        self._recommendation_repository = RecommendationRepository(postgres_adapter=self._recommendation_sqlite_adapter)
+        self._content_similarity_logic = ContentSimilarityLogic(
+            repository=self._recommendation_repository,
+            invalidation_bus=self._invalidation_bus,
+        )
 
         # ── Movie layer ─────────────────────────────────────────────────────
         self._movie_sqlite_adapter = MoviePostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
         self._movie_repository = MovieRepository(postgres_adapter=self._movie_sqlite_adapter)
-        self._movie_logic = MovieLogic(repository=self._movie_repository)
+        self._movie_logic = MovieLogic(
+            repository=self._movie_repository,
+            genre_logic=self._genre_logic,
+            content_similarity_logic=self._content_similarity_logic,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+            single_flight=self._single_flight,
+        )
+
+        # ── Movie stats layer ───────────────────────────────────────────────
+        self._movie_stats_sqlite_adapter = MovieStatsPostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
+        self._movie_stats_repository = MovieStatsRepository(postgres_adapter=self._movie_stats_sqlite_adapter)
+        self._movie_stats_logic = MovieStatsLogic(
+            repository=self._movie_stats_repository,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+        )
+
+        # ── Recommendation layer ────────────────────────────────────────────
+        self._recommendation_logic = RecommendationLogic(
+            repository=self._recommendation_repository,
+            content_similarity_logic=self._content_similarity_logic,
+        )
 
         # ── Watch layer ─────────────────────────────────────────────────────
         self._watch_sqlite_adapter = WatchPostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
         self._watch_repository = WatchRepository(postgres_adapter=self._watch_sqlite_adapter)
-        self._watch_logic = WatchLogic(repository=self._watch_repository)
+        self._watch_logic = WatchLogic(
+            repository=self._watch_repository,
+            movie_stats_repository=self._movie_stats_repository,
+            recommendation_logic=self._recommendation_logic,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+            single_flight=self._single_flight,
+        )
 
         # ── Rating layer ────────────────────────────────────────────────────
         self._rating_sqlite_adapter = RatingPostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
         self._rating_repository = RatingRepository(postgres_adapter=self._rating_sqlite_adapter)
         self._rating_logic = RatingLogic(
             repository=self._rating_repository,
-            watch_repository=self._watch_repository,
+            movie_stats_repository=self._movie_stats_repository,
+            recommendation_logic=self._recommendation_logic,
+            invalidation_bus=self._invalidation_bus,
+            response_cache=self._response_cache,
+            single_flight=self._single_flight,
         )
 
+        # ── Leaderboard layer ───────────────────────────────────────────────
+        self._leaderboard_sqlite_adapter = LeaderboardPostgresAdapter(adapter=self._sqlite_adapter)  # type: ignore[arg-type]
+        self._leaderboard_repository = LeaderboardRepository(postgres_adapter=self._leaderboard_sqlite_adapter)
+        self._leaderboard_logic = LeaderboardLogic(repository=self._leaderboard_repository)
+
     # ── Public accessors (mirrors ServiceContainer provider attribute names) ─
 
     def auth_logic(self) -> AuthLogic:
@@ -148,12 +247,39 @@ class TestServiceContainer:
     def movie_logic(self) -> MovieLogic:
         return self._movie_logic
 
+    def movie_stats_logic(self) -> MovieStatsLogic:
+        return self._movie_stats_logic
+
     def watch_logic(self) -> WatchLogic:
         return self._watch_logic
 
     def rating_logic(self) -> RatingLogic:
         return self._rating_logic
 
+    def leaderboard_logic(self) -> LeaderboardLogic:
+        return self._leaderboard_logic
+
+    def recommendation_logic(self) -> RecommendationLogic:
+        return self._recommendation_logic
+
+    def content_similarity_logic(self) -> ContentSimilarityLogic:
+        return self._content_similarity_logic
+
+    def password_hasher(self) -> PasswordHasher:
+        return self._password_hasher
+
+    def principal_cache(self) -> PrincipalCache:
+        return self._principal_cache
+
+    def invalidation_bus(self) -> InMemoryInvalidationBus:
+        return self._invalidation_bus
+
+    def response_cache(self) -> ResponseCache:
+        return self._response_cache
+
+    def single_flight(self) -> SingleFlight:
+        return self._single_flight
+
     def sqlite_adapter(self) -> AsyncSQLiteSQLAlchemyAdapter:
         return self._sqlite_adapter
 
@@ -191,7 +317,7 @@ async def drop_test_schema(adapter: AsyncSQLiteSQLAlchemyAdapter) -> None:
 async def clear_all_tables(adapter: AsyncSQLiteSQLAlchemyAdapter) -> None:
     """
     Delete all rows from every table in reverse FK-dependency order:
-      user_rate_movie → user_watch_movie → movies → genres → users
+      user_rate_movie → user_watch_movie → movie_stats → movies → genres → users
 
     ED-1 NOTE: WatchStatusType is stored as VARCHAR(20); no ENUM migration
     issues exist with SQLite.
@@ -200,6 +326,7 @@ async def clear_all_tables(adapter: AsyncSQLiteSQLAlchemyAdapter) -> None:
     try:
         await session.execute(text("DELETE FROM user_rate_movie"))
         await session.execute(text("DELETE FROM user_watch_movie"))
+        await session.execute(text("DELETE FROM movie_stats"))
         await session.execute(text("DELETE FROM movies"))
         await session.execute(text("DELETE FROM genres"))
         await session.execute(text("DELETE FROM users"))